@@ -0,0 +1,102 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the AsyncQueue and the AsyncPriorityQueue - message throughput and p99 latency between enqueueing a message
+# and dequeueing it, compared with the queues of the asyncio library
+# run from the root of the repository with: python -m Benchmarks.BenchmarkAsyncQueues
+import argparse
+import asyncio
+from random import randint
+from time import perf_counter
+
+from DataStructures.ConcurrentDataStructures import AsyncQueue, AsyncPriorityQueue
+
+
+async def measure(enqueue, dequeue, tasks, messages):
+    """
+    passes messages through a queue shared by the given number of producer and consumer tasks, every message is the time
+    at which it was enqueued
+
+    :param enqueue: a coroutine function, which enqueues a message
+    :param dequeue: a coroutine function, which dequeues a message
+    :param tasks: the number of producer tasks, which is also the number of consumer tasks
+    :param messages: the total number of messages
+    :return: a tuple with the number of messages per second and the p99 latency of a message in microseconds
+    """
+
+    per_task = messages // tasks
+    latencies = []
+
+    async def produce():
+        for _ in range(per_task):
+            await enqueue(perf_counter())
+
+    async def consume():
+        for _ in range(per_task):
+            enqueued = await dequeue()
+            latencies.append(perf_counter() - enqueued)
+
+    start = perf_counter()
+    await asyncio.gather(*[produce() for _ in range(tasks)], *[consume() for _ in range(tasks)])
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[int(0.99*(len(latencies) - 1))] * 10**6
+
+
+async def main(tasks, messages, capacity):
+    """
+    measures the queues of this repository and the queues of the asyncio library with the same workload
+
+    :param tasks: the number of producer tasks, which is also the number of consumer tasks
+    :param messages: the total number of messages passed through each queue
+    :param capacity: the capacity of the queues
+    :return: a dictionary, which maps the name of each queue to its throughput and p99 latency
+    """
+
+    queue = AsyncQueue(float, capacity=capacity)
+    results = {"AsyncQueue": await measure(queue.enqueue, queue.dequeue, tasks, messages)}
+
+    queue = asyncio.Queue(capacity)
+    results["asyncio.Queue"] = await measure(queue.put, queue.get, tasks, messages)
+
+    queue = AsyncPriorityQueue(float, duplicates=True, capacity=capacity)
+    results["AsyncPriorityQueue"] = await measure(lambda message: queue.enqueue(message, randint(0, 100)),
+                                                  queue.dequeue, tasks, messages)
+
+    # the message is the second element of the entry, so that the priority decides the order
+    queue = asyncio.PriorityQueue(capacity)
+
+    async def get():
+        return (await queue.get())[1]
+
+    results["asyncio.PriorityQueue"] = await measure(lambda message: queue.put((randint(0, 100), message)), get,
+                                                     tasks, messages)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput and latency of the asyncio-native queues")
+    parser.add_argument("--tasks", type=int, default=4, help="the number of producer tasks and of consumer tasks")
+    parser.add_argument("--messages", type=int, default=100000, help="the number of messages passed through each queue")
+    parser.add_argument("--capacity", type=int, default=100, help="the capacity of the queues")
+    arguments = parser.parse_args()
+
+    print("{0:>22} {1:>16} {2:>16}".format("queue", "messages/s", "p99 latency (us)"))
+    for name, (throughput, latency) in asyncio.run(main(arguments.tasks, arguments.messages, arguments.capacity)).items():
+        print("{0:>22} {1:>16.0f} {2:>16.1f}".format(name, throughput, latency))
@@ -0,0 +1,79 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the BlockingQueue - throughput and latency between enqueueing and dequeueing an element with many producer
+# and consumer threads, compared with the Queue of the queue module of the standard library
+# run from the root of the repository with: python -m Benchmarks.BenchmarkBlockingQueue
+import argparse
+import queue as standard_queue
+from threading import Thread
+from time import perf_counter
+
+from DataStructures.ConcurrentDataStructures import BlockingQueue
+
+
+def measure(enqueue, dequeue, threads, messages):
+    """
+    passes messages through a queue shared by the given number of producer and consumer threads, every message is the
+    time at which it was enqueued
+
+    :param enqueue: a function, which enqueues a message
+    :param dequeue: a function, which dequeues a message
+    :param threads: the number of producer threads, which is also the number of consumer threads
+    :param messages: the total number of messages
+    :return: a tuple with the number of messages per second and the p50 and p99 latencies of a message in microseconds
+    """
+
+    per_thread = messages // threads
+    latencies = []
+
+    def produce():
+        for _ in range(per_thread):
+            enqueue(perf_counter())
+
+    def consume():
+        # every consumer collects its latencies locally, so that the consumers don't contend for the list
+        local = [perf_counter() - dequeue() for _ in range(per_thread)]
+        latencies.extend(local)
+
+    workers = [Thread(target=produce) for _ in range(threads)] + [Thread(target=consume) for _ in range(threads)]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return (len(latencies) / elapsed, latencies[len(latencies) // 2] * 10**6,
+            latencies[int(0.99*(len(latencies) - 1))] * 10**6)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput and latency of the BlockingQueue")
+    parser.add_argument("--messages", type=int, default=96000, help="the number of messages passed through each queue")
+    parser.add_argument("--capacity", type=int, default=1000, help="the capacity of the queues")
+    arguments = parser.parse_args()
+
+    print("{0:>8} {1:>14} {2:>12} {3:>12} {4:>12}".format("threads", "queue", "messages/s", "p50 (us)", "p99 (us)"))
+    for threads in (1, 4, 16):
+        blocking = BlockingQueue(float, capacity=arguments.capacity)
+        shared = standard_queue.Queue(arguments.capacity)
+        for name, enqueue, dequeue in (("BlockingQueue", blocking.enqueue, blocking.dequeue),
+                                       ("queue.Queue", shared.put, shared.get)):
+            print("{0:>8} {1:>14} {2:>12.0f} {3:>12.1f} {4:>12.1f}".format(
+                threads, name, *measure(enqueue, dequeue, threads, arguments.messages)))
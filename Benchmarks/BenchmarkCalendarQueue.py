@@ -0,0 +1,77 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the CalendarQueue - the hold model of discrete-event simulation, compared with the PriorityQueue and the
+# DuplicatePriorityQueue
+# run from the root of the repository with: python -m Benchmarks.BenchmarkCalendarQueue
+import argparse
+import random
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import PriorityQueue, DuplicatePriorityQueue
+from DataStructures.SchedulingDataStructures import CalendarQueue
+
+
+# the distributions of the time between a dequeued event and the event it schedules
+DISTRIBUTIONS = {
+    "exponential": lambda: random.expovariate(1.0),
+    "uniform": lambda: random.uniform(0.0, 2.0),
+    "bimodal": lambda: random.uniform(100.0, 1000.0) if random.random() < 0.1 else random.expovariate(1.0)
+}
+
+
+def hold(queue, size, holds, increment):
+    """
+    runs the hold model - the queue is filled with events and then every dequeued event enqueues a new event a random
+    time after it, so the size of the queue stays the same
+
+    :param queue: an empty queue with float priorities, which dequeues the lowest priority first
+    :param size: the number of events in the queue
+    :param holds: the number of hold operations (a dequeue followed by an enqueue)
+    :param increment: a function, which returns the random time between a dequeued event and the new event
+    :return: the average time of a hold operation in microseconds
+    """
+
+    random.seed(size)
+    for _ in range(size):
+        priority = increment()
+        queue.enqueue(priority, priority)
+
+    start = perf_counter()
+    for _ in range(holds):
+        priority = queue.dequeue() + increment()
+        queue.enqueue(priority, priority)
+
+    return (perf_counter() - start) / holds * 10**6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="The hold model with the calendar queue and the priority queues")
+    parser.add_argument("--holds", type=int, default=50000, help="the number of hold operations for each queue size")
+    arguments = parser.parse_args()
+
+    queues = {
+        "CalendarQueue": lambda: CalendarQueue(float, priority_type=float),
+        "PriorityQueue": lambda: PriorityQueue(float, reverse=True, priority_type=float),
+        "DuplicatePriorityQueue": lambda: DuplicatePriorityQueue(float, reverse=True, priority_type=float)
+    }
+
+    print("{0:>12} {1:>8} ".format("increment", "size") + " ".join("{0:>22}".format(name) for name in queues))
+    for distribution, increment in DISTRIBUTIONS.items():
+        for size in (100, 1000, 10000, 100000):
+            times = [hold(create(), size, arguments.holds, increment) for create in queues.values()]
+            print("{0:>12} {1:>8} ".format(distribution, size) + " ".join("{0:>17.2f} us/op".format(time) for time in times))
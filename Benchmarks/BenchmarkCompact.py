@@ -0,0 +1,83 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the compact Stack and Queue - memory used by a million numbers stored in a deque and in an array, the time
+# to add and remove them, and the time to sum them through a memoryview
+# run from the root of the repository with: python -m Benchmarks.BenchmarkCompact
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import Stack, Queue
+
+
+def measure(create, add, remove, export, numbers):
+    """
+    measures the memory and the time of a stack or a queue with the given numbers
+
+    :param create: a function, which creates the empty stack or queue
+    :param add: the name of the method adding many elements, e.g. "push_many"
+    :param remove: the name of the method removing many elements, e.g. "pop_many"
+    :param export: a function, which sums the elements of the structure without removing them
+    :param numbers: a function, which returns an iterator of new number objects, so that the memory of the numbers stored
+        in a deque is counted as well
+    :return: a tuple with the memory in MB, the time to add the numbers, to sum them and to remove them in milliseconds
+    """
+
+    # the memory is measured separately, since tracing the allocations slows down adding the numbers
+    tracemalloc.start()
+    structure = create()
+    getattr(structure, add)(numbers())
+    memory = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    del structure
+
+    structure = create()
+    start = perf_counter()
+    getattr(structure, add)(numbers())
+    added = perf_counter()
+
+    export_start = perf_counter()
+    export(structure)
+    exported = perf_counter()
+    getattr(structure, remove)(structure.size)
+    removed = perf_counter()
+
+    return memory, (added - start) * 1000, (exported - export_start) * 1000, (removed - exported) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory and time of the compact Stack and Queue")
+    parser.add_argument("--elements", type=int, default=10**6, help="the number of stored numbers")
+    arguments = parser.parse_args()
+
+    # large integers are used since small integers are cached by the interpreter and don't take memory when stored
+    count = arguments.elements
+    numbers = {int: lambda: iter(range(10**6, 10**6 + count)), float: lambda: map(float, range(count))}
+
+    print("{0:>6} {1:>6} {2:>8} {3:>12} {4:>10} {5:>10} {6:>11}".format("class", "type", "compact", "memory (MB)",
+                                                                         "add (ms)", "sum (ms)", "remove (ms)"))
+    for name, add, remove in (("Stack", "push_many", "pop_many"), ("Queue", "enqueue_many", "dequeue_many")):
+        structure_class = Stack if name == "Stack" else Queue
+        for elements_type in (int, float):
+            for compact in (False, True):
+                export = (lambda structure: sum(structure.as_memoryview())) if compact else \
+                    (lambda structure: sum(structure.view()))
+                result = measure(lambda: structure_class(elements_type, compact=compact), add, remove, export,
+                                 numbers[elements_type])
+                print("{0:>6} {1:>6} {2:>8} {3:>12.1f} {4:>10.1f} {5:>10.1f} {6:>11.1f}".format(
+                    name, elements_type.__name__, str(compact), *result))
@@ -0,0 +1,113 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the ConcurrentPriorityQueue - throughput with 1, 4 and 16 producer and consumer threads
+# run from the root of the repository with: python -m Benchmarks.BenchmarkConcurrentPriorityQueue
+import argparse
+from random import randint
+from threading import Lock, Thread
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import DuplicatePriorityQueue
+from DataStructures.ConcurrentDataStructures import ConcurrentPriorityQueue
+
+
+def concurrent_throughput(threads, elements):
+    """
+    measures the throughput of a ConcurrentPriorityQueue shared by the given number of producers and consumers
+
+    :param threads: the number of producer threads, which is also the number of consumer threads
+    :param elements: the total number of elements enqueued by all producers
+    :return: the number of elements enqueued and dequeued per second
+    """
+
+    queue = ConcurrentPriorityQueue(int, duplicates=True)
+    per_thread = elements // threads
+
+    def produce():
+        for _ in range(per_thread):
+            queue.enqueue(0, randint(0, 1000))
+
+    def consume():
+        for _ in range(per_thread):
+            queue.dequeue()
+            queue.task_done()
+
+    return per_thread*threads / _run(threads, produce, consume, queue.join)
+
+
+def locked_throughput(threads, elements):
+    """
+    measures the throughput of a DuplicatePriorityQueue with an external lock around every call and consumers, which
+    poll the queue, i.e. the setup the ConcurrentPriorityQueue replaces
+
+    :param threads: the number of producer threads, which is also the number of consumer threads
+    :param elements: the total number of elements enqueued by all producers
+    :return: the number of elements enqueued and dequeued per second
+    """
+
+    queue = DuplicatePriorityQueue(int)
+    lock = Lock()
+    per_thread = elements // threads
+
+    def produce():
+        for _ in range(per_thread):
+            with lock:
+                queue.enqueue(0, randint(0, 1000))
+
+    def consume():
+        dequeued = 0
+        while dequeued < per_thread:
+            with lock:
+                if queue.size > 0:
+                    queue.dequeue()
+                    dequeued += 1
+
+    return per_thread*threads / _run(threads, produce, consume, lambda: None)
+
+
+def _run(threads, produce, consume, join):
+    """
+    starts the producer and consumer threads and waits for all of them to finish
+
+    :param threads: the number of producer threads, which is also the number of consumer threads
+    :param produce: the function run by the producers
+    :param consume: the function run by the consumers
+    :param join: a function called after all threads have finished
+    :return: the number of seconds elapsed
+    """
+
+    workers = [Thread(target=produce) for _ in range(threads)] + [Thread(target=consume) for _ in range(threads)]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    join()
+
+    return perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the ConcurrentPriorityQueue")
+    parser.add_argument("--elements", type=int, default=96000, help="the number of elements passed through the queue")
+    arguments = parser.parse_args()
+
+    print("{0:>8} {1:>24} {2:>24}".format("threads", "ConcurrentPriorityQueue", "external lock + polling"))
+    for threads in (1, 4, 16):
+        print("{0:>8} {1:>18.0f} ops/s {2:>18.0f} ops/s".format(
+            threads, concurrent_throughput(threads, arguments.elements), locked_throughput(threads, arguments.elements)))
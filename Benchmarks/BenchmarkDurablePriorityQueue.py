@@ -0,0 +1,73 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the DurablePriorityQueue - throughput when syncing the log after every operation and with group commit,
+# and the time to recover the queue from the log
+# run from the root of the repository with: python -m Benchmarks.BenchmarkDurablePriorityQueue
+import argparse
+import os
+from random import sample
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from DataStructures.DurableDataStructures import DurablePriorityQueue
+
+
+def throughput(directory, sync_every, operations):
+    """
+    enqueues and then dequeues elements from a durable priority queue, which syncs its log after every sync_every records
+
+    :param directory: the directory for the files of the queue
+    :param sync_every: the sync_every argument of the queue
+    :param operations: the number of elements, which are enqueued and dequeued
+    :return: a tuple with the number of operations per second and the number of seconds to recover the queue after
+        the elements have been enqueued
+    """
+
+    path = os.path.join(directory, "queue{0}".format(sync_every))
+    priorities = sample(range(10*operations), operations)
+
+    start = perf_counter()
+    queue = DurablePriorityQueue(path, int, sync_every=sync_every)
+    for priority in priorities:
+        queue.enqueue(priority, priority)
+    queue.flush()
+    enqueued = perf_counter()
+
+    # the queue is recovered from the log, which holds all enqueued elements
+    with DurablePriorityQueue(path, int) as recovered:
+        recovery = perf_counter() - enqueued
+
+    dequeued = perf_counter()
+    for _ in range(operations):
+        queue.dequeue()
+    queue.close()
+    end = perf_counter()
+
+    return 2*operations / (enqueued - start + end - dequeued), recovery
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the DurablePriorityQueue with different sync intervals")
+    parser.add_argument("--operations", type=int, default=5000, help="the number of elements enqueued and dequeued")
+    arguments = parser.parse_args()
+
+    print("{0:>12} {1:>14} {2:>14}".format("sync_every", "ops/s", "recovery (s)"))
+    with TemporaryDirectory() as directory:
+        for sync_every in (1, 10, 100, 1000):
+            operations_per_second, recovery = throughput(directory, sync_every, arguments.operations)
+            print("{0:>12} {1:>14.0f} {2:>14.3f}".format(sync_every, operations_per_second, recovery))
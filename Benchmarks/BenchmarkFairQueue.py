@@ -0,0 +1,103 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the FairQueue - tail latency of quiet lanes under a noisy-neighbour load, compared with a single shared
+# Queue, and the time of the enqueue and dequeue operations
+# run from the root of the repository with: python -m Benchmarks.BenchmarkFairQueue
+import argparse
+import random
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import Queue, FairQueue
+
+
+def simulate(queue, enqueue, ticks, quiet_lanes, capacity, burst, period):
+    """
+    simulates a server, which dequeues capacity elements per tick - a noisy lane enqueues a burst of elements every period
+    ticks and every quiet lane enqueues an element with a probability of 0.1 per tick
+
+    :param queue: the queue, which holds (lane, tick of enqueueing) tuples
+    :param enqueue: a function, which enqueues an element in a given lane
+    :param ticks: the number of simulated ticks
+    :param quiet_lanes: the number of quiet lanes
+    :param capacity: the number of elements dequeued per tick
+    :param burst: the number of elements in a burst of the noisy lane
+    :param period: the number of ticks between two bursts
+    :return: a tuple with the sorted latencies (in ticks) of the elements of the quiet lanes and the average time of an
+        operation in microseconds
+    """
+
+    random.seed(37)
+    latencies = []
+    operations = 0
+    start = perf_counter()
+    for tick in range(ticks):
+        if tick % period == 0:
+            for _ in range(burst):
+                enqueue(("noisy", tick), "noisy")
+            operations += burst
+        for lane in range(quiet_lanes):
+            if random.random() < 0.1:
+                enqueue((lane, tick), lane)
+                operations += 1
+
+        for _ in range(min(capacity, queue.size)):
+            lane, enqueued = queue.dequeue()
+            operations += 1
+            if lane != "noisy":
+                latencies.append(tick - enqueued)
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return latencies, elapsed / operations * 10**6
+
+
+def percentile(latencies, fraction):
+    """
+    gets a percentile of the latencies
+
+    :param latencies: a sorted list of latencies
+    :param fraction: the percentile as a fraction, e.g. 0.99
+    :return: the latency at the given percentile
+    """
+
+    return latencies[int(fraction*(len(latencies) - 1))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latency of quiet lanes under a noisy-neighbour load")
+    parser.add_argument("--ticks", type=int, default=100000, help="the number of simulated ticks")
+    parser.add_argument("--quiet-lanes", type=int, default=5, help="the number of quiet lanes")
+    parser.add_argument("--capacity", type=int, default=10, help="the number of elements dequeued per tick")
+    parser.add_argument("--burst", type=int, default=180, help="the number of elements in a burst of the noisy lane")
+    parser.add_argument("--period", type=int, default=20, help="the number of ticks between two bursts")
+    arguments = parser.parse_args()
+    workload = (arguments.ticks, arguments.quiet_lanes, arguments.capacity, arguments.burst, arguments.period)
+
+    shared = Queue(tuple)
+    fair = FairQueue(tuple)
+    results = {
+        "Queue": simulate(shared, lambda item, lane: shared.enqueue(item), *workload),
+        "FairQueue": simulate(fair, fair.enqueue, *workload)
+    }
+
+    print("quiet lane latency in ticks")
+    print("{0:>10} {1:>6} {2:>6} {3:>6} {4:>6} {5:>10}".format("queue", "p50", "p99", "p99.9", "max", "us/op"))
+    for name, (latencies, operation_time) in results.items():
+        print("{0:>10} {1:>6} {2:>6} {3:>6} {4:>6} {5:>10.2f}".format(
+            name, percentile(latencies, 0.5), percentile(latencies, 0.99), percentile(latencies, 0.999), latencies[-1],
+            operation_time))
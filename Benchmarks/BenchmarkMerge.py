@@ -0,0 +1,96 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of PriorityQueue.merge() and DuplicatePriorityQueue.merge() - merging per-tenant queues into a global queue,
+# compared with draining every tenant queue and enqueueing its elements one by one
+# run from the root of the repository with: python -m Benchmarks.BenchmarkMerge
+import argparse
+from random import sample
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import PriorityQueue, DuplicatePriorityQueue
+
+
+def tenant_queues(queue_class, tenants, elements):
+    """
+    creates the queues of the tenants, every element is its own priority and the priorities of the queues don't overlap
+
+    :param queue_class: PriorityQueue or DuplicatePriorityQueue
+    :param tenants: the number of tenant queues
+    :param elements: the number of elements in each queue
+    :return: a list with the queues
+    """
+
+    priorities = sample(range(10*tenants*elements), tenants*elements)
+    queues = []
+    for tenant in range(tenants):
+        queue = queue_class(int)
+        queue.enqueue_many([(priority, priority) for priority in priorities[tenant*elements:(tenant + 1)*elements]])
+        queues.append(queue)
+
+    return queues
+
+
+def merge(queue_class, queues):
+    """
+    merges the queues into a new global queue with merge()
+
+    :param queue_class: PriorityQueue or DuplicatePriorityQueue
+    :param queues: the queues of the tenants
+    :return: the number of seconds elapsed
+    """
+
+    start = perf_counter()
+    merged = queue_class(int)
+    for queue in queues:
+        merged.merge(queue)
+
+    return perf_counter() - start
+
+
+def drain(queue_class, queues):
+    """
+    merges the queues into a new global queue by dequeueing every element and enqueueing it in the global queue
+
+    :param queue_class: PriorityQueue or DuplicatePriorityQueue
+    :param queues: the queues of the tenants
+    :return: the number of seconds elapsed
+    """
+
+    start = perf_counter()
+    merged = queue_class(int)
+    for queue in queues:
+        while queue.size > 0:
+            element = queue.dequeue()
+            merged.enqueue(element, element)
+
+    return perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merging priority queues with merge() and by draining them")
+    parser.add_argument("--tenants", type=int, default=10, help="the number of tenant queues")
+    parser.add_argument("--elements", type=int, default=10000, help="the number of elements in each tenant queue")
+    arguments = parser.parse_args()
+
+    print("{0:>22} {1:>12} {2:>12}".format("queue", "merge (s)", "drain (s)"))
+    for queue_class in (PriorityQueue, DuplicatePriorityQueue):
+        queues = tenant_queues(queue_class, arguments.tenants, arguments.elements)
+        merge_time = merge(queue_class, queues)
+        # draining empties the queues, so it is measured last
+        drain_time = drain(queue_class, queues)
+        print("{0:>22} {1:>12.3f} {2:>12.3f}".format(queue_class.__name__, merge_time, drain_time))
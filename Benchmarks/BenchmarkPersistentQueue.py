@@ -0,0 +1,71 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the PersistentQueue - MB/s of enqueueing and dequeueing records of various sizes, syncing to disk after
+# every operation and in batches
+# run from the root of the repository with: python -m Benchmarks.BenchmarkPersistentQueue
+import argparse
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from DataStructures.DurableDataStructures import PersistentQueue
+
+
+def throughput(path, record_size, megabytes, sync_every):
+    """
+    enqueues and then dequeues records of a given size in a new persistent queue
+
+    :param path: the path for the files of the queue
+    :param record_size: the size of a record in bytes
+    :param megabytes: the total size of the records in MB
+    :param sync_every: the sync_every argument of the queue
+    :return: a tuple with the MB/s of enqueueing and of dequeueing the records
+    """
+
+    record = os.urandom(record_size)
+    records = max(1, megabytes * 2**20 // record_size)
+
+    with PersistentQueue(path, bytes, segment_size=16 * 2**20, sync_every=sync_every) as queue:
+        start = perf_counter()
+        for _ in range(records):
+            queue.enqueue(record)
+        queue.flush()
+        enqueued = perf_counter()
+        for _ in range(records):
+            queue.dequeue()
+        queue.flush()
+        dequeued = perf_counter()
+
+    size = records * record_size / 2**20
+    return size / (enqueued - start), size / (dequeued - enqueued)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the PersistentQueue for various record sizes")
+    parser.add_argument("--megabytes", type=int, default=16, help="the total size of the records for each measurement")
+    arguments = parser.parse_args()
+
+    print("{0:>12} {1:>10} {2:>14} {3:>14}".format("record size", "sync_every", "enqueue MB/s", "dequeue MB/s"))
+    with TemporaryDirectory() as directory:
+        for record_size in (64, 1024, 16384, 262144):
+            for sync_every in (1, 100, 10000):
+                # syncing every small record takes too long for the whole size, so fewer records are written
+                megabytes = arguments.megabytes if sync_every > 1 or record_size >= 16384 else 1
+                path = os.path.join(directory, "queue-{0}-{1}".format(record_size, sync_every))
+                print("{0:>12} {1:>10} {2:>14.1f} {3:>14.1f}".format(
+                    record_size, sync_every, *throughput(path, record_size, megabytes, sync_every)))
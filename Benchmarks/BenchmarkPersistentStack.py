@@ -0,0 +1,112 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the PersistentStack - a depth-first search, which keeps a snapshot of the path to every visited node,
+# compared with copying a Stack for every snapshot
+# run from the root of the repository with: python -m Benchmarks.BenchmarkPersistentStack
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from DataStructures.AbstractDataStructures import Stack, PersistentStack
+
+
+def persistent_search(branching, depth):
+    """
+    searches a complete tree, the path to a node is a new version of the path to its parent, which shares all elements
+    of the parent's path
+
+    :param branching: the number of children of an inner node
+    :param depth: the depth of the tree
+    :return: a list with the snapshots of the paths to all nodes
+    """
+
+    snapshots = []
+    pending = [PersistentStack(int).push(0)]
+    while len(pending) > 0:
+        path = pending.pop()
+        snapshots.append(path)
+        if path.size <= depth:
+            node = path.peek()
+            pending.extend(path.push(node*branching + child + 1) for child in range(branching))
+
+    return snapshots
+
+
+def copying_search(branching, depth):
+    """
+    searches a complete tree with a single mutable path, which is copied to a new Stack for every snapshot
+
+    :param branching: the number of children of an inner node
+    :param depth: the depth of the tree
+    :return: a list with the snapshots of the paths to all nodes
+    """
+
+    snapshots = []
+    path = Stack(int)
+
+    def visit(node):
+        path.push(node)
+        snapshot = Stack(int)
+        # the view iterates from the top to the bottom of the stack, so it is reversed to keep the order of the elements
+        snapshot.push_many(reversed(list(path.view())))
+        snapshots.append(snapshot)
+        if path.size <= depth:
+            for child in range(branching):
+                visit(node*branching + child + 1)
+        path.pop()
+
+    visit(0)
+    return snapshots
+
+
+def measure(search, branching, depth):
+    """
+    runs a search and measures its time and the memory of the snapshots
+
+    :param search: persistent_search or copying_search
+    :param branching: the number of children of an inner node
+    :param depth: the depth of the tree
+    :return: a tuple with the number of snapshots, the time in seconds and the memory of the snapshots in MB
+    """
+
+    start = perf_counter()
+    snapshots = search(branching, depth)
+    elapsed = perf_counter() - start
+    del snapshots
+
+    # the memory is measured in a separate run, since tracing the allocations slows down the search
+    tracemalloc.start()
+    snapshots = search(branching, depth)
+    memory = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+
+    return len(snapshots), elapsed, memory
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot-heavy depth-first search with PersistentStack and Stack")
+    parser.add_argument("--branching", type=int, default=3, help="the number of children of an inner node")
+    arguments = parser.parse_args()
+
+    print("{0:>6} {1:>10} {2:>16} {3:>16} {4:>16} {5:>16}".format("depth", "snapshots", "persistent (s)", "copying (s)",
+                                                                    "persistent (MB)", "copying (MB)"))
+    for depth in (4, 6, 8, 10):
+        snapshots, persistent_time, persistent_memory = measure(persistent_search, arguments.branching, depth)
+        _, copying_time, copying_memory = measure(copying_search, arguments.branching, depth)
+        print("{0:>6} {1:>10} {2:>16.3f} {3:>16.3f} {4:>16.1f} {5:>16.1f}".format(
+            depth, snapshots, persistent_time, copying_time, persistent_memory, copying_memory))
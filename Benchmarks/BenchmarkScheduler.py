@@ -0,0 +1,70 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the Scheduler - dispatches 10 million events (by default) scheduled by a population of simulated entities
+# and reports the instrumentation of the scheduler; with the default arguments it runs for a few minutes
+# run from the root of the repository with: python -m Benchmarks.BenchmarkScheduler
+import argparse
+import random
+from time import perf_counter
+
+from DataStructures.SchedulingDataStructures import Scheduler
+
+
+def simulate(events, entities, time_type):
+    """
+    every entity schedules its next event a random time after its current event until the given number of events have
+    been scheduled, so the queue depth stays equal to the number of entities
+
+    :param events: the total number of events to dispatch
+    :param entities: the number of simulated entities
+    :param time_type: the time type of the scheduler - with int many events share the same time and are batched
+    :return: the scheduler after all events have been dispatched and the wall-clock time of the simulation in seconds
+    """
+
+    random.seed(35)
+    scheduler = Scheduler(time_type)
+    scheduled = [0]
+
+    def event():
+        if scheduled[0] < events:
+            scheduled[0] += 1
+            scheduler.schedule(scheduler.now + time_type(random.expovariate(0.01)), event)
+
+    for _ in range(min(entities, events)):
+        scheduled[0] += 1
+        scheduler.schedule(time_type(random.expovariate(0.01)), event)
+
+    start = perf_counter()
+    scheduler.run_until(float("inf") if time_type == float else 2**62)
+
+    return scheduler, perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dispatching events with the discrete-event scheduler")
+    parser.add_argument("--events", type=int, default=10**7, help="the number of dispatched events")
+    parser.add_argument("--entities", type=int, default=1000, help="the number of simulated entities")
+    arguments = parser.parse_args()
+
+    print("{0:>6} {1:>12} {2:>10} {3:>14} {4:>16} {5:>14}".format("time", "events", "wall (s)", "events/s",
+                                                                   "max queue depth", "max lag (ms)"))
+    for time_type in (float, int):
+        scheduler, elapsed = simulate(arguments.events, arguments.entities, time_type)
+        print("{0:>6} {1:>12} {2:>10.1f} {3:>14.0f} {4:>16} {5:>14.3f}".format(
+            time_type.__name__, scheduler.dispatched, elapsed, scheduler.events_per_second, scheduler.max_queue_depth,
+            scheduler.max_lag * 1000))
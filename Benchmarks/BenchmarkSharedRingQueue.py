@@ -0,0 +1,115 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the SharedRingQueue - throughput of passing records from a producer process to a consumer process,
+# compared with multiprocessing.Queue
+# run from the root of the repository with: python -m Benchmarks.BenchmarkSharedRingQueue
+import argparse
+import multiprocessing
+from time import perf_counter, sleep
+
+from DataStructures.ConcurrentDataStructures import SharedRingQueue
+from DataStructures.Errors import EmptyQueueError, FullQueueError
+
+
+def produce_ring(queue, records):
+    """
+    enqueues records in a shared ring queue, spinning while the queue is full
+
+    :param queue: the shared ring queue
+    :param records: the number of records to enqueue
+    """
+
+    for index in range(records):
+        while True:
+            try:
+                queue.enqueue((index, 0.5))
+                break
+            except FullQueueError:
+                # gives up the CPU, so that spinning doesn't starve the consumer on a machine with few cores
+                sleep(0)
+    queue.close()
+
+
+def produce_multiprocessing(queue, records):
+    """
+    puts records in a multiprocessing queue, blocking while the queue is full
+
+    :param queue: the multiprocessing queue
+    :param records: the number of records to put
+    """
+
+    for index in range(records):
+        queue.put((index, 0.5))
+
+
+def ring_throughput(records, capacity):
+    """
+    passes records from a child process to this process through a shared ring queue
+
+    :param records: the number of records
+    :param capacity: the capacity of the queue
+    :return: the number of records per second
+    """
+
+    with SharedRingQueue("<qd", capacity) as queue:
+        producer = multiprocessing.Process(target=produce_ring, args=(queue, records))
+        start = perf_counter()
+        producer.start()
+        for _ in range(records):
+            while True:
+                try:
+                    queue.dequeue()
+                    break
+                except EmptyQueueError:
+                    sleep(0)
+        elapsed = perf_counter() - start
+        producer.join()
+
+    return records / elapsed
+
+
+def multiprocessing_throughput(records, capacity):
+    """
+    passes records from a child process to this process through a multiprocessing queue
+
+    :param records: the number of records
+    :param capacity: the capacity of the queue
+    :return: the number of records per second
+    """
+
+    queue = multiprocessing.Queue(capacity)
+    producer = multiprocessing.Process(target=produce_multiprocessing, args=(queue, records))
+    start = perf_counter()
+    producer.start()
+    for _ in range(records):
+        queue.get()
+    elapsed = perf_counter() - start
+    producer.join()
+
+    return records / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the SharedRingQueue and multiprocessing.Queue")
+    parser.add_argument("--records", type=int, default=200000, help="the number of records passed through each queue")
+    arguments = parser.parse_args()
+
+    print("{0:>10} {1:>20} {2:>24}".format("capacity", "SharedRingQueue", "multiprocessing.Queue"))
+    for capacity in (64, 1024, 16384):
+        print("{0:>10} {1:>10.0f} records/s {2:>14.0f} records/s".format(
+            capacity, ring_throughput(arguments.records, capacity), multiprocessing_throughput(arguments.records, capacity)))
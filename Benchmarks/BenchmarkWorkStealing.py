@@ -0,0 +1,169 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Benchmark of the WorkStealingExecutor - a recursive divide-and-conquer workload with 1 to 32 worker threads, compared
+# with a pool of threads sharing a single BlockingQueue
+# only threads are measured - the deques of the executor are objects in the memory of a process, so the executor has no
+# process-based variant to compare with; since CPU-bound threads are serialised by the GIL, the benchmark measures the
+# scheduling overhead of the two designs rather than a parallel speed-up
+# run from the root of the repository with: python -m Benchmarks.BenchmarkWorkStealing
+import argparse
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from DataStructures.ConcurrentDataStructures import BlockingQueue, WorkStealingExecutor
+
+
+class SharedQueuePool(object):
+    """
+    a pool of worker threads, which take the tasks from a single shared BlockingQueue
+    """
+
+    def __init__(self, workers):
+        """
+        constructor for the pool, starts the worker threads
+
+        :param workers: the number of worker threads
+        """
+
+        self.__tasks = BlockingQueue(tuple)
+        self.__threads = [Thread(target=self.__work, daemon=True) for _ in range(workers)]
+        for thread in self.__threads:
+            thread.start()
+
+    def submit(self, function, *args):
+        """
+        schedules a function to be called with the given arguments
+
+        :param function: the function to call
+        :param args: the arguments of the function
+        """
+
+        self.__tasks.enqueue((function, args))
+
+    def shutdown(self):
+        """
+        stops the worker threads after all submitted tasks have been run
+        """
+
+        for _ in self.__threads:
+            self.__tasks.enqueue(())
+        for thread in self.__threads:
+            thread.join()
+
+    def __work(self):
+        """
+        the loop of a worker thread
+        """
+
+        while True:
+            task = self.__tasks.dequeue()
+            if len(task) == 0:
+                return
+            function, args = task
+            function(*args)
+
+
+class SumTask(object):
+    """
+    sums a range of integers by recursively splitting it in halves, every half is submitted as a new task until it is
+    smaller than the leaf size - the partial sums are added to a total and an event is set when all leaves are done
+    """
+
+    def __init__(self, pool, size, leaf):
+        """
+        constructor for the task
+
+        :param pool: the executor or the pool running the tasks
+        :param size: the size of the summed range
+        :param leaf: the size of a range, which is summed sequentially
+        """
+
+        self.__pool = pool
+        self.__leaf = leaf
+        self.__lock = Lock()
+        self.__total = 0
+        self.__remaining = size
+        self.__done = Event()
+
+    def run(self, low, high):
+        """
+        the task - sums the range from low to high or splits it in two subtasks
+
+        :param low: the first integer of the range
+        :param high: the integer after the last integer of the range
+        """
+
+        if high - low <= self.__leaf:
+            partial = sum(range(low, high))
+            with self.__lock:
+                self.__total += partial
+                self.__remaining -= high - low
+                if self.__remaining == 0:
+                    self.__done.set()
+            return
+
+        middle = (low + high) // 2
+        self.__pool.submit(self.run, low, middle)
+        self.__pool.submit(self.run, middle, high)
+
+    def wait(self):
+        """
+        waits until the whole range has been summed
+
+        :return: the sum of the range
+        """
+
+        self.__done.wait()
+        return self.__total
+
+
+def measure(pool, size, leaf):
+    """
+    runs the workload and measures its time
+
+    :param pool: the executor or the pool running the tasks
+    :param size: the size of the summed range
+    :param leaf: the size of a range, which is summed sequentially
+    :return: the number of seconds elapsed
+    """
+
+    start = perf_counter()
+    task = SumTask(pool, size, leaf)
+    pool.submit(task.run, 0, size)
+    total = task.wait()
+    elapsed = perf_counter() - start
+    assert total == size*(size - 1) // 2
+
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recursive tasks with work stealing and with a shared queue")
+    parser.add_argument("--size", type=int, default=2**22, help="the size of the summed range")
+    parser.add_argument("--leaf", type=int, default=256, help="the size of a range summed sequentially")
+    arguments = parser.parse_args()
+
+    print("{0:>8} {1:>22} {2:>22} {3:>8}".format("threads", "WorkStealingExecutor", "shared BlockingQueue", "steals"))
+    for threads in (1, 2, 4, 8, 16, 32):
+        with WorkStealingExecutor(threads) as executor:
+            stealing = measure(executor, arguments.size, arguments.leaf)
+            steals = executor.steals
+        pool = SharedQueuePool(threads)
+        shared = measure(pool, arguments.size, arguments.leaf)
+        pool.shutdown()
+        print("{0:>8} {1:>20.3f} s {2:>20.3f} s {3:>8}".format(threads, stealing, shared, steals))
@@ -15,215 +15,398 @@ limitations under the License.
 """
 
 
+from array import array
 from copy import deepcopy
-from collections import deque
+from collections import Counter, deque
+from threading import Condition
+from time import monotonic
 
 from DataStructures.Errors import *
-from DataStructures.TreeDataStructures import MaxBinaryHeap, MinBinaryHeap
+from DataStructures.TreeDataStructures import MaxBinaryHeap, MinBinaryHeap, MinMaxBinaryHeap, AVLTree
 
 
-class Stack(object):
+# the policies of a bounded stack or queue for adding an element when it is full
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "raise", "block")
+
+# the array type codes used by compact stacks and queues for each supported type of elements
+COMPACT_TYPECODES = {int: "q", float: "d"}
+
+# the smallest and the largest integer, which fit in the type code of a compact stack or queue of int elements
+COMPACT_INT_RANGE = (-2**63, 2**63 - 1)
+
+
+class ArrayDeque(object):
     """
-    Implementation for the abstract data structure called Stack - follows the principle Last In First Out.
-    The current implementation is just a wrapper around the python deque object with proper naming conventions and type
-    checking.
+    A double-ended queue of numbers stored unboxed in a growable circular array.array, used as the storage of compact
+    stacks and queues. It supports the subset of the deque interface used by Stack and Queue, including the maxlen
+    argument, and stores each element in 8 bytes instead of a pointer to a boxed Python object.
     """
 
-    def __init__(self, elements_type=None):
+    def __init__(self, typecode, maxlen=None):
         """
-        a constructor for a stack
+        constructor for the array deque
 
-        :param elements_type: optional argument, which represents the type of data in the stack (int, str, float, etc.)
-             default value is None, which means that the stack can contain elements of all types,
-             otherwise, it can contain only elements of the specified type
-        :raises StackTypeError: in case the 'elements_type' argument is not a valid type
+        :param typecode: the array.array type code of the elements, e.g. "q" for 64-bit integers or "d" for floats
+        :param maxlen: the maximum number of elements, when the deque is full appending an element drops the element at
+            the front, None (default) means the deque is unbounded
         """
 
-        # checking that the elements_type argument is a valid type if passed
-        if elements_type is not None and type(elements_type) != type:
-            raise StackTypeError("{0} is not a valid type for a stack.".format(elements_type))
+        self.__typecode = typecode
+        self.__array = array(typecode, [0])*16
+        self.__head = 0
+        self.__size = 0
+        self.__maxlen = maxlen
 
-        # the elements in the stack are stored in a python deque object
-        self.__elements = deque()
-        self.__elements_type = elements_type
+        # the number of changes of the deque, used by its iterators to detect changes during the iteration, same as the
+        # state counter of the python deque
+        self.__state = 0
 
     def __str__(self):
         """
-        the string representation for the stack returns the string representation of the deque object
+        the string representation of the array deque
+
+        :return: a string in the form ArrayDeque('q', [1, 2, 3])
         """
 
-        return str(self.__elements)
+        return "ArrayDeque({0!r}, {1})".format(self.__typecode, list(self))
 
     def __repr__(self):
         """
-        the repr representation for the stack returns the repr representation of the deque object
+        the repr representation of the array deque
+
+        :return: same as str()
         """
 
-        return repr(self.__elements)
+        return str(self)
 
     def __len__(self):
         """
-        overriding this method so that the len(stack) syntax can be used, where stack is an object of type Stack
+        overriding this method allows the use of the len(deque) syntax
 
-        :return: calls the size() method of the stack to get the number of elements in the stack
+        :return: the number of elements in the deque
         """
 
-        return self.size
+        return self.__size
 
     def __iter__(self):
         """
-        overriding this method allows the use of an iterator for a Stack object
+        overriding this method allows iterating over the deque without removing its elements
 
-        :return: returns a reference to the object itself
+        :return: a generator of the elements from the front to the back of the deque
+        :raises RuntimeError: if the deque is changed during the iteration
         """
 
-        return self
+        return self.__iterate(range(self.__size), self.__state)
 
-    def __next__(self):
+    def __reversed__(self):
         """
-        overriding this method implements the next() method of the iterator so that the Stack object is iterable
+        overriding this method allows iterating over the deque in reverse order without removing its elements
 
-        :return: calls the pop() method to return the appropriate element and remove it from the stack
-        :raises StopIteration: if the stack is empty
+        :return: a generator of the elements from the back to the front of the deque
+        :raises RuntimeError: if the deque is changed during the iteration
         """
 
-        if self.size == 0:
-            raise StopIteration
-        else:
-            return self.pop()
+        return self.__iterate(range(self.__size - 1, -1, -1), self.__state)
+
+    def __iterate(self, positions, state):
+        """
+        a generator of the elements at the given positions, the position of the front of the deque is read on every step,
+        since exporting a memoryview can move the elements without changing the deque
+
+        :param positions: an iterable with the positions counted from the front of the deque
+        :param state: the number of changes of the deque when the iterator was created, the generator body only runs when
+            the first element is requested, so the state cannot be read in it
+        :raises RuntimeError: if the deque is changed during the iteration
+        """
+
+        for index in positions:
+            if self.__state != state:
+                raise RuntimeError("ArrayDeque mutated during iteration")
+            yield self.__array[(self.__head + index) % len(self.__array)]
+
+        if self.__state != state:
+            raise RuntimeError("ArrayDeque mutated during iteration")
+
+    def __getitem__(self, index):
+        """
+        overriding this method allows the deque[index] syntax
+
+        :param index: the position of an element, negative positions are counted from the back of the deque
+        :return: the element at this position
+        :raises IndexError: if the position is out of range
+        """
+
+        if index < 0:
+            index += self.__size
+
+        if index < 0 or index >= self.__size:
+            raise IndexError("ArrayDeque index out of range")
+
+        return self.__array[(self.__head + index) % len(self.__array)]
 
     def __contains__(self, item):
         """
-        overriding this method allows the use of the 'item in stack' syntax, where 'item' is some value, while stack
-        is an object of type Stack
+        overriding this method allows the 'item in deque' syntax
 
-        :param item: the value to search for in the stack
-        :return: calls the contains() method to check if the stack contains this value
+        :param item: the element to search for
+        :return: True if the element is in the deque and False otherwise
         """
 
-        return self.contains(item)
+        try:
+            self.__find(item)
+            return True
+        except ValueError:
+            return False
 
     @property
-    def size(self):
+    def maxlen(self):
         """
-        this method gets the number of elements in the stack
+        a getter for the maximum length of the deque
 
-        :return: the number of elements in the deque object, which contains the elements of the stack
+        :return: the maximum number of elements in the deque or None if the deque is unbounded
         """
 
-        return len(self.__elements)
+        return self.__maxlen
 
     @property
-    def type(self):
+    def typecode(self):
         """
-        this method gets the type of elements in the stack
+        a getter for the type code of the deque
 
-        :return: the type of elements in the stack or None if there are elements of multiple types in the stack
+        :return: the array.array type code of the elements
         """
 
-        return self.__elements_type
+        return self.__typecode
 
-    def contains(self, item):
+    def append(self, item):
         """
-        this method checks if a value is contained in the stack
+        adds an element at the back of the deque, doubling the array if it is full
 
-        :param item: the value to search for in the stack
-        :return: True if the value is contained in the list with elements of the stack and False otherwise
-        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the 'item'
-            argument used when calling this method
+        :param item: the element to add
+        :raises TypeError: if the element cannot be stored with the type code of the deque
+        :raises OverflowError: if an integer doesn't fit in the type code of the deque
         """
 
-        if self.__elements_type is None or type(item) == self.__elements_type:
-            return item in self.__elements
+        if self.__size == len(self.__array):
+            self.__resize(2*len(self.__array))
+
+        self.__array[(self.__head + self.__size) % len(self.__array)] = item
+        self.__state += 1
+        if self.__maxlen is not None and self.__size == self.__maxlen:
+            self.__head = (self.__head + 1) % len(self.__array)
         else:
-            raise StackTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+            self.__size += 1
 
-    def push(self, item):
+    def extend(self, items):
         """
-        this method pushes an element on top of the stack
+        adds many elements at the back of the deque, copying them in at most two slices of the array
 
-        :param item: the element to push in the stack
-        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the
-            'item' argument used when calling this method
+        :param items: an iterable with the elements to add
+        :raises TypeError: if any of the elements cannot be stored with the type code of the deque
+        :raises OverflowError: if an integer doesn't fit in the type code of the deque
         """
 
-        if self.__elements_type is None or type(item) == self.__elements_type:
-            self.__elements.append(item)
-        else:
-            raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.__elements_type))
+        items = array(self.__typecode, items)
+        self.__state += 1
+        if self.__maxlen is not None:
+            items = items[max(0, len(items) - self.__maxlen):]
+            dropped = max(0, self.__size + len(items) - self.__maxlen)
+            self.__head = (self.__head + dropped) % len(self.__array)
+            self.__size -= dropped
+
+        if self.__size + len(items) > len(self.__array):
+            capacity = len(self.__array)
+            while capacity < self.__size + len(items):
+                capacity *= 2
+            self.__resize(capacity)
+
+        start = (self.__head + self.__size) % len(self.__array)
+        first = min(len(items), len(self.__array) - start)
+        self.__array[start:start + first] = items[:first]
+        self.__array[:len(items) - first] = items[first:]
+        self.__size += len(items)
 
     def pop(self):
         """
-        this method pops the top element out of the stack (the last pushed element in the stack)
+        removes the element at the back of the deque
 
-        :return: the top element in the stack
-        :raises EmptyStackError: if there are no elements in the stack
+        :return: the removed element
+        :raises IndexError: if the deque is empty
         """
 
-        if self.size > 0:
-            return self.__elements.pop()
-        else:
-            raise EmptyStackError("There are no elements in the stack")
+        if self.__size == 0:
+            raise IndexError("pop from an empty ArrayDeque")
 
-    def peek(self):
+        self.__state += 1
+        self.__size -= 1
+
+        return self.__array[(self.__head + self.__size) % len(self.__array)]
+
+    def popleft(self):
         """
-        this method peeks the top element of the stack, same as the pop() method,
-        but without removing the element from the stack
+        removes the element at the front of the deque
 
-        :return: the last pushed element in the stack or None if there are no elements in the stack
+        :return: the removed element
+        :raises IndexError: if the deque is empty
         """
 
-        if self.size > 0:
-            return self.__elements[-1]
-        else:
-            return None
+        if self.__size == 0:
+            raise IndexError("pop from an empty ArrayDeque")
 
-    def remove(self, element):
+        self.__state += 1
+        item = self.__array[self.__head]
+        self.__head = (self.__head + 1) % len(self.__array)
+        self.__size -= 1
+
+        return item
+
+    def remove(self, item):
         """
-        this method removes an element from the stack
+        removes the first occurrence of an element
 
-        :param element: the element to remove from the stack
-        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the 'element'
-            argument used when calling this method
-        :raises StackElementError: if the element to remove is not contained in the stack
+        :param item: the element to remove
+        :raises ValueError: if the element is not in the deque
         """
 
-        if self.__elements_type is None or type(element) == self.__elements_type:
-            try:
-                self.__elements.remove(element)
-            except ValueError:
-                raise StackElementError("The element {0} that you are trying to remove is not contained in the stack.".format(element))
+        index = self.__find(item)
+        self.__state += 1
+        self.__resize(len(self.__array))
+        del self.__array[index]
+        self.__array.append(0)
+        self.__size -= 1
+
+    def memoryview(self):
+        """
+        exports the elements from the front to the back of the deque without copying them, the elements are moved to the
+        beginning of the array first if they wrap around its end; the view must be released before the deque is changed
+
+        :return: a memoryview of the elements
+        """
+
+        if self.__head + self.__size > len(self.__array):
+            self.__resize(len(self.__array))
+
+        return memoryview(self.__array)[self.__head:self.__head + self.__size]
+
+    def __find(self, item):
+        """
+        finds the position of the first occurrence of an element
+
+        :param item: the element to search for
+        :return: the position of the element counted from the front of the deque
+        :raises ValueError: if the element is not in the deque
+        """
+
+        capacity = len(self.__array)
+        end = self.__head + self.__size
+        try:
+            return self.__array.index(item, self.__head, min(end, capacity)) - self.__head
+        except (ValueError, TypeError):
+            if end <= capacity:
+                raise ValueError("The element is not in the ArrayDeque")
+
+        try:
+            return self.__array.index(item, 0, end - capacity) + capacity - self.__head
+        except (ValueError, TypeError):
+            raise ValueError("The element is not in the ArrayDeque")
+
+    def __resize(self, capacity):
+        """
+        copies the elements to a new array with the given capacity, starting from its beginning
+
+        :param capacity: the number of slots in the new array, must not be less than the number of elements
+        """
+
+        end = self.__head + self.__size
+        if end <= len(self.__array):
+            elements = self.__array[self.__head:end]
         else:
-            raise StackTypeError("The element {0} that you are trying to remove is not of type {1}".format(element, self.__elements_type))
+            elements = self.__array[self.__head:] + self.__array[:end - len(self.__array)]
 
+        self.__array = elements + array(self.__typecode, [0])*(capacity - self.__size)
+        self.__head = 0
 
-class Queue(object):
+
+class Stack(object):
     """
-    Implementation for the abstract data structure called Queue - follows the principle First In First Out.
+    Implementation for the abstract data structure called Stack - follows the principle Last In First Out.
     The current implementation is just a wrapper around the python deque object with proper naming conventions and type
     checking.
     """
 
-    def __init__(self, elements_type=None):
+    def __init__(self, elements_type=None, maxlen=None, overflow="drop_oldest", compact=False, indexed=False):
         """
-        a constructor for a Queue
+        a constructor for a stack
 
-        :param elements_type: optional argument, which represents the type of elements in the queue
-            default value is None, which means that the queue can contain elements of all types,
-            otherwise, the queue can only contain elements of the specified type
-        :raises QueueTypeError: if the 'elements_type' argument is specified and is not a valid type
+        :param elements_type: optional argument, which represents the type of data in the stack (int, str, float, etc.)
+             default value is None, which means that the stack can contain elements of all types,
+             otherwise, it can contain only elements of the specified type
+        :param maxlen: optional argument, the maximum number of elements in the stack, default value is None, which
+            means that the stack is unbounded
+        :param overflow: the policy for pushing an element when the stack is full - "drop_oldest" (default) drops the
+            element at the bottom of the stack, "drop_newest" drops the pushed element, "raise" raises a FullStackError
+            and "block" waits until another thread pops an element
+        :param compact: a boolean, if set to True the elements are stored unboxed in an array.array instead of a deque,
+            which uses about 4 times less memory, only allowed if the type of elements is int or float, default is False;
+            the integers in a compact stack must fit in 64 bits, otherwise a ValueError is raised when they are added
+        :param indexed: a boolean, if set to True the stack keeps a counter of its elements, which makes contains() take
+            O(1) time and remove() fail in O(1) time if the element is missing, the elements must be hashable,
+            default is False
+        :raises StackTypeError: in case the 'elements_type' argument is not a valid type
+        :raises StackTypeError: if compact is not a boolean or it is True, but the type of elements is not int or float
+        :raises StackTypeError: if indexed is not a boolean
+        :raises StackTypeError: if the maxlen argument is not an integer
+        :raises ValueError: if the maxlen argument is not positive or the overflow argument is not a valid policy
         """
 
         # checking that the elements_type argument is a valid type if passed
         if elements_type is not None and type(elements_type) != type:
-            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+            raise StackTypeError("{0} is not a valid type for a stack.".format(elements_type))
+
+        if maxlen is not None and type(maxlen) != int:
+            raise StackTypeError("The maximum length of a stack must be an integer")
+
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("The maximum length of a stack must be a positive integer")
 
-        self.__elements = deque()  # elements in the queue are stored in a deque object
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("The overflow policy of a stack must be one of {0}".format(", ".join(OVERFLOW_POLICIES)))
+
+        if type(compact) != bool:
+            raise StackTypeError("{0} is not a valid boolean argument for initialising a stack.".format(compact))
+
+        if compact and elements_type not in COMPACT_TYPECODES:
+            raise StackTypeError("Only a stack of int or float elements can be compact")
+
+        if type(indexed) != bool:
+            raise StackTypeError("{0} is not a valid boolean argument for initialising a stack.".format(indexed))
+
+        # the elements in the stack are stored in a python deque object (or an array deque if the stack is compact),
+        # which drops the oldest elements by itself
+        deque_maxlen = maxlen if overflow == "drop_oldest" else None
+        if compact:
+            self.__elements = ArrayDeque(COMPACT_TYPECODES[elements_type], deque_maxlen)
+        else:
+            self.__elements = deque(maxlen=deque_maxlen)
         self.__elements_type = elements_type
+        self.__maxlen = maxlen
+        self.__overflow = overflow
+        self.__dropped = 0
+
+        # the integers in a compact stack are range-checked before they are added, so that a batch is rejected as a whole
+        # instead of failing inside the array
+        self.__int_range = COMPACT_INT_RANGE if compact and elements_type == int else None
+
+        # an indexed stack counts how many times each element is contained in it, the counter is updated whenever elements
+        # are added, removed or dropped
+        self.__counts = Counter() if indexed else None
+
+        # threads pushing to a full stack with the block policy wait on this condition
+        self.__not_full = Condition() if maxlen is not None and overflow == "block" else None
 
     def __str__(self):
         """
-        the str representation for the stack returns the str representation of the deque object
+        the string representation for the stack returns the string representation of the deque object
         """
 
         return str(self.__elements)
@@ -237,41 +420,42 @@ class Queue(object):
 
     def __len__(self):
         """
-        overriding this method allows the use of the len(queue) syntax, where queue is an object of type Queue
+        overriding this method so that the len(stack) syntax can be used, where stack is an object of type Stack
 
-        :return: calls the size() method to get the number of elements in the queue
+        :return: calls the size() method of the stack to get the number of elements in the stack
         """
 
         return self.size
 
     def __iter__(self):
         """
-        overriding this method allows the use of an iterator for the queue
+        overriding this method allows the use of an iterator for a Stack object
 
-        :return: reference to the queue object itself
+        :return: returns a reference to the object itself
         """
 
         return self
 
     def __next__(self):
         """
-        overriding this method implements the next method for the iterator
+        overriding this method implements the next() method of the iterator so that the Stack object is iterable
 
-        :return: calls the dequeue() method to get the appropriate value to return and remove it from the queue
-        :raises StopIteration: if there are no elements in the queue
+        :return: calls the pop() method to return the appropriate element and remove it from the stack
+        :raises StopIteration: if the stack is empty
         """
 
         if self.size == 0:
             raise StopIteration
         else:
-            return self.dequeue()
+            return self.pop()
 
     def __contains__(self, item):
         """
-        overriding this method allows the use of the 'item in queue' syntax, where the queue object is of type Queue
+        overriding this method allows the use of the 'item in stack' syntax, where 'item' is some value, while stack
+        is an object of type Stack
 
-        :param item: the item to search for in the queue
-        :return: calls the contains() method to check if the item is contained in the queue
+        :param item: the value to search for in the stack
+        :return: calls the contains() method to check if the stack contains this value
         """
 
         return self.contains(item)
@@ -279,9 +463,9 @@ class Queue(object):
     @property
     def size(self):
         """
-        this method gets the number of elements in the queue
+        this method gets the number of elements in the stack
 
-        :return: the number of elements in the queue
+        :return: the number of elements in the deque object, which contains the elements of the stack
         """
 
         return len(self.__elements)
@@ -289,678 +473,3378 @@ class Queue(object):
     @property
     def type(self):
         """
-        this method gets the type of elements in the queue
+        this method gets the type of elements in the stack
 
-        :return: the type of elements in the queue or None if the queue can contain all types of elements
+        :return: the type of elements in the stack or None if there are elements of multiple types in the stack
         """
 
         return self.__elements_type
 
-    def contains(self, item):
+    @property
+    def maxlen(self):
         """
-        this method checks if an item is contained in the queue
+        this method gets the maximum number of elements in the stack
 
-        :param item: the item to search for in the queue
-        :return: True if the item is contained in the queue and False otherwise
-        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        :return: the maximum length of the stack or None if the stack is unbounded
         """
 
-        if self.__elements_type is None or type(item) == self.__elements_type:
-            return item in self.__elements
-        else:
-            raise QueueTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+        return self.__maxlen
 
-    def enqueue(self, item):
+    @property
+    def overflow(self):
         """
-        this method enqueues an element in the queue
+        this method gets the overflow policy of the stack
 
-        :param item: the element to enqueue
-        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
-            of the 'item' argument used when calling this method
+        :return: the policy for pushing an element when the stack is full
         """
 
-        if self.__elements_type is None or type(item) == self.__elements_type:
-            self.__elements.append(item)
-        else:
-            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+        return self.__overflow
 
-    def dequeue(self):
+    @property
+    def dropped(self):
         """
-        this method removes the item that got first in the queue
+        this method gets the number of elements dropped because the stack was full
 
-        :raises EmptyQueueError: if there are no elements in the queue
+        :return: the number of dropped elements
         """
 
-        if self.size > 0:
-            return self.__elements.popleft()
-        else:
-            raise EmptyQueueError("There are no elements in the queue")
+        return self.__dropped
 
-    def peek(self):
+    @property
+    def compact(self):
         """
-        this method peeks the item that got first in the queue (without removing it)
+        this method checks if the elements of the stack are stored unboxed in an array
 
-        :return: the peeked item or None if there are no elements in the queue
+        :return: True if the stack is compact and False otherwise
         """
 
-        if self.size > 0:
-            return self.__elements[0]
-        else:
-            return None
+        return type(self.__elements) == ArrayDeque
 
-    def remove(self, element):
+    @property
+    def indexed(self):
         """
-        this method removes an element from the queue
+        this method checks if the stack keeps a counter of its elements
 
-        :param element: the element to remove from the queue
-        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
-            of the 'element' argument used when calling this method
-        :raises QueueElementError: if the element to remove is not contained in the queue
+        :return: True if the stack is indexed and False otherwise
         """
 
-        if self.__elements_type is None or type(element) == self.__elements_type:
-            try:
-                self.__elements.remove(element)
-            except ValueError:
-                raise QueueElementError("The element {0} that you are trying to remove is not contained in the queue.".format(element))
-        else:
-            raise QueueTypeError("The element {0} that you are trying to remove is not of type {1}.".format(element, self.__elements_type))
+        return self.__counts is not None
 
+    def __index(self, items):
+        """
+        counts the elements, which are added to an indexed stack, and finds the elements, which the deque drops by itself
+        with the drop_oldest policy, must be called before the elements are added; the counter itself is updated by
+        __reindex() only after the elements have been stored, so that it isn't changed if storing them fails
 
-class PriorityQueue(object):
-    """
-    Abstract Data Structure - represents a queue with priorities for elements
+        :param items: a list with the elements, which are added
+        :return: a tuple with a Counter of the added elements and a list of the dropped elements
+        :raises StackTypeError: if any of the elements is not hashable
+        """
 
-    NOTE: this implementation provides a one-to-one mapping of elements to priorities (bijective mapping), that is one element is linked to only one priority
-        and one priority is linked to only one element. Therefore, when adding an element in the queue, if there is already an element with the same priority, then the old element
-        would be overwritten.
-    """
+        overflow = 0
+        if self.__elements.maxlen is not None:
+            overflow = max(0, len(self.__elements) + len(items) - self.__elements.maxlen)
+        dropped = min(overflow, len(self.__elements))
+
+        try:
+            added = Counter(items[overflow - dropped:])
+        except TypeError:
+            raise StackTypeError("The elements of an indexed stack must be hashable")
 
-    def __init__(self, elements_type=None, reverse=False):
+        return added, [self.__elements[index] for index in range(dropped)]
+
+    def __reindex(self, added, dropped):
         """
-        constructor for the priority queue
+        updates the counter of an indexed structure after the elements counted by __index() have been stored
 
-        :param elements_type: denotes the type of elements that can be added to the queue, default is None, which allows
-            all types of elements
-        :param reverse: a boolean, which represents what kind of priority queue to use - if set to False(default) then
-            the dequeue() function returns the element with the greatest priority, if set to True - it returns the element with the least priority
-        :raises PriorityQueueTypeError: if a valid type is not given as argument or a boolean is not used for the reverse argument
+        :param added: a Counter of the added elements
+        :param dropped: a list of the elements, which the deque dropped
         """
 
-        if elements_type is not None and type(elements_type) != type:
-            raise PriorityQueueTypeError("{0} is not a valid type for initialising the priority queue".format(elements_type))
-
-        if type(reverse) != bool:
-            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(reverse))
-
-        if not reverse:
-            self.__indices = MaxBinaryHeap(int)
-        else:
-            self.__indices = MinBinaryHeap(int)
-
-        self.__elements = {}
-        self.__elements_type = elements_type
+        for item in dropped:
+            self.__unindex(item)
+        self.__counts.update(added)
 
-    def __str__(self):
+    def __unindex(self, item):
         """
-        a string representation of the priority queue
+        removes an element from the counter of an indexed stack
 
-        :return: the str representation of the dictionary with elements in the queue
+        :param item: the removed element
         """
 
-        return str(self.__elements)
+        count = self.__counts[item] - 1
+        if count > 0:
+            self.__counts[item] = count
+        else:
+            del self.__counts[item]
 
-    def __repr__(self):
+    def view(self):
         """
-        a repr representation of the priority queue
+        this method iterates over the elements of the stack without removing or copying them, unlike iterating over the
+        stack itself, which pops its elements
 
-        :return: the repr representation of the dictionary with elements in the queue
+        :return: a read-only iterator of the elements from the top to the bottom of the stack (LIFO order)
+        :raises RuntimeError: when the next element is requested, if the stack has been changed during the iteration
         """
 
-        return repr(self.__elements)
+        return reversed(self.__elements)
 
-    def __len__(self):
+    def _storage(self):
         """
-        overriding this method allows the 'len(priority_queue) syntax'
+        a protected hook for subclasses, which build operations on the atomic methods of the underlying storage, e.g. a
+        pop() without a size check, the subclass is responsible for keeping the counter of an indexed stack and the
+        maximum length in sync if it changes the storage
 
-        :return: the number of elements in the queue
+        :return: the deque (or the array deque of a compact stack) with the elements from the bottom to the top
         """
 
-        return self.size
+        return self.__elements
 
-    def __contains__(self, element):
+    def as_memoryview(self):
         """
-        overriding this method allows the 'element in priority_queue' syntax
+        this method exports the elements of a compact stack without copying them, the view must be released (or not used
+        any more) before the stack is changed
 
-        :param element: the element to search for
-        :return: True if there is an element linked to this priority and False otherwise
+        :return: a memoryview of the elements from the bottom to the top of the stack
+        :raises StackTypeError: if the stack is not compact
         """
 
-        return self.contains_element(element)
+        if type(self.__elements) != ArrayDeque:
+            raise StackTypeError("Only the elements of a compact stack can be exported to a memoryview")
 
-    def __iter__(self):
+        return self.__elements.memoryview()
+
+    def contains(self, item):
         """
-        overriding this method allows the use of an iterator with the priority queue
+        this method checks if a value is contained in the stack
 
-        :return: reference to the queue itself
+        :param item: the value to search for in the stack
+        :return: True if the value is contained in the list with elements of the stack and False otherwise
+        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the 'item'
+            argument used when calling this method
         """
 
-        return self
+        if self.__elements_type is None or type(item) == self.__elements_type:
+            if self.__counts is not None:
+                try:
+                    return item in self.__counts
+                except TypeError:
+                    return False
+            return item in self.__elements
+        else:
+            raise StackTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
 
-    def __next__(self):
+    def push(self, item):
         """
-        the next method used for the iterator
+        this method pushes an element on top of the stack
 
-        :return: uses dequeue to return the next element
-        :raises StopIteration: if the queue is empty
+        :param item: the element to push in the stack
+        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the
+            'item' argument used when calling this method
+        :raises FullStackError: if the stack is full and its overflow policy is "raise"
+        :raises ValueError: if the stack is compact and the element is an integer, which doesn't fit in 64 bits
         """
 
-        if self.size == 0:
-            raise StopIteration
-        else:
-            return self.dequeue()
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.__elements_type))
 
-    @property
-    def size(self):
-        """
-        this method gets the size of the queue
+        self.__check_range([item])
 
-        :return: the number of elements in the queue
-        """
+        if self.__not_full is not None:
+            with self.__not_full:
+                while len(self.__elements) >= self.__maxlen:
+                    self.__not_full.wait()
+                indexed = self.__index([item]) if self.__counts is not None else None
+                self.__elements.append(item)
+                if indexed is not None:
+                    self.__reindex(*indexed)
+            return
 
-        return len(self.__elements)
+        if self.__maxlen is not None and len(self.__elements) >= self.__maxlen:
+            if self.__overflow == "raise":
+                raise FullStackError("The stack is full, it cannot contain more than {0} elements".format(self.__maxlen))
+            # with the drop_oldest policy the deque drops the element at the bottom of the stack by itself
+            self.__dropped += 1
+            if self.__overflow == "drop_newest":
+                return
 
-    @property
-    def type(self):
+        indexed = self.__index([item]) if self.__counts is not None else None
+        self.__elements.append(item)
+        if indexed is not None:
+            self.__reindex(*indexed)
+
+    def __check_range(self, items):
         """
-        a getter for the type of elements in the queue
+        checks that the integers added to a compact stack fit in its type code, does nothing if the stack isn't a compact
+        stack of int elements
 
-        :return: the type of elements allowed in the queue
+        :param items: a list with the elements, which are added
+        :raises ValueError: if any of the integers doesn't fit in 64 bits
         """
 
-        return self.__elements_type
+        if self.__int_range is None:
+            return
 
-    @property
-    def reversed(self):
+        low, high = self.__int_range
+        for item in items:
+            if not low <= item <= high:
+                raise ValueError("The element {0} that you are trying to push doesn't fit in a compact stack".format(item))
+
+    def __notify_not_full(self, count):
         """
-        this method checks if the queue is reversed
+        wakes up threads waiting to push to the stack after elements have been removed, only used with the block policy
 
-        :return: True if the dequeue function returns the element in the least priority and False otherwise
+        :param count: the number of removed elements
         """
 
-        return type(self.__indices) == MinBinaryHeap
+        if self.__not_full is not None and count > 0:
+            with self.__not_full:
+                self.__not_full.notify(count)
 
-    def enqueue(self, item, priority):
+    def push_many(self, items):
         """
-        this method inserts an element into the queue with a given priority,
-        if the priority argument already exists in the queue, the element stored with this priority will be overwritten
-        by the new element
+        this method pushes many elements on top of the stack in the order they are given, the elements are validated in a
+        single pass and added at once, which is faster than calling push() for each element
+        (except with the block policy, where the validated elements are pushed one by one with push(), so other threads
+        can interleave with the batch while it waits for free space)
 
-        :param item: the item to insert
-        :param priority: the priority of the item
-        :raises PriorityQueueTypeError: if the priority argument is not an integer
-        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other elements in the queue
-            unless the type of the queue is None (all types allowed in this case)
+        :param items: an iterable with the elements to push
+        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of any of the
+            elements, in this case none of the elements is pushed
+        :raises ValueError: if the stack is compact and any of the elements is an integer, which doesn't fit in 64 bits, in
+            this case none of the elements is pushed
+        :raises FullStackError: if the elements don't fit in the stack and its overflow policy is "raise", in this case
+            none of the elements is pushed
         """
 
-        if type(priority) != int:
-            raise PriorityQueueTypeError("The priority of an element must be an integer")
+        items = list(items)
+        if self.__elements_type is not None:
+            for item in items:
+                if type(item) != self.__elements_type:
+                    raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.__elements_type))
 
-        if self.__elements_type is not None and type(item) != self.__elements_type:
-            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__elements_type))
+        self.__check_range(items)
 
-        if priority not in self.__elements:
-            self.__indices.add(priority)
-        self.__elements[priority] = item
+        if self.__maxlen is not None:
+            free = max(0, self.__maxlen - len(self.__elements))
+            if self.__overflow == "drop_oldest":
+                self.__dropped += max(0, len(items) - free)
+            elif self.__overflow == "drop_newest":
+                self.__dropped += max(0, len(items) - free)
+                items = items[:free]
+            elif self.__overflow == "raise" and len(items) > free:
+                raise FullStackError("The stack is full, it cannot contain more than {0} elements".format(self.__maxlen))
+            elif self.__overflow == "block":
+                for item in items:
+                    self.push(item)
+                return
 
-    def dequeue(self):
+        indexed = self.__index(items) if self.__counts is not None else None
+        self.__elements.extend(items)
+        if indexed is not None:
+            self.__reindex(*indexed)
+
+    def pop_many(self, n):
         """
-        this method takes the element with the greatest or the lowest priority depending on the reverse argument in the
-        constructor, then returns this element and removes it from the queue
+        this method pops up to n elements out of the stack
 
-        :return: the element to be dequeued
-        :raises EmptyPriorityQueueError: if the queue is empty
+        :param n: the maximum number of elements to pop
+        :return: a list with the popped elements in the order they were popped (the top element first), the list has
+            fewer than n elements if there are fewer than n elements in the stack
+        :raises StackTypeError: if n is not an integer
+        :raises ValueError: if n is negative
         """
 
-        if self.size == 0:
-            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+        if type(n) != int:
+            raise StackTypeError("The number of elements to pop must be an integer")
 
-        if type(self.__indices) == MinBinaryHeap:
-            min_priority = self.__indices.remove_min()
-            element_to_return = self.__elements.get(min_priority)
-            self.__elements.pop(min_priority)
-            return element_to_return
-        elif type(self.__indices) == MaxBinaryHeap:
-            max_priority = self.__indices.remove_max()
-            element_to_return = self.__elements.get(max_priority)
-            self.__elements.pop(max_priority)
-            return element_to_return
+        if n < 0:
+            raise ValueError("The number of elements to pop must not be negative")
 
-    def peek(self):
+        if self.__not_full is not None:
+            with self.__not_full:
+                return self.__pop_many(n)
+        return self.__pop_many(n)
+
+    def __pop_many(self, n):
         """
-        this method is the same as dequeue() but doesn't remove the element from the priority queue
+        pops up to n elements from the stack, with the block policy the caller must hold the lock of the stack
 
-        :return: the element to be dequeued without removing it or None if the queue is empty
+        :param n: the maximum number of elements to pop
+        :return: a list with the popped elements
         """
 
-        if self.size == 0:
-            return None
+        pop = self.__elements.pop
+        items = [pop() for _ in range(min(n, len(self.__elements)))]
+        if self.__counts is not None:
+            for item in items:
+                self.__unindex(item)
+        self.__notify_not_full(len(items))
 
-        if type(self.__indices) == MinBinaryHeap:
-            return self.__elements.get(self.__indices.peek_min())
-        elif type(self.__indices) == MaxBinaryHeap:
-            return self.__elements.get(self.__indices.peek_max())
+        return items
 
-    def get_element(self, priority):
+    def pop(self):
         """
-        this method gets the element with a specified priority
+        this method pops the top element out of the stack (the last pushed element in the stack)
 
-        :param priority: the given priority
-        :return: the element linked to this priority or None if not existing
-        :raises PriorityQueueTypeError: if the priority is not of type int
+        :return: the top element in the stack
+        :raises EmptyStackError: if there are no elements in the stack
         """
 
-        if type(priority) != int:
-            raise PriorityQueueTypeError("The priority parameter must be an integer.")
-
-        return self.__elements.get(priority)
+        if self.__not_full is not None:
+            with self.__not_full:
+                return self.__pop()
+        return self.__pop()
 
-    def contains_priority(self, priority):
+    def __pop(self):
         """
-        this method checks if a given priority is assigned to an object
+        pops the top element of the stack, with the block policy the caller must hold the lock of the stack
 
-        :param priority: the priority to check
-        :return: True if the queue contains this priority and False otherwise
-        :raises PriorityQueueTypeError: if the priority is not of type int
+        :return: the top element in the stack
+        :raises EmptyStackError: if there are no elements in the stack
         """
 
-        if type(priority) == int:
-            return priority in self.__elements.keys()
+        if self.size > 0:
+            item = self.__elements.pop()
+            if self.__counts is not None:
+                self.__unindex(item)
+            self.__notify_not_full(1)
+            return item
         else:
-            raise PriorityQueueTypeError("Priorities must be of type int")
+            raise EmptyStackError("There are no elements in the stack")
 
-    def contains_element(self, element):
+    def peek(self):
         """
-        this method checks if a given element is contained in the queue
+        this method peeks the top element of the stack, same as the pop() method,
+        but without removing the element from the stack
 
-        :param element: the element to check
-        :return: True if the element is in the queue and False otherwise
-        :raises PriorityQueueTypeError: if the element's type is not the same as the type of elements in the queue
+        :return: the last pushed element in the stack or None if there are no elements in the stack
         """
 
-        if self.__elements_type is not None and type(element) != self.__elements_type:
-            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.__elements_type))
-
-        return element in self.__elements.values()
+        if self.size > 0:
+            return self.__elements[-1]
+        else:
+            return None
 
-    def replace_priority(self, element, new_priority, comparison=None):
+    def remove(self, element):
         """
-        this method finds an element and replaces its priority with a new one
+        this method removes an element from the stack
 
-        :param element: the element, for which the priority must be replaced
-        :param new_priority: the new priority
-        :param comparison: represents whether a comparison between the two priorities must be made before replacing
-            None - no comparison, 1 - greater than comparison (new > old)), -1 - less than comparison (new < old)
-        :return: True if the element's priority has been replaced and False otherwise
-        :raises PriorityQueueTypeError: if the type of the queue is not None and is different than the type of the element argument
-        :raises PriorityQueueTypeError: if the type of the new priority is not int
-        :raises ValueError if the type of the comparison argument is not any of these (None, -1, 1)
-        :raises PriorityQueueElementError: if the element is not contained in the queue
+        :param element: the element to remove from the stack
+        :raises StackTypeError: if the type of the Stack object is specified and is different from the type of the 'element'
+            argument used when calling this method
+        :raises StackElementError: if the element to remove is not contained in the stack
         """
 
-        if self.__elements_type is not None and type(element) != self.__elements_type:
-            raise PriorityQueueTypeError("Type of the first parameter is not " + str(self.__elements_type))
+        if self.__elements_type is None or type(element) == self.__elements_type:
+            if self.__not_full is not None:
+                with self.__not_full:
+                    self.__remove(element)
+            else:
+                self.__remove(element)
+        else:
+            raise StackTypeError("The element {0} that you are trying to remove is not of type {1}".format(element, self.__elements_type))
 
-        if type(new_priority) != int:
-            raise PriorityQueueTypeError("The priority parameter must be an integer.")
+    def __remove(self, element):
+        """
+        removes an element from the stack, with the block policy the caller must hold the lock of the stack
 
-        if comparison is not None and comparison != 1 and comparison != -1:
-            raise ValueError("The comparison argument must be None for no comparison, -1 - for less than comparison"
-                             "and 1 for greater than comparison")
+        :param element: the element to remove from the stack
+        :raises StackElementError: if the element to remove is not contained in the stack
+        """
 
-        element_found = False
-        replaced = False
-        for priority in self.__elements:
-            if self.__elements[priority] == element:
-                if (comparison is None and priority != new_priority) or (comparison == 1 and new_priority > priority)\
-                            or (comparison == -1 and new_priority < priority):
-                    self.__elements.pop(priority)
-                    if new_priority not in self.__indices:
-                        self.__indices.replace(priority, new_priority)
-                    else:
-                        self.__indices.remove(priority)
-                    self.__elements[new_priority] = element
-                    replaced = True
-                element_found = True
-                break
+        # an indexed stack fails fast instead of scanning all elements for a missing element
+        if self.__counts is not None and not self.contains(element):
+            raise StackElementError("The element {0} that you are trying to remove is not contained in the stack.".format(element))
+        try:
+            self.__elements.remove(element)
+        except ValueError:
+            raise StackElementError("The element {0} that you are trying to remove is not contained in the stack.".format(element))
+        if self.__counts is not None:
+            self.__unindex(element)
+        self.__notify_not_full(1)
 
-        if not element_found:
-            raise PriorityQueueElementError("The queue doesn't contain the element for which you are trying to replace the priority.")
 
-        return replaced
+class _StackCell(object):
+    """
+    An immutable cons cell of a PersistentStack - an element and a reference to the cell below it, which can be shared by
+    many versions of the stack. The __slots__ keep each cell as small as a tuple of two items.
+    """
 
-    def remove_element(self, element):
-        """
-        this method removes an element from the priority queue
+    __slots__ = ("item", "below")
 
-        :param element: the element to remove
-        :raises PriorityQueueElementError: if the queue doesn't contain the element to delete
-        :raises PriorityQueueTypeError: if the type of the argument differs from the type of the elements in the queue
+    def __init__(self, item, below):
         """
+        constructor for the cell
 
-        if self.__elements_type is not None and type(element) != self.__elements_type:
-            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.__elements_type))
-
-        removed = False
-        for priority in self.__elements:
-            test_element = self.__elements[priority]
-            if element == test_element:
-                self.__indices.remove(priority)
-                self.__elements.pop(priority)
-                removed = True
-                break
+        :param item: the element stored in the cell
+        :param below: the cell below this cell or None if this is the bottom cell
+        """
 
-        if not removed:
-            raise PriorityQueueElementError("The queue doesn't contain the element you are trying to delete.")
+        self.item = item
+        self.below = below
 
 
-class DuplicatePriorityQueue(PriorityQueue):
+class PersistentStack(object):
     """
-    Abstract Data Structure - represents a queue with priorities for elements, difference from PriorityQueue is that
-    this implementation allows elements with duplicated priorities, that is the mapping between elements and priorities is injective
+    Implementation of an immutable (persistent) Stack - push() and pop() don't change the stack, but return a new version
+    of it in O(1) time, which shares all of its cells below the top with the old version. A snapshot of the stack is the
+    stack itself, so backtracking algorithms can keep a version at every step without copying any elements.
     """
 
-    def __init__(self, elements_type=None, reverse=False):
+    __slots__ = ("__top", "__size", "__elements_type")
+
+    def __init__(self, elements_type=None):
         """
-        overriding the constructor to get references to the elements and the priorities
+        constructor for an empty persistent stack
 
-        :param elements_type: the type of elements in the queue
-        :param reverse: the reverse argument of the PriorityQueue
+        :param elements_type: optional argument, which represents the type of data in the stack, default value is None,
+            which means that the stack can contain elements of all types
+        :raises StackTypeError: in case the 'elements_type' argument is not a valid type
         """
 
-        super().__init__(elements_type, reverse)
+        if elements_type is not None and type(elements_type) != type:
+            raise StackTypeError("{0} is not a valid type for a stack.".format(elements_type))
 
-        self.__elements = self._PriorityQueue__elements
-        self.__indices = self._PriorityQueue__indices
+        self.__top = None
         self.__size = 0
+        self.__elements_type = elements_type
 
-    @property
-    def size(self):
+    def __version(self, top, size):
         """
-        overriding the size() method to return the __size attribute
-        :return: the number of elements in the queue (including duplicated priorities)
+        creates a new version of the stack with the same type of elements
+
+        :param top: the top cell of the new version
+        :param size: the number of elements in the new version
+        :return: the new version
         """
 
-        return self.__size
+        stack = PersistentStack.__new__(PersistentStack)
+        stack.__top = top
+        stack.__size = size
+        stack.__elements_type = self.__elements_type
 
-    def enqueue(self, item, priority):
+        return stack
+
+    def __str__(self):
         """
-        overriding the enqueue() method to allow duplicated priorities,
-        2 or more elements with the same priorities are stored in an ordinary queue
+        the string representation of the stack
 
-        :param item: the item to enqueue
-        :param priority: the priority of the item
-        :raises PriorityQueueTypeError: if the type of the priority is not int
-        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other queue's elements
+        :return: a string in the form PersistentStack([bottom, ..., top]), same order as the str of a Stack
         """
 
-        if type(priority) != int:
-            raise PriorityQueueTypeError("The priority of an element must be an integer")
+        return "PersistentStack({0})".format(list(self)[::-1])
 
-        if self.type is not None and type(item) != self.type:
-            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.type))
+    def __repr__(self):
+        """
+        the repr representation of the stack
 
-        if priority not in self.__elements:
-            self.__indices.add(priority)
-            self.__elements[priority] = item
-        else:
-            element = self.__elements[priority]
+        :return: same as str()
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        overriding this method so that the len(stack) syntax can be used
+
+        :return: the number of elements in the stack
+        """
+
+        return self.__size
+
+    def __iter__(self):
+        """
+        overriding this method allows iterating over the stack, the iteration doesn't remove any elements, since the
+        stack is immutable
+
+        :return: a generator of the elements from the top to the bottom of the stack
+        """
+
+        cell = self.__top
+        while cell is not None:
+            yield cell.item
+            cell = cell.below
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in stack' syntax
+
+        :param item: the value to search for in the stack
+        :return: calls the contains() method to check if the stack contains this value
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the stack
+
+        :return: the number of elements in this version of the stack
+        """
+
+        return self.__size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the stack
+
+        :return: the type of elements in the stack or None if the stack can contain elements of all types
+        """
+
+        return self.__elements_type
+
+    def contains(self, item):
+        """
+        this method checks if a value is contained in the stack, it takes O(n) time
+
+        :param item: the value to search for in the stack
+        :return: True if the value is contained in the stack and False otherwise
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of the 'item'
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise StackTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+
+        return any(element == item for element in self)
+
+    def push(self, item):
+        """
+        this method creates a new version of the stack with an element on top, this version is not changed
+
+        :param item: the element to push
+        :return: the new version of the stack
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of the 'item'
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.__elements_type))
+
+        return self.__version(_StackCell(item, self.__top), self.__size + 1)
+
+    def push_many(self, items):
+        """
+        this method creates a new version of the stack with many elements pushed in the order they are given
+
+        :param items: an iterable with the elements to push
+        :return: the new version of the stack
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of any of the
+            elements
+        """
+
+        items = list(items)
+        if self.__elements_type is not None:
+            for item in items:
+                if type(item) != self.__elements_type:
+                    raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.__elements_type))
+
+        top = self.__top
+        for item in items:
+            top = _StackCell(item, top)
+
+        return self.__version(top, self.__size + len(items))
+
+    def pop(self):
+        """
+        this method creates a new version of the stack without its top element, this version is not changed
+
+        :return: the new version of the stack, the removed element can be read with peek() before popping
+        :raises EmptyStackError: if there are no elements in the stack
+        """
+
+        if self.__top is None:
+            raise EmptyStackError("There are no elements in the stack")
+
+        return self.__version(self.__top.below, self.__size - 1)
+
+    def peek(self):
+        """
+        this method peeks the top element of the stack
+
+        :return: the last pushed element in the stack or None if there are no elements in the stack
+        """
+
+        if self.__top is None:
+            return None
+
+        return self.__top.item
+
+    def to_stack(self):
+        """
+        this method copies the elements to a mutable Stack with the same type of elements
+
+        :return: a Stack with the same elements in the same order
+        """
+
+        stack = Stack(self.__elements_type)
+        stack.push_many(list(self)[::-1])
+
+        return stack
+
+
+def _aggregate_functions(aggregates, error):
+    """
+    checks the aggregates argument of a min-max stack or queue and adds the min and max aggregates to it
+
+    :param aggregates: None or a dictionary linking names of aggregates to associative functions of two arguments
+    :param error: the type of error to raise if the argument is not valid
+    :return: a tuple (names, functions) of the aggregates, min and max are always the first two of them
+    :raises error: if the argument is not a dictionary, a name is not a string or a function is not callable
+    :raises ValueError: if min or max is used as the name of a custom aggregate
+    """
+
+    if aggregates is None:
+        aggregates = {}
+
+    if type(aggregates) != dict:
+        raise error("The aggregates must be given in a dictionary")
+
+    names = ["min", "max"]
+    functions = [min, max]
+    for name, function in aggregates.items():
+        if type(name) != str:
+            raise error("The name of an aggregate must be a string")
+        if not callable(function):
+            raise error("The function of the aggregate {0} must be callable".format(name))
+        if name in names:
+            raise ValueError("The aggregate {0} is always available and cannot be redefined".format(name))
+        names.append(name)
+        functions.append(function)
+
+    return tuple(names), tuple(functions)
+
+
+class MinMaxStack(object):
+    """
+    A Stack, which answers min(), max() and any other associative aggregate of its elements (e.g. sum, gcd or a custom
+    monoid) in O(1) time.
+
+    The elements are kept in a Stack and next to every element the aggregates of all elements from the bottom of the stack
+    up to this element are stored, so push() computes the new aggregates from the aggregates below in O(1) time and pop()
+    simply drops them. The aggregate functions must be associative, but don't need to be commutative - they are always
+    applied in the order the elements were pushed.
+    """
+
+    def __init__(self, elements_type=None, aggregates=None):
+        """
+        constructor for a min-max stack
+
+        :param elements_type: optional argument, which represents the type of data in the stack, default value is None,
+            which means that the stack can contain elements of all types
+        :param aggregates: a dictionary linking the names of custom aggregates to associative functions of two elements,
+            e.g. {"sum": operator.add, "gcd": math.gcd}, min and max are always available
+        :raises StackTypeError: in case the 'elements_type' argument is not a valid type
+        :raises StackTypeError: if the aggregates argument is not a dictionary of names and functions
+        :raises ValueError: if min or max is used as the name of a custom aggregate
+        """
+
+        self.__elements = Stack(elements_type)
+        self.__names, self.__functions = _aggregate_functions(aggregates, StackTypeError)
+
+        # the aggregates of the elements from the bottom up to each element, parallel to the elements in the stack
+        self.__prefixes = []
+
+    def __str__(self):
+        """
+        the string representation of the stack
+
+        :return: the str representation of the wrapped Stack
+        """
+
+        return str(self.__elements)
+
+    def __repr__(self):
+        """
+        the repr representation of the stack
+
+        :return: the repr representation of the wrapped Stack
+        """
+
+        return repr(self.__elements)
+
+    def __len__(self):
+        """
+        overriding this method so that the len(stack) syntax can be used
+
+        :return: the number of elements in the stack
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the stack
+
+        :return: reference to the stack object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method implements the next() method of the iterator
+
+        :return: calls the pop() method to return the top element and remove it from the stack
+        :raises StopIteration: if the stack is empty
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.pop()
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in stack' syntax
+
+        :param item: the value to search for in the stack
+        :return: calls the contains() method to check if the stack contains this value
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the stack
+
+        :return: the number of elements in the stack
+        """
+
+        return self.__elements.size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the stack
+
+        :return: the type of elements in the stack or None if the stack can contain elements of all types
+        """
+
+        return self.__elements.type
+
+    @property
+    def aggregates(self):
+        """
+        this method gets the names of the aggregates of the stack
+
+        :return: a tuple with the names of the aggregates, starting with min and max
+        """
+
+        return self.__names
+
+    def contains(self, item):
+        """
+        this method checks if a value is contained in the stack
+
+        :param item: the value to search for in the stack
+        :return: True if the value is contained in the stack and False otherwise
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of the 'item'
+        """
+
+        return self.__elements.contains(item)
+
+    def push(self, item):
+        """
+        this method pushes an element on top of the stack and computes the aggregates up to it
+
+        :param item: the element to push
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of the 'item'
+        :raises Exception: the exception raised by an aggregate function, in this case the element is not pushed
+        """
+
+        self.push_many([item])
+
+    def push_many(self, items):
+        """
+        this method pushes many elements on top of the stack in the order they are given
+
+        :param items: an iterable with the elements to push
+        :raises StackTypeError: if the type of the stack is specified and is different from the type of any of the
+            elements, in this case none of the elements is pushed
+        :raises Exception: the exception raised by an aggregate function, e.g. a TypeError if min or max is applied to
+            elements, which cannot be compared, in this case none of the elements is pushed
+        """
+
+        items = list(items)
+        if self.type is not None:
+            for item in items:
+                if type(item) != self.type:
+                    raise StackTypeError("The element {0} that you are trying to push is not of type {1}".format(item, self.type))
+
+        # the aggregates are computed before the elements are pushed, so that the stack isn't changed if any of the
+        # aggregate functions raises an exception
+        prefixes = []
+        last = self.__prefixes[-1] if len(self.__prefixes) > 0 else None
+        for item in items:
+            if last is None:
+                last = (item,)*len(self.__functions)
+            else:
+                last = tuple(function(prefix, item) for function, prefix in zip(self.__functions, last))
+            prefixes.append(last)
+
+        self.__elements.push_many(items)
+        self.__prefixes.extend(prefixes)
+
+    def pop(self):
+        """
+        this method pops the top element out of the stack
+
+        :return: the top element in the stack
+        :raises EmptyStackError: if there are no elements in the stack
+        """
+
+        item = self.__elements.pop()
+        self.__prefixes.pop()
+
+        return item
+
+    def pop_many(self, n):
+        """
+        this method pops up to n elements out of the stack
+
+        :param n: the maximum number of elements to pop
+        :return: a list with the popped elements, the top element first
+        :raises StackTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        items = self.__elements.pop_many(n)
+        del self.__prefixes[len(self.__prefixes) - len(items):]
+
+        return items
+
+    def peek(self):
+        """
+        this method peeks the top element of the stack without removing it
+
+        :return: the last pushed element in the stack or None if there are no elements in the stack
+        """
+
+        return self.__elements.peek()
+
+    def min(self):
+        """
+        this method gets the smallest element in the stack in O(1) time
+
+        :return: the smallest element
+        :raises EmptyStackError: if there are no elements in the stack
+        """
+
+        return self.aggregate("min")
+
+    def max(self):
+        """
+        this method gets the greatest element in the stack in O(1) time
+
+        :return: the greatest element
+        :raises EmptyStackError: if there are no elements in the stack
+        """
+
+        return self.aggregate("max")
+
+    def aggregate(self, name):
+        """
+        this method gets an aggregate of all elements in the stack in O(1) time
+
+        :param name: the name of the aggregate
+        :return: the aggregate of the elements from the bottom to the top of the stack
+        :raises StackElementError: if there is no aggregate with this name
+        :raises EmptyStackError: if there are no elements in the stack
+        """
+
+        if name not in self.__names:
+            raise StackElementError("There is no aggregate with the name {0}".format(name))
+
+        if len(self.__prefixes) == 0:
+            raise EmptyStackError("There are no elements in the stack")
+
+        return self.__prefixes[-1][self.__names.index(name)]
+
+
+class Queue(object):
+    """
+    Implementation for the abstract data structure called Queue - follows the principle First In First Out.
+    The current implementation is just a wrapper around the python deque object with proper naming conventions and type
+    checking.
+    """
+
+    def __init__(self, elements_type=None, maxlen=None, overflow="drop_oldest", compact=False, indexed=False):
+        """
+        a constructor for a Queue
+
+        :param elements_type: optional argument, which represents the type of elements in the queue
+            default value is None, which means that the queue can contain elements of all types,
+            otherwise, the queue can only contain elements of the specified type
+        :param maxlen: optional argument, the maximum number of elements in the queue, default value is None, which
+            means that the queue is unbounded
+        :param overflow: the policy for enqueueing an element when the queue is full - "drop_oldest" (default) drops the
+            element at the front of the queue, "drop_newest" drops the enqueued element, "raise" raises a FullQueueError
+            and "block" waits until another thread dequeues an element
+        :param compact: a boolean, if set to True the elements are stored unboxed in an array.array instead of a deque,
+            which uses about 4 times less memory, only allowed if the type of elements is int or float, default is False;
+            the integers in a compact queue must fit in 64 bits, otherwise a ValueError is raised when they are added
+        :param indexed: a boolean, if set to True the queue keeps a counter of its elements, which makes contains() take
+            O(1) time and remove() fail in O(1) time if the element is missing, the elements must be hashable,
+            default is False
+        :raises QueueTypeError: if the 'elements_type' argument is specified and is not a valid type
+        :raises QueueTypeError: if compact is not a boolean or it is True, but the type of elements is not int or float
+        :raises QueueTypeError: if indexed is not a boolean
+        :raises QueueTypeError: if the maxlen argument is not an integer
+        :raises ValueError: if the maxlen argument is not positive or the overflow argument is not a valid policy
+        """
+
+        # checking that the elements_type argument is a valid type if passed
+        if elements_type is not None and type(elements_type) != type:
+            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+
+        if maxlen is not None and type(maxlen) != int:
+            raise QueueTypeError("The maximum length of a queue must be an integer")
+
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("The maximum length of a queue must be a positive integer")
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("The overflow policy of a queue must be one of {0}".format(", ".join(OVERFLOW_POLICIES)))
+
+        if type(compact) != bool:
+            raise QueueTypeError("{0} is not a valid boolean argument for initialising a queue.".format(compact))
+
+        if compact and elements_type not in COMPACT_TYPECODES:
+            raise QueueTypeError("Only a queue of int or float elements can be compact")
+
+        if type(indexed) != bool:
+            raise QueueTypeError("{0} is not a valid boolean argument for initialising a queue.".format(indexed))
+
+        # elements in the queue are stored in a deque object (or an array deque if the queue is compact), which drops
+        # the oldest elements by itself
+        deque_maxlen = maxlen if overflow == "drop_oldest" else None
+        if compact:
+            self.__elements = ArrayDeque(COMPACT_TYPECODES[elements_type], deque_maxlen)
+        else:
+            self.__elements = deque(maxlen=deque_maxlen)
+        self.__elements_type = elements_type
+        self.__maxlen = maxlen
+        self.__overflow = overflow
+        self.__dropped = 0
+
+        # the integers in a compact queue are range-checked before they are added, so that a batch is rejected as a whole
+        # instead of failing inside the array
+        self.__int_range = COMPACT_INT_RANGE if compact and elements_type == int else None
+
+        # an indexed queue counts how many times each element is contained in it, the counter is updated whenever elements
+        # are added, removed or dropped
+        self.__counts = Counter() if indexed else None
+
+        # threads enqueueing to a full queue with the block policy wait on this condition
+        self.__not_full = Condition() if maxlen is not None and overflow == "block" else None
+
+    def __str__(self):
+        """
+        the str representation for the stack returns the str representation of the deque object
+        """
+
+        return str(self.__elements)
+
+    def __repr__(self):
+        """
+        the repr representation for the stack returns the repr representation of the deque object
+        """
+
+        return repr(self.__elements)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax, where queue is an object of type Queue
+
+        :return: calls the size() method to get the number of elements in the queue
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the queue
+
+        :return: reference to the queue object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method implements the next method for the iterator
+
+        :return: calls the dequeue() method to get the appropriate value to return and remove it from the queue
+        :raises StopIteration: if there are no elements in the queue
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in queue' syntax, where the queue object is of type Queue
+
+        :param item: the item to search for in the queue
+        :return: calls the contains() method to check if the item is contained in the queue
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return len(self.__elements)
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the queue
+
+        :return: the type of elements in the queue or None if the queue can contain all types of elements
+        """
+
+        return self.__elements_type
+
+    @property
+    def maxlen(self):
+        """
+        this method gets the maximum number of elements in the queue
+
+        :return: the maximum length of the queue or None if the queue is unbounded
+        """
+
+        return self.__maxlen
+
+    @property
+    def overflow(self):
+        """
+        this method gets the overflow policy of the queue
+
+        :return: the policy for enqueueing an element when the queue is full
+        """
+
+        return self.__overflow
+
+    @property
+    def dropped(self):
+        """
+        this method gets the number of elements dropped because the queue was full
+
+        :return: the number of dropped elements
+        """
+
+        return self.__dropped
+
+    @property
+    def compact(self):
+        """
+        this method checks if the elements of the queue are stored unboxed in an array
+
+        :return: True if the queue is compact and False otherwise
+        """
+
+        return type(self.__elements) == ArrayDeque
+
+    @property
+    def indexed(self):
+        """
+        this method checks if the queue keeps a counter of its elements
+
+        :return: True if the queue is indexed and False otherwise
+        """
+
+        return self.__counts is not None
+
+    def __index(self, items):
+        """
+        counts the elements, which are added to an indexed queue, and finds the elements, which the deque drops by itself
+        with the drop_oldest policy, must be called before the elements are added; the counter itself is updated by
+        __reindex() only after the elements have been stored, so that it isn't changed if storing them fails
+
+        :param items: a list with the elements, which are added
+        :return: a tuple with a Counter of the added elements and a list of the dropped elements
+        :raises QueueTypeError: if any of the elements is not hashable
+        """
+
+        overflow = 0
+        if self.__elements.maxlen is not None:
+            overflow = max(0, len(self.__elements) + len(items) - self.__elements.maxlen)
+        dropped = min(overflow, len(self.__elements))
+
+        try:
+            added = Counter(items[overflow - dropped:])
+        except TypeError:
+            raise QueueTypeError("The elements of an indexed queue must be hashable")
+
+        return added, [self.__elements[index] for index in range(dropped)]
+
+    def __reindex(self, added, dropped):
+        """
+        updates the counter of an indexed structure after the elements counted by __index() have been stored
+
+        :param added: a Counter of the added elements
+        :param dropped: a list of the elements, which the deque dropped
+        """
+
+        for item in dropped:
+            self.__unindex(item)
+        self.__counts.update(added)
+
+    def __unindex(self, item):
+        """
+        removes an element from the counter of an indexed queue
+
+        :param item: the removed element
+        """
+
+        count = self.__counts[item] - 1
+        if count > 0:
+            self.__counts[item] = count
+        else:
+            del self.__counts[item]
+
+    def view(self):
+        """
+        this method iterates over the elements of the queue without removing or copying them, unlike iterating over the
+        queue itself, which dequeues its elements
+
+        :return: a read-only iterator of the elements from the front to the back of the queue (FIFO order)
+        :raises RuntimeError: when the next element is requested, if the queue has been changed during the iteration
+        """
+
+        return iter(self.__elements)
+
+    def as_memoryview(self):
+        """
+        this method exports the elements of a compact queue without copying them, the view must be released (or not used
+        any more) before the queue is changed
+
+        :return: a memoryview of the elements from the front to the back of the queue
+        :raises QueueTypeError: if the queue is not compact
+        """
+
+        if type(self.__elements) != ArrayDeque:
+            raise QueueTypeError("Only the elements of a compact queue can be exported to a memoryview")
+
+        return self.__elements.memoryview()
+
+    def contains(self, item):
+        """
+        this method checks if an item is contained in the queue
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        """
+
+        if self.__elements_type is None or type(item) == self.__elements_type:
+            if self.__counts is not None:
+                try:
+                    return item in self.__counts
+                except TypeError:
+                    return False
+            return item in self.__elements
+        else:
+            raise QueueTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+
+    def enqueue(self, item):
+        """
+        this method enqueues an element in the queue
+
+        :param item: the element to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
+            of the 'item' argument used when calling this method
+        :raises FullQueueError: if the queue is full and its overflow policy is "raise"
+        :raises ValueError: if the queue is compact and the element is an integer, which doesn't fit in 64 bits
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+
+        self.__check_range([item])
+
+        if self.__not_full is not None:
+            with self.__not_full:
+                while len(self.__elements) >= self.__maxlen:
+                    self.__not_full.wait()
+                indexed = self.__index([item]) if self.__counts is not None else None
+                self.__elements.append(item)
+                if indexed is not None:
+                    self.__reindex(*indexed)
+            return
+
+        if self.__maxlen is not None and len(self.__elements) >= self.__maxlen:
+            if self.__overflow == "raise":
+                raise FullQueueError("The queue is full, it cannot contain more than {0} elements".format(self.__maxlen))
+            # with the drop_oldest policy the deque drops the element at the front of the queue by itself
+            self.__dropped += 1
+            if self.__overflow == "drop_newest":
+                return
+
+        indexed = self.__index([item]) if self.__counts is not None else None
+        self.__elements.append(item)
+        if indexed is not None:
+            self.__reindex(*indexed)
+
+    def __check_range(self, items):
+        """
+        checks that the integers added to a compact queue fit in its type code, does nothing if the queue isn't a compact
+        queue of int elements
+
+        :param items: a list with the elements, which are added
+        :raises ValueError: if any of the integers doesn't fit in 64 bits
+        """
+
+        if self.__int_range is None:
+            return
+
+        low, high = self.__int_range
+        for item in items:
+            if not low <= item <= high:
+                raise ValueError("The element {0} that you are trying to enqueue doesn't fit in a compact queue".format(item))
+
+    def __notify_not_full(self, count):
+        """
+        wakes up threads waiting to enqueue to the queue after elements have been removed, only used with the block policy
+
+        :param count: the number of removed elements
+        """
+
+        if self.__not_full is not None and count > 0:
+            with self.__not_full:
+                self.__not_full.notify(count)
+
+    def enqueue_many(self, items):
+        """
+        this method enqueues many elements in the order they are given, the elements are validated in a single pass and
+        added at once, which is faster than calling enqueue() for each element
+        (except with the block policy, where the validated elements are enqueued one by one with enqueue(), so other
+        threads can interleave with the batch while it waits for free space)
+
+        :param items: an iterable with the elements to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of any
+            of the elements, in this case none of the elements is enqueued
+        :raises ValueError: if the queue is compact and any of the elements is an integer, which doesn't fit in 64 bits, in
+            this case none of the elements is enqueued
+        :raises FullQueueError: if the elements don't fit in the queue and its overflow policy is "raise", in this case
+            none of the elements is enqueued
+        """
+
+        items = list(items)
+        if self.__elements_type is not None:
+            for item in items:
+                if type(item) != self.__elements_type:
+                    raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+
+        self.__check_range(items)
+
+        if self.__maxlen is not None:
+            free = max(0, self.__maxlen - len(self.__elements))
+            if self.__overflow == "drop_oldest":
+                self.__dropped += max(0, len(items) - free)
+            elif self.__overflow == "drop_newest":
+                self.__dropped += max(0, len(items) - free)
+                items = items[:free]
+            elif self.__overflow == "raise" and len(items) > free:
+                raise FullQueueError("The queue is full, it cannot contain more than {0} elements".format(self.__maxlen))
+            elif self.__overflow == "block":
+                for item in items:
+                    self.enqueue(item)
+                return
+
+        indexed = self.__index(items) if self.__counts is not None else None
+        self.__elements.extend(items)
+        if indexed is not None:
+            self.__reindex(*indexed)
+
+    def dequeue_many(self, n):
+        """
+        this method dequeues up to n elements from the queue
+
+        :param n: the maximum number of elements to dequeue
+        :return: a list with the dequeued elements in the order they were enqueued, the list has fewer than n elements if
+            there are fewer than n elements in the queue
+        :raises QueueTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        if type(n) != int:
+            raise QueueTypeError("The number of elements to dequeue must be an integer")
+
+        if n < 0:
+            raise ValueError("The number of elements to dequeue must not be negative")
+
+        if self.__not_full is not None:
+            with self.__not_full:
+                return self.__dequeue_many(n)
+        return self.__dequeue_many(n)
+
+    def __dequeue_many(self, n):
+        """
+        dequeues up to n elements from the queue, with the block policy the caller must hold the lock of the queue
+
+        :param n: the maximum number of elements to dequeue
+        :return: a list with the dequeued elements
+        """
+
+        popleft = self.__elements.popleft
+        items = [popleft() for _ in range(min(n, len(self.__elements)))]
+        if self.__counts is not None:
+            for item in items:
+                self.__unindex(item)
+        self.__notify_not_full(len(items))
+
+        return items
+
+    def dequeue(self):
+        """
+        this method removes the item that got first in the queue
+
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if self.__not_full is not None:
+            with self.__not_full:
+                return self.__dequeue()
+        return self.__dequeue()
+
+    def __dequeue(self):
+        """
+        dequeues the front element of the queue, with the block policy the caller must hold the lock of the queue
+
+        :return: the dequeued element
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if self.size > 0:
+            item = self.__elements.popleft()
+            if self.__counts is not None:
+                self.__unindex(item)
+            self.__notify_not_full(1)
+            return item
+        else:
+            raise EmptyQueueError("There are no elements in the queue")
+
+    def dequeue_last(self):
+        """
+        this method removes the item that got last in the queue, i.e. the item, which would be dequeued last
+
+        :return: the removed item
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if self.__not_full is not None:
+            with self.__not_full:
+                return self.__dequeue_last()
+        return self.__dequeue_last()
+
+    def __dequeue_last(self):
+        """
+        removes the back element of the queue, with the block policy the caller must hold the lock of the queue
+
+        :return: the removed element
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if self.size > 0:
+            item = self.__elements.pop()
+            if self.__counts is not None:
+                self.__unindex(item)
+            self.__notify_not_full(1)
+            return item
+        else:
+            raise EmptyQueueError("There are no elements in the queue")
+
+    def peek(self):
+        """
+        this method peeks the item that got first in the queue (without removing it)
+
+        :return: the peeked item or None if there are no elements in the queue
+        """
+
+        if self.size > 0:
+            return self.__elements[0]
+        else:
+            return None
+
+    def remove(self, element):
+        """
+        this method removes an element from the queue
+
+        :param element: the element to remove from the queue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
+            of the 'element' argument used when calling this method
+        :raises QueueElementError: if the element to remove is not contained in the queue
+        """
+
+        if self.__elements_type is None or type(element) == self.__elements_type:
+            if self.__not_full is not None:
+                with self.__not_full:
+                    self.__remove(element)
+            else:
+                self.__remove(element)
+        else:
+            raise QueueTypeError("The element {0} that you are trying to remove is not of type {1}.".format(element, self.__elements_type))
+
+    def __remove(self, element):
+        """
+        removes an element from the queue, with the block policy the caller must hold the lock of the queue
+
+        :param element: the element to remove from the queue
+        :raises QueueElementError: if the element to remove is not contained in the queue
+        """
+
+        # an indexed queue fails fast instead of scanning all elements for a missing element
+        if self.__counts is not None and not self.contains(element):
+            raise QueueElementError("The element {0} that you are trying to remove is not contained in the queue.".format(element))
+        try:
+            self.__elements.remove(element)
+        except ValueError:
+            raise QueueElementError("The element {0} that you are trying to remove is not contained in the queue.".format(element))
+        if self.__counts is not None:
+            self.__unindex(element)
+        self.__notify_not_full(1)
+
+
+class MinMaxQueue(object):
+    """
+    A Queue, which answers min(), max() and any other associative aggregate of its elements (e.g. sum, gcd or a custom
+    monoid) in O(1) amortized time, e.g. over a sliding window.
+
+    The queue is made of two stacks (two-stack aggregation) - elements are enqueued on the back stack, for which only the
+    aggregates of all its elements are kept, and dequeued from the front stack, for which the aggregates from each element
+    up to the back of the front stack are kept. When the front stack is empty, all elements of the back stack are moved to
+    it at once and their aggregates are computed, so every element is moved only once. The aggregate functions must be
+    associative, but don't need to be commutative - they are always applied in the order the elements were enqueued.
+    """
+
+    def __init__(self, elements_type=None, aggregates=None):
+        """
+        constructor for a min-max queue
+
+        :param elements_type: optional argument, which represents the type of elements in the queue, default value is None,
+            which means that the queue can contain elements of all types
+        :param aggregates: a dictionary linking the names of custom aggregates to associative functions of two elements,
+            e.g. {"sum": operator.add, "gcd": math.gcd}, min and max are always available
+        :raises QueueTypeError: if the 'elements_type' argument is specified and is not a valid type
+        :raises QueueTypeError: if the aggregates argument is not a dictionary of names and functions
+        :raises ValueError: if min or max is used as the name of a custom aggregate
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+
+        self.__names, self.__functions = _aggregate_functions(aggregates, QueueTypeError)
+        self.__elements_type = elements_type
+
+        # the front of the queue is at the top of the front stack, the back of the queue is at the top of the back stack
+        self.__front = Stack(elements_type)
+        self.__suffixes = []
+        self.__back = Stack(elements_type)
+        self.__back_aggregates = None
+
+    def __str__(self):
+        """
+        the str representation of the queue
+
+        :return: the str representation of a deque with the elements from the front to the back of the queue
+        """
+
+        return str(deque(list(self.__front.view()) + list(self.__back.view())[::-1]))
+
+    def __repr__(self):
+        """
+        the repr representation of the queue
+
+        :return: same as str()
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the queue
+
+        :return: reference to the queue object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method implements the next method for the iterator
+
+        :return: calls the dequeue() method to get the appropriate value to return and remove it from the queue
+        :raises StopIteration: if there are no elements in the queue
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in queue' syntax
+
+        :param item: the item to search for in the queue
+        :return: calls the contains() method to check if the item is contained in the queue
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the queue
+
+        :return: the number of elements in both stacks of the queue
+        """
+
+        return self.__front.size + self.__back.size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the queue
+
+        :return: the type of elements in the queue or None if the queue can contain elements of all types
+        """
+
+        return self.__elements_type
+
+    @property
+    def aggregates(self):
+        """
+        this method gets the names of the aggregates of the queue
+
+        :return: a tuple with the names of the aggregates, starting with min and max
+        """
+
+        return self.__names
+
+    def contains(self, item):
+        """
+        this method checks if an item is contained in the queue
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise QueueTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+
+        return item in self.__front or item in self.__back
+
+    def enqueue(self, item):
+        """
+        this method enqueues an element in the queue and adds it to the aggregates of the back stack
+
+        :param item: the element to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of the item
+        :raises Exception: the exception raised by an aggregate function, in this case the element is not enqueued
+        """
+
+        self.enqueue_many([item])
+
+    def enqueue_many(self, items):
+        """
+        this method enqueues many elements in the order they are given
+
+        :param items: an iterable with the elements to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of any of
+            the elements, in this case none of the elements is enqueued
+        :raises Exception: the exception raised by an aggregate function, e.g. a TypeError if min or max is applied to
+            elements, which cannot be compared, in this case none of the elements is enqueued
+        """
+
+        items = list(items)
+        if self.__elements_type is not None:
+            for item in items:
+                if type(item) != self.__elements_type:
+                    raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+
+        # the aggregates are computed before the elements are enqueued, so that the queue isn't changed if any of the
+        # aggregate functions raises an exception
+        aggregates = self.__back_aggregates
+        for item in items:
+            if aggregates is None:
+                aggregates = (item,)*len(self.__functions)
+            else:
+                aggregates = tuple(function(aggregate, item) for function, aggregate in zip(self.__functions, aggregates))
+
+        self.__back.push_many(items)
+        self.__back_aggregates = aggregates
+
+    def __refill(self):
+        """
+        moves all elements of the back stack to the front stack if the front stack is empty, computing the aggregates of
+        the front stack from its bottom (the back of the queue) to its top (the front of the queue)
+
+        :raises Exception: the exception raised by an aggregate function, in this case no element is moved
+        """
+
+        if self.__front.size > 0 or self.__back.size == 0:
+            return
+
+        # the view of the back stack returns the elements from the back to the front of the queue, the aggregates are
+        # computed before the elements are moved, so that the queue isn't changed if an aggregate function raises
+        suffixes = []
+        last = None
+        for item in self.__back.view():
+            if last is None:
+                last = (item,)*len(self.__functions)
+            else:
+                last = tuple(function(item, suffix) for function, suffix in zip(self.__functions, last))
+            suffixes.append(last)
+
+        self.__front.push_many(self.__back.pop_many(self.__back.size))
+        self.__back_aggregates = None
+        self.__suffixes = suffixes
+
+    def dequeue(self):
+        """
+        this method removes the item that got first in the queue
+
+        :return: the dequeued item
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if self.size == 0:
+            raise EmptyQueueError("There are no elements in the queue")
+
+        self.__refill()
+        self.__suffixes.pop()
+
+        return self.__front.pop()
+
+    def dequeue_many(self, n):
+        """
+        this method dequeues up to n elements from the queue
+
+        :param n: the maximum number of elements to dequeue
+        :return: a list with the dequeued elements in the order they were enqueued
+        :raises QueueTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        if type(n) != int:
+            raise QueueTypeError("The number of elements to dequeue must be an integer")
+
+        if n < 0:
+            raise ValueError("The number of elements to dequeue must not be negative")
+
+        items = []
+        while len(items) < n and self.size > 0:
+            self.__refill()
+            popped = self.__front.pop_many(n - len(items))
+            del self.__suffixes[len(self.__suffixes) - len(popped):]
+            items.extend(popped)
+
+        return items
+
+    def peek(self):
+        """
+        this method peeks the item that got first in the queue (without removing it)
+
+        :return: the peeked item or None if there are no elements in the queue
+        """
+
+        # the front of the queue is at the bottom of the back stack if the front stack is empty
+        self.__refill()
+
+        return self.__front.peek()
+
+    def min(self):
+        """
+        this method gets the smallest element in the queue in O(1) amortized time
+
+        :return: the smallest element
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        return self.aggregate("min")
+
+    def max(self):
+        """
+        this method gets the greatest element in the queue in O(1) amortized time
+
+        :return: the greatest element
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        return self.aggregate("max")
+
+    def aggregate(self, name):
+        """
+        this method gets an aggregate of all elements in the queue in O(1) amortized time
+
+        :param name: the name of the aggregate
+        :return: the aggregate of the elements from the front to the back of the queue
+        :raises QueueElementError: if there is no aggregate with this name
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        if name not in self.__names:
+            raise QueueElementError("There is no aggregate with the name {0}".format(name))
+
+        if self.size == 0:
+            raise EmptyQueueError("There are no elements in the queue")
+
+        index = self.__names.index(name)
+        if len(self.__suffixes) == 0:
+            return self.__back_aggregates[index]
+        if self.__back_aggregates is None:
+            return self.__suffixes[-1][index]
+
+        return self.__functions[index](self.__suffixes[-1][index], self.__back_aggregates[index])
+
+
+class PriorityQueue(object):
+    """
+    Abstract Data Structure - represents a queue with priorities for elements
+
+    NOTE: this implementation provides a one-to-one mapping of elements to priorities (bijective mapping), that is one element is linked to only one priority
+        and one priority is linked to only one element. Therefore, when adding an element in the queue, if there is already an element with the same priority, then the old element
+        would be overwritten.
+
+    NOTE: if the queue is bounded by a capacity, the priorities are indexed in a min-max heap so that both the element to
+        be dequeued next and the element to be dequeued last can be found in logarithmic time. When the queue is full,
+        enqueueing a new element evicts the element to be dequeued last or, if the new element would be dequeued after
+        all other elements, the new element is discarded.
+
+    NOTE: if the queue uses an ordered index, the priorities are indexed in an AVL tree instead of a heap, which allows
+        range queries on the priorities (range, count_above, floor, ceiling) in O(log n + k) time instead of a full scan.
+    """
+
+    def __init__(self, elements_type=None, reverse=False, priority_type=int, capacity=None, ordered_index=False):
+        """
+        constructor for the priority queue
+
+        :param elements_type: denotes the type of elements that can be added to the queue, default is None, which allows
+            all types of elements
+        :param reverse: a boolean, which represents what kind of priority queue to use - if set to False(default) then
+            the dequeue() function returns the element with the greatest priority, if set to True - it returns the element with the least priority
+        :param priority_type: the type of the priorities in the queue, default is int, any totally ordered and hashable
+            type can be used (float, tuple, Decimal, etc.)
+        :param capacity: the maximum number of elements in the queue, default is None, which means the queue is unbounded
+        :param ordered_index: a boolean, if set to True the priorities are indexed in an AVL tree, which speeds up the
+            range queries, otherwise (default) the priorities are indexed in a binary heap
+        :raises PriorityQueueTypeError: if a valid type is not given as argument or a boolean is not used for the reverse argument
+        :raises PriorityQueueTypeError: if a valid type is not given for the priority_type argument
+        :raises PriorityQueueTypeError: if the capacity is not an integer
+        :raises PriorityQueueTypeError: if a boolean is not used for the ordered_index argument
+        :raises ValueError: if the capacity is not a positive integer
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise PriorityQueueTypeError("{0} is not a valid type for initialising the priority queue".format(elements_type))
+
+        if type(reverse) != bool:
+            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(reverse))
+
+        if type(priority_type) != type:
+            raise PriorityQueueTypeError("{0} is not a valid type for the priorities of the priority queue".format(priority_type))
+
+        if capacity is not None and type(capacity) != int:
+            raise PriorityQueueTypeError("The capacity of the priority queue must be an integer")
+
+        if capacity is not None and capacity <= 0:
+            raise ValueError("The capacity of the priority queue must be a positive integer")
+
+        if type(ordered_index) != bool:
+            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(ordered_index))
+
+        # the index of priorities is typed the same way as the priorities in the queue
+        if ordered_index:
+            self.__indices = AVLTree(priority_type)
+        elif capacity is not None:
+            self.__indices = MinMaxBinaryHeap(priority_type)
+        elif not reverse:
+            self.__indices = MaxBinaryHeap(priority_type)
+        else:
+            self.__indices = MinBinaryHeap(priority_type)
+
+        self.__elements = {}
+        self.__elements_type = elements_type
+        self.__priority_type = priority_type
+        self.__reverse = reverse
+        self.__capacity = capacity
+        self.__ordered_index = ordered_index
+
+    def __str__(self):
+        """
+        a string representation of the priority queue
+
+        :return: the str representation of the dictionary with elements in the queue
+        """
+
+        return str(self.__elements)
+
+    def __repr__(self):
+        """
+        a repr representation of the priority queue
+
+        :return: the repr representation of the dictionary with elements in the queue
+        """
+
+        return repr(self.__elements)
+
+    def __len__(self):
+        """
+        overriding this method allows the 'len(priority_queue) syntax'
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __contains__(self, element):
+        """
+        overriding this method allows the 'element in priority_queue' syntax
+
+        :param element: the element to search for
+        :return: True if there is an element linked to this priority and False otherwise
+        """
+
+        return self.contains_element(element)
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator with the priority queue
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        the next method used for the iterator
+
+        :return: uses dequeue to return the next element
+        :raises StopIteration: if the queue is empty
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    @property
+    def size(self):
+        """
+        this method gets the size of the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return len(self.__elements)
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements allowed in the queue
+        """
+
+        return self.__elements_type
+
+    @property
+    def priority_type(self):
+        """
+        a getter for the type of priorities in the queue
+
+        :return: the type of priorities allowed in the queue
+        """
+
+        return self.__priority_type
+
+    @property
+    def reversed(self):
+        """
+        this method checks if the queue is reversed
+
+        :return: True if the dequeue function returns the element in the least priority and False otherwise
+        """
+
+        return self.__reverse
+
+    @property
+    def capacity(self):
+        """
+        a getter for the maximum number of elements in the queue
+
+        :return: the capacity of the queue or None if the queue is unbounded
+        """
+
+        return self.__capacity
+
+    @property
+    def ordered_index(self):
+        """
+        this method checks if the priorities in the queue are indexed in an AVL tree
+
+        :return: True if the queue uses an ordered index and False if it uses a binary heap
+        """
+
+        return self.__ordered_index
+
+    def enqueue(self, item, priority):
+        """
+        this method inserts an element into the queue with a given priority,
+        if the priority argument already exists in the queue, the element stored with this priority will be overwritten
+        by the new element
+
+        :param item: the item to insert
+        :param priority: the priority of the item
+        :raises PriorityQueueTypeError: if the priority argument is not of the priority type of the queue
+        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other elements in the queue
+            unless the type of the queue is None (all types allowed in this case)
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.__priority_type))
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__elements_type))
+
+        if priority not in self.__elements:
+            if self.__capacity is not None and self.size >= self.__capacity:
+                # the new element is discarded if it would be dequeued after all elements in the full queue
+                if (self.__reverse and priority > self.__indices.peek_max()) or \
+                        (not self.__reverse and priority < self.__indices.peek_min()):
+                    return
+                self.__elements.pop(self.__remove_last_index())
+
+            self.__indices.add(priority)
+        self.__elements[priority] = item
+
+    def enqueue_many(self, pairs):
+        """
+        this method inserts many elements into the queue at once, the result is the same as calling enqueue() for each
+        pair, but the index of priorities is rebuilt only once, which takes O(n + k) time when the priorities are
+        indexed in a binary heap
+
+        :param pairs: an iterable of (item, priority) tuples
+        :raises PriorityQueueTypeError: if any of the items or the priorities is not of the type allowed in the queue,
+            in this case none of the elements is enqueued
+        """
+
+        pairs = list(pairs)
+        for item, priority in pairs:
+            if type(priority) != self.__priority_type:
+                raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.__priority_type))
+
+            if self.__elements_type is not None and type(item) != self.__elements_type:
+                raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__elements_type))
+
+        new_priorities = []
+        for item, priority in pairs:
+            if priority not in self.__elements:
+                new_priorities.append(priority)
+            self.__elements[priority] = item
+
+        self.__indices.extend(new_priorities)
+
+        if self.__capacity is not None:
+            while self.size > self.__capacity:
+                self.__elements.pop(self.__remove_last_index())
+
+    def merge(self, other):
+        """
+        this method merges the elements of another priority queue into this queue, the other queue is not modified;
+        the elements of the other queue are treated as if they were enqueued after the elements of this queue, hence
+        if both queues have an element with the same priority, the element of the other queue is retained
+
+        :param other: the priority queue (PriorityQueue or DuplicatePriorityQueue) to merge into this queue
+        :raises PriorityQueueTypeError: if the argument is not a priority queue
+        :raises PriorityQueueTypeError: if the other queue contains elements or priorities of different types
+        """
+
+        if not isinstance(other, PriorityQueue):
+            raise PriorityQueueTypeError("Only a priority queue can be merged into a priority queue")
+
+        if other.priority_type != self.__priority_type:
+            raise PriorityQueueTypeError("The priorities of the merged queue must be of type {0}".format(self.__priority_type))
+
+        if self.__elements_type is not None and other.type != self.__elements_type:
+            raise PriorityQueueTypeError("The elements of the merged queue must be of type {0}".format(self.__elements_type))
+
+        self.enqueue_many(other._pairs())
+
+    def _pairs(self):
+        """
+        gets the elements in the queue together with their priorities, subclasses override this method if they store
+        the elements differently
+
+        :return: a list of (item, priority) tuples
+        """
+
+        return [(item, priority) for priority, item in self.__elements.items()]
+
+    def _priority_of(self, element):
+        """
+        finds the priority of an element in the queue, subclasses override this method if they store the elements
+        differently
+
+        :param element: the element to find
+        :return: the priority of the element or None if the queue doesn't contain the element
+        """
+
+        for priority, test_element in self.__elements.items():
+            if test_element == element:
+                return priority
+
+        return None
+
+    def _peek_priority(self):
+        """
+        gets the priority of the element, which would be dequeued next
+
+        :return: the greatest or the lowest priority depending on the reverse argument in the constructor or None if the
+            queue is empty
+        """
+
+        if len(self.__elements) == 0:
+            return None
+
+        if self.__reverse:
+            return self.__indices.peek_min()
+        else:
+            return self.__indices.peek_max()
+
+    def __remove_last_index(self):
+        """
+        removes the priority of the element, which would be dequeued last, from the heap of indices,
+        can only be used when the queue is bounded by a capacity
+
+        :return: the removed priority
+        """
+
+        if self.__reverse:
+            return self.__indices.remove_max()
+        else:
+            return self.__indices.remove_min()
+
+    def dequeue(self):
+        """
+        this method takes the element with the greatest or the lowest priority depending on the reverse argument in the
+        constructor, then returns this element and removes it from the queue
+
+        :return: the element to be dequeued
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        if self.size == 0:
+            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+
+        if self.__reverse:
+            min_priority = self.__indices.remove_min()
+            element_to_return = self.__elements.get(min_priority)
+            self.__elements.pop(min_priority)
+            return element_to_return
+        else:
+            max_priority = self.__indices.remove_max()
+            element_to_return = self.__elements.get(max_priority)
+            self.__elements.pop(max_priority)
+            return element_to_return
+
+    def peek(self):
+        """
+        this method is the same as dequeue() but doesn't remove the element from the priority queue
+
+        :return: the element to be dequeued without removing it or None if the queue is empty
+        """
+
+        if self.size == 0:
+            return None
+
+        if self.__reverse:
+            return self.__elements.get(self.__indices.peek_min())
+        else:
+            return self.__elements.get(self.__indices.peek_max())
+
+    def get_element(self, priority):
+        """
+        this method gets the element with a specified priority
+
+        :param priority: the given priority
+        :return: the element linked to this priority or None if not existing
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        return self.__elements.get(priority)
+
+    def contains_priority(self, priority):
+        """
+        this method checks if a given priority is assigned to an object
+
+        :param priority: the priority to check
+        :return: True if the queue contains this priority and False otherwise
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if type(priority) == self.__priority_type:
+            return priority in self.__elements.keys()
+        else:
+            raise PriorityQueueTypeError("Priorities must be of type {0}".format(self.__priority_type))
+
+    def contains_element(self, element):
+        """
+        this method checks if a given element is contained in the queue
+
+        :param element: the element to check
+        :return: True if the element is in the queue and False otherwise
+        :raises PriorityQueueTypeError: if the element's type is not the same as the type of elements in the queue
+        """
+
+        if self.__elements_type is not None and type(element) != self.__elements_type:
+            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.__elements_type))
+
+        return element in self.__elements.values()
+
+    def range(self, low=None, high=None):
+        """
+        this method finds all elements with priorities between two bounds (inclusive), the method takes O(log n + k)
+        time if the queue uses an ordered index and O(n log n) time otherwise
+
+        :param low: the lower bound of the priorities, None means there is no lower bound
+        :param high: the upper bound of the priorities, None means there is no upper bound
+        :return: a list with the elements between the bounds in the order they would be dequeued
+        :raises PriorityQueueTypeError: if any of the bounds is not of the priority type of the queue
+        """
+
+        return [self.__elements[priority] for priority in self.__priorities_between(low, high)]
+
+    def count_above(self, priority):
+        """
+        this method counts the elements with a priority greater than the given priority, the method takes O(log n)
+        time if the queue uses an ordered index and O(n) time otherwise
+
+        :param priority: the priority to compare with
+        :return: the number of elements with a greater priority
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        if self.__ordered_index:
+            return self.__indices.count_greater(priority)
+
+        return len([key for key in self.__elements if key > priority])
+
+    def floor(self, priority):
+        """
+        this method finds the greatest priority in the queue, which is less than or equal to the given priority
+
+        :param priority: the priority to compare with
+        :return: the found priority or None if all priorities in the queue are greater than the argument
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        if self.__ordered_index:
+            return self.__indices.floor(priority)
+
+        return max([key for key in self.__elements if key <= priority], default=None)
+
+    def ceiling(self, priority):
+        """
+        this method finds the least priority in the queue, which is greater than or equal to the given priority
+
+        :param priority: the priority to compare with
+        :return: the found priority or None if all priorities in the queue are less than the argument
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        if self.__ordered_index:
+            return self.__indices.ceiling(priority)
+
+        return min([key for key in self.__elements if key >= priority], default=None)
+
+    def __priorities_between(self, low, high):
+        """
+        finds the priorities in the queue between two bounds (inclusive)
+
+        :param low: the lower bound, None means there is no lower bound
+        :param high: the upper bound, None means there is no upper bound
+        :return: a list with the found priorities in the order they would be dequeued
+        :raises PriorityQueueTypeError: if any of the bounds is not of the priority type of the queue
+        """
+
+        for bound in (low, high):
+            if bound is not None and type(bound) != self.__priority_type:
+                raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        if self.__ordered_index:
+            priorities = self.__indices.range(low, high)
+        else:
+            priorities = sorted([key for key in self.__elements
+                                 if (low is None or key >= low) and (high is None or key <= high)])
+
+        if not self.__reverse:
+            priorities.reverse()
+
+        return priorities
+
+    def replace_priority(self, element, new_priority, comparison=None):
+        """
+        this method finds an element and replaces its priority with a new one
+
+        :param element: the element, for which the priority must be replaced
+        :param new_priority: the new priority
+        :param comparison: represents whether a comparison between the two priorities must be made before replacing
+            None - no comparison, 1 - greater than comparison (new > old)), -1 - less than comparison (new < old)
+        :return: True if the element's priority has been replaced and False otherwise
+        :raises PriorityQueueTypeError: if the type of the queue is not None and is different than the type of the element argument
+        :raises PriorityQueueTypeError: if the type of the new priority is not the priority type of the queue
+        :raises ValueError if the type of the comparison argument is not any of these (None, -1, 1)
+        :raises PriorityQueueElementError: if the element is not contained in the queue
+        """
+
+        if self.__elements_type is not None and type(element) != self.__elements_type:
+            raise PriorityQueueTypeError("Type of the first parameter is not " + str(self.__elements_type))
+
+        if type(new_priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.__priority_type))
+
+        if comparison is not None and comparison != 1 and comparison != -1:
+            raise ValueError("The comparison argument must be None for no comparison, -1 - for less than comparison"
+                             "and 1 for greater than comparison")
+
+        element_found = False
+        replaced = False
+        for priority in self.__elements:
+            if self.__elements[priority] == element:
+                if (comparison is None and priority != new_priority) or (comparison == 1 and new_priority > priority)\
+                            or (comparison == -1 and new_priority < priority):
+                    self.__elements.pop(priority)
+                    if new_priority not in self.__indices:
+                        self.__indices.replace(priority, new_priority)
+                    else:
+                        self.__indices.remove(priority)
+                    self.__elements[new_priority] = element
+                    replaced = True
+                element_found = True
+                break
+
+        if not element_found:
+            raise PriorityQueueElementError("The queue doesn't contain the element for which you are trying to replace the priority.")
+
+        return replaced
+
+    def remove_element(self, element):
+        """
+        this method removes an element from the priority queue
+
+        :param element: the element to remove
+        :raises PriorityQueueElementError: if the queue doesn't contain the element to delete
+        :raises PriorityQueueTypeError: if the type of the argument differs from the type of the elements in the queue
+        """
+
+        if self.__elements_type is not None and type(element) != self.__elements_type:
+            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.__elements_type))
+
+        removed = False
+        for priority in self.__elements:
+            test_element = self.__elements[priority]
+            if element == test_element:
+                self.__indices.remove(priority)
+                self.__elements.pop(priority)
+                removed = True
+                break
+
+        if not removed:
+            raise PriorityQueueElementError("The queue doesn't contain the element you are trying to delete.")
+
+
+class DuplicatePriorityQueue(PriorityQueue):
+    """
+    Abstract Data Structure - represents a queue with priorities for elements, difference from PriorityQueue is that
+    this implementation allows elements with duplicated priorities, that is the mapping between elements and priorities is injective
+    """
+
+    def __init__(self, elements_type=None, reverse=False, priority_type=int, capacity=None, ordered_index=False):
+        """
+        overriding the constructor to get references to the elements and the priorities
+
+        :param elements_type: the type of elements in the queue
+        :param reverse: the reverse argument of the PriorityQueue
+        :param priority_type: the type of priorities in the queue
+        :param capacity: the maximum number of elements in the queue (including duplicated priorities)
+        :param ordered_index: the ordered_index argument of the PriorityQueue
+        """
+
+        super().__init__(elements_type, reverse, priority_type, capacity, ordered_index)
+
+        self.__elements = self._PriorityQueue__elements
+        self.__indices = self._PriorityQueue__indices
+        self.__size = 0
+
+    @property
+    def size(self):
+        """
+        overriding the size() method to return the __size attribute
+        :return: the number of elements in the queue (including duplicated priorities)
+        """
+
+        return self.__size
+
+    def enqueue(self, item, priority):
+        """
+        overriding the enqueue() method to allow duplicated priorities,
+        2 or more elements with the same priorities are stored in an ordinary queue
+
+        :param item: the item to enqueue
+        :param priority: the priority of the item
+        :raises PriorityQueueTypeError: if the type of the priority is not the priority type of the queue
+        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other queue's elements
+        """
+
+        if type(priority) != self.priority_type:
+            raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.priority_type))
+
+        if self.type is not None and type(item) != self.type:
+            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.type))
+
+        if self.capacity is not None and self.size >= self.capacity:
+            # the new element is discarded if it would be dequeued after all elements in the full queue, this includes
+            # the case when its priority is the same as the last priority, since it would be dequeued after the duplicates
+            if (self.reversed and priority >= self.__indices.peek_max()) or \
+                    (not self.reversed and priority <= self.__indices.peek_min()):
+                return
+            self.__evict_last()
+
+        if priority not in self.__elements:
+            self.__indices.add(priority)
+            self.__elements[priority] = item
+        else:
+            element = self.__elements[priority]
             if type(element) == Queue:
                 element.enqueue(item)
             else:
-                duplicates = Queue(self.type)
-                duplicates.enqueue(element)
-                duplicates.enqueue(item)
-                self.__elements[priority] = duplicates
-        self.__size += 1
+                duplicates = Queue(self.type)
+                duplicates.enqueue(element)
+                duplicates.enqueue(item)
+                self.__elements[priority] = duplicates
+        self.__size += 1
+
+    def enqueue_many(self, pairs):
+        """
+        overriding the enqueue_many() method to allow duplicated priorities, elements with the same priority are
+        dequeued in the order they appear in the pairs argument
+
+        :param pairs: an iterable of (item, priority) tuples
+        :raises PriorityQueueTypeError: if any of the items or the priorities is not of the type allowed in the queue,
+            in this case none of the elements is enqueued
+        """
+
+        pairs = list(pairs)
+        for item, priority in pairs:
+            if type(priority) != self.priority_type:
+                raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.priority_type))
+
+            if self.type is not None and type(item) != self.type:
+                raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.type))
+
+        new_priorities = []
+        for item, priority in pairs:
+            if priority not in self.__elements:
+                new_priorities.append(priority)
+                self.__elements[priority] = item
+            else:
+                element = self.__elements[priority]
+                if type(element) == Queue:
+                    element.enqueue(item)
+                else:
+                    duplicates = Queue(self.type)
+                    duplicates.enqueue(element)
+                    duplicates.enqueue(item)
+                    self.__elements[priority] = duplicates
+            self.__size += 1
+
+        self.__indices.extend(new_priorities)
+
+        if self.capacity is not None:
+            while self.size > self.capacity:
+                self.__evict_last()
+
+    def _pairs(self):
+        """
+        overriding the method, which gets the elements with their priorities, to return the elements with duplicated
+        priorities in the order they were enqueued
+
+        :return: a list of (item, priority) tuples
+        """
+
+        pairs = []
+        for priority, element in self.__elements.items():
+            if type(element) != Queue:
+                pairs.append((element, priority))
+            else:
+                pairs.extend([(item, priority) for item in element.view()])
+
+        return pairs
+
+    def _priority_of(self, element):
+        """
+        overriding the method, which finds the priority of an element, to search the elements with duplicated priorities
+        too
+
+        :param element: the element to find
+        :return: the priority of the element or None if the queue doesn't contain the element
+        """
+
+        for priority, test_element in self.__elements.items():
+            if type(test_element) != Queue and test_element == element:
+                return priority
+            elif type(test_element) == Queue and element in test_element:
+                return priority
+
+        return None
+
+    def __evict_last(self):
+        """
+        removes the element, which would be dequeued last, can only be used when the queue is bounded by a capacity
+        """
+
+        if self.reversed:
+            last_priority = self.__indices.peek_max()
+        else:
+            last_priority = self.__indices.peek_min()
+
+        element = self.__elements[last_priority]
+        if type(element) != Queue:
+            self.__elements.pop(last_priority)
+            self._PriorityQueue__remove_last_index()
+        else:
+            # the last element with this priority is the one that was enqueued last
+            element.dequeue_last()
+            if len(element) == 1:
+                self.__elements[last_priority] = element.dequeue()
+        self.__size -= 1
+
+    def dequeue(self):
+        """
+        overriding the dequeue() method to handle duplicated priorities too
+
+        :return: the dequeued element
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        if self.size == 0:
+            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+
+        if self.reversed:
+            min_priority = self.__indices.peek_min()
+            element_to_return = self.__elements.get(min_priority)
+            if type(element_to_return) != Queue:
+                self.__indices.remove_min()
+                self.__elements.pop(min_priority)
+                self.__size -= 1
+                return element_to_return
+            else:
+                if len(element_to_return) == 2:
+                    to_return = element_to_return.dequeue()
+                    self.__elements[min_priority] = element_to_return.dequeue()
+                    self.__size -= 1
+                    return to_return
+                else:
+                    self.__size -= 1
+                    return element_to_return.dequeue()
+
+        else:
+            max_priority = self.__indices.peek_max()
+            element_to_return = self.__elements.get(max_priority)
+            if type(element_to_return) != Queue:
+                self.__indices.remove_max()
+                self.__elements.pop(max_priority)
+                self.__size -= 1
+                return element_to_return
+            else:
+                if len(element_to_return) == 2:
+                    to_return = element_to_return.dequeue()
+                    self.__elements[max_priority] = element_to_return.dequeue()
+                    self.__size -= 1
+                    return to_return
+                else:
+                    self.__size -= 1
+                    return element_to_return.dequeue()
+
+    def peek(self):
+        """
+        overriding the peek method to handle duplicated priorities too
+
+        :return: the element to be dequeued, but without removing it or None if the queue is empty
+        """
+
+        if self.size == 0:
+            return None
+
+        if self.reversed:
+            to_peek = self.__elements.get(self.__indices.peek_min())
+        else:
+            to_peek = self.__elements.get(self.__indices.peek_max())
+
+        if type(to_peek) != Queue:
+            return to_peek
+        else:
+            return to_peek.peek()
+
+    def get_element(self, priority):
+        """
+        overriding the get method to handle duplicated priorities
+
+        :param priority: the priority to search for
+        :return: the element linked to the given priority
+        :raises PriorityQueueTypeError: if the priority's type is not the priority type of the queue
+        """
+
+        if type(priority) != self.priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.priority_type))
+
+        element = self.__elements.get(priority)
+        if type(element) != Queue:
+            return element
+        else:
+            return element.peek()
+
+    def contains_element(self, element):
+        """
+        overriding the contains_element method to search for values with duplicated priorities too
+
+        :param element: the element to search for
+        :return: True if the element is contained in the queue and False otherwise
+        :raises PriorityQueueTypeError: if the element's type is not the same as the type of queue's elements
+        """
+
+        if self.type is not None and type(element) != self.type:
+            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+
+        if not self.has_duplicates():
+            return super().contains_element(element)
+
+        for test_element in self.__elements.values():
+            if type(test_element) != Queue and test_element == element:
+                return True
+            elif type(test_element) == Queue:
+                if element in test_element:
+                    return True
+        return False
+    
+    def range(self, low=None, high=None):
+        """
+        overriding the range method to return all elements with duplicated priorities too
+
+        :param low: the lower bound of the priorities, None means there is no lower bound
+        :param high: the upper bound of the priorities, None means there is no upper bound
+        :return: a list with the elements between the bounds in the order they would be dequeued
+        :raises PriorityQueueTypeError: if any of the bounds is not of the priority type of the queue
+        """
+
+        elements = []
+        for priority in self._PriorityQueue__priorities_between(low, high):
+            element = self.__elements[priority]
+            if type(element) != Queue:
+                elements.append(element)
+            else:
+                elements.extend(element.view())
+
+        return elements
+
+    def count_above(self, priority):
+        """
+        overriding the count_above method to count the elements with duplicated priorities too, the method takes
+        O(log n + k) time if the queue uses an ordered index, where k is the number of greater priorities
+
+        :param priority: the priority to compare with
+        :return: the number of elements with a greater priority
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        if not self.has_duplicates():
+            return super().count_above(priority)
+
+        count = 0
+        for key in self._PriorityQueue__priorities_between(priority, None):
+            if key != priority:
+                element = self.__elements[key]
+                count += len(element) if type(element) == Queue else 1
+
+        return count
+
+    def has_duplicates(self):
+        """
+        a method for fast check if there are items with duplicated
+
+        :return: True if there are two or more elements with the same priority and False otherwise
+        """
+
+        return self.size != len(self.__elements)
+
+    def replace_priority(self, element, new_priority, comparison=None):
+        """
+        overriding the replace_priority method to work with duplicated priorities too
+
+        :param element: the element, for which the priority must be replaced
+        :param new_priority: the new priority
+        :param comparison: represents whether a comparison between the two priorities must be made before replacing
+            None - no comparison, 1 - greater than comparison (new > old)), -1 - less than comparison (new < old)
+        :return: True if the element's priority has been replaced and False otherwise
+        :raises PriorityQueueTypeError: if the type of the queue is not None and is different than the type of the element argument
+        :raises PriorityQueueTypeError: if the type of the new priority is not the priority type of the queue
+        :raises ValueError if the type of the comparison argument is not any of these (None, -1, 1)
+        :raises PriorityQueueElementError: if the element is not contained in the queue
+        :return:
+        """
+
+        if self.type is not None and type(element) != self.type:
+            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+
+        if type(new_priority) != self.priority_type:
+            raise PriorityQueueTypeError("The priority parameter must be of type {0}.".format(self.priority_type))
+
+        if comparison is not None and comparison != 1 and comparison != -1:
+            raise ValueError("The comparison argument must be None for no comparison, -1 - for less than comparison"
+                             "and 1 for greater than comparison")
+
+        element_found = False
+        replaced = False
+        for priority in self.__elements:
+            test_element = self.__elements[priority]
+            if type(test_element) == Queue:
+                if element in test_element:
+                    if (comparison is None and priority != new_priority) or \
+                            (comparison == 1 and new_priority > priority)\
+                            or (comparison == -1 and new_priority < priority):
+                        test_element.remove(element)
+                        if len(test_element) == 1:
+                            self.__elements[priority] = test_element.dequeue()
+
+                        if new_priority not in self.__indices:
+                            self.__indices.add(new_priority)
+                            self.__elements[new_priority] = element
+                        else:
+                            if type(self.__elements[new_priority]) == Queue:
+                                self.__elements[new_priority].enqueue(element)
+                            else:
+                                duplicates = Queue(self.type)
+                                duplicates.enqueue(self.__elements[new_priority])
+                                duplicates.enqueue(element)
+                                self.__elements[new_priority] = duplicates
+
+                        replaced = True
+                    element_found = True
+                    break
+            else:
+                if test_element == element:
+                    if (comparison is None and priority != new_priority) or \
+                            (comparison == 1 and new_priority > priority) \
+                            or (comparison == -1 and new_priority < priority):
+                        self.__elements.pop(priority)
+                        if new_priority not in self.__indices:
+                            self.__indices.replace(priority, new_priority)
+                            self.__elements[new_priority] = element
+                        else:
+                            self.__indices.remove(priority)
+                            if type(self.__elements[new_priority]) == Queue:
+                                self.__elements[new_priority].enqueue(element)
+                            else:
+                                duplicates = Queue(self.type)
+                                duplicates.enqueue(self.__elements[new_priority])
+                                duplicates.enqueue(element)
+                                self.__elements[new_priority] = duplicates
+                        replaced = True
+                    element_found = True
+                    break
+
+        if not element_found:
+            raise PriorityQueueElementError("The queue doesn't contain the element for which you are trying to replace the priority.")
+
+        return replaced
+
+    def remove_element(self, element):
+        """
+        overriding the remove() method to handle duplicated priorities too
+
+        :param element: the element to remove
+        :raises PriorityQueueTypeError: if the type of the argument is not the same as the type of the elements in the heap
+        :raises PriorityQueueElementError: if the element to remove is not contained in the heap
+        """
+
+        if self.type is not None and type(element) != self.type:
+            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+
+        removed = False
+        for priority in self.__elements:
+            test_element = self.__elements[priority]
+            if type(test_element) == Queue:
+                try:
+                    test_element.remove(element)
+                    if len(test_element) == 0:
+                        self.__elements.pop(priority)
+                        self.__indices.remove(priority)
+                    elif len(test_element) == 1:
+                        self.__elements[priority] = test_element.dequeue()
+                    self.__size -= 1
+                    removed = True
+                    break
+                except QueueElementError:
+                    pass
+            else:
+                if element == test_element:
+                    self.__indices.remove(priority)
+                    self.__elements.pop(priority)
+                    self.__size -= 1
+                    removed = True
+                    break
+
+        if not removed:
+            raise PriorityQueueElementError("The queue doesn't contain the element you are trying to delete.")
+
+
+class AgingPriorityQueue(object):
+    """
+    Abstract Data Structure - represents a queue with priorities for elements, in which the effective priority of an
+    element grows with the time the element has been waiting in the queue, so that elements with a low priority cannot
+    wait forever while elements with a higher priority keep arriving
+
+    The effective priority of an element enqueued at time t with priority p is p + aging_rate*(now - t). Since all elements
+    age at the same rate, the order of two elements never changes with time, hence the queue stores every element with the
+    fixed virtual priority p - aging_rate*t (p + aging_rate*t for a reversed queue, in which the effective priority of an
+    element decreases with time) in a DuplicatePriorityQueue and dequeue runs in O(log n) time without rescanning the queue.
+
+    NOTE: elements with the same effective priority are dequeued in the order they were enqueued.
+    """
+
+    def __init__(self, elements_type=None, reverse=False, priority_type=int, aging_rate=1.0, clock=monotonic):
+        """
+        constructor for the aging priority queue
+
+        :param elements_type: denotes the type of elements that can be added to the queue, default is None, which allows
+            all types of elements
+        :param reverse: the reverse argument of the PriorityQueue - if set to True the queue dequeues the element with the
+            lowest effective priority and the effective priorities decrease with time
+        :param priority_type: the type of the priorities in the queue, either int (default) or float
+        :param aging_rate: the amount, by which the priority of an element changes per unit of time, default is 1.0
+        :param clock: a function returning the current time, default is time.monotonic, i.e. the aging rate is per second
+        :raises PriorityQueueTypeError: if a valid type is not given as argument or a boolean is not used for the reverse argument
+        :raises PriorityQueueTypeError: if the priority_type argument is neither int, nor float
+        :raises PriorityQueueTypeError: if the aging rate is not a number or the clock is not callable
+        :raises ValueError: if the aging rate is negative
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise PriorityQueueTypeError("{0} is not a valid type for initialising the priority queue".format(elements_type))
+
+        if type(reverse) != bool:
+            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(reverse))
+
+        if priority_type != int and priority_type != float:
+            raise PriorityQueueTypeError("The priorities of the aging priority queue must be either of type int or float")
+
+        if type(aging_rate) != int and type(aging_rate) != float:
+            raise PriorityQueueTypeError("The aging rate of the priority queue must be a number")
+
+        if aging_rate < 0:
+            raise ValueError("The aging rate of the priority queue must not be negative")
+
+        if not callable(clock):
+            raise PriorityQueueTypeError("The clock of the priority queue must be callable")
+
+        # the elements are stored as (element, priority, enqueue time) tuples linked to their virtual priorities
+        self.__elements = DuplicatePriorityQueue(tuple, reverse, float)
+        self.__elements_type = elements_type
+        self.__priority_type = priority_type
+        self.__aging_rate = aging_rate
+        self.__clock = clock
+
+        self.__dequeued = 0
+        self.__total_wait = 0.0
+        self.__max_wait = 0.0
+
+    def __str__(self):
+        """
+        overriding the str() method
+
+        :return: a string of the list of (effective priority, element) tuples in the order they would be dequeued
+        """
+
+        now = self.__clock()
+        return str([(self.__effective_priority(entry, now), entry[0]) for entry in self.__elements.range()])
+
+    def __repr__(self):
+        """
+        overriding the repr() method
+
+        :return: a string in the form <AgingPriorityQueue object at ...>
+        """
+
+        return "<AgingPriorityQueue object at {0}>".format(hex(id(self)))
+
+    def __len__(self):
+        """
+        overriding the len() method
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__elements.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator with the aging priority queue
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        the next method used for the iterator
+
+        :return: uses dequeue to return the next element
+        :raises StopIteration: if the queue is empty
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    @property
+    def size(self):
+        """
+        a getter for the size of the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__elements.size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements in the queue, None if all types are allowed
+        """
+
+        return self.__elements_type
+
+    @property
+    def priority_type(self):
+        """
+        a getter for the type of the priorities in the queue
+
+        :return: the type of the priorities in the queue
+        """
+
+        return self.__priority_type
+
+    @property
+    def reversed(self):
+        """
+        a getter for the reverse argument of the queue
+
+        :return: True if the queue dequeues the element with the lowest effective priority
+        """
+
+        return self.__elements.reversed
+
+    @property
+    def aging_rate(self):
+        """
+        a getter for the aging rate of the queue
+
+        :return: the amount, by which the priority of an element changes per unit of time
+        """
+
+        return self.__aging_rate
+
+    @property
+    def mean_wait(self):
+        """
+        a getter for the average time the dequeued elements have waited in the queue
+
+        :return: the mean wait time, 0.0 if no elements have been dequeued
+        """
+
+        if self.__dequeued == 0:
+            return 0.0
+
+        return self.__total_wait / self.__dequeued
+
+    @property
+    def max_wait(self):
+        """
+        a getter for the longest time a dequeued element has waited in the queue
+
+        :return: the maximum wait time, 0.0 if no elements have been dequeued
+        """
+
+        return self.__max_wait
+
+    @property
+    def oldest_wait(self):
+        """
+        a getter for the time the oldest element in the queue has been waiting, this is an O(n) operation
+
+        :return: the wait time of the oldest element, 0.0 if the queue is empty
+        """
+
+        if self.size == 0:
+            return 0.0
+
+        return self.__clock() - min(entry[2] for entry in self.__elements.range())
+
+    def enqueue(self, item, priority):
+        """
+        this method inserts an element into the queue with a given priority
+
+        :param item: the item to insert
+        :param priority: the priority of the item at the time it is enqueued
+        :raises PriorityQueueTypeError: if the priority argument is not of the priority type of the queue
+        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other elements in the queue
+            unless the type of the queue is None (all types allowed in this case)
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.__priority_type))
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__elements_type))
+
+        now = self.__clock()
+        if self.reversed:
+            virtual_priority = float(priority + self.__aging_rate*now)
+        else:
+            virtual_priority = float(priority - self.__aging_rate*now)
+
+        self.__elements.enqueue((item, priority, now), virtual_priority)
 
     def dequeue(self):
         """
-        overriding the dequeue() method to handle duplicated priorities too
+        this method returns the element with the greatest effective priority (or the lowest one if the queue is reversed)
+        and removes it from the queue
+
+        :return: the element to be dequeued
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        return self.dequeue_with_wait()[0]
+
+    def dequeue_with_wait(self):
+        """
+        this method is the same as dequeue() but also returns the time the element has waited in the queue
+
+        :return: a tuple (element, wait time)
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        if self.size == 0:
+            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+
+        item, priority, enqueue_time = self.__elements.dequeue()
+        wait = self.__clock() - enqueue_time
+
+        self.__dequeued += 1
+        self.__total_wait += wait
+        self.__max_wait = max(self.__max_wait, wait)
+
+        return item, wait
+
+    def peek(self):
+        """
+        this method is the same as dequeue() but doesn't remove the element from the priority queue
+
+        :return: the element to be dequeued without removing it or None if the queue is empty
+        """
+
+        if self.size == 0:
+            return None
+
+        return self.__elements.peek()[0]
+
+    def effective_priority(self, item):
+        """
+        this method finds the current effective priority of an element, this is an O(n) operation
+
+        :param item: the element
+        :return: the priority of the element increased (or decreased if the queue is reversed) with its age
+        :raises PriorityQueueElementError: if the queue doesn't contain the element
+        """
+
+        now = self.__clock()
+        for entry in self.__elements.range():
+            if entry[0] == item:
+                return self.__effective_priority(entry, now)
+
+        raise PriorityQueueElementError("The queue doesn't contain the element")
+
+    def __effective_priority(self, entry, now):
+        """
+        computes the effective priority of a stored element
+
+        :param entry: the (element, priority, enqueue time) tuple
+        :param now: the current time
+        :return: the effective priority
+        """
+
+        if self.reversed:
+            return entry[1] - self.__aging_rate*(now - entry[2])
+        else:
+            return entry[1] + self.__aging_rate*(now - entry[2])
+
+
+class FairQueue(object):
+    """
+    Abstract Data Structure - a queue multiplexing many lanes (e.g. the traffic of many tenants), which keeps one Queue per
+    lane and serves the lanes fairly with deficit round robin
+
+    Every non-empty lane waits for its turn in a round robin order. When a lane gets its turn, its deficit is increased with
+    its weight and the lane is served while its deficit is at least 1, every dequeued element decreasing the deficit by 1.
+    Hence, while two lanes are non-empty, they get dequeued elements in proportion to their weights and a lane with a lot
+    of traffic cannot delay the elements of the other lanes by more than a round. Both enqueue and dequeue run in O(1)
+    amortized time.
+    """
+
+    def __init__(self, elements_type=None, default_weight=1):
+        """
+        constructor for the fair queue
+
+        :param elements_type: denotes the type of elements that can be added to the queue, default is None, which allows
+            all types of elements
+        :param default_weight: the weight of the lanes created implicitly by enqueue(), default is 1
+        :raises QueueTypeError: if a valid type is not given as argument or the default weight is not a number
+        :raises ValueError: if the default weight is not positive
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+
+        self.__check_weight(default_weight)
+
+        self.__elements_type = elements_type
+        self.__default_weight = default_weight
+        self.__lanes = {}
+        self.__weights = {}
+        self.__deficits = {}
+        self.__enqueued = {}
+        self.__dequeued = {}
+
+        # the non-empty lanes in round robin order, the lane at the front is the one currently being served
+        self.__active = deque()
+        self.__size = 0
+
+    def __str__(self):
+        """
+        overriding the str() method
+
+        :return: a string of the dictionary linking lanes with their queues
+        """
+
+        return str({lane: list(queue.view()) for lane, queue in self.__lanes.items()})
+
+    def __repr__(self):
+        """
+        overriding the repr() method
 
-        :return: the dequeued element
-        :raises EmptyPriorityQueueError: if the queue is empty
+        :return: a string in the form <FairQueue object at ...>
         """
 
-        if self.size == 0:
-            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+        return "<FairQueue object at {0}>".format(hex(id(self)))
 
-        if type(self.__indices) == MinBinaryHeap:
-            min_priority = self.__indices.peek_min()
-            element_to_return = self.__elements.get(min_priority)
-            if type(element_to_return) != Queue:
-                self.__indices.remove_min()
-                self.__elements.pop(min_priority)
-                self.__size -= 1
-                return element_to_return
-            else:
-                if len(element_to_return) == 2:
-                    to_return = element_to_return.dequeue()
-                    self.__elements[min_priority] = element_to_return.dequeue()
-                    self.__size -= 1
-                    return to_return
-                else:
-                    self.__size -= 1
-                    return element_to_return.dequeue()
+    def __len__(self):
+        """
+        overriding the len() method
 
-        elif type(self.__indices) == MaxBinaryHeap:
-            max_priority = self.__indices.peek_max()
-            element_to_return = self.__elements.get(max_priority)
-            if type(element_to_return) != Queue:
-                self.__indices.remove_max()
-                self.__elements.pop(max_priority)
-                self.__size -= 1
-                return element_to_return
-            else:
-                if len(element_to_return) == 2:
-                    to_return = element_to_return.dequeue()
-                    self.__elements[max_priority] = element_to_return.dequeue()
-                    self.__size -= 1
-                    return to_return
-                else:
-                    self.__size -= 1
-                    return element_to_return.dequeue()
+        :return: the number of elements in all lanes
+        """
 
-    def peek(self):
+        return self.__size
+
+    def __iter__(self):
         """
-        overriding the peek method to handle duplicated priorities too
+        overriding this method allows the use of an iterator with the fair queue
 
-        :return: the element to be dequeued, but without removing it or None if the queue is empty
+        :return: reference to the queue itself
         """
 
-        if self.size == 0:
-            return None
+        return self
 
-        to_peek = None
-        if type(self.__indices) == MinBinaryHeap:
-            to_peek = self.__elements.get(self.__indices.peek_min())
-        elif type(self.__indices) == MaxBinaryHeap:
-            to_peek = self.__elements.get(self.__indices.peek_max())
+    def __next__(self):
+        """
+        the next method used for the iterator
 
-        if type(to_peek) != Queue:
-            return to_peek
+        :return: uses dequeue to return the next element
+        :raises StopIteration: if the queue is empty
+        """
+
+        if self.__size == 0:
+            raise StopIteration
         else:
-            return to_peek.peek()
+            return self.dequeue()
 
-    def get_element(self, priority):
+    @property
+    def size(self):
         """
-        overriding the get method to handle duplicated priorities
+        a getter for the size of the queue
 
-        :param priority: the priority to search for
-        :return: the element linked to the given priority
-        :raises PriorityQueueTypeError: if the priority's type is not int
+        :return: the number of elements in all lanes
         """
 
-        if type(priority) != int:
-            raise PriorityQueueTypeError("The priority parameter must be an integer.")
+        return self.__size
 
-        element = self.__elements.get(priority)
-        if type(element) != Queue:
-            return element
-        else:
-            return element.peek()
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
 
-    def contains_element(self, element):
+        :return: the type of elements in the queue, None if all types are allowed
         """
-        overriding the contains_element method to search for values with duplicated priorities too
 
-        :param element: the element to search for
-        :return: True if the element is contained in the queue and False otherwise
-        :raises PriorityQueueTypeError: if the element's type is not the same as the type of queue's elements
+        return self.__elements_type
+
+    @property
+    def lanes(self):
         """
+        a getter for the lanes of the queue
 
-        if self.type is not None and type(element) != self.type:
-            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+        :return: a list with the lanes in the order they were created
+        """
 
-        if not self.has_duplicates():
-            return super().contains_element(element)
+        return list(self.__lanes)
 
-        for test_element in self.__elements.values():
-            if type(test_element) != Queue and test_element == element:
-                return True
-            elif type(test_element) == Queue:
-                if element in test_element:
-                    return True
-        return False
-    
-    def has_duplicates(self):
+    @staticmethod
+    def __check_weight(weight):
         """
-        a method for fast check if there are items with duplicated
+        checks that a weight is valid
 
-        :return: True if there are two or more elements with the same priority and False otherwise
+        :param weight: the weight to check
+        :raises QueueTypeError: if the weight is not a number
+        :raises ValueError: if the weight is not positive
         """
 
-        return self.size != len(self.__elements)
+        if type(weight) != int and type(weight) != float:
+            raise QueueTypeError("The weight of a lane must be a number")
 
-    def replace_priority(self, element, new_priority, comparison=None):
+        if weight <= 0:
+            raise ValueError("The weight of a lane must be positive")
+
+    def __check_lane(self, lane):
         """
-        overriding the replace_priority method to work with duplicated priorities too
+        checks that a lane exists
 
-        :param element: the element, for which the priority must be replaced
-        :param new_priority: the new priority
-        :param comparison: represents whether a comparison between the two priorities must be made before replacing
-            None - no comparison, 1 - greater than comparison (new > old)), -1 - less than comparison (new < old)
-        :return: True if the element's priority has been replaced and False otherwise
-        :raises PriorityQueueTypeError: if the type of the queue is not None and is different than the type of the element argument
-        :raises PriorityQueueTypeError: if the type of the new priority is not int
-        :raises ValueError if the type of the comparison argument is not any of these (None, -1, 1)
-        :raises PriorityQueueElementError: if the element is not contained in the queue
-        :return:
+        :param lane: the lane to check
+        :raises QueueElementError: if the queue doesn't have this lane
         """
 
-        if self.type is not None and type(element) != self.type:
-            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+        if lane not in self.__lanes:
+            raise QueueElementError("The fair queue doesn't have a lane {0}".format(lane))
 
-        if type(new_priority) != int:
-            raise PriorityQueueTypeError("The priority parameter must be an integer.")
+    def add_lane(self, lane, weight=None):
+        """
+        this method creates a lane or changes the weight of an existing lane
 
-        if comparison is not None and comparison != 1 and comparison != -1:
-            raise ValueError("The comparison argument must be None for no comparison, -1 - for less than comparison"
-                             "and 1 for greater than comparison")
+        :param lane: the name of the lane, can be any hashable object
+        :param weight: the weight of the lane, None (default) means the default weight of the queue
+        :raises QueueTypeError: if the weight is not a number
+        :raises ValueError: if the weight is not positive
+        """
 
-        element_found = False
-        replaced = False
-        for priority in self.__elements:
-            test_element = self.__elements[priority]
-            if type(test_element) == Queue:
-                if element in test_element:
-                    if (comparison is None and priority != new_priority) or \
-                            (comparison == 1 and new_priority > priority)\
-                            or (comparison == -1 and new_priority < priority):
-                        test_element.remove(element)
-                        if len(test_element) == 1:
-                            self.__elements[priority] = test_element.dequeue()
+        if weight is None:
+            weight = self.__default_weight
 
-                        if new_priority not in self.__indices:
-                            self.__indices.add(new_priority)
-                            self.__elements[new_priority] = element
-                        else:
-                            if type(self.__elements[new_priority]) == Queue:
-                                self.__elements[new_priority].enqueue(element)
-                            else:
-                                duplicates = Queue(self.type)
-                                duplicates.enqueue(self.__elements[new_priority])
-                                duplicates.enqueue(element)
-                                self.__elements[new_priority] = duplicates
+        self.__check_weight(weight)
 
-                        replaced = True
-                    element_found = True
-                    break
-            else:
-                if test_element == element:
-                    if (comparison is None and priority != new_priority) or \
-                            (comparison == 1 and new_priority > priority) \
-                            or (comparison == -1 and new_priority < priority):
-                        self.__elements.pop(priority)
-                        if new_priority not in self.__indices:
-                            self.__indices.replace(priority, new_priority)
-                            self.__elements[new_priority] = element
-                        else:
-                            self.__indices.remove(priority)
-                            if type(self.__elements[new_priority]) == Queue:
-                                self.__elements[new_priority].enqueue(element)
-                            else:
-                                duplicates = Queue(self.type)
-                                duplicates.enqueue(self.__elements[new_priority])
-                                duplicates.enqueue(element)
-                                self.__elements[new_priority] = duplicates
-                        replaced = True
-                    element_found = True
-                    break
+        if lane not in self.__lanes:
+            self.__lanes[lane] = Queue(self.__elements_type)
+            self.__deficits[lane] = 0
+            self.__enqueued[lane] = 0
+            self.__dequeued[lane] = 0
+        self.__weights[lane] = weight
 
-        if not element_found:
-            raise PriorityQueueElementError("The queue doesn't contain the element for which you are trying to replace the priority.")
+    def weight(self, lane):
+        """
+        this method gets the weight of a lane
 
-        return replaced
+        :param lane: the lane
+        :return: the weight of the lane
+        :raises QueueElementError: if the queue doesn't have this lane
+        """
 
-    def remove_element(self, element):
+        self.__check_lane(lane)
+
+        return self.__weights[lane]
+
+    def depth(self, lane):
         """
-        overriding the remove() method to handle duplicated priorities too
+        this method gets the number of elements in a lane
 
-        :param element: the element to remove
-        :raises PriorityQueueTypeError: if the type of the argument is not the same as the type of the elements in the heap
-        :raises PriorityQueueElementError: if the element to remove is not contained in the heap
+        :param lane: the lane
+        :return: the number of elements waiting in the lane
+        :raises QueueElementError: if the queue doesn't have this lane
         """
 
-        if self.type is not None and type(element) != self.type:
-            raise PriorityQueueTypeError("The priority queue only contains elements of type {0}".format(self.type))
+        self.__check_lane(lane)
 
-        removed = False
-        for priority in self.__elements:
-            test_element = self.__elements[priority]
-            if type(test_element) == Queue:
-                try:
-                    test_element.remove(element)
-                    if len(test_element) == 0:
-                        self.__elements.pop(priority)
-                        self.__indices.remove(priority)
-                    elif len(test_element) == 1:
-                        self.__elements[priority] = test_element.dequeue()
-                    self.__size -= 1
-                    removed = True
+        return self.__lanes[lane].size
+
+    def enqueued(self, lane):
+        """
+        this method gets the number of elements enqueued in a lane
+
+        :param lane: the lane
+        :return: the number of elements enqueued in the lane since it was created
+        :raises QueueElementError: if the queue doesn't have this lane
+        """
+
+        self.__check_lane(lane)
+
+        return self.__enqueued[lane]
+
+    def dequeued(self, lane):
+        """
+        this method gets the number of elements dequeued from a lane
+
+        :param lane: the lane
+        :return: the number of elements dequeued from the lane since it was created
+        :raises QueueElementError: if the queue doesn't have this lane
+        """
+
+        self.__check_lane(lane)
+
+        return self.__dequeued[lane]
+
+    def enqueue(self, item, lane):
+        """
+        this method enqueues an element in a lane, the lane is created with the default weight if it doesn't exist
+
+        :param item: the element to enqueue
+        :param lane: the lane of the element
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of the item
+        """
+
+        if lane not in self.__lanes:
+            if self.__elements_type is not None and type(item) != self.__elements_type:
+                raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+            self.add_lane(lane)
+
+        queue = self.__lanes[lane]
+        queue.enqueue(item)
+        self.__enqueued[lane] += 1
+        self.__size += 1
+
+        if queue.size == 1:
+            # the first active lane gets its turn straight away, the others wait at the end of the round
+            if len(self.__active) == 0:
+                self.__deficits[lane] = self.__weights[lane]
+            self.__active.append(lane)
+
+    def dequeue(self):
+        """
+        this method dequeues the next element of the lane, which is currently being served
+
+        :return: the dequeued element
+        :raises EmptyQueueError: if there are no elements in any of the lanes
+        """
+
+        if self.__size == 0:
+            raise EmptyQueueError("There are no elements in the queue")
+
+        # pass the turn on until a lane with enough deficit is found
+        while self.__deficits[self.__active[0]] < 1:
+            self.__active.rotate(-1)
+            self.__deficits[self.__active[0]] += self.__weights[self.__active[0]]
+
+        lane = self.__active[0]
+        queue = self.__lanes[lane]
+        item = queue.dequeue()
+        self.__deficits[lane] -= 1
+        self.__dequeued[lane] += 1
+        self.__size -= 1
+
+        # an empty lane leaves the round and loses its deficit, so that an idle lane cannot accumulate credit
+        if queue.size == 0:
+            self.__deficits[lane] = 0
+            self.__active.popleft()
+            if len(self.__active) > 0:
+                self.__deficits[self.__active[0]] += self.__weights[self.__active[0]]
+
+        return item
+
+    def peek(self):
+        """
+        this method peeks the element, which would be dequeued next, without removing it
+
+        :return: the peeked element or None if there are no elements in the queue
+        """
+
+        if self.__size == 0:
+            return None
+
+        # the deficits are not changed, hence the lane is found by simulating the passing of the turn
+        lane = self.__active[0]
+        if self.__deficits[lane] < 1:
+            for index in range(1, len(self.__active)):
+                next_lane = self.__active[index]
+                if self.__deficits[next_lane] + self.__weights[next_lane] >= 1:
+                    lane = next_lane
                     break
-                except QueueElementError:
-                    pass
             else:
-                if element == test_element:
-                    self.__indices.remove(priority)
-                    self.__elements.pop(priority)
-                    self.__size -= 1
-                    removed = True
-                    break
+                return self.__peek_slow()
 
-        if not removed:
-            raise PriorityQueueElementError("The queue doesn't contain the element you are trying to delete.")
+        return self.__lanes[lane].peek()
+
+    def __peek_slow(self):
+        """
+        finds the element to be dequeued next when some lanes need more than one round to reach a deficit of 1 (weights
+        less than 1), by simulating the rounds on a copy of the deficits
+
+        :return: the element to be dequeued next
+        """
+
+        deficits = dict(self.__deficits)
+        active = deque(self.__active)
+        while deficits[active[0]] < 1:
+            active.rotate(-1)
+            deficits[active[0]] += self.__weights[active[0]]
+
+        return self.__lanes[active[0]].peek()
 
 
 class Graph(object):
@@ -0,0 +1,1917 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import asyncio
+import multiprocessing
+import os
+from contextlib import nullcontext
+from concurrent.futures import Future
+from itertools import count
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct, error as StructError
+from threading import Lock, Condition, Thread, current_thread, local
+from time import monotonic
+
+from DataStructures.Errors import *
+from DataStructures.AbstractDataStructures import Stack, Queue, PriorityQueue, DuplicatePriorityQueue
+
+
+class _TaskTracker(object):
+    """
+    Base class of the thread-safe queues, which count the enqueued elements that haven't been processed yet - provides
+    task_done() and join() with the same semantics as in the queue module of the standard library.
+
+    The counter of unfinished tasks is guarded by its own mutex, so consumers calling task_done() and threads waiting in
+    join() don't contend with the producers and consumers for the mutex of the queue. The queue counts an enqueued element
+    before releasing its own mutex, hence a consumer can never mark the element as finished before it has been counted.
+    """
+
+    def __init__(self):
+        """
+        constructor for the task tracking of a queue
+        """
+
+        self.__lock = Lock()
+        self.__all_tasks_done = Condition(self.__lock)
+        self.__unfinished_tasks = 0
+
+    @property
+    def unfinished_tasks(self):
+        """
+        a getter for the number of enqueued elements for which task_done() hasn't been called yet
+
+        :return: the number of unfinished tasks
+        """
+
+        with self.__lock:
+            return self.__unfinished_tasks
+
+    def task_done(self):
+        """
+        this method indicates that a previously dequeued element has been processed, used by consumer threads
+
+        :raises ValueError: if the method is called more times than there were elements enqueued
+        """
+
+        with self.__lock:
+            if self.__unfinished_tasks <= 0:
+                raise ValueError("task_done() called more times than there were elements in the queue")
+            self.__finish(1)
+
+    def join(self, timeout=None):
+        """
+        this method blocks until all elements in the queue have been dequeued and processed, that is until task_done()
+        has been called for every enqueued element
+
+        :param timeout: the maximum number of seconds to wait, None (default) means wait forever
+        :return: True if all tasks have been processed and False if the timeout has expired
+        """
+
+        with self.__all_tasks_done:
+            return self.__all_tasks_done.wait_for(lambda: self.__unfinished_tasks == 0, timeout)
+
+    def _add_tasks(self, tasks):
+        """
+        counts a number of enqueued elements as unfinished tasks, the mutex of the queue must be held when calling this
+        method, so that the elements cannot be dequeued before they are counted
+
+        :param tasks: the number of new tasks
+        """
+
+        if tasks > 0:
+            with self.__lock:
+                self.__unfinished_tasks += tasks
+
+    def _finish_tasks(self, tasks):
+        """
+        marks a number of tasks as finished and wakes up the joining threads if there are no more unfinished tasks
+
+        :param tasks: the number of finished tasks
+        """
+
+        if tasks > 0:
+            with self.__lock:
+                self.__finish(tasks)
+
+    def __finish(self, tasks):
+        """
+        decrements the counter of unfinished tasks and wakes up the joining threads if it reaches zero, the mutex of the
+        counter must be held when calling this method
+
+        :param tasks: the number of finished tasks
+        """
+
+        self.__unfinished_tasks -= tasks
+        if self.__unfinished_tasks == 0:
+            self.__all_tasks_done.notify_all()
+
+
+class ConcurrentPriorityQueue(_TaskTracker):
+    """
+    Thread-safe wrapper around PriorityQueue and DuplicatePriorityQueue, which can be shared between producer and
+    consumer threads, e.g. as the dispatch queue of a worker pool.
+
+    All operations on the wrapped queue are guarded by one mutex, since the elements and the heap of priorities of the
+    wrapped queue must always be changed together. The counter of unfinished tasks has a separate mutex, so task_done()
+    and join() never wait for the mutex of the queue, and the getters of immutable properties (and size) take no lock.
+    Consumers waiting for elements and threads waiting for all tasks to be processed are parked on separate condition
+    variables, so that an enqueue only wakes up a single consumer and the completion of a task only wakes up the joining
+    threads.
+    """
+
+    def __init__(self, elements_type=None, reverse=False, priority_type=int, duplicates=False):
+        """
+        constructor for the concurrent priority queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param reverse: the reverse argument of the wrapped PriorityQueue
+        :param priority_type: the type of priorities in the queue, int by default
+        :param duplicates: a boolean, if set to True a DuplicatePriorityQueue is wrapped, otherwise (default) a
+            PriorityQueue is wrapped
+        :raises PriorityQueueTypeError: if any of the arguments is not valid for initialising a priority queue
+        :raises PriorityQueueTypeError: if the duplicates argument is not a boolean
+        """
+
+        if type(duplicates) != bool:
+            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(duplicates))
+
+        if duplicates:
+            self.__queue = DuplicatePriorityQueue(elements_type, reverse, priority_type)
+        else:
+            self.__queue = PriorityQueue(elements_type, reverse, priority_type)
+
+        self.__lock = Lock()
+        self.__not_empty = Condition(self.__lock)
+        super().__init__()
+
+    def __str__(self):
+        """
+        a string representation of the concurrent priority queue
+
+        :return: the str representation of the wrapped queue
+        """
+
+        with self.__lock:
+            return str(self.__queue)
+
+    def __repr__(self):
+        """
+        a repr representation of the concurrent priority queue
+
+        :return: the repr representation of the wrapped queue
+        """
+
+        with self.__lock:
+            return repr(self.__queue)
+
+    def __len__(self):
+        """
+        overriding this method allows the 'len(queue)' syntax
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __contains__(self, element):
+        """
+        overriding this method allows the 'element in queue' syntax
+
+        :param element: the element to search for
+        :return: True if the element is contained in the queue and False otherwise
+        """
+
+        return self.contains_element(element)
+
+    @property
+    def size(self):
+        """
+        this method gets the size of the queue, the value might be outdated as soon as it is returned if other threads
+        are using the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__queue.size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements allowed in the queue
+        """
+
+        return self.__queue.type
+
+    @property
+    def priority_type(self):
+        """
+        a getter for the type of priorities in the queue
+
+        :return: the type of priorities allowed in the queue
+        """
+
+        return self.__queue.priority_type
+
+    @property
+    def reversed(self):
+        """
+        this method checks if the queue is reversed
+
+        :return: True if the dequeue function returns the element with the least priority and False otherwise
+        """
+
+        return self.__queue.reversed
+
+    def enqueue(self, item, priority):
+        """
+        this method inserts an element into the queue with a given priority and wakes up one of the waiting consumers
+
+        :param item: the item to insert
+        :param priority: the priority of the item
+        :raises PriorityQueueTypeError: if the priority or the item are not of the types allowed in the queue
+        """
+
+        with self.__lock:
+            size = self.__queue.size
+            self.__queue.enqueue(item, priority)
+
+            # an element, which overwrites another element with the same priority is not counted as a new task
+            self._add_tasks(self.__queue.size - size)
+            self.__not_empty.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        this method removes and returns the element with the greatest or the lowest priority depending on the reverse
+        argument in the constructor
+
+        :param block: if set to True (default) the method waits until there is an element in the queue, otherwise an
+            error is raised straight away if the queue is empty
+        :param timeout: the maximum number of seconds to wait for an element, None (default) means wait forever
+        :return: the dequeued element
+        :raises EmptyPriorityQueueError: if the queue is empty and block is False or the timeout has expired
+        :raises ValueError: if the timeout is a negative number
+        """
+
+        if timeout is not None and timeout < 0:
+            raise ValueError("The timeout argument must be a non-negative number")
+
+        with self.__not_empty:
+            if not block:
+                if self.__queue.size == 0:
+                    raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+            elif timeout is None:
+                while self.__queue.size == 0:
+                    self.__not_empty.wait()
+            else:
+                deadline = monotonic() + timeout
+                while self.__queue.size == 0:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+                    self.__not_empty.wait(remaining)
+
+            return self.__queue.dequeue()
+
+    def peek(self):
+        """
+        this method is the same as dequeue() but doesn't remove the element from the queue and never blocks
+
+        :return: the element to be dequeued without removing it or None if the queue is empty
+        """
+
+        with self.__lock:
+            return self.__queue.peek()
+
+    def get_element(self, priority):
+        """
+        this method gets the element with a specified priority
+
+        :param priority: the given priority
+        :return: the element linked to this priority or None if not existing
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        with self.__lock:
+            return self.__queue.get_element(priority)
+
+    def contains_priority(self, priority):
+        """
+        this method checks if a given priority is assigned to an element
+
+        :param priority: the priority to check
+        :return: True if the queue contains this priority and False otherwise
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        with self.__lock:
+            return self.__queue.contains_priority(priority)
+
+    def contains_element(self, element):
+        """
+        this method checks if a given element is contained in the queue
+
+        :param element: the element to check
+        :return: True if the element is in the queue and False otherwise
+        :raises PriorityQueueTypeError: if the element's type is not the same as the type of elements in the queue
+        """
+
+        with self.__lock:
+            return self.__queue.contains_element(element)
+
+    def replace_priority(self, element, new_priority, comparison=None):
+        """
+        this method finds an element and replaces its priority with a new one, see PriorityQueue.replace_priority()
+
+        :param element: the element, for which the priority must be replaced
+        :param new_priority: the new priority
+        :param comparison: None - no comparison, 1 - greater than comparison, -1 - less than comparison
+        :return: True if the element's priority has been replaced and False otherwise
+        :raises PriorityQueueTypeError: if the element or the new priority are not of the types allowed in the queue
+        :raises ValueError: if the comparison argument is not any of these (None, -1, 1)
+        :raises PriorityQueueElementError: if the element is not contained in the queue
+        """
+
+        with self.__lock:
+            size = self.__queue.size
+            replaced = self.__queue.replace_priority(element, new_priority, comparison)
+            self._finish_tasks(size - self.__queue.size)
+            return replaced
+
+    def remove_element(self, element):
+        """
+        this method removes an element from the queue, the removed element is treated as a finished task
+
+        :param element: the element to remove
+        :raises PriorityQueueElementError: if the queue doesn't contain the element to delete
+        :raises PriorityQueueTypeError: if the type of the argument differs from the type of the elements in the queue
+        """
+
+        with self.__lock:
+            self.__queue.remove_element(element)
+            self._finish_tasks(1)
+
+
+class BlockingQueue(_TaskTracker):
+    """
+    Thread-safe FIFO queue with producer/consumer semantics, which wraps the Queue and keeps its element type checking.
+
+    Consumers calling dequeue() on an empty queue are parked on a condition variable instead of polling the queue and,
+    if the queue is bounded by a capacity, producers calling enqueue() on a full queue are parked on another condition
+    variable. Both conditions share the mutex of the queue, while the threads waiting in join() are parked on a condition
+    of the separate mutex, which guards the counter of unfinished tasks.
+    """
+
+    def __init__(self, elements_type=None, capacity=None):
+        """
+        constructor for the blocking queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param capacity: the maximum number of elements in the queue, None (default) means the queue is unbounded
+        :raises QueueTypeError: if the elements_type argument is not a valid type or the capacity is not an integer
+        :raises ValueError: if the capacity is not a positive integer
+        """
+
+        if capacity is not None and type(capacity) != int:
+            raise QueueTypeError("The capacity of the queue must be an integer")
+
+        if capacity is not None and capacity <= 0:
+            raise ValueError("The capacity of the queue must be a positive integer")
+
+        self.__queue = Queue(elements_type)
+        self.__capacity = capacity
+
+        self.__lock = Lock()
+        self.__not_empty = Condition(self.__lock)
+        self.__not_full = Condition(self.__lock)
+        super().__init__()
+
+    def __str__(self):
+        """
+        a string representation of the blocking queue
+
+        :return: the str representation of the wrapped queue
+        """
+
+        with self.__lock:
+            return str(self.__queue)
+
+    def __repr__(self):
+        """
+        a repr representation of the blocking queue
+
+        :return: the repr representation of the wrapped queue
+        """
+
+        with self.__lock:
+            return repr(self.__queue)
+
+    def __len__(self):
+        """
+        overriding this method allows the 'len(queue)' syntax
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the 'item in queue' syntax
+
+        :param item: the element to search for
+        :return: True if the element is contained in the queue and False otherwise
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the size of the queue, the value might be outdated as soon as it is returned if other threads
+        are using the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__queue.size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements allowed in the queue
+        """
+
+        return self.__queue.type
+
+    @property
+    def capacity(self):
+        """
+        a getter for the capacity of the queue
+
+        :return: the maximum number of elements in the queue, None if the queue is unbounded
+        """
+
+        return self.__capacity
+
+    def enqueue(self, item, block=True, timeout=None):
+        """
+        this method enqueues an element at the back of the queue and wakes up one of the waiting consumers
+
+        :param item: the element to enqueue
+        :param block: if set to True (default) the method waits until there is free space in a bounded queue,
+            otherwise an error is raised straight away if the queue is full
+        :param timeout: the maximum number of seconds to wait for free space, None (default) means wait forever
+        :raises QueueTypeError: if the element is not of the type of elements in the queue
+        :raises FullQueueError: if the queue is full and block is False or the timeout has expired
+        :raises ValueError: if the timeout is a negative number
+        """
+
+        if timeout is not None and timeout < 0:
+            raise ValueError("The timeout argument must be a non-negative number")
+
+        # the type is checked before waiting, so that a wrong element doesn't wait for free space
+        if self.__queue.type is not None and type(item) != self.__queue.type:
+            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__queue.type))
+
+        with self.__not_full:
+            if self.__capacity is not None:
+                has_space = lambda: self.__queue.size < self.__capacity
+                if not (self.__not_full.wait_for(has_space, timeout) if block else has_space()):
+                    raise FullQueueError("The queue is full, it cannot contain more than {0} elements".format(self.__capacity))
+
+            self.__queue.enqueue(item)
+            self._add_tasks(1)
+            self.__not_empty.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        this method removes and returns the element at the front of the queue and wakes up one of the waiting producers
+
+        :param block: if set to True (default) the method waits until there is an element in the queue, otherwise an
+            error is raised straight away if the queue is empty
+        :param timeout: the maximum number of seconds to wait for an element, None (default) means wait forever
+        :return: the dequeued element
+        :raises EmptyQueueError: if the queue is empty and block is False or the timeout has expired
+        :raises ValueError: if the timeout is a negative number
+        """
+
+        if timeout is not None and timeout < 0:
+            raise ValueError("The timeout argument must be a non-negative number")
+
+        with self.__not_empty:
+            has_elements = lambda: self.__queue.size > 0
+            if not (self.__not_empty.wait_for(has_elements, timeout) if block else has_elements()):
+                raise EmptyQueueError("There are no elements in the queue")
+
+            item = self.__queue.dequeue()
+            self.__not_full.notify()
+            return item
+
+    def peek(self):
+        """
+        this method peeks the element at the front of the queue without removing it and never blocks
+
+        :return: the peeked element or None if the queue is empty
+        """
+
+        with self.__lock:
+            return self.__queue.peek()
+
+    def contains(self, item):
+        """
+        this method checks if an element is contained in the queue
+
+        :param item: the element to search for
+        :return: True if the element is in the queue and False otherwise
+        :raises QueueTypeError: if the element is not of the type of elements in the queue
+        """
+
+        with self.__lock:
+            return self.__queue.contains(item)
+
+    def remove(self, element):
+        """
+        this method removes an element from the queue, the removed element is treated as a finished task
+
+        :param element: the element to remove
+        :raises QueueTypeError: if the element is not of the type of elements in the queue
+        :raises QueueElementError: if the element is not contained in the queue
+        """
+
+        with self.__lock:
+            self.__queue.remove(element)
+            self.__not_full.notify()
+            self._finish_tasks(1)
+
+
+class _DelayQueueBase(object):
+    """
+    Base class of the delay queues - keeps the elements in a DuplicatePriorityQueue ordered by their release times, so
+    elements with the same release time are released in the order they were enqueued. The subclasses only implement the
+    enqueueing and the waiting for an element to become due.
+    """
+
+    def __init__(self, elements_type, guard):
+        """
+        constructor for the base of the delay queues
+
+        :param elements_type: the type of elements in the queue, None allows all types of elements
+        :param guard: a context manager, which is entered by the methods that read or remove elements without waiting,
+            so that they are not interleaved with changes made by other threads
+        :raises QueueTypeError: if the elements_type argument is not a valid type
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+
+        self.__elements_type = elements_type
+        self.__queue = DuplicatePriorityQueue(tuple, reverse=True, priority_type=float)
+        self.__guard = guard
+
+    def __str__(self):
+        """
+        the str representation of the delay queue
+
+        :return: a string with the list of elements in the order they are released
+        """
+
+        with self.__guard:
+            return str([entry[1] for entry in self.__queue.range()])
+
+    def __repr__(self):
+        """
+        the repr representation of the delay queue
+
+        :return: same as str()
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax
+
+        :return: the number of elements in the queue, including the elements, which are not due yet
+        """
+
+        return self.size
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the queue, including the elements, which are not due yet
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__queue.size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the queue
+
+        :return: the type of elements in the queue or None if the queue can contain all types of elements
+        """
+
+        return self.__elements_type
+
+    @property
+    def next_delay(self):
+        """
+        this method gets the number of seconds until the element at the front of the queue is due
+
+        :return: the remaining delay of the first element, 0 if it is already due, None if the queue is empty
+        """
+
+        with self.__guard:
+            delay = self._delay()
+        return None if delay is None else max(0.0, delay)
+
+    def peek(self):
+        """
+        this method peeks the element, which is released first, without removing it, even if it is not due yet
+
+        :return: the peeked element or None if there are no elements in the queue
+        """
+
+        with self.__guard:
+            if self.__queue.size == 0:
+                return None
+
+            return self.__queue.peek()[1]
+
+    def dequeue_due(self):
+        """
+        this method removes all elements, which are due, at once and never waits
+
+        :return: a list with the due elements in the order they are released, empty if no element is due
+        """
+
+        with self.__guard:
+            items = []
+            now = monotonic()
+            while self.__queue.size > 0 and self.__queue.peek()[0] <= now:
+                items.append(self.__queue.dequeue()[1])
+
+            return items
+
+    def _delay(self):
+        """
+        computes the remaining delay of the element at the front of the queue, the guard must be held
+
+        :return: the number of seconds until the first element is due (negative if it is overdue) or None if the queue
+            is empty
+        """
+
+        if self.__queue.size == 0:
+            return None
+
+        return self.__queue.peek()[0] - monotonic()
+
+    def _entry(self, item, delay):
+        """
+        checks the arguments of enqueue() and enqueues the element with its release time, the guard must be held
+
+        :param item: the element to enqueue
+        :param delay: the number of seconds after which the element is due
+        :return: True if the element is at the front of the queue and False otherwise
+        :raises QueueTypeError: if the element is not of the type of elements in the queue or the delay is not a number
+        :raises ValueError: if the delay is negative
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+
+        if type(delay) != int and type(delay) != float:
+            raise QueueTypeError("The delay of an element must be an integer or a float")
+
+        if delay < 0:
+            raise ValueError("The delay of an element must not be negative")
+
+        release = monotonic() + delay
+        entry = (release, item)
+        self.__queue.enqueue(entry, release)
+
+        return self.__queue.peek() is entry
+
+    def _release(self):
+        """
+        removes the element at the front of the queue, the guard must be held and the queue must not be empty
+
+        :return: the removed element
+        """
+
+        return self.__queue.dequeue()[1]
+
+
+class DelayQueue(_DelayQueueBase):
+    """
+    Thread-safe queue, in which every element is released after a delay - dequeue() returns the element with the earliest
+    release time, waiting until this time has come.
+
+    The elements are kept in a DuplicatePriorityQueue ordered by their release times, so elements with the same release
+    time are released in the order they were enqueued. A consumer waits on a condition variable with a timeout equal to
+    the remaining delay of the first element, instead of polling the queue, and is woken up earlier only if an element
+    with an earlier release time is enqueued.
+    """
+
+    def __init__(self, elements_type=None):
+        """
+        constructor for the delay queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :raises QueueTypeError: if the elements_type argument is not a valid type
+        """
+
+        self.__available = Condition(Lock())
+        super().__init__(elements_type, self.__available)
+
+    def enqueue(self, item, delay):
+        """
+        this method enqueues an element, which is released after the given delay, and wakes up a waiting consumer if the
+        element is released before all other elements
+
+        :param item: the element to enqueue
+        :param delay: the number of seconds after which the element is due, an integer or a float
+        :raises QueueTypeError: if the element is not of the type of elements in the queue or the delay is not a number
+        :raises ValueError: if the delay is negative
+        """
+
+        with self.__available:
+            if self._entry(item, delay):
+                self.__available.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        this method removes and returns the element with the earliest release time, waiting until it is due
+
+        :param block: if set to True (default) the method waits until an element is due, otherwise an error is raised
+            straight away if no element is due
+        :param timeout: the maximum number of seconds to wait, None (default) means wait forever
+        :return: the dequeued element
+        :raises EmptyQueueError: if no element is due and block is False or the timeout has expired
+        :raises ValueError: if the timeout is a negative number
+        """
+
+        if timeout is not None and timeout < 0:
+            raise ValueError("The timeout argument must be a non-negative number")
+
+        deadline = None if timeout is None else monotonic() + timeout
+        with self.__available:
+            while True:
+                delay = self._delay()
+                if delay is not None and delay <= 0:
+                    break
+
+                remaining = None if deadline is None else deadline - monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise EmptyQueueError("There are no due elements in the queue")
+
+                if delay is None or (remaining is not None and remaining < delay):
+                    delay = remaining
+                self.__available.wait(delay)
+
+            item = self._release()
+
+            # the next element might be due as well, so another consumer must recompute its waiting time
+            if self.size > 0:
+                self.__available.notify()
+
+            return item
+
+
+class WorkStealingDeque(Stack):
+    """
+    Abstract Data Structure - a Stack owned by a single worker thread, which pushes and pops tasks at the top of the stack
+    (LIFO order, so the most recently created tasks, whose data is most likely still in the cache, run first), while other
+    threads can steal tasks from the bottom of the stack (FIFO order, so the oldest and usually the largest tasks are
+    stolen).
+
+    The push, pop and steal operations are single append(), pop() and popleft() calls on the python deque, which are
+    atomic, so the owner and the thieves never wait for a lock.
+    """
+
+    def __init__(self, elements_type=None):
+        """
+        constructor for the work-stealing deque
+
+        :param elements_type: the type of elements in the deque, None (default) allows all types of elements
+        :raises StackTypeError: if the elements_type argument is not a valid type
+        """
+
+        super().__init__(elements_type)
+
+    def pop(self):
+        """
+        overriding the pop() method, so that the size of the deque is not checked before popping, since a thief might
+        steal the last element in between
+
+        :return: the element at the top of the deque
+        :raises EmptyStackError: if there are no elements in the deque
+        """
+
+        try:
+            return self._storage().pop()
+        except IndexError:
+            raise EmptyStackError("There are no elements in the stack")
+
+    def pop_many(self, n):
+        """
+        overriding the pop_many() method, so that the elements stolen while popping are skipped
+
+        :param n: the maximum number of elements to pop
+        :return: a list with the popped elements, the top element first
+        :raises StackTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        if type(n) != int:
+            raise StackTypeError("The number of elements to pop must be an integer")
+
+        if n < 0:
+            raise ValueError("The number of elements to pop must not be negative")
+
+        items = []
+        pop = self._storage().pop
+        try:
+            while len(items) < n:
+                items.append(pop())
+        except IndexError:
+            pass
+
+        return items
+
+    def peek(self):
+        """
+        overriding the peek() method, so that the size of the deque is not checked before peeking
+
+        :return: the element at the top of the deque or None if there are no elements in the deque
+        """
+
+        try:
+            return self._storage()[-1]
+        except IndexError:
+            return None
+
+    def steal(self):
+        """
+        this method removes the element at the bottom of the deque, it is called by threads other than the owner
+
+        :return: the oldest element in the deque
+        :raises EmptyStackError: if there are no elements in the deque
+        """
+
+        try:
+            return self._storage().popleft()
+        except IndexError:
+            raise EmptyStackError("There are no elements in the stack")
+
+
+class WorkStealingExecutor(object):
+    """
+    A thread-pool executor for CPU-bound and recursive (divide-and-conquer) tasks, in which every worker thread has its
+    own WorkStealingDeque.
+
+    A task submitted from a worker thread is pushed on the deque of this worker, which runs its own tasks in LIFO order.
+    A task submitted from any other thread is pushed on the deques of the workers in round-robin order. A worker without
+    tasks steals the oldest task of another worker and only goes to sleep if all deques are empty. A task waiting for the
+    result of a subtask should call wait(), which runs other tasks in the meantime instead of blocking the worker.
+    """
+
+    def __init__(self, workers=None):
+        """
+        constructor for the executor, starts the worker threads
+
+        :param workers: the number of worker threads, None (default) means the number of processors
+        :raises ExecutorTypeError: if the number of workers is not an integer
+        :raises ValueError: if the number of workers is not a positive integer
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if type(workers) != int:
+            raise ExecutorTypeError("The number of workers must be an integer")
+
+        if workers <= 0:
+            raise ValueError("The number of workers must be a positive integer")
+
+        self.__deques = [WorkStealingDeque(tuple) for _ in range(workers)]
+        self.__steals = [0]*workers
+        self.__submitted = count()
+        self.__local = local()
+
+        # workers go to sleep on this condition only after counting themselves as idle and then checking under its lock
+        # that all deques are empty
+        self.__work_available = Condition()
+        self.__idle = 0
+        self.__shutdown = False
+
+        self.__threads = [Thread(target=self.__work, args=(index,), name="WorkStealingExecutor-{0}".format(index),
+                                 daemon=True) for index in range(workers)]
+        for thread in self.__threads:
+            thread.start()
+
+    def __enter__(self):
+        """
+        allows the use of the executor in a with statement
+
+        :return: reference to the executor itself
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        shuts down the executor at the end of a with statement, waiting for all submitted tasks
+        """
+
+        self.shutdown(wait=True)
+
+    @property
+    def workers(self):
+        """
+        a getter for the number of worker threads
+
+        :return: the number of workers
+        """
+
+        return len(self.__threads)
+
+    @property
+    def pending(self):
+        """
+        a getter for the number of submitted tasks, which haven't started yet, the value might be outdated as soon as it
+        is returned
+
+        :return: the number of tasks in the deques of all workers
+        """
+
+        return sum(tasks.size for tasks in self.__deques)
+
+    @property
+    def steals(self):
+        """
+        a getter for the number of tasks, which a worker stole from the deque of another worker
+
+        :return: the number of stolen tasks
+        """
+
+        return sum(self.__steals)
+
+    def submit(self, function, *args, **kwargs):
+        """
+        this method schedules a function to be called with the given arguments
+
+        :param function: the function to call
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+        :return: a concurrent.futures.Future, which holds the result of the function call
+        :raises RuntimeError: if the executor has been shut down and the method is not called from a worker thread
+        """
+
+        index = getattr(self.__local, "index", None)
+        if index is None:
+            # tasks of the workers are still accepted after shutdown(), since the workers finish all pending tasks
+            if self.__shutdown:
+                raise RuntimeError("Cannot submit tasks after the executor has been shut down")
+            index = next(self.__submitted) % len(self.__deques)
+
+        future = Future()
+        self.__deques[index].push((future, function, args, kwargs))
+
+        # a worker counts itself as idle before it checks that the deques are empty, so either the worker finds the task or
+        # this read sees the idle worker and the notification is sent under the lock, after the worker has started waiting
+        if self.__idle > 0:
+            with self.__work_available:
+                self.__work_available.notify()
+
+        return future
+
+    def wait(self, future, timeout=None):
+        """
+        this method waits for the result of a submitted task, when called from a worker thread the worker runs other
+        tasks while waiting, so that recursive tasks don't block all workers
+
+        :param future: the future returned by submit()
+        :param timeout: the maximum number of seconds to wait, None (default) means wait forever
+        :return: the result of the task
+        :raises TimeoutError: if the timeout expires before the task is done
+        :raises Exception: the exception raised by the task, if any
+        """
+
+        index = getattr(self.__local, "index", None)
+        if index is None:
+            return future.result(timeout)
+
+        # the future wakes up the sleeping workers when it is done, so a worker waiting for it sleeps on the same condition
+        # as the idle workers and is woken up either by a new task or by the result
+        future.add_done_callback(self.__wake_up)
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while not future.done():
+            if deadline is not None and monotonic() >= deadline:
+                return future.result(0)
+
+            task = self.__find_task(index)
+            if task is not None:
+                self.__run(task)
+                continue
+
+            # the task is running in another worker, which may submit new tasks while it runs
+            with self.__work_available:
+                self.__idle += 1
+                try:
+                    while not future.done() and all(tasks.size == 0 for tasks in self.__deques):
+                        remaining = None if deadline is None else deadline - monotonic()
+                        if remaining is not None and remaining <= 0:
+                            return future.result(0)
+                        self.__work_available.wait(remaining)
+                finally:
+                    self.__idle -= 1
+
+        return future.result()
+
+    def shutdown(self, wait=True):
+        """
+        this method stops the executor from accepting new tasks, the workers exit when all submitted tasks have been run,
+        calling it more than once has no effect
+
+        :param wait: if set to True (default) the method waits until all workers have exited
+        """
+
+        with self.__work_available:
+            self.__shutdown = True
+            self.__work_available.notify_all()
+
+        if wait:
+            for thread in self.__threads:
+                if thread is not current_thread():
+                    thread.join()
+
+    def __wake_up(self, future):
+        """
+        the done callback of a future, for which a worker waits in wait(), wakes up all sleeping workers, since the
+        waiting worker might not be the one woken up by notify()
+
+        :param future: the future, which is done
+        """
+
+        with self.__work_available:
+            self.__work_available.notify_all()
+
+    def __find_task(self, index):
+        """
+        finds the next task of a worker, first at the top of its own deque and then at the bottom of the other deques
+
+        :param index: the index of the worker
+        :return: the task or None if all deques are empty
+        """
+
+        try:
+            return self.__deques[index].pop()
+        except EmptyStackError:
+            pass
+
+        workers = len(self.__deques)
+        for offset in range(1, workers):
+            try:
+                task = self.__deques[(index + offset) % workers].steal()
+            except EmptyStackError:
+                continue
+            self.__steals[index] += 1
+            return task
+
+        return None
+
+    @staticmethod
+    def __run(task):
+        """
+        runs a task and stores its result or its exception in its future
+
+        :param task: a tuple (future, function, args, kwargs)
+        """
+
+        future, function, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def __work(self, index):
+        """
+        the loop of a worker thread
+
+        :param index: the index of the worker and its deque
+        """
+
+        self.__local.index = index
+        while True:
+            task = self.__find_task(index)
+            if task is not None:
+                self.__run(task)
+                continue
+
+            with self.__work_available:
+                self.__idle += 1
+                try:
+                    while all(tasks.size == 0 for tasks in self.__deques):
+                        if self.__shutdown:
+                            return
+                        self.__work_available.wait()
+                finally:
+                    self.__idle -= 1
+
+
+class AsyncQueue(object):
+    """
+    asyncio-native FIFO queue built on the Queue data structure - enqueue() and dequeue() are coroutines, which suspend
+    the calling task instead of blocking the thread or raising an error.
+
+    If a capacity is given, enqueue() waits until there is free space in the queue, which applies backpressure to the
+    producers. A task cancelled while waiting in enqueue() or dequeue() doesn't add or lose any elements.
+    """
+
+    def __init__(self, elements_type=None, capacity=None):
+        """
+        constructor for the asynchronous queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param capacity: the maximum number of elements in the queue, None (default) means the queue is unbounded
+        :raises QueueTypeError: if the elements_type argument is not a valid type or the capacity is not an integer
+        :raises ValueError: if the capacity is not a positive integer
+        """
+
+        if capacity is not None and type(capacity) != int:
+            raise QueueTypeError("The capacity of the queue must be an integer")
+
+        if capacity is not None and capacity <= 0:
+            raise ValueError("The capacity of the queue must be a positive integer")
+
+        self.__queue = Queue(elements_type)
+        self.__capacity = capacity
+
+        # both conditions share the same lock, since they guard the same queue
+        lock = asyncio.Lock()
+        self.__not_empty = asyncio.Condition(lock)
+        self.__not_full = asyncio.Condition(lock)
+
+    def __str__(self):
+        """
+        the str representation of the queue
+
+        :return: the str representation of the wrapped Queue object
+        """
+
+        return str(self.__queue)
+
+    def __repr__(self):
+        """
+        the repr representation of the queue
+
+        :return: the repr representation of the wrapped Queue object
+        """
+
+        return repr(self.__queue)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in queue' syntax
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__queue.size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the queue
+
+        :return: the type of elements in the queue or None if the queue can contain all types of elements
+        """
+
+        return self.__queue.type
+
+    @property
+    def capacity(self):
+        """
+        this method gets the maximum number of elements in the queue
+
+        :return: the capacity of the queue or None if the queue is unbounded
+        """
+
+        return self.__capacity
+
+    def full(self):
+        """
+        this method checks if the queue has reached its capacity
+
+        :return: True if enqueue() would have to wait for free space and False otherwise
+        """
+
+        return self.__capacity is not None and self.__queue.size >= self.__capacity
+
+    def contains(self, item):
+        """
+        this method checks if an item is contained in the queue
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        """
+
+        return self.__queue.contains(item)
+
+    def peek(self):
+        """
+        this method peeks the item that got first in the queue (without removing it)
+
+        :return: the peeked item or None if there are no elements in the queue
+        """
+
+        return self.__queue.peek()
+
+    async def enqueue(self, item):
+        """
+        this coroutine enqueues an element in the queue, waiting for free space if the queue is full
+
+        :param item: the element to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
+            of the 'item' argument, the error is raised before waiting for free space
+        """
+
+        if self.__queue.type is not None and type(item) != self.__queue.type:
+            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__queue.type))
+
+        async with self.__not_full:
+            await _wait(self.__not_full, lambda: not self.full())
+            self.__queue.enqueue(item)
+            self.__not_empty.notify()
+
+    async def dequeue(self):
+        """
+        this coroutine removes and returns the item that got first in the queue, waiting for an item if the queue is empty
+
+        :return: the dequeued item
+        """
+
+        async with self.__not_empty:
+            await _wait(self.__not_empty, lambda: self.__queue.size > 0)
+            item = self.__queue.dequeue()
+            self.__not_full.notify()
+            return item
+
+
+class AsyncPriorityQueue(object):
+    """
+    asyncio-native priority queue built on the PriorityQueue (or DuplicatePriorityQueue) data structure - enqueue() and
+    dequeue() are coroutines, which suspend the calling task instead of blocking the thread or raising an error.
+
+    If a capacity is given, enqueue() waits until there is free space in the queue, which applies backpressure to the
+    producers. A task cancelled while waiting in enqueue() or dequeue() doesn't add or lose any elements.
+    """
+
+    def __init__(self, elements_type=None, reverse=False, priority_type=int, duplicates=False, capacity=None):
+        """
+        constructor for the asynchronous priority queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param reverse: the reverse argument of the wrapped PriorityQueue
+        :param priority_type: the type of priorities in the queue, int by default
+        :param duplicates: a boolean, if set to True a DuplicatePriorityQueue is wrapped, otherwise (default) a
+            PriorityQueue is wrapped
+        :param capacity: the maximum number of elements in the queue, None (default) means the queue is unbounded
+        :raises PriorityQueueTypeError: if any of the arguments is not valid for initialising a priority queue
+        :raises PriorityQueueTypeError: if the duplicates argument is not a boolean or the capacity is not an integer
+        :raises ValueError: if the capacity is not a positive integer
+        """
+
+        if type(duplicates) != bool:
+            raise PriorityQueueTypeError("{0} is not a valid boolean argument for initialising the priority queue.".format(duplicates))
+
+        if capacity is not None and type(capacity) != int:
+            raise PriorityQueueTypeError("The capacity of the priority queue must be an integer")
+
+        if capacity is not None and capacity <= 0:
+            raise ValueError("The capacity of the priority queue must be a positive integer")
+
+        if duplicates:
+            self.__queue = DuplicatePriorityQueue(elements_type, reverse, priority_type)
+        else:
+            self.__queue = PriorityQueue(elements_type, reverse, priority_type)
+
+        self.__duplicates = duplicates
+        self.__capacity = capacity
+
+        # both conditions share the same lock, since they guard the same queue
+        lock = asyncio.Lock()
+        self.__not_empty = asyncio.Condition(lock)
+        self.__not_full = asyncio.Condition(lock)
+
+    def __str__(self):
+        """
+        a string representation of the priority queue
+
+        :return: the str representation of the wrapped queue
+        """
+
+        return str(self.__queue)
+
+    def __repr__(self):
+        """
+        a repr representation of the priority queue
+
+        :return: the repr representation of the wrapped queue
+        """
+
+        return repr(self.__queue)
+
+    def __len__(self):
+        """
+        overriding this method allows the 'len(queue)' syntax
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __contains__(self, element):
+        """
+        overriding this method allows the 'element in queue' syntax
+
+        :param element: the element to search for
+        :return: True if the element is contained in the queue and False otherwise
+        """
+
+        return self.contains_element(element)
+
+    @property
+    def size(self):
+        """
+        this method gets the size of the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__queue.size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements allowed in the queue
+        """
+
+        return self.__queue.type
+
+    @property
+    def priority_type(self):
+        """
+        a getter for the type of priorities in the queue
+
+        :return: the type of priorities allowed in the queue
+        """
+
+        return self.__queue.priority_type
+
+    @property
+    def reversed(self):
+        """
+        this method checks if the queue is reversed
+
+        :return: True if the dequeue function returns the element with the least priority and False otherwise
+        """
+
+        return self.__queue.reversed
+
+    @property
+    def capacity(self):
+        """
+        this method gets the maximum number of elements in the queue
+
+        :return: the capacity of the queue or None if the queue is unbounded
+        """
+
+        return self.__capacity
+
+    def full(self):
+        """
+        this method checks if the queue has reached its capacity
+
+        :return: True if the queue contains as many elements as its capacity and False otherwise
+        """
+
+        return self.__capacity is not None and self.__queue.size >= self.__capacity
+
+    def peek(self):
+        """
+        this method returns the element to be dequeued without removing it
+
+        :return: the element to be dequeued or None if the queue is empty
+        """
+
+        return self.__queue.peek()
+
+    def get_element(self, priority):
+        """
+        this method gets the element with a specified priority
+
+        :param priority: the given priority
+        :return: the element linked to this priority or None if not existing
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        return self.__queue.get_element(priority)
+
+    def contains_priority(self, priority):
+        """
+        this method checks if a given priority is assigned to an element
+
+        :param priority: the priority to check
+        :return: True if the queue contains this priority and False otherwise
+        :raises PriorityQueueTypeError: if the priority is not of the priority type of the queue
+        """
+
+        return self.__queue.contains_priority(priority)
+
+    def contains_element(self, element):
+        """
+        this method checks if a given element is contained in the queue
+
+        :param element: the element to check
+        :return: True if the element is in the queue and False otherwise
+        :raises PriorityQueueTypeError: if the element's type is not the same as the type of elements in the queue
+        """
+
+        return self.__queue.contains_element(element)
+
+    async def enqueue(self, item, priority):
+        """
+        this coroutine inserts an element into the queue with a given priority, waiting for free space if the queue is
+        full; an element, which overwrites another element with the same priority in a queue without duplicates
+        doesn't need free space
+
+        :param item: the item to insert
+        :param priority: the priority of the item
+        :raises PriorityQueueTypeError: if the priority or the item are not of the types allowed in the queue, the error
+            is raised before waiting for free space
+        """
+
+        if type(priority) != self.__queue.priority_type:
+            raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.__queue.priority_type))
+
+        if self.__queue.type is not None and type(item) != self.__queue.type:
+            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__queue.type))
+
+        async with self.__not_full:
+            await _wait(self.__not_full, lambda: not self.full() or
+                        (not self.__duplicates and self.__queue.contains_priority(priority)))
+            self.__queue.enqueue(item, priority)
+            self.__not_empty.notify()
+
+    async def dequeue(self):
+        """
+        this coroutine removes and returns the element with the greatest or the lowest priority depending on the reverse
+        argument in the constructor, waiting for an element if the queue is empty
+
+        :return: the dequeued element
+        """
+
+        async with self.__not_empty:
+            await _wait(self.__not_empty, lambda: self.__queue.size > 0)
+            item = self.__queue.dequeue()
+            self.__not_full.notify()
+            return item
+
+
+class AsyncDelayQueue(_DelayQueueBase):
+    """
+    asyncio-native queue, in which every element is released after a delay - dequeue() is a coroutine, which returns the
+    element with the earliest release time, suspending the calling task until this time has come.
+
+    The elements are kept in a DuplicatePriorityQueue ordered by their release times. A waiting task is resumed by a timer
+    of the event loop set to the release time of the first element, instead of polling the queue, and earlier only if an
+    element with an earlier release time is enqueued.
+    """
+
+    def __init__(self, elements_type=None):
+        """
+        constructor for the asynchronous delay queue
+
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :raises QueueTypeError: if the elements_type argument is not a valid type
+        """
+
+        # the methods, which don't wait, never suspend the calling task, so no other task can change the queue meanwhile
+        super().__init__(elements_type, nullcontext())
+        self.__available = asyncio.Condition()
+
+    async def enqueue(self, item, delay):
+        """
+        this coroutine enqueues an element, which is released after the given delay, and wakes up the waiting tasks if the
+        element is released before all other elements
+
+        :param item: the element to enqueue
+        :param delay: the number of seconds after which the element is due, an integer or a float
+        :raises QueueTypeError: if the element is not of the type of elements in the queue or the delay is not a number
+        :raises ValueError: if the delay is negative
+        """
+
+        async with self.__available:
+            if self._entry(item, delay):
+                self.__available.notify_all()
+
+    async def dequeue(self):
+        """
+        this coroutine removes and returns the element with the earliest release time, waiting until it is due
+
+        :return: the dequeued element
+        """
+
+        async with self.__available:
+            try:
+                while True:
+                    delay = self._delay()
+                    if delay is not None and delay <= 0:
+                        break
+
+                    try:
+                        await asyncio.wait_for(self.__available.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except asyncio.CancelledError:
+                # the notification received by a cancelled task is passed on to another waiting task
+                if self.size > 0:
+                    self.__available.notify()
+                raise
+
+            item = self._release()
+            if self.size > 0:
+                self.__available.notify()
+
+            return item
+
+
+async def _wait(condition, predicate):
+    """
+    waits on an asyncio condition until the predicate holds, the lock of the condition must be held; if the waiting task
+    is cancelled after it has been notified, the notification is passed on to another waiting task so that it isn't lost
+
+    :param condition: the asyncio condition to wait on
+    :param predicate: a function with no arguments, which returns True when the task can proceed
+    """
+
+    try:
+        while not predicate():
+            await condition.wait()
+    except asyncio.CancelledError:
+        if predicate():
+            condition.notify()
+        raise
+
+
+# the header of a shared ring queue - the read index, the write index, the capacity and the record format
+_RING_HEADER = Struct("<QQQ64s")
+
+
+class SharedRingQueue(object):
+    """
+    FIFO queue of fixed-size records in a shared memory block, which can be used for passing records between processes
+    without pickling them.
+
+    The records are packed with a struct format in the slots of a ring buffer. The read and write indices only grow and
+    the slot of an index is the index modulo the capacity. With a single producer and a single consumer no lock is used:
+    only the producer writes the write index (after writing the record) and only the consumer writes the read index (after
+    reading the record). In multi-producer mode the producers are serialised with a multiprocessing lock, there can still
+    be only one consumer.
+
+    NOTE: the queue can be passed to a child process as an argument of multiprocessing.Process, other processes can attach
+    to it with SharedRingQueue.attach() using its name.
+    """
+
+    def __init__(self, record_format, capacity, multi_producer=False):
+        """
+        constructor for the shared ring queue, creates a new shared memory block
+
+        :param record_format: the struct format of a record, e.g. "<qd" for a record of an integer and a float
+        :param capacity: the maximum number of records in the queue
+        :param multi_producer: a boolean, if set to True enqueue() is guarded by a lock, so that many processes can
+            enqueue records, otherwise (default) only one process can enqueue records
+        :raises QueueTypeError: if the record format is not a valid struct format or the capacity is not an integer
+        :raises QueueTypeError: if the multi_producer argument is not a boolean
+        :raises ValueError: if the capacity is not a positive integer
+        """
+
+        if type(record_format) != str:
+            raise QueueTypeError("The record format must be a struct format string")
+
+        try:
+            record = Struct(record_format)
+        except StructError:
+            raise QueueTypeError("{0} is not a valid struct format".format(record_format))
+
+        if len(record_format.encode()) > 64:
+            raise QueueTypeError("The record format cannot be longer than 64 characters")
+
+        if type(capacity) != int:
+            raise QueueTypeError("The capacity of the queue must be an integer")
+
+        if capacity <= 0:
+            raise ValueError("The capacity of the queue must be a positive integer")
+
+        if type(multi_producer) != bool:
+            raise QueueTypeError("{0} is not a valid boolean argument for initialising the queue.".format(multi_producer))
+
+        memory = SharedMemory(create=True, size=_RING_HEADER.size + capacity*record.size)
+        _RING_HEADER.pack_into(memory.buf, 0, 0, 0, capacity, record_format.encode())
+
+        self.__init_attached(memory, multiprocessing.Lock() if multi_producer else None, True)
+
+    @classmethod
+    def attach(cls, name, lock=None):
+        """
+        attaches to a shared ring queue created by another process
+
+        :param name: the name of the queue
+        :param lock: the lock of the queue if it was created in multi-producer mode, without it the attached queue can
+            only consume records or be the single producer
+        :return: a SharedRingQueue using the shared memory block of the queue with this name
+        :raises FileNotFoundError: if there is no queue with this name
+        """
+
+        queue = cls.__new__(cls)
+        queue.__init_attached(SharedMemory(name=name), lock, False)
+
+        return queue
+
+    def __init_attached(self, memory, lock, owner):
+        """
+        initialises the attributes of the queue from its shared memory block
+
+        :param memory: the shared memory block
+        :param lock: the lock for the producers or None
+        :param owner: True if the queue has created the shared memory block
+        """
+
+        capacity, record_format = _RING_HEADER.unpack_from(memory.buf, 0)[2:]
+        self.__memory = memory
+        self.__buffer = memory.buf
+        self.__lock = lock
+        self.__owner = owner
+        self.__capacity = capacity
+        self.__record = Struct(record_format.rstrip(b"\0").decode())
+        self.__index = Struct("<Q")
+
+    def __reduce__(self):
+        """
+        allows passing the queue to a child process, the child process attaches to the same shared memory block
+
+        :return: a tuple used by pickle for recreating the queue
+        """
+
+        return SharedRingQueue.attach, (self.name, self.__lock)
+
+    def __enter__(self):
+        """
+        allows the use of the queue in a with statement
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        closes the queue at the end of a with statement and destroys the shared memory block if the queue created it
+        """
+
+        self.close()
+        if self.__owner:
+            self.unlink()
+
+    def __len__(self):
+        """
+        overriding this method allows the 'len(queue)' syntax
+
+        :return: the number of records in the queue
+        """
+
+        return self.size
+
+    def __repr__(self):
+        """
+        a repr representation of the shared ring queue
+
+        :return: a string in the form <SharedRingQueue name=... format=... capacity=...>
+        """
+
+        return "<SharedRingQueue name={0} format={1} capacity={2}>".format(self.name, self.__record.format, self.__capacity)
+
+    @property
+    def name(self):
+        """
+        a getter for the name of the queue, used by other processes to attach to it
+
+        :return: the name of the shared memory block
+        """
+
+        return self.__memory.name
+
+    @property
+    def record_format(self):
+        """
+        a getter for the struct format of the records
+
+        :return: the format of a record
+        """
+
+        return self.__record.format
+
+    @property
+    def capacity(self):
+        """
+        a getter for the capacity of the queue
+
+        :return: the maximum number of records in the queue
+        """
+
+        return self.__capacity
+
+    @property
+    def multi_producer(self):
+        """
+        a getter, which shows whether the producers are guarded by a lock
+
+        :return: True if the queue has a lock for the producers
+        """
+
+        return self.__lock is not None
+
+    @property
+    def size(self):
+        """
+        this method gets the number of records in the queue, the value might be outdated as soon as it is returned if
+        other processes are using the queue
+
+        :return: the number of records in the queue
+        """
+
+        return self.__write_index() - self.__read_index()
+
+    def __read_index(self):
+        """
+        reads the read index from the header of the queue
+
+        :return: the number of records dequeued since the queue was created
+        """
+
+        return self.__index.unpack_from(self.__buffer, 0)[0]
+
+    def __write_index(self):
+        """
+        reads the write index from the header of the queue
+
+        :return: the number of records enqueued since the queue was created
+        """
+
+        return self.__index.unpack_from(self.__buffer, 8)[0]
+
+    def __offset(self, index):
+        """
+        computes the position of the slot of an index
+
+        :param index: a read or write index
+        :return: the offset of the slot of the index in the shared memory block
+        """
+
+        return _RING_HEADER.size + (index % self.__capacity)*self.__record.size
+
+    def enqueue(self, item):
+        """
+        this method enqueues a record at the back of the queue
+
+        :param item: the record to enqueue - a tuple with the fields of the record or a single value if the record format
+            has a single field
+        :raises QueueTypeError: if the item cannot be packed with the record format of the queue
+        :raises FullQueueError: if the queue is full
+        """
+
+        fields = item if type(item) == tuple else (item,)
+
+        if self.__lock is None:
+            self.__enqueue(fields)
+        else:
+            with self.__lock:
+                self.__enqueue(fields)
+
+    def __enqueue(self, fields):
+        """
+        writes a record in the next free slot and then publishes it by advancing the write index
+
+        :param fields: the fields of the record
+        """
+
+        write_index = self.__write_index()
+        if write_index - self.__read_index() >= self.__capacity:
+            raise FullQueueError("The queue is full, it cannot contain more than {0} records".format(self.__capacity))
+
+        try:
+            self.__record.pack_into(self.__buffer, self.__offset(write_index), *fields)
+        except StructError:
+            raise QueueTypeError("The record {0} doesn't match the format {1}".format(fields, self.__record.format))
+
+        self.__index.pack_into(self.__buffer, 8, write_index + 1)
+
+    def dequeue(self):
+        """
+        this method removes the record at the front of the queue, can only be called by one process at a time
+
+        :return: the dequeued record - a tuple with its fields or a single value if the record format has a single field
+        :raises EmptyQueueError: if there are no records in the queue
+        """
+
+        read_index = self.__read_index()
+        if read_index == self.__write_index():
+            raise EmptyQueueError("There are no records in the queue")
+
+        record = self.__record.unpack_from(self.__buffer, self.__offset(read_index))
+        self.__index.pack_into(self.__buffer, 0, read_index + 1)
+
+        return record[0] if len(record) == 1 else record
+
+    def peek(self):
+        """
+        this method peeks the record at the front of the queue without removing it
+
+        :return: the peeked record or None if there are no records in the queue
+        """
+
+        read_index = self.__read_index()
+        if read_index == self.__write_index():
+            return None
+
+        record = self.__record.unpack_from(self.__buffer, self.__offset(read_index))
+
+        return record[0] if len(record) == 1 else record
+
+    def close(self):
+        """
+        this method detaches the queue from the shared memory block, the queue cannot be used after it is closed
+        """
+
+        self.__buffer = None
+        self.__memory.close()
+
+    def unlink(self):
+        """
+        this method destroys the shared memory block, should be called once by the process, which created the queue,
+        after all processes have closed it
+        """
+
+        self.__memory.unlink()
@@ -0,0 +1,944 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+
+import mmap
+import os
+import pickle
+from struct import Struct
+from zlib import crc32
+
+from DataStructures.Errors import *
+from DataStructures.AbstractDataStructures import PriorityQueue
+
+
+# every record in a log file is prefixed with its length and its checksum, so that a record, which was only partially
+# written before a crash, can be detected and discarded
+_RECORD_HEADER = Struct(">II")
+
+
+def _write_record(log_file, record):
+    """
+    serializes a record and appends it to a log file
+
+    :param log_file: the binary file to append to
+    :param record: the record to write, must be serializable with pickle
+    """
+
+    data = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+    log_file.write(_RECORD_HEADER.pack(len(data), crc32(data)))
+    log_file.write(data)
+
+
+def _read_records(log_path):
+    """
+    reads all complete records from a log file and truncates the file after the last complete record
+
+    :param log_path: the path of the log file
+    :return: a list with the records in the order they were written
+    """
+
+    records = []
+    if not os.path.exists(log_path):
+        return records
+
+    with open(log_path, "rb") as log_file:
+        content = log_file.read()
+
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(content):
+        length, checksum = _RECORD_HEADER.unpack_from(content, offset)
+        data = content[offset + _RECORD_HEADER.size: offset + _RECORD_HEADER.size + length]
+        if len(data) != length or crc32(data) != checksum:
+            break
+        records.append(pickle.loads(data))
+        offset += _RECORD_HEADER.size + length
+
+    # a torn record at the end of the log is dropped, otherwise new records would be appended after it
+    if offset != len(content):
+        with open(log_path, "r+b") as log_file:
+            log_file.truncate(offset)
+
+    return records
+
+
+def _scan_segment(segment_path, offset, validate):
+    """
+    counts the complete records in a segment file starting from a given offset, if validate is True the checksums of the
+    records are checked and the file is truncated after the last valid record
+
+    :param segment_path: the path of the segment file
+    :param offset: the offset of the first record to count
+    :param validate: a boolean, True if the checksums of the records must be checked
+    :return: the number of records after the offset
+    """
+
+    size = os.path.getsize(segment_path)
+    if size == 0:
+        return 0
+
+    count = 0
+    with open(segment_path, "rb") as segment_file:
+        with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            while offset + _RECORD_HEADER.size <= size:
+                length, checksum = _RECORD_HEADER.unpack_from(view, offset)
+                end = offset + _RECORD_HEADER.size + length
+                if end > size or (validate and crc32(view[offset + _RECORD_HEADER.size: end]) != checksum):
+                    break
+                count += 1
+                offset = end
+
+    # a torn record at the end of the last segment is dropped, otherwise new records would be appended after it
+    if validate and offset < size:
+        with open(segment_path, "r+b") as segment_file:
+            segment_file.truncate(offset)
+
+    return count
+
+
+def _write_snapshot(snapshot_path, snapshot):
+    """
+    atomically replaces a snapshot file - the snapshot is written in a temporary file, which is then renamed
+
+    :param snapshot_path: the path of the snapshot file
+    :param snapshot: the snapshot to write, must be serializable with pickle
+    """
+
+    temporary_path = snapshot_path + ".tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, pickle.HIGHEST_PROTOCOL)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary_path, snapshot_path)
+
+
+def _read_snapshot(snapshot_path):
+    """
+    reads a snapshot file
+
+    :param snapshot_path: the path of the snapshot file
+    :return: the snapshot or None if the file doesn't exist
+    """
+
+    if not os.path.exists(snapshot_path):
+        return None
+
+    with open(snapshot_path, "rb") as snapshot_file:
+        return pickle.load(snapshot_file)
+
+
+class DurablePriorityQueue(PriorityQueue):
+    """
+    Abstract Data Structure - a priority queue, which survives restarts of the process using it
+
+    Every operation, which changes the queue, is appended as a record to a write-ahead log file (path + ".log"). The log
+    is periodically compacted into a binary snapshot of the queue (path + ".snapshot"). When a durable queue is created
+    with the path of an existing queue, the queue is recovered from the snapshot and the records logged after it, and the
+    index of priorities is built at once in O(n) time.
+
+    NOTE: the log file is synced to disk after every sync_every records (group commit). With the default of 1 every
+    operation is durable once it returns, with a greater value the operations since the last sync may be lost on a crash,
+    but the queue is never recovered in an inconsistent state.
+
+    NOTE: the elements and the priorities of the queue must be serializable with pickle.
+    """
+
+    def __init__(self, path, elements_type=None, reverse=False, priority_type=int, ordered_index=False,
+                 sync_every=1, checkpoint_every=None):
+        """
+        constructor for the durable priority queue, recovers the queue if there are files for the given path
+
+        :param path: the path used for the files of the queue, the log is stored in path + ".log" and the snapshot in
+            path + ".snapshot"
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param reverse: a boolean, if set to True the queue dequeues the element with the lowest priority
+        :param priority_type: the type of the priorities in the queue, default is int
+        :param ordered_index: a boolean, if set to True the priorities are indexed in an AVL tree
+        :param sync_every: the number of records written to the log between two syncs to disk, default is 1
+        :param checkpoint_every: the number of records written to the log after which a snapshot is taken automatically,
+            default is None, which means snapshots are only taken when checkpoint() is called
+        :raises PriorityQueueTypeError: if any of the arguments of the priority queue is not valid
+        :raises PriorityQueueTypeError: if sync_every or checkpoint_every is not an integer
+        :raises PriorityQueueTypeError: if the recovered elements or priorities are not of the types of the queue
+        :raises ValueError: if sync_every or checkpoint_every is not a positive integer
+        """
+
+        super().__init__(elements_type=elements_type, reverse=reverse, priority_type=priority_type,
+                         ordered_index=ordered_index)
+
+        if type(sync_every) != int:
+            raise PriorityQueueTypeError("The sync_every argument must be an integer")
+
+        if sync_every <= 0:
+            raise ValueError("The sync_every argument must be a positive integer")
+
+        if checkpoint_every is not None and type(checkpoint_every) != int:
+            raise PriorityQueueTypeError("The checkpoint_every argument must be an integer")
+
+        if checkpoint_every is not None and checkpoint_every <= 0:
+            raise ValueError("The checkpoint_every argument must be a positive integer")
+
+        self.__log_path = path + ".log"
+        self.__snapshot_path = path + ".snapshot"
+        self.__sync_every = sync_every
+        self.__checkpoint_every = checkpoint_every
+
+        # the snapshot stores the sequence number of the last record it includes, since a crash between taking the
+        # snapshot and truncating the log leaves records in the log, which must not be applied twice
+        sequence = 0
+        elements = {}
+        snapshot = _read_snapshot(self.__snapshot_path)
+        if snapshot is not None:
+            sequence, pairs = snapshot
+            elements = {priority: item for item, priority in pairs}
+
+        for record in _read_records(self.__log_path):
+            if record[0] <= sequence:
+                continue
+            sequence = record[0]
+            self.__apply(elements, record)
+
+        super().enqueue_many([(item, priority) for priority, item in elements.items()])
+
+        self.__sequence = sequence
+        self.__unsynced = 0
+        self.__since_checkpoint = 0
+        self.__log = open(self.__log_path, "ab")
+
+    def __enter__(self):
+        """
+        allows the use of the queue in a with statement
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        closes the queue at the end of a with statement
+        """
+
+        self.close()
+
+    @property
+    def path(self):
+        """
+        a getter for the path of the files of the queue
+
+        :return: the path given in the constructor
+        """
+
+        return self.__log_path[:-len(".log")]
+
+    @property
+    def closed(self):
+        """
+        a getter, which shows whether the queue has been closed
+
+        :return: True if the queue has been closed and False otherwise
+        """
+
+        return self.__log is None
+
+    @staticmethod
+    def __apply(elements, record):
+        """
+        applies a log record to a dictionary linking priorities with elements
+
+        :param elements: the dictionary
+        :param record: the record to apply
+        """
+
+        operation = record[1]
+        if operation == "put":
+            elements[record[3]] = record[2]
+        elif operation == "del":
+            elements.pop(record[2])
+        elif operation == "move":
+            elements[record[3]] = elements.pop(record[2])
+
+    def __log_records(self, records):
+        """
+        appends records to the log, syncs the log if enough records have been written since the last sync and takes a
+        snapshot if enough records have been written since the last snapshot
+
+        :param records: a list of records without sequence numbers
+        """
+
+        for record in records:
+            self.__sequence += 1
+            _write_record(self.__log, (self.__sequence,) + record)
+
+        self.__unsynced += len(records)
+        if self.__unsynced >= self.__sync_every:
+            self.flush()
+
+        self.__since_checkpoint += len(records)
+        if self.__checkpoint_every is not None and self.__since_checkpoint >= self.__checkpoint_every:
+            self.checkpoint()
+
+    def __check_open(self):
+        """
+        checks that the queue can still be modified
+
+        :raises ValueError: if the queue has been closed
+        """
+
+        if self.__log is None:
+            raise ValueError("The durable priority queue has been closed")
+
+    def enqueue(self, item, priority):
+        """
+        overriding the enqueue() method to log the inserted element
+
+        :param item: the item to insert
+        :param priority: the priority of the item
+        :raises ValueError: if the queue has been closed
+        :raises PriorityQueueTypeError: if the item or the priority is not of the type allowed in the queue
+        """
+
+        self.__check_open()
+        super().enqueue(item, priority)
+        self.__log_records([("put", item, priority)])
+
+    def enqueue_many(self, pairs):
+        """
+        overriding the enqueue_many() method to log the inserted elements, the records are synced at once
+
+        :param pairs: an iterable of (item, priority) tuples
+        :raises ValueError: if the queue has been closed
+        :raises PriorityQueueTypeError: if any of the items or the priorities is not of the type allowed in the queue
+        """
+
+        self.__check_open()
+        pairs = list(pairs)
+        super().enqueue_many(pairs)
+        self.__log_records([("put", item, priority) for item, priority in pairs])
+
+    def dequeue(self):
+        """
+        overriding the dequeue() method to log the removed element
+
+        :return: the element to be dequeued
+        :raises ValueError: if the queue has been closed
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        self.__check_open()
+        if self.size == 0:
+            raise EmptyPriorityQueueError("The priority queue doesn't contain any elements")
+
+        priority = self._peek_priority()
+        element = super().dequeue()
+        self.__log_records([("del", priority)])
+
+        return element
+
+    def replace_priority(self, element, new_priority, comparison=None):
+        """
+        overriding the replace_priority() method to log the change of the priority
+
+        :param element: the element, for which the priority must be replaced
+        :param new_priority: the new priority
+        :param comparison: None - no comparison, 1 - greater than comparison, -1 - less than comparison
+        :return: True if the element's priority has been replaced and False otherwise
+        :raises ValueError: if the queue has been closed
+        :raises PriorityQueueTypeError: if the element or the new priority is not of the type allowed in the queue
+        :raises ValueError if the type of the comparison argument is not any of these (None, -1, 1)
+        :raises PriorityQueueElementError: if the element is not contained in the queue
+        """
+
+        self.__check_open()
+        old_priority = self._priority_of(element)
+        replaced = super().replace_priority(element, new_priority, comparison)
+        if replaced:
+            self.__log_records([("move", old_priority, new_priority)])
+
+        return replaced
+
+    def remove_element(self, element):
+        """
+        overriding the remove_element() method to log the removed element
+
+        :param element: the element to remove
+        :raises ValueError: if the queue has been closed
+        :raises PriorityQueueElementError: if the queue doesn't contain the element to delete
+        :raises PriorityQueueTypeError: if the type of the argument differs from the type of the elements in the queue
+        """
+
+        self.__check_open()
+        priority = self._priority_of(element)
+        super().remove_element(element)
+        self.__log_records([("del", priority)])
+
+    def flush(self):
+        """
+        this method writes all logged records to disk, regardless of the sync_every argument
+
+        :raises ValueError: if the queue has been closed
+        """
+
+        self.__check_open()
+        self.__log.flush()
+        os.fsync(self.__log.fileno())
+        self.__unsynced = 0
+
+    def checkpoint(self):
+        """
+        this method writes a snapshot of the queue and truncates the log, which makes the recovery of the queue faster
+        and stops the log from growing indefinitely
+
+        :raises ValueError: if the queue has been closed
+        """
+
+        self.flush()
+        pairs = self._pairs()
+        _write_snapshot(self.__snapshot_path, (self.__sequence, pairs))
+
+        self.__log.truncate(0)
+        self.__log.flush()
+        os.fsync(self.__log.fileno())
+        self.__since_checkpoint = 0
+
+    def close(self):
+        """
+        this method syncs the log to disk and closes it, the queue cannot be modified after it has been closed,
+        closing an already closed queue has no effect
+        """
+
+        if self.__log is None:
+            return
+
+        self.flush()
+        self.__log.close()
+        self.__log = None
+
+
+class PersistentQueue(object):
+    """
+    Abstract Data Structure - a queue stored on disk, which survives restarts of the process using it and can hold more
+    elements than fit in memory
+
+    The elements are appended as records to segment files (path + ".000000000000.segment", path + ".000000000001.segment",
+    etc.). When a segment reaches segment_size bytes, the records are appended to a new segment. The elements are read
+    through a memory map of the segment at the front of the queue and the position of the front of the queue is stored
+    in a checkpoint file (path + ".checkpoint"). A segment is deleted as soon as all of its elements have been dequeued.
+
+    NOTE: the segments and the checkpoint are synced to disk after every sync_every operations (group commit). With the
+    default of 1 every operation is durable once it returns, with a greater value the elements enqueued since the last
+    sync may be lost on a crash and the elements dequeued since the last sync are dequeued again after the recovery.
+
+    NOTE: the elements of the queue must be serializable with pickle.
+    """
+
+    def __init__(self, path, elements_type=None, segment_size=64 * 1024 * 1024, sync_every=1):
+        """
+        constructor for the persistent queue, recovers the queue if there are files for the given path
+
+        :param path: the path used for the files of the queue
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param segment_size: the maximum size of a segment file in bytes, default is 64 MiB, an element, which is greater
+            than the segment size, is stored in a segment on its own
+        :param sync_every: the number of operations between two syncs to disk, default is 1
+        :raises QueueTypeError: if the 'elements_type' argument is specified and is not a valid type
+        :raises QueueTypeError: if segment_size or sync_every is not an integer
+        :raises ValueError: if segment_size or sync_every is not a positive integer
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise QueueTypeError("{0} is not a valid type.".format(elements_type))
+
+        if type(segment_size) != int:
+            raise QueueTypeError("The segment_size argument must be an integer")
+
+        if segment_size <= 0:
+            raise ValueError("The segment_size argument must be a positive integer")
+
+        if type(sync_every) != int:
+            raise QueueTypeError("The sync_every argument must be an integer")
+
+        if sync_every <= 0:
+            raise ValueError("The sync_every argument must be a positive integer")
+
+        self.__path = path
+        self.__checkpoint_path = path + ".checkpoint"
+        self.__elements_type = elements_type
+        self.__segment_size = segment_size
+        self.__sync_every = sync_every
+
+        # segments before the checkpointed one are left over by a crash between writing the checkpoint and deleting them
+        head_segment, head_offset = _read_snapshot(self.__checkpoint_path) or (0, 0)
+        segments = self.__segments()
+        for segment in segments:
+            if segment < head_segment:
+                os.remove(self.__segment_path(segment))
+        segments = [segment for segment in segments if segment >= head_segment]
+
+        # the checkpointed segment is missing if it was deleted after all of its elements had been dequeued
+        if len(segments) == 0:
+            segments = [head_segment]
+        if segments[0] != head_segment:
+            head_segment, head_offset = segments[0], 0
+
+        # only the last segment can contain a torn record, the other segments were synced before a new one was started
+        self.__size = 0
+        for segment in segments:
+            offset = head_offset if segment == head_segment else 0
+            self.__size += _scan_segment(self.__segment_path(segment), offset, segment == segments[-1]) \
+                if os.path.exists(self.__segment_path(segment)) else 0
+
+        self.__head_segment = head_segment
+        self.__head_offset = head_offset
+        self.__view = None
+        self.__tail_segment = segments[-1]
+        self.__writer = open(self.__segment_path(self.__tail_segment), "ab")
+        self.__write_offset = self.__writer.tell()
+        self.__unsynced_writes = 0
+        self.__unsynced_reads = 0
+
+        _write_snapshot(self.__checkpoint_path, (self.__head_segment, self.__head_offset))
+
+    def __enter__(self):
+        """
+        allows the use of the queue in a with statement
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        closes the queue at the end of a with statement
+        """
+
+        self.close()
+
+    def __str__(self):
+        """
+        the str representation of the persistent queue shows its path and its size, since its elements are on disk
+        """
+
+        return "PersistentQueue({0!r}, size={1})".format(self.__path, self.__size)
+
+    def __repr__(self):
+        """
+        the repr representation of the persistent queue is the same as its str representation
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax, where queue is an object of type PersistentQueue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the queue
+
+        :return: reference to the queue object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method implements the next method for the iterator
+
+        :return: calls the dequeue() method to get the appropriate value to return and remove it from the queue
+        :raises StopIteration: if there are no elements in the queue
+        """
+
+        if self.size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in queue' syntax
+
+        :param item: the item to search for in the queue
+        :return: calls the contains() method to check if the item is contained in the queue
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        a getter for the size of the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements in the queue, None if the queue can contain elements of all types
+        """
+
+        return self.__elements_type
+
+    @property
+    def path(self):
+        """
+        a getter for the path of the files of the queue
+
+        :return: the path given in the constructor
+        """
+
+        return self.__path
+
+    @property
+    def closed(self):
+        """
+        a getter, which shows whether the queue has been closed
+
+        :return: True if the queue has been closed and False otherwise
+        """
+
+        return self.__writer is None
+
+    @property
+    def segment_count(self):
+        """
+        a getter for the number of segment files of the queue
+
+        :return: the number of segments from the front to the back of the queue
+        """
+
+        return self.__tail_segment - self.__head_segment + 1
+
+    def __segment_path(self, segment):
+        """
+        builds the path of a segment file
+
+        :param segment: the index of the segment
+        :return: the path of the segment file
+        """
+
+        return "{0}.{1:012d}.segment".format(self.__path, segment)
+
+    def __segments(self):
+        """
+        finds the segment files of the queue on disk
+
+        :return: a sorted list with the indices of the segments
+        """
+
+        directory, prefix = os.path.split(self.__path)
+        prefix += "."
+        segments = []
+        for name in os.listdir(directory or "."):
+            index = name[len(prefix):-len(".segment")]
+            if name.startswith(prefix) and name.endswith(".segment") and index.isdigit():
+                segments.append(int(index))
+
+        return sorted(segments)
+
+    def __check_open(self):
+        """
+        checks that the queue can still be used
+
+        :raises ValueError: if the queue has been closed
+        """
+
+        if self.__writer is None:
+            raise ValueError("The persistent queue has been closed")
+
+    def __map(self, segment):
+        """
+        maps a segment file in memory, the segment at the back of the queue is flushed first, so that the map includes the
+        records, which are still in the buffer of the file
+
+        :param segment: the index of the segment
+        :return: a read-only memory map of the segment
+        """
+
+        if segment == self.__tail_segment:
+            self.__writer.flush()
+
+        with open(self.__segment_path(segment), "rb") as segment_file:
+            return mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __mapped(self, end):
+        """
+        returns the map of the segment at the front of the queue, the segment is mapped again if the map doesn't reach
+        the given offset, which happens when records have been appended to the segment after it was mapped
+
+        :param end: the offset, which must be included in the map
+        :return: the memory map of the front segment
+        """
+
+        if self.__view is None or len(self.__view) < end:
+            if self.__view is not None:
+                self.__view.close()
+            self.__view = self.__map(self.__head_segment)
+
+        return self.__view
+
+    def __advance_segment(self):
+        """
+        moves the front of the queue to the next segment if all records of the front segment have been read, the
+        checkpoint is written before the consumed segment is deleted, so that a crash never leaves a checkpoint pointing
+        to a deleted segment with unread records
+        """
+
+        # the size of the file is only checked when the offset reaches the end of the map, which avoids a system call
+        # for every dequeued element
+        while self.__head_segment != self.__tail_segment and \
+                (self.__view is None or self.__head_offset >= len(self.__view)) and \
+                self.__head_offset >= os.path.getsize(self.__segment_path(self.__head_segment)):
+            if self.__view is not None:
+                self.__view.close()
+                self.__view = None
+            consumed = self.__head_segment
+            self.__head_segment, self.__head_offset = consumed + 1, 0
+            _write_snapshot(self.__checkpoint_path, (self.__head_segment, self.__head_offset))
+            self.__unsynced_reads = 0
+            os.remove(self.__segment_path(consumed))
+
+    def __read_head(self):
+        """
+        reads the record at the front of the queue without removing it, must only be called if the queue is not empty
+
+        :return: a tuple (data, end) - the serialized element and the offset after its record
+        """
+
+        self.__advance_segment()
+        start = self.__head_offset + _RECORD_HEADER.size
+        length, _ = _RECORD_HEADER.unpack_from(self.__mapped(start), self.__head_offset)
+        view = self.__mapped(start + length)
+
+        return view[start: start + length], start + length
+
+    def __append(self, data):
+        """
+        appends a serialized element to the segment at the back of the queue, a new segment is started if the record
+        doesn't fit in the current one
+
+        :param data: the serialized element
+        """
+
+        record_size = _RECORD_HEADER.size + len(data)
+        if self.__write_offset > 0 and self.__write_offset + record_size > self.__segment_size:
+            self.__writer.flush()
+            os.fsync(self.__writer.fileno())
+            self.__writer.close()
+            self.__tail_segment += 1
+            self.__writer = open(self.__segment_path(self.__tail_segment), "ab")
+            self.__write_offset = 0
+
+        self.__writer.write(_RECORD_HEADER.pack(len(data), crc32(data)))
+        self.__writer.write(data)
+        self.__write_offset += record_size
+
+    def __check_type(self, item):
+        """
+        checks the type of an element, which is enqueued
+
+        :param item: the element to check
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of the item
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise QueueTypeError("The element {0} that you are trying to enqueue is not of type {1}".format(item, self.__elements_type))
+
+    def __synced(self, writes, reads):
+        """
+        counts the operations since the last sync and syncs the queue to disk if there are enough of them
+
+        :param writes: the number of enqueued elements
+        :param reads: the number of dequeued elements
+        """
+
+        self.__unsynced_writes += writes
+        self.__unsynced_reads += reads
+        if self.__unsynced_writes + self.__unsynced_reads >= self.__sync_every:
+            self.flush()
+
+    def contains(self, item):
+        """
+        this method checks if an item is contained in the queue, the segments are scanned from the front to the back of
+        the queue, so it takes O(n) time
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        :raises ValueError: if the queue has been closed
+        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        """
+
+        self.__check_open()
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise QueueTypeError("The parameter {0} is not of type {1}.".format(item, self.__elements_type))
+
+        remaining = self.__size
+        segment, offset = self.__head_segment, self.__head_offset
+        while remaining > 0:
+            with self.__map(segment) as view:
+                while remaining > 0 and offset < len(view):
+                    length, _ = _RECORD_HEADER.unpack_from(view, offset)
+                    offset += _RECORD_HEADER.size
+                    if pickle.loads(view[offset: offset + length]) == item:
+                        return True
+                    offset += length
+                    remaining -= 1
+            segment, offset = segment + 1, 0
+
+        return False
+
+    def enqueue(self, item):
+        """
+        this method enqueues an element in the queue
+
+        :param item: the element to enqueue
+        :raises ValueError: if the queue has been closed
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type
+            of the 'item' argument used when calling this method
+        """
+
+        self.__check_open()
+        self.__check_type(item)
+        self.__append(pickle.dumps(item, pickle.HIGHEST_PROTOCOL))
+        self.__size += 1
+        self.__synced(1, 0)
+
+    def enqueue_many(self, items):
+        """
+        this method enqueues many elements in the order they are given, the elements are validated in a single pass and
+        synced to disk at once
+
+        :param items: an iterable with the elements to enqueue
+        :raises ValueError: if the queue has been closed
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of any
+            of the elements, in this case none of the elements is enqueued
+        """
+
+        self.__check_open()
+        items = list(items)
+        for item in items:
+            self.__check_type(item)
+
+        for item in items:
+            self.__append(pickle.dumps(item, pickle.HIGHEST_PROTOCOL))
+        self.__size += len(items)
+        self.__synced(len(items), 0)
+
+    def dequeue(self):
+        """
+        this method removes the element that got first in the queue
+
+        :return: the dequeued element
+        :raises ValueError: if the queue has been closed
+        :raises EmptyQueueError: if there are no elements in the queue
+        """
+
+        self.__check_open()
+        if self.__size == 0:
+            raise EmptyQueueError("There are no elements in the queue")
+
+        data, self.__head_offset = self.__read_head()
+        self.__size -= 1
+        self.__synced(0, 1)
+
+        return pickle.loads(data)
+
+    def dequeue_many(self, n):
+        """
+        this method dequeues up to n elements from the queue, the new front of the queue is synced to disk at once
+
+        :param n: the maximum number of elements to dequeue
+        :return: a list with the dequeued elements in the order they were enqueued, the list has fewer than n elements if
+            there are fewer than n elements in the queue
+        :raises ValueError: if the queue has been closed
+        :raises QueueTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        self.__check_open()
+        if type(n) != int:
+            raise QueueTypeError("The number of elements to dequeue must be an integer")
+
+        if n < 0:
+            raise ValueError("The number of elements to dequeue must not be negative")
+
+        items = []
+        for _ in range(min(n, self.__size)):
+            data, self.__head_offset = self.__read_head()
+            items.append(pickle.loads(data))
+        self.__size -= len(items)
+        self.__synced(0, len(items))
+
+        return items
+
+    def peek(self):
+        """
+        this method peeks the element that got first in the queue (without removing it)
+
+        :return: the peeked element or None if there are no elements in the queue
+        :raises ValueError: if the queue has been closed
+        """
+
+        self.__check_open()
+        if self.__size == 0:
+            return None
+
+        data, _ = self.__read_head()
+        return pickle.loads(data)
+
+    def flush(self):
+        """
+        this method writes the enqueued elements and the front of the queue to disk, regardless of the sync_every argument
+
+        :raises ValueError: if the queue has been closed
+        """
+
+        self.__check_open()
+        if self.__unsynced_writes > 0:
+            self.__writer.flush()
+            os.fsync(self.__writer.fileno())
+        if self.__unsynced_reads > 0:
+            _write_snapshot(self.__checkpoint_path, (self.__head_segment, self.__head_offset))
+        self.__unsynced_writes = 0
+        self.__unsynced_reads = 0
+
+    def close(self):
+        """
+        this method syncs the queue to disk and closes its files, the queue cannot be used after it has been closed,
+        closing an already closed queue has no effect
+        """
+
+        if self.__writer is None:
+            return
+
+        self.flush()
+        if self.__view is not None:
+            self.__view.close()
+            self.__view = None
+        self.__writer.close()
+        self.__writer = None
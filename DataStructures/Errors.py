@@ -27,6 +27,16 @@ class StackTypeError(TypeError):
         super().__init__(msg)
 
 
+class FullStackError(ValueError):
+    """
+    A custom type of error, when an element is added to a bounded stack, which is full, and the overflow policy of the stack
+    is to raise an error.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
 class EmptyQueueError(ValueError):
     """
     A custom type of error, when an operation is performed, which requires a non-empty queue, but an empty queue is
@@ -56,6 +66,16 @@ class QueueTypeError(TypeError):
         super().__init__(msg)
 
 
+class FullQueueError(ValueError):
+    """
+    A custom type of error, when an element is added to a bounded queue, which is full, and the overflow policy of the queue
+    is to raise an error.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
 class EmptyPriorityQueueError(ValueError):
     """
     A custom type of error, when an operation is performed, which requires a non-empty priority queue, but an empty one is
@@ -150,3 +170,59 @@ class BinaryHeapTypeError(TypeError):
 
     def __init__(self, msg):
         super().__init__(msg)
+
+
+class EmptyAVLTreeError(ValueError):
+    """
+    A custom type of error, when an operation is performed, which requires a non-empty AVL tree, but an empty one is
+    calling the function.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class AVLTreeElementError(KeyError):
+    """
+    A custom type of error, when an operation is performed, which requires an element from the AVL tree, but this element
+    is not found in it.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class AVLTreeTypeError(TypeError):
+    """
+    A custom type of error, when an AVL tree operation is performed with arguments of the wrong type.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class TimingWheelTypeError(TypeError):
+    """
+    A custom type of error, when a timing wheel operation is performed with arguments of the wrong type.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class SchedulerTypeError(TypeError):
+    """
+    A custom type of error, when a scheduler operation is performed with arguments of the wrong type.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class ExecutorTypeError(TypeError):
+    """
+    A custom type of error, when an executor is created or used with arguments of the wrong type.
+    """
+
+    def __init__(self, msg):
+        super().__init__(msg)
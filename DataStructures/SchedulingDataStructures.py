@@ -0,0 +1,1176 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+
+import asyncio
+from bisect import insort
+from collections import deque
+from heapq import nsmallest
+from math import floor, isfinite
+from threading import Event, Lock, Thread, current_thread
+from time import monotonic, perf_counter
+
+from DataStructures.Errors import *
+from DataStructures.AbstractDataStructures import Queue, DuplicatePriorityQueue
+
+
+class CalendarQueue(object):
+    """
+    Abstract Data Structure - a priority queue for discrete-event simulation, which dequeues the element with the lowest
+    priority (the earliest timestamp) first
+
+    The elements are hashed by their priority into an array of buckets ("days"), each bucket covering an interval of
+    priorities of the same width, and the array is walked like a calendar ("year" after "year"). When the priorities of
+    the elements are close to the last dequeued priority, which is the common case in a simulation, both enqueue and
+    dequeue run in amortized O(1) time instead of the O(log n) time of the heap-based PriorityQueue. The number of buckets
+    follows the number of elements and the width of the buckets is re-estimated from the elements at the front of the
+    queue whenever the buckets are resized.
+
+    NOTE: elements with the same priority are retained and dequeued in the order they were enqueued, the same way as in
+        the DuplicatePriorityQueue.
+    """
+
+    # the queue never shrinks below this number of buckets
+    __MIN_BUCKETS = 2
+
+    # the number of elements at the front of the queue used to estimate the width of the buckets
+    __SAMPLE_SIZE = 25
+
+    def __init__(self, elements_type=None, priority_type=int):
+        """
+        constructor for the calendar queue
+
+        :param elements_type: denotes the type of elements that can be added to the queue, default is None, which allows
+            all types of elements
+        :param priority_type: the type of the priorities in the queue, either int (default) or float
+        :raises PriorityQueueTypeError: if a valid type is not given for the elements_type argument
+        :raises PriorityQueueTypeError: if the priority_type argument is neither int, nor float
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise PriorityQueueTypeError("{0} is not a valid type for initialising the calendar queue".format(elements_type))
+
+        if priority_type != int and priority_type != float:
+            raise PriorityQueueTypeError("The priorities of the calendar queue must be either of type int or float")
+
+        self.__elements_type = elements_type
+        self.__priority_type = priority_type
+
+        # every bucket is a list of (priority, sequence number, element) tuples sorted by priority, the sequence number
+        # breaks the ties between equal priorities in the order of enqueueing
+        self.__buckets = [[] for _ in range(self.__MIN_BUCKETS)]
+        self.__width = 1.0
+        self.__size = 0
+        self.__sequence = 0
+
+        # the number of the day (counted from priority 0) of the last dequeued element, no element in the queue
+        # has a priority in an earlier day
+        self.__day = 0
+
+    def __str__(self):
+        """
+        overriding the str() method
+
+        :return: a string of the list of (priority, element) tuples in the order they would be dequeued
+        """
+
+        return str([(entry[0], entry[2]) for entry in sorted(entry for bucket in self.__buckets for entry in bucket)])
+
+    def __repr__(self):
+        """
+        overriding the repr() method
+
+        :return: a string in the form <CalendarQueue object at ...>
+        """
+
+        return "<CalendarQueue object at {0}>".format(hex(id(self)))
+
+    def __len__(self):
+        """
+        overriding the len() method
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator with the calendar queue
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        the next method used for the iterator
+
+        :return: uses dequeue to return the next element
+        :raises StopIteration: if the queue is empty
+        """
+
+        if self.__size == 0:
+            raise StopIteration
+        else:
+            return self.dequeue()
+
+    @property
+    def size(self):
+        """
+        a getter for the size of the queue
+
+        :return: the number of elements in the queue
+        """
+
+        return self.__size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the queue
+
+        :return: the type of elements in the queue, None if all types are allowed
+        """
+
+        return self.__elements_type
+
+    @property
+    def priority_type(self):
+        """
+        a getter for the type of the priorities in the queue
+
+        :return: the type of the priorities in the queue
+        """
+
+        return self.__priority_type
+
+    @property
+    def bucket_count(self):
+        """
+        a getter for the current number of buckets in the queue
+
+        :return: the number of buckets
+        """
+
+        return len(self.__buckets)
+
+    @property
+    def bucket_width(self):
+        """
+        a getter for the current width of the buckets in the queue
+
+        :return: the range of priorities covered by a single bucket
+        """
+
+        return self.__width
+
+    def enqueue(self, item, priority):
+        """
+        this method inserts an element into the queue with a given priority
+
+        :param item: the item to insert
+        :param priority: the priority of the item
+        :raises PriorityQueueTypeError: if the priority argument is not of the priority type of the queue
+        :raises PriorityQueueTypeError: if the element to enqueue is not of the same type as the other elements in the queue
+            unless the type of the queue is None (all types allowed in this case)
+        :raises ValueError: if the priority is infinite or NaN
+        """
+
+        if type(priority) != self.__priority_type:
+            raise PriorityQueueTypeError("The priority of an element must be of type {0}".format(self.__priority_type))
+
+        # an infinite or NaN priority doesn't belong to any day of the calendar
+        if not isfinite(priority):
+            raise ValueError("The priority of an element in the calendar queue must be a finite number")
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise PriorityQueueTypeError("The element you are trying to enqueue is not of type {0}".format(self.__elements_type))
+
+        day = self.__day_of(priority)
+        if self.__size == 0 or day < self.__day:
+            self.__day = day
+
+        insort(self.__buckets[day % len(self.__buckets)], (priority, self.__sequence, item))
+        self.__sequence += 1
+        self.__size += 1
+
+        if self.__size > 2*len(self.__buckets):
+            self.__resize(2*len(self.__buckets))
+
+    def dequeue(self):
+        """
+        this method returns the element with the lowest priority and removes it from the queue, if there are many
+        elements with this priority the one, which was enqueued first, is returned
+
+        :return: the element to be dequeued
+        :raises EmptyPriorityQueueError: if the queue is empty
+        """
+
+        if self.__size == 0:
+            raise EmptyPriorityQueueError("The calendar queue doesn't contain any elements")
+
+        element = self.__buckets[self.__find_next()].pop(0)[2]
+        self.__size -= 1
+
+        if self.__size < len(self.__buckets)/2 and len(self.__buckets) > self.__MIN_BUCKETS:
+            self.__resize(int(len(self.__buckets)/2))
+
+        return element
+
+    def peek(self):
+        """
+        this method is the same as dequeue() but doesn't remove the element from the queue
+
+        :return: the element to be dequeued without removing it or None if the queue is empty
+        """
+
+        if self.__size == 0:
+            return None
+
+        return self.__buckets[self.__find_next()][0][2]
+
+    def __day_of(self, priority):
+        """
+        computes the day (the interval of priorities covered by one bucket) of a priority
+
+        :param priority: the priority
+        :return: the number of the day counted from priority 0
+        """
+
+        return floor(priority / self.__width)
+
+    def __find_next(self):
+        """
+        finds the bucket of the element with the lowest priority, the queue must not be empty
+
+        :return: the index of the bucket
+        """
+
+        buckets_count = len(self.__buckets)
+
+        # walk the calendar for one year starting from the current day
+        for day in range(self.__day, self.__day + buckets_count):
+            bucket = self.__buckets[day % buckets_count]
+            if len(bucket) > 0 and self.__day_of(bucket[0][0]) <= day:
+                self.__day = day
+                return day % buckets_count
+
+        # there are no elements in the whole year, hence jump directly to the day of the lowest priority
+        lowest = min(bucket[0] for bucket in self.__buckets if len(bucket) > 0)
+        self.__day = self.__day_of(lowest[0])
+
+        return self.__day % buckets_count
+
+    def __resize(self, buckets_count):
+        """
+        redistributes the elements of the queue in a new number of buckets with a new width
+
+        :param buckets_count: the new number of buckets
+        """
+
+        entries = [entry for bucket in self.__buckets for entry in bucket]
+
+        # the new width is estimated from the average distance between the elements at the front of the queue, ignoring
+        # distances much larger than the average, so that a few distant elements don't make the buckets too wide
+        sample = nsmallest(self.__SAMPLE_SIZE, entries)
+        if len(sample) > 1:
+            distances = [sample[i + 1][0] - sample[i][0] for i in range(len(sample) - 1)]
+            average = sum(distances) / len(distances)
+            distances = [distance for distance in distances if distance <= 2*average]
+            average = sum(distances) / len(distances)
+            if average > 0:
+                self.__width = 3.0*average
+
+        self.__buckets = [[] for _ in range(buckets_count)]
+        for entry in entries:
+            self.__buckets[self.__day_of(entry[0]) % buckets_count].append(entry)
+        for bucket in self.__buckets:
+            bucket.sort()
+
+        if len(sample) > 0:
+            self.__day = self.__day_of(sample[0][0])
+
+
+class TimerHandle(object):
+    """
+    A handle for an element scheduled in a TimingWheel or an event scheduled in a Scheduler, which is used for cancelling
+    the element or the event.
+    """
+
+    __PENDING, __CANCELLED, __EXPIRED = range(3)
+
+    def __init__(self, item, deadline):
+        """
+        constructor for the timer handle, handles are only created by the timing wheel and the scheduler
+
+        :param item: the scheduled element (the callback for a scheduler event)
+        :param deadline: the tick of the wheel, at which the element expires (the time of a scheduler event)
+        """
+
+        self.__item = item
+        self.__deadline = deadline
+        self.__state = self.__PENDING
+
+    def __repr__(self):
+        """
+        overriding the repr() method
+
+        :return: a string in the form <TimerHandle item=... deadline=...>
+        """
+
+        return "<TimerHandle item={0!r} deadline={1}>".format(self.__item, self.__deadline)
+
+    @property
+    def item(self):
+        """
+        a getter for the scheduled element
+
+        :return: the element linked to this handle
+        """
+
+        return self.__item
+
+    @property
+    def deadline(self):
+        """
+        a getter for the tick, at which the element expires
+
+        :return: the deadline of the element
+        """
+
+        return self.__deadline
+
+    @property
+    def pending(self):
+        """
+        a getter, which shows whether the element is still waiting to expire
+
+        :return: True if the element has neither expired, nor been cancelled
+        """
+
+        return self.__state == self.__PENDING
+
+    @property
+    def cancelled(self):
+        """
+        a getter, which shows whether the element has been cancelled
+
+        :return: True if the element has been cancelled before it expired
+        """
+
+        return self.__state == self.__CANCELLED
+
+
+class TimingWheel(object):
+    """
+    Abstract Data Structure - a hierarchical timing wheel for managing timeouts, which are usually cancelled before they
+    expire (e.g. connection timeouts)
+
+    The wheel is driven by ticks. Every level of the wheel is an array of slots and every slot is a Queue of timer handles.
+    A slot of the lowest level covers a single tick and a slot of each next level covers a whole revolution of the level
+    below it. Scheduling an element puts its handle in the slot of the lowest level, which covers its deadline, in O(1)
+    time. When a slot of a higher level is reached, its handles are cascaded into the levels below it. Cancelling an
+    element only marks its handle in O(1) time and the handle is dropped when its slot is reached.
+    """
+
+    def __init__(self, elements_type=None, slots=64, levels=4):
+        """
+        constructor for the timing wheel
+
+        :param elements_type: denotes the type of elements that can be scheduled, default is None, which allows all types
+        :param slots: the number of slots in each level of the wheel, default is 64
+        :param levels: the number of levels of the wheel, default is 4, the wheel can schedule elements slots**levels - 1
+            ticks ahead without cascading them more than once per level, elements scheduled further ahead are placed
+            again every time they reach the end of the wheel
+        :raises TimingWheelTypeError: if a valid type is not given for the elements_type argument
+        :raises TimingWheelTypeError: if slots or levels is not an integer
+        :raises ValueError: if slots is less than 2 or levels is not positive
+        """
+
+        if elements_type is not None and type(elements_type) != type:
+            raise TimingWheelTypeError("{0} is not a valid type for initialising the timing wheel".format(elements_type))
+
+        if type(slots) != int or type(levels) != int:
+            raise TimingWheelTypeError("The number of slots and levels of the timing wheel must be integers")
+
+        if slots < 2:
+            raise ValueError("The timing wheel must have at least 2 slots in each level")
+
+        if levels <= 0:
+            raise ValueError("The timing wheel must have at least 1 level")
+
+        self.__elements_type = elements_type
+        self.__slots = slots
+        self.__wheels = [[Queue(TimerHandle) for _ in range(slots)] for _ in range(levels)]
+        self.__now = 0
+        self.__size = 0
+
+    def __len__(self):
+        """
+        overriding the len() method
+
+        :return: the number of pending elements in the wheel
+        """
+
+        return self.__size
+
+    @property
+    def size(self):
+        """
+        a getter for the size of the wheel
+
+        :return: the number of pending elements in the wheel
+        """
+
+        return self.__size
+
+    @property
+    def type(self):
+        """
+        a getter for the type of elements in the wheel
+
+        :return: the type of elements in the wheel, None if all types are allowed
+        """
+
+        return self.__elements_type
+
+    @property
+    def now(self):
+        """
+        a getter for the current tick of the wheel
+
+        :return: the number of ticks since the wheel was created
+        """
+
+        return self.__now
+
+    def schedule(self, item, delay):
+        """
+        this method schedules an element to expire after a number of ticks
+
+        :param item: the element to schedule
+        :param delay: the number of ticks after which the element expires
+        :return: a TimerHandle, which can be used for cancelling the element
+        :raises TimingWheelTypeError: if the element is not of the type of elements in the wheel
+        :raises TimingWheelTypeError: if the delay is not an integer
+        :raises ValueError: if the delay is not positive
+        """
+
+        if self.__elements_type is not None and type(item) != self.__elements_type:
+            raise TimingWheelTypeError("The element you are trying to schedule is not of type {0}".format(self.__elements_type))
+
+        if type(delay) != int:
+            raise TimingWheelTypeError("The delay of an element must be an integer number of ticks")
+
+        if delay <= 0:
+            raise ValueError("The delay of an element must be a positive number of ticks")
+
+        handle = TimerHandle(item, self.__now + delay)
+        self.__place(handle)
+        self.__size += 1
+
+        return handle
+
+    def cancel(self, handle):
+        """
+        this method cancels a scheduled element, so that it never expires
+
+        :param handle: the handle returned when the element was scheduled
+        :return: True if the element has been cancelled and False if it has already expired or been cancelled
+        :raises TimingWheelTypeError: if the argument is not a TimerHandle
+        """
+
+        if type(handle) != TimerHandle:
+            raise TimingWheelTypeError("Only a TimerHandle can be cancelled")
+
+        if not handle.pending:
+            return False
+
+        handle._TimerHandle__state = TimerHandle._TimerHandle__CANCELLED
+        self.__size -= 1
+
+        return True
+
+    def tick(self):
+        """
+        this method advances the wheel with a single tick
+
+        :return: a list with the elements, which expire on this tick; elements cascaded from a higher level come after the
+            elements scheduled directly in the lowest level, so elements expiring on the same tick are not necessarily
+            returned in the order they were scheduled
+        """
+
+        self.__now += 1
+
+        # the slots of the higher levels, which are reached on this tick, are cascaded starting from the highest one
+        # so that the cascaded handles can be cascaded again in the lower levels on the same tick
+        span = self.__slots**(len(self.__wheels) - 1)
+        for level in range(len(self.__wheels) - 1, 0, -1):
+            if self.__now % span == 0:
+                for handle in self.__take_slot(level, (self.__now // span) % self.__slots):
+                    if handle.pending:
+                        self.__place(handle)
+            span //= self.__slots
+
+        expired = []
+        for handle in self.__take_slot(0, self.__now % self.__slots):
+            if not handle.pending:
+                continue
+            # a deadline beyond the range of the wheel was put in the last slot of the highest level, with a single level
+            # it is never cascaded, so it is put back in the wheel until its deadline is reached
+            if handle.deadline > self.__now:
+                self.__place(handle)
+                continue
+            handle._TimerHandle__state = TimerHandle._TimerHandle__EXPIRED
+            expired.append(handle.item)
+        self.__size -= len(expired)
+
+        return expired
+
+    def advance(self, ticks):
+        """
+        this method advances the wheel with a number of ticks
+
+        :param ticks: the number of ticks
+        :return: a list with the elements, which expire during these ticks, in the order they expire
+        :raises TimingWheelTypeError: if the number of ticks is not an integer
+        :raises ValueError: if the number of ticks is negative
+        """
+
+        if type(ticks) != int:
+            raise TimingWheelTypeError("The number of ticks must be an integer")
+
+        if ticks < 0:
+            raise ValueError("The number of ticks must not be negative")
+
+        expired = []
+        for _ in range(ticks):
+            expired.extend(self.tick())
+
+        return expired
+
+    async def run(self, interval, callback):
+        """
+        this coroutine ticks the wheel in real time until the task running it is cancelled, the ticks are scheduled
+        relative to the clock of the event loop, so delayed ticks are caught up with instead of accumulating drift
+
+        :param interval: the duration of a tick in seconds
+        :param callback: a function or a coroutine function called with the list of expired elements on every tick, on
+            which some elements expire
+        :raises TimingWheelTypeError: if the interval is not a number
+        :raises ValueError: if the interval is not positive
+        """
+
+        if type(interval) != int and type(interval) != float:
+            raise TimingWheelTypeError("The interval of the ticks must be a number")
+
+        if interval <= 0:
+            raise ValueError("The interval of the ticks must be positive")
+
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + interval
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            while loop.time() >= next_tick:
+                next_tick += interval
+                expired = self.tick()
+                if len(expired) > 0:
+                    result = callback(expired)
+                    if asyncio.iscoroutine(result):
+                        await result
+
+    def __place(self, handle):
+        """
+        puts a handle in the slot of the lowest level, which covers its deadline
+
+        :param handle: the handle to put in the wheel
+        """
+
+        delay = handle.deadline - self.__now
+        span = 1
+        for level in range(len(self.__wheels)):
+            if delay < span*self.__slots or level == len(self.__wheels) - 1:
+                # a deadline beyond the range of the highest level is put in its last slot and placed again when the
+                # slot is reached
+                deadline = min(handle.deadline, self.__now + span*self.__slots - 1)
+                self.__wheels[level][(deadline // span) % self.__slots].enqueue(handle)
+                return
+            span *= self.__slots
+
+    def __take_slot(self, level, slot):
+        """
+        empties a slot of the wheel
+
+        :param level: the level of the slot
+        :param slot: the index of the slot in the level
+        :return: the Queue of handles, which were in the slot
+        """
+
+        handles = self.__wheels[level][slot]
+        self.__wheels[level][slot] = Queue(TimerHandle)
+
+        return handles
+
+
+class Scheduler(object):
+    """
+    A deterministic discrete-event scheduler - callbacks are scheduled at points of a simulated time and are dispatched in
+    the order of their times, callbacks scheduled at the same time are dispatched in the order they were scheduled.
+
+    The events are kept in a DuplicatePriorityQueue, which already dequeues elements with the same priority in FIFO order.
+    All events with the same time are dequeued as a single batch before any of them is dispatched. Cancelling an event only
+    marks its handle in O(1) time and the event is dropped when it is dequeued.
+    """
+
+    def __init__(self, time_type=float, start=None):
+        """
+        constructor for the scheduler
+
+        :param time_type: the type of the simulated time, default is float, any numeric type can be used
+        :param start: the initial simulated time, default is None, which means time_type(0)
+        :raises SchedulerTypeError: if a valid type is not given for the time_type argument
+        :raises SchedulerTypeError: if the start argument is not of the time type of the scheduler
+        """
+
+        if type(time_type) != type:
+            raise SchedulerTypeError("{0} is not a valid type for the time of the scheduler".format(time_type))
+
+        if start is None:
+            start = time_type(0)
+
+        if type(start) != time_type:
+            raise SchedulerTypeError("The start time of the scheduler must be of type {0}".format(time_type))
+
+        self.__time_type = time_type
+        self.__events = DuplicatePriorityQueue(TimerHandle, reverse=True, priority_type=time_type)
+        self.__now = start
+        self.__pending = 0
+
+        # the events of a batch, which weren't dispatched because a callback raised an exception
+        self.__batch = []
+
+        self.__dispatched = 0
+        self.__dispatch_time = 0.0
+        self.__max_queue_depth = 0
+        self.__max_lag = 0.0
+
+    def __len__(self):
+        """
+        overriding the len() method
+
+        :return: the number of pending events in the scheduler
+        """
+
+        return self.__pending
+
+    @property
+    def now(self):
+        """
+        a getter for the current simulated time
+
+        :return: the time of the last dispatched batch or the time given to the last call of run_until()
+        """
+
+        return self.__now
+
+    @property
+    def time_type(self):
+        """
+        a getter for the type of the simulated time
+
+        :return: the type of the time of the scheduler
+        """
+
+        return self.__time_type
+
+    @property
+    def queue_depth(self):
+        """
+        a getter for the number of pending events
+
+        :return: the number of events, which have neither been dispatched, nor cancelled
+        """
+
+        return self.__pending
+
+    @property
+    def max_queue_depth(self):
+        """
+        a getter for the greatest number of pending events since the scheduler was created
+
+        :return: the maximum queue depth
+        """
+
+        return self.__max_queue_depth
+
+    @property
+    def dispatched(self):
+        """
+        a getter for the number of dispatched events
+
+        :return: the number of callbacks called since the scheduler was created
+        """
+
+        return self.__dispatched
+
+    @property
+    def events_per_second(self):
+        """
+        a getter for the dispatch throughput of the scheduler
+
+        :return: the number of dispatched events divided by the wall-clock time spent in run_until(), 0.0 if no time has
+            been spent yet
+        """
+
+        if self.__dispatch_time == 0:
+            return 0.0
+
+        return self.__dispatched / self.__dispatch_time
+
+    @property
+    def max_lag(self):
+        """
+        a getter for the greatest dispatch lag - the wall-clock time between dequeueing a batch of events and calling the
+        callback of an event in the batch, i.e. the time an event waited behind the events scheduled at the same time
+
+        :return: the maximum lag in seconds
+        """
+
+        return self.__max_lag
+
+    def schedule(self, at, callback):
+        """
+        this method schedules a callback to be called at a given simulated time
+
+        :param at: the simulated time
+        :param callback: a callable, which is called without arguments
+        :return: a TimerHandle, which can be used for cancelling the event
+        :raises SchedulerTypeError: if the time is not of the time type of the scheduler or the callback is not callable
+        :raises ValueError: if the time is earlier than the current time of the scheduler
+        """
+
+        if type(at) != self.__time_type:
+            raise SchedulerTypeError("The time of an event must be of type {0}".format(self.__time_type))
+
+        if not callable(callback):
+            raise SchedulerTypeError("The callback of an event must be callable")
+
+        if at < self.__now:
+            raise ValueError("An event cannot be scheduled earlier than the current time of the scheduler")
+
+        handle = TimerHandle(callback, at)
+        self.__events.enqueue(handle, at)
+        self.__pending += 1
+        self.__max_queue_depth = max(self.__max_queue_depth, self.__pending)
+
+        return handle
+
+    def cancel(self, handle):
+        """
+        this method cancels a scheduled event, so that its callback is never called
+
+        :param handle: the handle returned when the event was scheduled
+        :return: True if the event has been cancelled and False if it has already been dispatched or cancelled
+        :raises SchedulerTypeError: if the argument is not a TimerHandle
+        """
+
+        if type(handle) != TimerHandle:
+            raise SchedulerTypeError("Only a TimerHandle can be cancelled")
+
+        if not handle.pending:
+            return False
+
+        handle._TimerHandle__state = TimerHandle._TimerHandle__CANCELLED
+        self.__pending -= 1
+
+        return True
+
+    def run_until(self, until):
+        """
+        this method dispatches all events scheduled at or before a given time and then advances the current time to it,
+        if a callback raises an exception, the exception is propagated and the remaining events of its batch are
+        dispatched first on the next call
+
+        :param until: the simulated time to run until
+        :return: the number of dispatched events
+        :raises SchedulerTypeError: if the time is not of the time type of the scheduler
+        :raises ValueError: if the time is earlier than the current time of the scheduler
+        """
+
+        if type(until) != self.__time_type:
+            raise SchedulerTypeError("The time to run until must be of type {0}".format(self.__time_type))
+
+        if until < self.__now:
+            raise ValueError("The scheduler cannot run until a time earlier than its current time")
+
+        dispatched = self.__dispatched
+        start = perf_counter()
+        try:
+            while len(self.__batch) > 0 or (self.__events.size > 0 and self.__events.peek().deadline <= until):
+                if len(self.__batch) == 0:
+                    self.__batch = self.__next_batch()
+                self.__dispatch_batch()
+            self.__now = until
+        finally:
+            self.__dispatch_time += perf_counter() - start
+
+        return self.__dispatched - dispatched
+
+    def __next_batch(self):
+        """
+        dequeues all events scheduled at the time of the next event and advances the current time to it
+
+        :return: a list with the handles of the events in the order they were scheduled
+        """
+
+        self.__now = self.__events.peek().deadline
+        batch = []
+        while self.__events.size > 0 and self.__events.peek().deadline == self.__now:
+            batch.append(self.__events.dequeue())
+        batch.reverse()
+
+        return batch
+
+    def __dispatch_batch(self):
+        """
+        calls the callbacks of the events in the current batch, the batch is kept reversed so that handles can be popped
+        from its end
+        """
+
+        start = perf_counter()
+        while len(self.__batch) > 0:
+            handle = self.__batch.pop()
+            if not handle.pending:
+                continue
+
+            handle._TimerHandle__state = TimerHandle._TimerHandle__EXPIRED
+            self.__pending -= 1
+            self.__max_lag = max(self.__max_lag, perf_counter() - start)
+            self.__dispatched += 1
+            handle.item()
+
+
+class TTLQueue(object):
+    """
+    Abstract Data Structure - a FIFO queue, in which every element expires a fixed time-to-live (TTL) after it has been
+    enqueued, so that expired elements are never dequeued
+
+    Every element is stamped with its expiry time when it is enqueued. Since all elements have the same TTL, the expiry
+    times increase from the front to the back of the queue, so the expired elements are always at the front and they are
+    removed in bulk in O(expired) time, with a single dequeue_many() call on the wrapped Queue. The expiry is driven lazily
+    by every access to the queue, and optionally by a background thread, which sweeps the queue every sweep_interval
+    seconds, so that the memory of expired elements is released even if the queue is not used.
+    """
+
+    def __init__(self, ttl, elements_type=None, sweep_interval=None, clock=monotonic):
+        """
+        constructor for the TTL queue, starts the background sweeper if a sweep interval is given
+
+        :param ttl: the number of time units (seconds by default), after which an element expires, an integer or a float
+        :param elements_type: the type of elements in the queue, None (default) allows all types of elements
+        :param sweep_interval: the number of seconds between two sweeps of the background thread, None (default) means
+            that the elements only expire when the queue is accessed
+        :param clock: a function returning the current time, default is time.monotonic, it must never go backwards
+        :raises QueueTypeError: if the elements_type argument is not a valid type
+        :raises QueueTypeError: if the ttl or the sweep interval is not a number or the clock is not callable
+        :raises ValueError: if the ttl or the sweep interval is not positive
+        """
+
+        if type(ttl) != int and type(ttl) != float:
+            raise QueueTypeError("The TTL of the queue must be a number")
+
+        if ttl <= 0:
+            raise ValueError("The TTL of the queue must be positive")
+
+        if sweep_interval is not None and type(sweep_interval) != int and type(sweep_interval) != float:
+            raise QueueTypeError("The sweep interval of the queue must be a number")
+
+        if sweep_interval is not None and sweep_interval <= 0:
+            raise ValueError("The sweep interval of the queue must be positive")
+
+        if not callable(clock):
+            raise QueueTypeError("The clock of the queue must be callable")
+
+        # the expiry times are kept in a deque parallel to the elements, so that the elements keep the type checking of
+        # the Queue and can be removed in bulk
+        self.__elements = Queue(elements_type)
+        self.__expiries = deque()
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__expired = 0
+
+        # the lock is only contended if the background sweeper is running
+        self.__lock = Lock()
+        self.__stopped = Event()
+        self.__sweeper = None
+        if sweep_interval is not None:
+            self.__sweeper = Thread(target=self.__sweep, args=(sweep_interval,), name="TTLQueue-sweeper", daemon=True)
+            self.__sweeper.start()
+
+    def __enter__(self):
+        """
+        allows the use of the queue in a with statement
+
+        :return: reference to the queue itself
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        stops the background sweeper at the end of a with statement
+        """
+
+        self.close()
+
+    def __str__(self):
+        """
+        the str representation of the queue
+
+        :return: the str representation of the wrapped Queue after removing the expired elements
+        """
+
+        with self.__lock:
+            self.__expire()
+            return str(self.__elements)
+
+    def __repr__(self):
+        """
+        the repr representation of the queue
+
+        :return: same as str()
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the len(queue) syntax
+
+        :return: the number of elements in the queue, which haven't expired
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the queue
+
+        :return: reference to the queue object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method implements the next method for the iterator
+
+        :return: calls the dequeue() method to get the next element, which hasn't expired
+        :raises StopIteration: if there are no elements in the queue, which haven't expired
+        """
+
+        try:
+            return self.dequeue()
+        except EmptyQueueError:
+            raise StopIteration
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in queue' syntax
+
+        :param item: the item to search for in the queue
+        :return: calls the contains() method to check if the item is contained in the queue
+        """
+
+        return self.contains(item)
+
+    @property
+    def size(self):
+        """
+        this method gets the number of elements in the queue after removing the expired elements
+
+        :return: the number of elements, which haven't expired
+        """
+
+        with self.__lock:
+            self.__expire()
+            return self.__elements.size
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements in the queue
+
+        :return: the type of elements in the queue or None if the queue can contain all types of elements
+        """
+
+        return self.__elements.type
+
+    @property
+    def ttl(self):
+        """
+        this method gets the time-to-live of the elements
+
+        :return: the TTL given in the constructor
+        """
+
+        return self.__ttl
+
+    @property
+    def expired(self):
+        """
+        this method gets the number of elements, which have expired since the queue was created
+
+        :return: the number of expired elements, including the elements removed by the background sweeper
+        """
+
+        with self.__lock:
+            self.__expire()
+            return self.__expired
+
+    def contains(self, item):
+        """
+        this method checks if an element, which hasn't expired, is contained in the queue
+
+        :param item: the item to search for in the queue
+        :return: True if the item is contained in the queue and False otherwise
+        :raises QueueTypeError: if the queue has a type of elements specified that is different from the type of the 'item'
+        """
+
+        with self.__lock:
+            self.__expire()
+            return self.__elements.contains(item)
+
+    def enqueue(self, item):
+        """
+        this method enqueues an element and stamps it with its expiry time
+
+        :param item: the element to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of the item
+        """
+
+        with self.__lock:
+            self.__elements.enqueue(item)
+            self.__expiries.append(self.__clock() + self.__ttl)
+
+    def enqueue_many(self, items):
+        """
+        this method enqueues many elements in the order they are given and stamps them with the same expiry time
+
+        :param items: an iterable with the elements to enqueue
+        :raises QueueTypeError: if the type of elements in the queue is specified and is different from the type of any of
+            the elements, in this case none of the elements is enqueued
+        """
+
+        items = list(items)
+        with self.__lock:
+            self.__elements.enqueue_many(items)
+            self.__expiries.extend([self.__clock() + self.__ttl]*len(items))
+
+    def dequeue(self):
+        """
+        this method removes the expired elements and then removes and returns the element at the front of the queue
+
+        :return: the oldest element, which hasn't expired
+        :raises EmptyQueueError: if there are no elements in the queue, which haven't expired
+        """
+
+        with self.__lock:
+            self.__expire()
+            item = self.__elements.dequeue()
+            self.__expiries.popleft()
+            return item
+
+    def dequeue_many(self, n):
+        """
+        this method removes the expired elements and then dequeues up to n elements
+
+        :param n: the maximum number of elements to dequeue
+        :return: a list with the dequeued elements in the order they were enqueued
+        :raises QueueTypeError: if n is not an integer
+        :raises ValueError: if n is negative
+        """
+
+        with self.__lock:
+            self.__expire()
+            items = self.__elements.dequeue_many(n)
+            for _ in range(len(items)):
+                self.__expiries.popleft()
+            return items
+
+    def peek(self):
+        """
+        this method peeks the element at the front of the queue after removing the expired elements
+
+        :return: the oldest element, which hasn't expired, or None if there is no such element
+        """
+
+        with self.__lock:
+            self.__expire()
+            return self.__elements.peek()
+
+    def expire(self):
+        """
+        this method removes the expired elements from the front of the queue, it is called by all other methods of the
+        queue, so it is only needed to release the memory of expired elements if the queue is not used
+
+        :return: the number of elements, which have expired
+        """
+
+        with self.__lock:
+            return self.__expire()
+
+    def close(self):
+        """
+        this method stops the background sweeper, if there is one, the queue can still be used after it has been closed
+        """
+
+        self.__stopped.set()
+        if self.__sweeper is not None and self.__sweeper is not current_thread():
+            self.__sweeper.join()
+
+    def __expire(self):
+        """
+        removes the expired elements in bulk, the lock must be held when calling this method
+
+        :return: the number of removed elements
+        """
+
+        now = self.__clock()
+        expired = 0
+        expiries = self.__expiries
+        while len(expiries) > 0 and expiries[0] <= now:
+            expiries.popleft()
+            expired += 1
+
+        if expired > 0:
+            self.__elements.dequeue_many(expired)
+            self.__expired += expired
+
+        return expired
+
+    def __sweep(self, interval):
+        """
+        the loop of the background sweeper
+
+        :param interval: the number of seconds between two sweeps
+        """
+
+        while not self.__stopped.wait(interval):
+            self.expire()
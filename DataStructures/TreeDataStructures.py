@@ -125,6 +125,27 @@ class BinaryHeap(ABC):
         else:
             raise BinaryHeapTypeError("The element you are trying to add in the heap is not of type {0}".format(self.__elements_type))
 
+    def extend(self, elements):
+        """
+        this method adds many elements in the heap at once, the heap is rebuilt bottom-up after the elements are added,
+        which takes O(n + k) time instead of the O(k log(n + k)) time needed for adding the elements one by one
+
+        :param elements: an iterable with the elements to add
+        :raises BinaryHeapTypeError: if the type of any of the elements is different from the type of elements in the heap,
+            in this case none of the elements is added
+        """
+
+        elements = list(elements)
+        for element in elements:
+            if type(element) != self.__elements_type:
+                raise BinaryHeapTypeError("The element you are trying to add in the heap is not of type {0}".format(self.__elements_type))
+
+        self.__elements.extend(elements)
+
+        # every element in the second half of the list is a leaf, hence only the first half needs to be adjusted
+        for index in range(int(len(self.__elements)/2) - 1, -1, -1):
+            self.__percolate_down(initial_index=index)
+
     @abstractmethod
     def __percolate_up(self, initial_index=-1):
         """
@@ -619,3 +640,874 @@ class MaxBinaryHeap(BinaryHeap):
 
         if not removed:
             raise BinaryHeapElementError("The element you are trying to remove is not contained in the heap.")
+
+
+# noinspection PyAbstractClass,PyPep8Naming
+class MinMaxBinaryHeap(BinaryHeap):
+    """
+    Abstract Data Structure - represents a min-max binary heap (a double-ended heap), both its minimum and its maximum
+    element can be accessed in constant time and removed in logarithmic time
+
+    The elements on even levels of the tree (the root is on level 0) are less than or equal to all their descendants,
+    while the elements on odd levels are greater than or equal to all their descendants.
+    """
+
+    def __init__(self, elements_type=int):
+        """
+        constructor for MinMaxBinaryHeap,
+        calls the parent class constructor and sets new references to the heap's elements list and type
+
+        :param elements_type: the type of elements allowed in the heap
+        """
+
+        BinaryHeap.__init__(self, elements_type)
+
+        self.__elements = self._BinaryHeap__elements
+        self.__elements_type = self._BinaryHeap__elements_type
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the binary heap
+
+        :return: reference to the heap object itself
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        overriding this method so that the iterator knows which element to return
+
+        :return: the min element in the heap and removes it
+        :raises StopIteration: if the heap is empty
+        """
+
+        if not self.size == 0:
+            return self.remove_min()
+        else:
+            raise StopIteration
+
+    @staticmethod
+    def __is_min_level(index):
+        """
+        checks whether an index in the list of elements is located on a min level (even level) of the tree
+
+        :param index: the index to check
+        :return: True if the index is on a min level and False if it is on a max level
+        """
+
+        return (index + 1).bit_length() % 2 == 1
+
+    def __swap(self, first_index, second_index):
+        """
+        swaps two elements in the list of elements
+
+        :param first_index: the index of the first element
+        :param second_index: the index of the second element
+        """
+
+        temp = self.__elements[first_index]
+        self.__elements[first_index] = self.__elements[second_index]
+        self.__elements[second_index] = temp
+
+    def __bubble_up(self, index, minimum):
+        """
+        moves an element up the tree through the levels of the same kind (min or max levels)
+
+        :param index: the index of the element to move
+        :param minimum: True if the element is on a min level and False if it is on a max level
+        """
+
+        # only elements on the third level or below have a grandparent
+        while index > 2:
+            grandparent = int((int((index - 1)/2) - 1)/2)
+            if minimum and self.__elements[index] >= self.__elements[grandparent]:
+                break
+            if not minimum and self.__elements[index] <= self.__elements[grandparent]:
+                break
+
+            self.__swap(index, grandparent)
+            index = grandparent
+
+    def _BinaryHeap__percolate_up(self, initial_index=-1):
+        """
+        this method is overridden from the abstract class, the implementation adjusts the heap in the correct order,
+        it is meant to be used after the add operation
+        """
+
+        if initial_index == -1:
+            initial_index = self.size - 1
+
+        child = initial_index
+
+        if 0 < child < self.size:
+            parent = int((child - 1)/2)
+            if self.__is_min_level(child):
+                if self.__elements[child] > self.__elements[parent]:
+                    self.__swap(child, parent)
+                    self.__bubble_up(parent, False)
+                else:
+                    self.__bubble_up(child, True)
+            else:
+                if self.__elements[child] < self.__elements[parent]:
+                    self.__swap(child, parent)
+                    self.__bubble_up(parent, True)
+                else:
+                    self.__bubble_up(child, False)
+
+    def _BinaryHeap__percolate_down(self, initial_index=0):
+        """
+        this method is overridden from the abstract class, the implementation adjusts the heap in the correct order,
+        it is meant to be used after the remove_min and remove_max operations
+        """
+
+        parent = initial_index
+        minimum = self.__is_min_level(parent)
+
+        while 2*parent + 1 < len(self.__elements):
+            # find the smallest (or the greatest on max levels) element among the children and the grandchildren
+            candidates = [index for index in (2*parent + 1, 2*parent + 2, 4*parent + 3, 4*parent + 4, 4*parent + 5, 4*parent + 6)
+                          if index < len(self.__elements)]
+            if minimum:
+                child = min(candidates, key=lambda index: self.__elements[index])
+                found = self.__elements[child] < self.__elements[parent]
+            else:
+                child = max(candidates, key=lambda index: self.__elements[index])
+                found = self.__elements[child] > self.__elements[parent]
+
+            if not found:
+                break
+
+            self.__swap(child, parent)
+
+            # a child is on the opposite kind of level, hence there is nothing more to adjust
+            if child <= 2*parent + 2:
+                break
+
+            # a grandchild might have to be swapped with its own parent, which is on the opposite kind of level
+            grandchild_parent = int((child - 1)/2)
+            if minimum and self.__elements[child] > self.__elements[grandchild_parent]:
+                self.__swap(child, grandchild_parent)
+            elif not minimum and self.__elements[child] < self.__elements[grandchild_parent]:
+                self.__swap(child, grandchild_parent)
+
+            parent = child
+
+    def __adjust(self, index):
+        """
+        restores the order of the heap after the element at the given index has been replaced with an arbitrary element
+
+        :param index: the index of the replaced element
+        """
+
+        self._BinaryHeap__percolate_up(initial_index=index)
+        self._BinaryHeap__percolate_down(initial_index=index)
+
+    def __remove_at(self, index):
+        """
+        removes the element at the given index and restores the order of the heap
+
+        :param index: the index of the element to remove
+        :return: the removed element
+        """
+
+        element = self.__elements[index]
+        last_element = self.__elements.pop()
+        if index < len(self.__elements):
+            self.__elements[index] = last_element
+            self.__adjust(index)
+
+        return element
+
+    def __max_index(self):
+        """
+        finds the index of the maximum element, which is the greater one of the root's children
+
+        :return: the index of the maximum element in the heap
+        """
+
+        if len(self.__elements) <= 2:
+            return len(self.__elements) - 1
+
+        return 1 if self.__elements[1] >= self.__elements[2] else 2
+
+    def peek_min(self):
+        """
+        this method gets the minimum element in the heap without removing it
+
+        :return: minimum element or None if there are no elements in the heap
+        """
+
+        if not self.size == 0:
+            return self.__elements[0]
+        else:
+            return None
+
+    def peek_max(self):
+        """
+        this method gets the maximum element in the heap without removing it
+
+        :return: maximum element or None if there are no elements in the heap
+        """
+
+        if not self.size == 0:
+            return self.__elements[self.__max_index()]
+        else:
+            return None
+
+    def remove_min(self):
+        """
+        this method removes the minimum element from the heap
+
+        :return: the minimum element in the heap
+        :raises EmptyBinaryHeapError: if there are no elements in the heap
+        """
+
+        if not self.size == 0:
+            return self.__remove_at(0)
+        else:
+            raise EmptyBinaryHeapError("There are no elements in the heap.")
+
+    def remove_max(self):
+        """
+        this method removes the maximum element from the heap
+
+        :return: the maximum element in the heap
+        :raises EmptyBinaryHeapError: if there are no elements in the heap
+        """
+
+        if not self.size == 0:
+            return self.__remove_at(self.__max_index())
+        else:
+            raise EmptyBinaryHeapError("There are no elements in the heap.")
+
+    def get_sorted_elements(self):
+        """
+        the difference between this method and the iterator is that after this function is finished the heap's
+        elements are preserved
+
+        :returns: a list with the sorted elements in the heap starting from the minimum entry
+        """
+
+        return sorted(self.__elements)
+
+    def replace_root(self, element):
+        """
+        removes and returns the smallest element in the heap and adds the new element, this method will
+        perform better than using remove_min() and add() for replacing the root
+
+        :param element: the new element to replace the root
+        :return: the smallest element in the heap
+        :raises EmptyBinaryHeapError: if there are no elements in the heap
+        :raises BinaryHeapTypeError: if the type of the argument is different than the type of elements in the heap
+        """
+
+        if type(element) == self.__elements_type:
+            if len(self.__elements) > 0:
+                temp = self.__elements[0]
+                self.__elements[0] = element
+                self.__adjust(0)
+                return temp
+            else:
+                raise EmptyBinaryHeapError("There are no elements in the heap.")
+        else:
+            raise BinaryHeapTypeError("The element you are trying to add in the heap is not of type {0}".format(self.__elements_type))
+
+    def replace(self, old_element, new_element):
+        """
+        this method replaces an element in the heap with a new element and adjusts the order
+
+        :param old_element: the element to replace
+        :param new_element: the new element
+        :raises BinaryHeapTypeError: if the type of any of the arguments is not the same as the type of elements in the heap
+        :raises BinaryHeapElementError: if the old element is not contained in the heap
+        """
+
+        if type(old_element) != self.__elements_type:
+            raise BinaryHeapTypeError("The old element you are trying to replace in the heap is not of type {0}".format(self.__elements_type))
+
+        if type(new_element) != self.__elements_type:
+            raise BinaryHeapTypeError("The new element to add in the heap is not of type {0}".format(self.__elements_type))
+
+        try:
+            index = self.__elements.index(old_element)
+        except ValueError:
+            raise BinaryHeapElementError("The element you are trying to replace is not contained in the heap.")
+
+        self.__elements[index] = new_element
+        self.__adjust(index)
+
+    def remove(self, element):
+        """
+        this method removes an element in the heap
+
+        :param element: the element to remove
+        :raises BinaryHeapTypeError: if the type of the argument is not the same as the type of the elements in the heap
+        :raises BinaryHeapElementError: if the element to remove is not contained in the heap
+        """
+
+        if type(element) != self.__elements_type:
+            raise BinaryHeapTypeError("The element to remove from the heap is not of type {0}".format(self.__elements_type))
+
+        try:
+            index = self.__elements.index(element)
+        except ValueError:
+            raise BinaryHeapElementError("The element you are trying to remove is not contained in the heap.")
+
+        self.__remove_at(index)
+
+
+class AVLTree(object):
+    """
+    Abstract Data Structure - represents a self-balancing binary search tree (AVL tree) of unique elements, each node
+    also stores the size of its subtree, hence besides the usual logarithmic insertion, deletion and search operations
+    the tree can also answer order queries (floor, ceiling, number of elements less than or greater than an element)
+    in logarithmic time and range queries in O(log n + k) time, where k is the number of returned elements
+    """
+
+    class _Node(object):
+        """
+        a node of the AVL tree
+        """
+
+        def __init__(self, value):
+            """
+            constructor for a leaf node
+
+            :param value: the value stored in the node
+            """
+
+            self.value = value
+            self.left = None
+            self.right = None
+            self.height = 1
+            self.size = 1
+
+    def __init__(self, elements_type=int):
+        """
+        a constructor for the AVLTree class
+
+        :param elements_type: optional argument, default value is int, only elements of this type can be added
+            to the tree
+        :raises AVLTreeTypeError: if the 'elements_type' argument is not a valid type
+        """
+
+        if type(elements_type) != type:
+            raise AVLTreeTypeError("{0} is not a valid type for an AVL tree.".format(elements_type))
+
+        self.__root = None
+        self.__elements_type = elements_type
+
+    def __len__(self):
+        """
+        overriding this method allows the use of the 'len(tree)' syntax
+
+        :return: calls the size method to get the number of elements in the tree
+        """
+
+        return self.size
+
+    def __str__(self):
+        """
+        this is the string representation of the tree
+
+        :return: the string representation of the list of sorted elements in the tree
+        """
+
+        return str(self.get_sorted_elements())
+
+    def __repr__(self):
+        """
+        this is the repr representation of the tree
+
+        :return: the repr representation of the list of sorted elements in the tree
+        """
+
+        return repr(self.get_sorted_elements())
+
+    def __contains__(self, item):
+        """
+        overriding this method allows the use of the 'item in tree' syntax
+
+        :param item: the item to search for in the tree
+        :return: calls the contains() method to check if the given item is contained in the tree
+        """
+
+        return self.contains(item)
+
+    def __iter__(self):
+        """
+        overriding this method allows the use of an iterator for the tree, unlike the binary heaps the iterator
+        doesn't remove any elements from the tree
+
+        :return: an iterator going through the elements of the tree in ascending order
+        """
+
+        return iter(self.get_sorted_elements())
+
+    @property
+    def size(self):
+        """
+        this method gets the size of the tree
+
+        :return: the number of elements in the tree
+        """
+
+        return self.__node_size(self.__root)
+
+    @property
+    def type(self):
+        """
+        this method gets the type of elements allowed to be added in the tree
+
+        :return: the type of elements in the tree
+        """
+
+        return self.__elements_type
+
+    def __check_type(self, element):
+        """
+        checks the type of an element given as argument to any of the tree's methods
+
+        :param element: the element to check
+        :raises AVLTreeTypeError: if the element's type is different from the type of elements in the tree
+        """
+
+        if type(element) != self.__elements_type:
+            raise AVLTreeTypeError("The AVL tree contains only elements of type {0}".format(self.__elements_type))
+
+    @staticmethod
+    def __node_size(node):
+        """
+        :return: the number of elements in the subtree of the node, 0 for an empty subtree
+        """
+
+        return node.size if node is not None else 0
+
+    @staticmethod
+    def __node_height(node):
+        """
+        :return: the height of the subtree of the node, 0 for an empty subtree
+        """
+
+        return node.height if node is not None else 0
+
+    def __update(self, node):
+        """
+        recalculates the height and the size of a node from its children
+        """
+
+        node.height = 1 + max(self.__node_height(node.left), self.__node_height(node.right))
+        node.size = 1 + self.__node_size(node.left) + self.__node_size(node.right)
+
+    def __rotate_left(self, node):
+        """
+        rotates the subtree of a node to the left
+
+        :return: the new root of the subtree
+        """
+
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self.__update(node)
+        self.__update(pivot)
+        return pivot
+
+    def __rotate_right(self, node):
+        """
+        rotates the subtree of a node to the right
+
+        :return: the new root of the subtree
+        """
+
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self.__update(node)
+        self.__update(pivot)
+        return pivot
+
+    def __balance(self, node):
+        """
+        restores the AVL property of a node whose subtrees have been modified
+
+        :param node: the node to balance
+        :return: the new root of the subtree
+        """
+
+        self.__update(node)
+        balance = self.__node_height(node.left) - self.__node_height(node.right)
+
+        if balance > 1:
+            if self.__node_height(node.left.left) < self.__node_height(node.left.right):
+                node.left = self.__rotate_left(node.left)
+            return self.__rotate_right(node)
+
+        if balance < -1:
+            if self.__node_height(node.right.right) < self.__node_height(node.right.left):
+                node.right = self.__rotate_right(node.right)
+            return self.__rotate_left(node)
+
+        return node
+
+    def __insert(self, node, element):
+        """
+        inserts an element in the subtree of a node
+
+        :return: the new root of the subtree
+        """
+
+        if node is None:
+            return self._Node(element)
+
+        if element < node.value:
+            node.left = self.__insert(node.left, element)
+        elif element > node.value:
+            node.right = self.__insert(node.right, element)
+        else:
+            return node
+
+        return self.__balance(node)
+
+    def __delete(self, node, element):
+        """
+        deletes an element from the subtree of a node
+
+        :return: the new root of the subtree
+        :raises AVLTreeElementError: if the element is not contained in the subtree
+        """
+
+        if node is None:
+            raise AVLTreeElementError("The element you are trying to remove is not contained in the AVL tree.")
+
+        if element < node.value:
+            node.left = self.__delete(node.left, element)
+        elif element > node.value:
+            node.right = self.__delete(node.right, element)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+
+            # replace the value with its successor and remove the successor from the right subtree
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+            node.right = self.__delete(node.right, successor.value)
+
+        return self.__balance(node)
+
+    def contains(self, item):
+        """
+        this method checks if an element is contained in the tree
+
+        :param item: the item to search for
+        :return: True if the tree contains this item and False otherwise
+        :raises AVLTreeTypeError: in case the argument's type differs from the type of elements in the tree
+        """
+
+        self.__check_type(item)
+
+        node = self.__root
+        while node is not None:
+            if item < node.value:
+                node = node.left
+            elif item > node.value:
+                node = node.right
+            else:
+                return True
+
+        return False
+
+    def add(self, element):
+        """
+        this method adds an element in the tree, the tree only contains unique elements, hence adding an element, which
+        is already in the tree doesn't change the tree
+
+        :param element: the element to add
+        :raises AVLTreeTypeError: if the argument's type is different from the type of elements in the tree
+        """
+
+        self.__check_type(element)
+
+        self.__root = self.__insert(self.__root, element)
+
+    def extend(self, elements):
+        """
+        this method adds many elements in the tree at once, the new elements are merged with the sorted elements of the
+        tree and a balanced tree is built from the result, which takes O(n + k log k) time
+
+        :param elements: an iterable with the elements to add
+        :raises AVLTreeTypeError: if the type of any of the elements is different from the type of elements in the tree,
+            in this case none of the elements is added
+        """
+
+        elements = list(elements)
+        for element in elements:
+            self.__check_type(element)
+
+        old_elements = self.get_sorted_elements()
+        new_elements = sorted(set(elements))
+
+        merged = []
+        old_index, new_index = 0, 0
+        while old_index < len(old_elements) or new_index < len(new_elements):
+            if new_index == len(new_elements) or \
+                    (old_index < len(old_elements) and old_elements[old_index] <= new_elements[new_index]):
+                element = old_elements[old_index]
+                old_index += 1
+            else:
+                element = new_elements[new_index]
+                new_index += 1
+
+            if len(merged) == 0 or merged[-1] != element:
+                merged.append(element)
+
+        self.__root = self.__build(merged, 0, len(merged))
+
+    def __build(self, sorted_elements, start, end):
+        """
+        builds a balanced tree from a slice of a sorted list of unique elements
+
+        :param sorted_elements: the sorted list
+        :param start: the start index of the slice (inclusive)
+        :param end: the end index of the slice (exclusive)
+        :return: the root of the built tree
+        """
+
+        if start >= end:
+            return None
+
+        middle = int((start + end)/2)
+        node = self._Node(sorted_elements[middle])
+        node.left = self.__build(sorted_elements, start, middle)
+        node.right = self.__build(sorted_elements, middle + 1, end)
+        self.__update(node)
+
+        return node
+
+    def remove(self, element):
+        """
+        this method removes an element from the tree
+
+        :param element: the element to remove
+        :raises AVLTreeTypeError: if the type of the argument is not the same as the type of the elements in the tree
+        :raises AVLTreeElementError: if the element to remove is not contained in the tree
+        """
+
+        self.__check_type(element)
+
+        self.__root = self.__delete(self.__root, element)
+
+    def replace(self, old_element, new_element):
+        """
+        this method replaces an element in the tree with a new element
+
+        :param old_element: the element to replace
+        :param new_element: the new element
+        :raises AVLTreeTypeError: if the type of any of the arguments is not the same as the type of elements in the tree
+        :raises AVLTreeElementError: if the old element is not contained in the tree
+        """
+
+        self.__check_type(new_element)
+
+        self.remove(old_element)
+        self.add(new_element)
+
+    def peek_min(self):
+        """
+        this method gets the minimum element in the tree without removing it
+
+        :return: minimum element or None if there are no elements in the tree
+        """
+
+        node = self.__root
+        if node is None:
+            return None
+
+        while node.left is not None:
+            node = node.left
+
+        return node.value
+
+    def peek_max(self):
+        """
+        this method gets the maximum element in the tree without removing it
+
+        :return: maximum element or None if there are no elements in the tree
+        """
+
+        node = self.__root
+        if node is None:
+            return None
+
+        while node.right is not None:
+            node = node.right
+
+        return node.value
+
+    def remove_min(self):
+        """
+        this method removes the minimum element from the tree
+
+        :return: the minimum element in the tree
+        :raises EmptyAVLTreeError: if there are no elements in the tree
+        """
+
+        if self.__root is None:
+            raise EmptyAVLTreeError("There are no elements in the AVL tree.")
+
+        element = self.peek_min()
+        self.__root = self.__delete(self.__root, element)
+        return element
+
+    def remove_max(self):
+        """
+        this method removes the maximum element from the tree
+
+        :return: the maximum element in the tree
+        :raises EmptyAVLTreeError: if there are no elements in the tree
+        """
+
+        if self.__root is None:
+            raise EmptyAVLTreeError("There are no elements in the AVL tree.")
+
+        element = self.peek_max()
+        self.__root = self.__delete(self.__root, element)
+        return element
+
+    def floor(self, element):
+        """
+        this method finds the greatest element in the tree, which is less than or equal to the argument
+
+        :param element: the element to compare with
+        :return: the found element or None if all elements in the tree are greater than the argument
+        :raises AVLTreeTypeError: if the type of the argument is not the same as the type of the elements in the tree
+        """
+
+        self.__check_type(element)
+
+        result = None
+        node = self.__root
+        while node is not None:
+            if node.value > element:
+                node = node.left
+            else:
+                result = node.value
+                node = node.right
+
+        return result
+
+    def ceiling(self, element):
+        """
+        this method finds the smallest element in the tree, which is greater than or equal to the argument
+
+        :param element: the element to compare with
+        :return: the found element or None if all elements in the tree are less than the argument
+        :raises AVLTreeTypeError: if the type of the argument is not the same as the type of the elements in the tree
+        """
+
+        self.__check_type(element)
+
+        result = None
+        node = self.__root
+        while node is not None:
+            if node.value < element:
+                node = node.right
+            else:
+                result = node.value
+                node = node.left
+
+        return result
+
+    def count_less(self, element):
+        """
+        this method counts the elements in the tree, which are less than the argument
+
+        :param element: the element to compare with
+        :return: the number of elements less than the argument
+        :raises AVLTreeTypeError: if the type of the argument is not the same as the type of the elements in the tree
+        """
+
+        self.__check_type(element)
+
+        count = 0
+        node = self.__root
+        while node is not None:
+            if node.value < element:
+                count += self.__node_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+
+        return count
+
+    def count_greater(self, element):
+        """
+        this method counts the elements in the tree, which are greater than the argument
+
+        :param element: the element to compare with
+        :return: the number of elements greater than the argument
+        :raises AVLTreeTypeError: if the type of the argument is not the same as the type of the elements in the tree
+        """
+
+        self.__check_type(element)
+
+        count = 0
+        node = self.__root
+        while node is not None:
+            if node.value > element:
+                count += self.__node_size(node.right) + 1
+                node = node.left
+            else:
+                node = node.right
+
+        return count
+
+    def range(self, low=None, high=None):
+        """
+        this method finds all elements in the tree between two bounds (inclusive)
+
+        :param low: the lower bound, None means there is no lower bound
+        :param high: the upper bound, None means there is no upper bound
+        :return: a list with the elements between the bounds in ascending order
+        :raises AVLTreeTypeError: if the type of any of the bounds is not the same as the type of the elements in the tree
+        """
+
+        if low is not None:
+            self.__check_type(low)
+        if high is not None:
+            self.__check_type(high)
+
+        elements = []
+        stack = []
+        node = self.__root
+
+        # iterative in-order traversal, which skips the subtrees outside the bounds
+        while len(stack) > 0 or node is not None:
+            if node is not None:
+                if low is not None and node.value < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if high is not None and node.value > high:
+                    break
+                elements.append(node.value)
+                node = node.right
+
+        return elements
+
+    def get_sorted_elements(self):
+        """
+        this method gets all elements in the tree
+
+        :returns: a list with the sorted elements in the tree starting from the minimum entry
+        """
+
+        return self.range()
@@ -0,0 +1,145 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT AVLTree
+import unittest
+import random
+
+from DataStructures.Errors import *
+from DataStructures.TreeDataStructures import AVLTree
+
+
+class AVLTreeTests(unittest.TestCase):
+
+    def test_size(self):
+        tree = AVLTree()
+        self.assertEqual(tree.size, 0, "Size method is not correct")
+        self.assertEqual(len(tree), 0, "len(tree) method not implemented correctly")
+
+        for i in range(10):
+            tree.add(i)
+        tree.add(5)
+        self.assertEqual(tree.size, 10, "Duplicated elements must not be added")
+
+        tree.remove(5)
+        tree.remove_min()
+        tree.remove_max()
+        self.assertEqual(len(tree), 7, "Size method is not correct")
+
+    def test_type(self):
+        with self.assertRaises(AVLTreeTypeError):
+            AVLTree(elements_type=5)
+
+        tree = AVLTree(str)
+        self.assertEqual(tree.type, str)
+        for method in (tree.add, tree.remove, tree.contains, tree.floor, tree.ceiling, tree.count_less, tree.count_greater):
+            with self.assertRaises(AVLTreeTypeError):
+                method(1)
+        with self.assertRaises(AVLTreeTypeError):
+            tree.range(1, "z")
+        with self.assertRaises(AVLTreeTypeError):
+            tree.replace("a", 1)
+
+    def test_add_remove(self):
+        tree = AVLTree()
+        with self.assertRaises(EmptyAVLTreeError):
+            tree.remove_min()
+        with self.assertRaises(EmptyAVLTreeError):
+            tree.remove_max()
+        with self.assertRaises(AVLTreeElementError):
+            tree.remove(1)
+        self.assertEqual(tree.peek_min(), None)
+        self.assertEqual(tree.peek_max(), None)
+
+        for num in [43, 2, 12, 234, 101, 59, 67, -5]:
+            tree.add(num)
+        self.assertTrue(59 in tree)
+        self.assertFalse(60 in tree)
+        self.assertEqual(tree.peek_min(), -5)
+        self.assertEqual(tree.peek_max(), 234)
+        self.assertEqual(tree.remove_min(), -5)
+        self.assertEqual(tree.remove_max(), 234)
+        tree.replace(43, 1000)
+        with self.assertRaises(AVLTreeElementError):
+            tree.replace(43, 44)
+        self.assertEqual(tree.get_sorted_elements(), [2, 12, 59, 67, 101, 1000])
+        self.assertEqual(str(tree), "[2, 12, 59, 67, 101, 1000]")
+        self.assertEqual([element for element in tree], [2, 12, 59, 67, 101, 1000], "Iterator not working")
+        self.assertEqual(len(tree), 6, "The iterator must not remove elements")
+
+    def test_order_queries(self):
+        tree = AVLTree()
+        self.assertEqual(tree.range(), [])
+        self.assertEqual(tree.floor(5), None)
+        self.assertEqual(tree.ceiling(5), None)
+
+        for num in range(0, 100, 10):
+            tree.add(num)
+        self.assertEqual(tree.range(25, 60), [30, 40, 50, 60])
+        self.assertEqual(tree.range(high=15), [0, 10])
+        self.assertEqual(tree.range(low=85), [90])
+        self.assertEqual(tree.range(60, 25), [])
+        self.assertEqual(tree.floor(55), 50)
+        self.assertEqual(tree.floor(50), 50)
+        self.assertEqual(tree.floor(-1), None)
+        self.assertEqual(tree.ceiling(55), 60)
+        self.assertEqual(tree.ceiling(91), None)
+        self.assertEqual(tree.count_less(50), 5)
+        self.assertEqual(tree.count_greater(50), 4)
+        self.assertEqual(tree.count_greater(55), 4)
+
+    def test_random_operations(self):
+        random.seed(2017)
+        tree = AVLTree()
+        elements = set()
+        for _ in range(2000):
+            element = random.randint(-100, 100)
+            if random.random() < 0.6:
+                tree.add(element)
+                elements.add(element)
+            elif element in elements:
+                tree.remove(element)
+                elements.remove(element)
+
+            sorted_elements = sorted(elements)
+            self.assertEqual(tree.get_sorted_elements(), sorted_elements, "Wrong AVL tree order")
+            self.assertEqual(tree.count_greater(element), len([e for e in sorted_elements if e > element]))
+            self.assertEqual(tree.floor(element), max([e for e in sorted_elements if e <= element], default=None))
+
+
+    def test_extend(self):
+        tree = AVLTree()
+        with self.assertRaises(AVLTreeTypeError):
+            tree.extend([1, "2"])
+        self.assertEqual(len(tree), 0, "No elements must be added if an element is invalid")
+
+        random.seed(31)
+        elements = [random.randint(-500, 500) for _ in range(400)]
+        tree.extend(elements[:200])
+        tree.add(1000)
+        tree.extend(elements[200:])
+        expected = sorted(set(elements) | {1000})
+        self.assertEqual(tree.get_sorted_elements(), expected, "Wrong extend implementation")
+        self.assertEqual(len(tree), len(expected))
+        self.assertEqual(tree.count_less(0), len([e for e in expected if e < 0]))
+        tree.remove(1000)
+        tree.add(-1000)
+        self.assertEqual(tree.peek_min(), -1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
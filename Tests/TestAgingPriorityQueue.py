@@ -0,0 +1,120 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT AgingPriorityQueue
+import unittest
+
+from DataStructures.AbstractDataStructures import AgingPriorityQueue
+from DataStructures.Errors import *
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AgingPriorityQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            AgingPriorityQueue(elements_type="str")
+        with self.assertRaises(PriorityQueueTypeError):
+            AgingPriorityQueue(reverse=1)
+        with self.assertRaises(PriorityQueueTypeError):
+            AgingPriorityQueue(priority_type=str)
+        with self.assertRaises(PriorityQueueTypeError):
+            AgingPriorityQueue(aging_rate="1")
+        with self.assertRaises(ValueError):
+            AgingPriorityQueue(aging_rate=-0.5)
+        with self.assertRaises(PriorityQueueTypeError):
+            AgingPriorityQueue(clock=1)
+
+        queue = AgingPriorityQueue(str, priority_type=float, aging_rate=2)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.priority_type, float)
+        self.assertEqual(queue.aging_rate, 2)
+        self.assertFalse(queue.reversed)
+        self.assertEqual(queue.size, 0)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.peek(), None)
+        self.assertEqual(queue.mean_wait, 0.0)
+        self.assertEqual(queue.oldest_wait, 0.0)
+        with self.assertRaises(EmptyPriorityQueueError):
+            queue.dequeue()
+        with self.assertRaises(PriorityQueueTypeError):
+            queue.enqueue("job", 1)
+        with self.assertRaises(PriorityQueueTypeError):
+            queue.enqueue(1, 1.0)
+
+    def test_aging(self):
+        clock = FakeClock()
+        queue = AgingPriorityQueue(str, aging_rate=1.0, clock=clock)
+        queue.enqueue("low", 1)
+        clock.now = 5.0
+        queue.enqueue("high", 10)
+        queue.enqueue("medium", 5)
+        self.assertEqual(queue.peek(), "high")
+        self.assertEqual(str(queue), "[(10.0, 'high'), (6.0, 'low'), (5.0, 'medium')]")
+        self.assertEqual(queue.effective_priority("low"), 6.0)
+        with self.assertRaises(PriorityQueueElementError):
+            queue.effective_priority("missing")
+
+        # under a sustained load of high priority elements the low priority element is eventually dequeued
+        dequeued = []
+        for _ in range(20):
+            clock.now += 1.0
+            queue.enqueue("high", 10)
+            dequeued.append(queue.dequeue())
+        self.assertIn("low", dequeued, "Elements with a low priority must not starve")
+        self.assertIn("medium", dequeued, "Elements with a low priority must not starve")
+        self.assertEqual(queue.size, 3)
+
+    def test_reverse(self):
+        clock = FakeClock()
+        queue = AgingPriorityQueue(reverse=True, aging_rate=0.5, clock=clock)
+        queue.enqueue("late", 10)
+        clock.now = 10.0
+        queue.enqueue("urgent", 3)
+        queue.enqueue("tied", 5)
+        queue.enqueue("tied later", 5)
+        self.assertTrue(queue.reversed)
+        self.assertEqual(queue.effective_priority("late"), 5.0)
+        self.assertEqual([element for element in queue], ["urgent", "late", "tied", "tied later"],
+                         "Elements with the same effective priority must be dequeued in the order they were enqueued")
+
+    def test_wait_statistics(self):
+        clock = FakeClock()
+        queue = AgingPriorityQueue(aging_rate=0, clock=clock)
+        queue.enqueue("first", 1)
+        clock.now = 2.0
+        queue.enqueue("second", 2)
+        clock.now = 4.0
+        self.assertEqual(queue.oldest_wait, 4.0)
+        self.assertEqual(queue.dequeue_with_wait(), ("second", 2.0))
+        clock.now = 10.0
+        self.assertEqual(queue.dequeue(), "first")
+        self.assertEqual(queue.max_wait, 10.0)
+        self.assertEqual(queue.mean_wait, 6.0)
+        self.assertEqual(queue.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+
+import asyncio
+import unittest
+
+from DataStructures.ConcurrentDataStructures import AsyncPriorityQueue
+from DataStructures.Errors import *
+
+
+class AsyncPriorityQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            AsyncPriorityQueue(duplicates=1)
+        with self.assertRaises(PriorityQueueTypeError):
+            AsyncPriorityQueue(capacity="10")
+        with self.assertRaises(ValueError):
+            AsyncPriorityQueue(capacity=-1)
+
+        queue = AsyncPriorityQueue(str, True, float, True, 5)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.priority_type, float)
+        self.assertTrue(queue.reversed)
+        self.assertEqual(queue.capacity, 5)
+        self.assertEqual(len(queue), 0)
+
+    def test_enqueue_dequeue(self):
+        async def scenario():
+            queue = AsyncPriorityQueue(str)
+            with self.assertRaises(PriorityQueueTypeError):
+                await queue.enqueue("word", 2.5)
+            with self.assertRaises(PriorityQueueTypeError):
+                await queue.enqueue(5, 5)
+
+            await queue.enqueue("low", 1)
+            await queue.enqueue("high", 10)
+            self.assertEqual(queue.peek(), "high")
+            self.assertTrue(queue.contains_priority(1))
+            self.assertTrue("low" in queue)
+            self.assertEqual(queue.get_element(1), "low")
+            self.assertEqual(await queue.dequeue(), "high")
+            self.assertEqual(await queue.dequeue(), "low")
+
+            consumer = asyncio.ensure_future(queue.dequeue())
+            await asyncio.sleep(0)
+            self.assertFalse(consumer.done(), "dequeue must wait for an element")
+            await queue.enqueue("item", 3)
+            self.assertEqual(await consumer, "item")
+
+        asyncio.run(scenario())
+
+    def test_backpressure(self):
+        async def scenario():
+            queue = AsyncPriorityQueue(capacity=2)
+            await queue.enqueue("a", 1)
+            await queue.enqueue("b", 2)
+            self.assertTrue(queue.full())
+
+            # overwriting an existing priority doesn't need free space
+            await asyncio.wait_for(queue.enqueue("c", 2), 1)
+            self.assertEqual(queue.get_element(2), "c")
+
+            producer = asyncio.ensure_future(queue.enqueue("d", 3))
+            await asyncio.sleep(0)
+            self.assertFalse(producer.done(), "enqueue must wait for free space")
+            self.assertEqual(await queue.dequeue(), "c")
+            await producer
+            self.assertEqual(await queue.dequeue(), "d")
+
+            queue = AsyncPriorityQueue(duplicates=True, capacity=1)
+            await queue.enqueue("a", 1)
+            producer = asyncio.ensure_future(queue.enqueue("b", 1))
+            await asyncio.sleep(0)
+            self.assertFalse(producer.done(), "duplicated priorities need free space")
+            producer.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(len(queue), 1, "Cancelled producer added an element")
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
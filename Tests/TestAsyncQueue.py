@@ -0,0 +1,104 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+
+import asyncio
+import unittest
+
+from DataStructures.ConcurrentDataStructures import AsyncQueue
+from DataStructures.Errors import *
+
+
+class AsyncQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            AsyncQueue(elements_type=5)
+        with self.assertRaises(QueueTypeError):
+            AsyncQueue(capacity=2.5)
+        with self.assertRaises(ValueError):
+            AsyncQueue(capacity=0)
+
+        queue = AsyncQueue(int, 10)
+        self.assertEqual(queue.type, int)
+        self.assertEqual(queue.capacity, 10)
+        self.assertEqual(len(queue), 0)
+        self.assertFalse(queue.full())
+        self.assertEqual(queue.peek(), None)
+
+    def test_enqueue_dequeue(self):
+        async def scenario():
+            queue = AsyncQueue(int)
+            with self.assertRaises(QueueTypeError):
+                await queue.enqueue("word")
+
+            for i in range(5):
+                await queue.enqueue(i)
+            self.assertEqual(queue.size, 5)
+            self.assertTrue(3 in queue)
+            self.assertEqual(queue.peek(), 0)
+            self.assertEqual([await queue.dequeue() for _ in range(5)], list(range(5)), "Wrong FIFO order")
+
+            consumer = asyncio.ensure_future(queue.dequeue())
+            await asyncio.sleep(0)
+            self.assertFalse(consumer.done(), "dequeue must wait for an element")
+            await queue.enqueue(42)
+            self.assertEqual(await consumer, 42)
+
+        asyncio.run(scenario())
+
+    def test_backpressure(self):
+        async def scenario():
+            queue = AsyncQueue(capacity=2)
+            await queue.enqueue(1)
+            await queue.enqueue(2)
+            self.assertTrue(queue.full())
+
+            producer = asyncio.ensure_future(queue.enqueue(3))
+            await asyncio.sleep(0)
+            self.assertFalse(producer.done(), "enqueue must wait for free space")
+            self.assertEqual(await queue.dequeue(), 1)
+            await producer
+            self.assertEqual(str(queue), "deque([2, 3])")
+
+        asyncio.run(scenario())
+
+    def test_cancellation(self):
+        async def scenario():
+            queue = AsyncQueue(capacity=1)
+            first = asyncio.ensure_future(queue.dequeue())
+            second = asyncio.ensure_future(queue.dequeue())
+            await asyncio.sleep(0)
+
+            await queue.enqueue("item")
+            first.cancel()
+            self.assertEqual(await asyncio.wait_for(second, 1), "item", "Cancelled consumer lost an element")
+            self.assertTrue(first.cancelled())
+
+            await queue.enqueue("kept")
+            producer = asyncio.ensure_future(queue.enqueue("cancelled"))
+            await asyncio.sleep(0)
+            producer.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(len(queue), 1, "Cancelled producer added an element")
+            self.assertEqual(await queue.dequeue(), "kept")
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import unittest
+from threading import Thread
+
+from DataStructures.ConcurrentDataStructures import BlockingQueue
+from DataStructures.Errors import *
+
+
+class BlockingQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            BlockingQueue(elements_type="str")
+        with self.assertRaises(QueueTypeError):
+            BlockingQueue(capacity=1.5)
+        with self.assertRaises(ValueError):
+            BlockingQueue(capacity=0)
+
+        queue = BlockingQueue(str, 10)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.capacity, 10)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.unfinished_tasks, 0)
+        self.assertEqual(queue.peek(), None)
+
+    def test_enqueue_dequeue(self):
+        queue = BlockingQueue(int, capacity=2)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue(block=False)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue(timeout=0.01)
+        with self.assertRaises(ValueError):
+            queue.dequeue(timeout=-1)
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue("1")
+
+        queue.enqueue(1)
+        queue.enqueue(2)
+        with self.assertRaises(FullQueueError):
+            queue.enqueue(3, block=False)
+        with self.assertRaises(FullQueueError):
+            queue.enqueue(3, timeout=0.01)
+        with self.assertRaises(ValueError):
+            queue.enqueue(3, timeout=-0.5)
+
+        self.assertEqual(queue.size, 2)
+        self.assertEqual(str(queue), "deque([1, 2])")
+        self.assertTrue(2 in queue)
+        self.assertEqual(queue.peek(), 1)
+        self.assertEqual(queue.dequeue(), 1)
+        queue.enqueue(3, block=False)
+        queue.remove(2)
+        with self.assertRaises(QueueElementError):
+            queue.remove(2)
+        self.assertEqual(queue.dequeue(timeout=0.5), 3)
+        self.assertEqual(queue.unfinished_tasks, 2, "Removed elements must be treated as finished tasks")
+
+    def test_producers_consumers(self):
+        queue = BlockingQueue(int, capacity=5)
+        consumed = []
+
+        def producer(start):
+            for element in range(start, start + 500):
+                queue.enqueue(element)
+
+        def consumer():
+            while True:
+                element = queue.dequeue()
+                if element < 0:
+                    queue.task_done()
+                    break
+                consumed.append(element)
+                queue.task_done()
+
+        consumers = [Thread(target=consumer) for _ in range(3)]
+        producers = [Thread(target=producer, args=(start,)) for start in (0, 1000, 2000)]
+        for thread in consumers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        self.assertTrue(queue.join(5), "All enqueued elements must be processed")
+
+        for _ in consumers:
+            queue.enqueue(-1)
+        for thread in consumers:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(sorted(consumed), list(range(500)) + list(range(1000, 1500)) + list(range(2000, 2500)))
+        self.assertEqual(queue.unfinished_tasks, 0)
+        self.assertEqual(queue.size, 0)
+        with self.assertRaises(ValueError):
+            queue.task_done()
+
+    def test_fifo_order(self):
+        queue = BlockingQueue(capacity=3)
+        dequeued = []
+        consumer = Thread(target=lambda: dequeued.extend(queue.dequeue() for _ in range(100)))
+        consumer.start()
+        for element in range(100):
+            queue.enqueue(element)
+            self.assertLessEqual(queue.size, 3, "The queue must never exceed its capacity")
+        consumer.join(5)
+        self.assertEqual(dequeued, list(range(100)), "A single consumer must receive the elements in FIFO order")
+
+
+if __name__ == "__main__":
+    unittest.main()
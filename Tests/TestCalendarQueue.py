@@ -0,0 +1,131 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT CalendarQueue
+import unittest
+import random
+
+from DataStructures.SchedulingDataStructures import CalendarQueue
+from DataStructures.Errors import *
+
+
+class CalendarQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            CalendarQueue(elements_type="str")
+        with self.assertRaises(PriorityQueueTypeError):
+            CalendarQueue(priority_type=str)
+
+        queue = CalendarQueue(str, float)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.priority_type, float)
+        self.assertEqual(queue.size, 0)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(str(queue), "[]")
+        self.assertEqual(queue.peek(), None)
+        with self.assertRaises(EmptyPriorityQueueError):
+            queue.dequeue()
+        with self.assertRaises(PriorityQueueTypeError):
+            queue.enqueue("event", 1)
+        with self.assertRaises(PriorityQueueTypeError):
+            queue.enqueue(1, 1.0)
+
+    def test_enqueue_dequeue(self):
+        queue = CalendarQueue(str)
+        for priority in [5, 3, 9, 3, 1]:
+            queue.enqueue("event" + str(priority), priority)
+        queue.enqueue("second3", 3)
+
+        self.assertEqual(queue.size, 6)
+        self.assertEqual(queue.peek(), "event1")
+        self.assertEqual(str(queue), "[(1, 'event1'), (3, 'event3'), (3, 'event3'), (3, 'second3'), (5, 'event5'), "
+                                     "(9, 'event9')]")
+        self.assertEqual([queue.dequeue() for _ in range(4)], ["event1", "event3", "event3", "second3"],
+                         "Elements with the same priority must be dequeued in the order they were enqueued")
+
+        # enqueueing an element with a lower priority than the last dequeued one
+        queue.enqueue("past", -10)
+        self.assertEqual([element for element in queue], ["past", "event5", "event9"])
+        self.assertEqual(queue.size, 0)
+
+    def test_resize(self):
+        queue = CalendarQueue(priority_type=float)
+        initial_buckets = queue.bucket_count
+        for index in range(1000):
+            queue.enqueue(index, index*0.01)
+        self.assertGreater(queue.bucket_count, initial_buckets, "The buckets must grow with the queue")
+        self.assertAlmostEqual(queue.bucket_width, 0.03, msg="Wrong estimation of the bucket width")
+
+        self.assertEqual([queue.dequeue() for _ in range(990)], list(range(990)))
+        self.assertLess(queue.bucket_count, 64, "The buckets must shrink with the queue")
+        self.assertEqual([element for element in queue], list(range(990, 1000)))
+
+    def test_hold_model(self):
+        # the hold model - every dequeued event schedules a new event a random time after it
+        random.seed(33)
+        queue = CalendarQueue(priority_type=float)
+        events = []
+        for _ in range(200):
+            priority = random.expovariate(1.0)
+            queue.enqueue(priority, priority)
+            events.append(priority)
+
+        now = 0.0
+        for _ in range(5000):
+            priority = queue.dequeue()
+            self.assertGreaterEqual(priority, now, "Events must be dequeued in order")
+            events.remove(priority)
+            self.assertEqual(priority, min(events + [priority]))
+            now = priority
+            if random.random() < 0.1:
+                new_priority = now + random.uniform(100, 1000)
+            else:
+                new_priority = now + random.expovariate(1.0)
+            queue.enqueue(new_priority, new_priority)
+            events.append(new_priority)
+
+        self.assertEqual([element for element in queue], sorted(events))
+
+    def test_random_operations(self):
+        random.seed(2017)
+        queue = CalendarQueue()
+        expected = []
+        for index in range(3000):
+            if random.random() < 0.55 or len(expected) == 0:
+                priority = random.randint(-500, 500)
+                queue.enqueue(index, priority)
+                expected.append((priority, index))
+            else:
+                expected.sort()
+                self.assertEqual(queue.peek(), expected[0][1])
+                self.assertEqual(queue.dequeue(), expected.pop(0)[1])
+            self.assertEqual(queue.size, len(expected))
+
+    def test_non_finite_priority(self):
+        queue = CalendarQueue(priority_type=float)
+        queue.enqueue("event", 1.5)
+        for priority in [float("inf"), float("-inf"), float("nan")]:
+            with self.assertRaises(ValueError):
+                queue.enqueue("invalid", priority)
+
+        self.assertEqual(queue.size, 1, "A rejected element must not be added to the queue")
+        self.assertEqual(queue.dequeue(), "event")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+
+import unittest
+from threading import Thread
+
+from DataStructures.ConcurrentDataStructures import ConcurrentPriorityQueue
+from DataStructures.Errors import *
+
+
+class ConcurrentPriorityQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            ConcurrentPriorityQueue(duplicates="yes")
+        with self.assertRaises(PriorityQueueTypeError):
+            ConcurrentPriorityQueue(priority_type=5)
+
+        queue = ConcurrentPriorityQueue(str, True, float, True)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.priority_type, float)
+        self.assertTrue(queue.reversed)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.unfinished_tasks, 0)
+
+    def test_enqueue_dequeue(self):
+        queue = ConcurrentPriorityQueue()
+        with self.assertRaises(EmptyPriorityQueueError):
+            queue.dequeue(block=False)
+        with self.assertRaises(EmptyPriorityQueueError):
+            queue.dequeue(timeout=0.01)
+        with self.assertRaises(ValueError):
+            queue.dequeue(timeout=-1)
+
+        queue.enqueue("low", 1)
+        queue.enqueue("high", 10)
+        queue.enqueue("overwritten", 1)
+        self.assertEqual(queue.size, 2, "Wrong enqueue implementation")
+        self.assertEqual(queue.unfinished_tasks, 2, "Overwritten elements must not be counted as tasks")
+        self.assertEqual(queue.peek(), "high")
+        self.assertTrue("overwritten" in queue)
+        self.assertEqual(queue.dequeue(), "high")
+        self.assertEqual(queue.dequeue(block=False), "overwritten")
+
+        queue = ConcurrentPriorityQueue(duplicates=True)
+        queue.enqueue("first", 1)
+        queue.enqueue("second", 1)
+        self.assertEqual(queue.unfinished_tasks, 2)
+        self.assertEqual(queue.dequeue(), "first")
+        self.assertEqual(queue.dequeue(), "second")
+
+    def test_blocking_dequeue(self):
+        queue = ConcurrentPriorityQueue(int)
+        results = []
+
+        def consumer():
+            results.append(queue.dequeue(timeout=5))
+
+        threads = [Thread(target=consumer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(4):
+            queue.enqueue(i, i)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), [0, 1, 2, 3], "Wrong blocking dequeue implementation")
+        self.assertEqual(len(queue), 0)
+
+    def test_task_done_join(self):
+        queue = ConcurrentPriorityQueue(duplicates=True)
+        with self.assertRaises(ValueError):
+            queue.task_done()
+        self.assertTrue(queue.join(timeout=0.01))
+
+        processed = []
+
+        def worker():
+            while True:
+                item = queue.dequeue()
+                if item is None:
+                    queue.task_done()
+                    break
+                processed.append(item)
+                queue.task_done()
+
+        threads = [Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(100):
+            queue.enqueue(i, i % 7)
+        self.assertTrue(queue.join(timeout=5), "Wrong join implementation")
+        self.assertEqual(sorted(processed), list(range(100)))
+
+        for _ in threads:
+            queue.enqueue(None, -1)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(queue.unfinished_tasks, 0)
+
+        queue.enqueue(1, 1)
+        self.assertFalse(queue.join(timeout=0.01))
+        queue.remove_element(1)
+        self.assertTrue(queue.join(timeout=0.01), "Removed elements must be treated as finished tasks")
+
+        queue = ConcurrentPriorityQueue()
+        queue.enqueue("a", 1)
+        queue.enqueue("b", 2)
+        self.assertTrue(queue.replace_priority("a", 2))
+        self.assertEqual(queue.unfinished_tasks, 1, "Overwritten elements must be treated as finished tasks")
+
+    def test_task_lock(self):
+        queue = ConcurrentPriorityQueue(str)
+        queue.enqueue("task", 1)
+        queue.dequeue()
+        finished = []
+
+        def finish():
+            queue.task_done()
+            finished.append(queue.join(1))
+
+        # the counter of unfinished tasks has its own mutex, so a consumer finishing a task doesn't wait for the mutex of
+        # the queue, which a producer or a consumer might be holding
+        with queue._ConcurrentPriorityQueue__lock:
+            consumer = Thread(target=finish)
+            consumer.start()
+            consumer.join(5)
+            self.assertFalse(consumer.is_alive(), "task_done() and join() must not wait for the mutex of the queue")
+
+        self.assertEqual(finished, [True])
+        self.assertEqual(queue.unfinished_tasks, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
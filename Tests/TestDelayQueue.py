@@ -0,0 +1,181 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADTs DelayQueue and AsyncDelayQueue
+import unittest
+import asyncio
+from threading import Thread
+from time import monotonic, sleep
+
+from DataStructures.ConcurrentDataStructures import DelayQueue, AsyncDelayQueue
+from DataStructures.Errors import *
+
+
+class DelayQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            DelayQueue(elements_type="str")
+
+        queue = DelayQueue(str)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.size, 0)
+        self.assertIsNone(queue.peek())
+        self.assertIsNone(queue.next_delay)
+        self.assertEqual(str(queue), "[]")
+
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue(5, 1)
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue("a", "1")
+        with self.assertRaises(ValueError):
+            queue.enqueue("a", -1)
+        with self.assertRaises(ValueError):
+            queue.dequeue(timeout=-1)
+
+    def test_order(self):
+        queue = DelayQueue(str)
+        queue.enqueue("late", 0.08)
+        queue.enqueue("early", 0.04)
+        queue.enqueue("late too", 0.08)
+        queue.enqueue("now", 0)
+        self.assertEqual(len(queue), 4)
+        self.assertEqual(str(queue), "['now', 'early', 'late', 'late too']")
+
+        self.assertEqual(queue.dequeue(block=False), "now")
+        self.assertEqual(queue.peek(), "early")
+        self.assertGreater(queue.next_delay, 0)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue(block=False)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue(timeout=0.01)
+
+        start = monotonic()
+        self.assertEqual(queue.dequeue(), "early")
+        self.assertGreaterEqual(monotonic() - start, 0.02, "An element must not be released before its delay")
+        self.assertEqual(queue.dequeue_due(), [])
+        sleep(0.06)
+        self.assertEqual(queue.next_delay, 0)
+        self.assertEqual(queue.dequeue_due(), ["late", "late too"])
+        self.assertEqual(queue.size, 0)
+
+    def test_wake_up(self):
+        queue = DelayQueue(int)
+        queue.enqueue(1, 10)
+
+        def enqueue_earlier():
+            sleep(0.02)
+            queue.enqueue(2, 0.01)
+
+        thread = Thread(target=enqueue_earlier)
+        thread.start()
+        start = monotonic()
+        self.assertEqual(queue.dequeue(timeout=5), 2, "A consumer must be woken up by an element released earlier")
+        self.assertLess(monotonic() - start, 5)
+        thread.join()
+
+    def test_consumers(self):
+        queue = DelayQueue(int)
+        results = []
+
+        def consume():
+            results.append(queue.dequeue(timeout=5))
+
+        consumers = [Thread(target=consume) for _ in range(5)]
+        for consumer in consumers:
+            consumer.start()
+        for element in range(5):
+            queue.enqueue(element, 0.01*(5 - element))
+        for consumer in consumers:
+            consumer.join()
+
+        self.assertEqual(sorted(results), list(range(5)))
+
+    def test_locked_reads(self):
+        queue = DelayQueue(str)
+        queue.enqueue("element", 10)
+        results = []
+
+        def read():
+            results.append((queue.peek(), queue.next_delay > 0))
+
+        # the reads must wait for a thread, which is changing the queue, to release the lock of the queue
+        with queue._DelayQueue__available:
+            reader = Thread(target=read)
+            reader.start()
+            reader.join(0.1)
+            self.assertTrue(reader.is_alive(), "peek() and next_delay must hold the lock of the queue")
+        reader.join()
+
+        self.assertEqual(results, [("element", True)])
+
+
+class AsyncDelayQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            AsyncDelayQueue(5)
+
+        async def scenario():
+            queue = AsyncDelayQueue(str)
+            self.assertIsNone(queue.peek())
+            with self.assertRaises(QueueTypeError):
+                await queue.enqueue(1, 1)
+            with self.assertRaises(ValueError):
+                await queue.enqueue("a", -0.5)
+
+        asyncio.run(scenario())
+
+    def test_dequeue(self):
+        async def scenario():
+            queue = AsyncDelayQueue(str)
+            await queue.enqueue("b", 0.05)
+            await queue.enqueue("a", 0.02)
+            self.assertEqual(str(queue), "['a', 'b']")
+
+            start = monotonic()
+            self.assertEqual(await queue.dequeue(), "a")
+            self.assertGreaterEqual(monotonic() - start, 0.01)
+            self.assertEqual(await queue.dequeue(), "b")
+
+            await queue.enqueue("c", 0)
+            await queue.enqueue("d", 0)
+            await queue.enqueue("e", 10)
+            self.assertEqual(queue.dequeue_due(), ["c", "d"])
+            self.assertEqual(queue.size, 1)
+
+            async def enqueue_earlier():
+                await asyncio.sleep(0.02)
+                await queue.enqueue("f", 0.01)
+
+            task = asyncio.get_running_loop().create_task(enqueue_earlier())
+            self.assertEqual(await asyncio.wait_for(queue.dequeue(), 5), "f")
+            await task
+
+            # a cancelled consumer doesn't lose any elements
+            consumer = asyncio.get_running_loop().create_task(queue.dequeue())
+            await asyncio.sleep(0.01)
+            consumer.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await consumer
+            self.assertEqual(queue.peek(), "e")
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ limitations under the License.
 
 
 import unittest
+from decimal import Decimal
 
 from DataStructures.AbstractDataStructures import DuplicatePriorityQueue
 from DataStructures.Errors import *
@@ -375,6 +376,102 @@ class DuplicatePriorityQueueTest(unittest.TestCase):
         self.assertEqual(priority_queue.get_element(1), None, "Wrong remove implementation")
         self.assertEqual(len(priority_queue), 13)
 
+    def test_priority_type(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            DuplicatePriorityQueue(priority_type="float")
+
+        priority_queue = DuplicatePriorityQueue(reverse=True, priority_type=Decimal)
+        self.assertEqual(priority_queue.priority_type, Decimal, "Wrong priority type")
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.enqueue("word", 1.5)
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.get_element(1)
+
+        priority_queue.enqueue("first", Decimal("0.1"))
+        priority_queue.enqueue("second", Decimal("0.1"))
+        priority_queue.enqueue("third", Decimal("0.3"))
+        self.assertEqual(priority_queue.get_element(Decimal("0.1")), "first")
+        self.assertTrue(priority_queue.replace_priority("third", Decimal("0.05")))
+        self.assertEqual([item for item in priority_queue], ["third", "first", "second"],
+                         "Wrong Decimal priorities implementation")
+
+    def test_capacity(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            DuplicatePriorityQueue(capacity="5")
+
+        priority_queue = DuplicatePriorityQueue(capacity=4)
+        self.assertEqual(priority_queue.capacity, 4)
+        priority_queue.enqueue("a", 5)
+        priority_queue.enqueue("b", 1)
+        priority_queue.enqueue("c", 1)
+        priority_queue.enqueue("d", 1)
+
+        priority_queue.enqueue("e", 1)
+        self.assertEqual(len(priority_queue), 4, "Wrong capacity implementation")
+        self.assertFalse(priority_queue.contains_element("e"), "Duplicates of the last priority must be discarded")
+
+        priority_queue.enqueue("f", 2)
+        self.assertEqual(len(priority_queue), 4, "Wrong capacity implementation")
+        self.assertFalse(priority_queue.contains_element("d"), "The last enqueued duplicate must be evicted")
+        priority_queue.enqueue("g", 3)
+        priority_queue.enqueue("h", 4)
+        self.assertEqual(len(priority_queue), 4)
+        self.assertFalse(priority_queue.contains_priority(1), "Wrong capacity implementation")
+        self.assertEqual([item for item in priority_queue], ["a", "h", "g", "f"])
+
+        priority_queue = DuplicatePriorityQueue(reverse=True, capacity=3)
+        for item, priority in [("a", 1), ("b", 2), ("c", 2), ("d", 0), ("e", 0), ("f", 3)]:
+            priority_queue.enqueue(item, priority)
+        self.assertEqual(len(priority_queue), 3)
+        self.assertEqual([item for item in priority_queue], ["d", "e", "a"], "Wrong capacity implementation with reverse")
+
+    def test_ordered_index(self):
+        for ordered_index in (True, False):
+            priority_queue = DuplicatePriorityQueue(reverse=True, ordered_index=ordered_index)
+            self.assertEqual(priority_queue.ordered_index, ordered_index)
+            for item, priority in [("a", 1), ("b", 2), ("c", 2), ("d", 3), ("e", 2), ("f", 5)]:
+                priority_queue.enqueue(item, priority)
+
+            self.assertEqual(priority_queue.range(2, 3), ["b", "c", "e", "d"], "Wrong range implementation")
+            self.assertEqual(priority_queue.count_above(1), 5, "Wrong count_above implementation")
+            self.assertEqual(priority_queue.count_above(2), 2, "Wrong count_above implementation")
+            self.assertEqual(priority_queue.floor(4), 3)
+            self.assertEqual(priority_queue.ceiling(4), 5)
+            self.assertEqual([item for item in priority_queue], ["a", "b", "c", "e", "d", "f"])
+
+
+    def test_merge(self):
+        priority_queue = DuplicatePriorityQueue(str)
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.enqueue_many([("a", 1), ("b", "2")])
+        self.assertEqual(len(priority_queue), 0, "No elements must be enqueued if a pair is invalid")
+
+        priority_queue.enqueue_many([("a", 1), ("b", 2), ("c", 1), ("d", 1)])
+        self.assertEqual(len(priority_queue), 4, "Wrong enqueue_many implementation")
+        self.assertEqual(priority_queue.range(1, 1), ["a", "c", "d"])
+
+        other = DuplicatePriorityQueue(str)
+        other.enqueue("e", 1)
+        other.enqueue("f", 3)
+        other.enqueue("g", 3)
+        priority_queue.merge(other)
+        self.assertEqual(len(other), 3, "The merged queue must not be modified")
+        self.assertEqual(len(priority_queue), 7, "Wrong merge implementation")
+        self.assertEqual([element for element in priority_queue], ["f", "g", "b", "a", "c", "d", "e"])
+
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.merge(DuplicatePriorityQueue(int))
+
+        for reverse in (False, True):
+            priority_queue = DuplicatePriorityQueue(reverse=reverse, capacity=4)
+            other = DuplicatePriorityQueue()
+            priority_queue.enqueue_many([(1, 1), (2, 2), (3, 3)])
+            other.enqueue_many([(4, 2), (5, 2), (6, 4)])
+            priority_queue.merge(other)
+            self.assertEqual(len(priority_queue), 4, "Wrong merge implementation with capacity")
+            expected = [1, 2, 4, 5] if reverse else [6, 3, 2, 4]
+            self.assertEqual([element for element in priority_queue], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
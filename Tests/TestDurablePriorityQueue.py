@@ -0,0 +1,157 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT DurablePriorityQueue
+import unittest
+import os
+import random
+import tempfile
+
+from DataStructures.DurableDataStructures import DurablePriorityQueue
+from DataStructures.Errors import *
+
+
+class DurablePriorityQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "queue")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_init(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            DurablePriorityQueue(self.path, sync_every=1.5)
+        with self.assertRaises(ValueError):
+            DurablePriorityQueue(self.path, sync_every=0)
+        with self.assertRaises(PriorityQueueTypeError):
+            DurablePriorityQueue(self.path, checkpoint_every="10")
+        with self.assertRaises(ValueError):
+            DurablePriorityQueue(self.path, checkpoint_every=-1)
+
+        with DurablePriorityQueue(self.path, str) as queue:
+            self.assertEqual(queue.size, 0)
+            self.assertEqual(queue.path, self.path)
+            self.assertFalse(queue.closed)
+        self.assertTrue(queue.closed)
+        with self.assertRaises(ValueError):
+            queue.enqueue("a", 1)
+        queue.close()
+
+    def test_recovery(self):
+        queue = DurablePriorityQueue(self.path, str)
+        for priority in range(10):
+            queue.enqueue("task" + str(priority), priority)
+        queue.enqueue("overwritten", 3)
+        self.assertEqual(queue.dequeue(), "task9")
+        queue.remove_element("task0")
+        self.assertTrue(queue.replace_priority("task5", 20))
+        self.assertFalse(queue.replace_priority("task4", 1, comparison=1))
+        with self.assertRaises(PriorityQueueElementError):
+            queue.remove_element("task9")
+        expected = str(queue)
+
+        # the queue is not closed, which simulates a crash of the process
+        recovered = DurablePriorityQueue(self.path, str)
+        self.assertEqual(str(recovered), expected, "Wrong recovery from the log")
+        self.assertEqual(recovered.get_element(3), "overwritten")
+        self.assertEqual([element for element in recovered], ["task5", "task8", "task7", "task6", "task4",
+                                                             "overwritten", "task2", "task1"])
+        recovered.close()
+        # every record of the crashed queue has already been synced, so closing it only releases its log
+        queue.close()
+
+        recovered = DurablePriorityQueue(self.path, str)
+        self.assertEqual(recovered.size, 0, "Dequeued elements must not be recovered")
+        recovered.close()
+
+        with self.assertRaises(PriorityQueueTypeError):
+            with DurablePriorityQueue(self.path, str) as queue:
+                queue.enqueue("a", 1)
+            DurablePriorityQueue(self.path, int)
+
+    def test_checkpoint(self):
+        queue = DurablePriorityQueue(self.path, reverse=True, checkpoint_every=5)
+        queue.enqueue_many([(priority, priority) for priority in range(12)])
+        self.assertEqual(os.path.getsize(self.path + ".log"), 0, "The log must be truncated after a snapshot")
+        queue.dequeue()
+        queue.replace_priority(1, 100)
+        with DurablePriorityQueue(os.path.join(self.directory.name, "other")) as other:
+            queue.merge(other)
+        queue.close()
+
+        recovered = DurablePriorityQueue(self.path, reverse=True)
+        self.assertEqual(recovered.size, 11)
+        self.assertEqual(recovered.peek(), 2)
+        self.assertEqual(recovered.get_element(100), 1)
+
+        # a crash between writing the snapshot and truncating the log leaves records, which must be skipped
+        recovered.enqueue(-1, -1)
+        recovered.flush()
+        with open(self.path + ".log", "rb") as log_file:
+            log = log_file.read()
+        recovered.checkpoint()
+        recovered.close()
+        with open(self.path + ".log", "wb") as log_file:
+            log_file.write(log)
+
+        recovered = DurablePriorityQueue(self.path, reverse=True)
+        self.assertEqual(recovered.size, 12, "Records included in the snapshot must not be applied twice")
+        self.assertEqual(recovered.dequeue(), -1)
+        recovered.close()
+
+    def test_torn_record(self):
+        queue = DurablePriorityQueue(self.path, sync_every=3)
+        queue.enqueue(1, 1)
+        queue.enqueue(2, 2)
+        queue.close()
+
+        with open(self.path + ".log", "ab") as log_file:
+            log_file.write(b"\x00\x00\x00\x30\x12")
+
+        queue = DurablePriorityQueue(self.path)
+        self.assertEqual(queue.size, 2, "A partially written record must be discarded")
+        queue.enqueue(3, 3)
+        queue.close()
+
+        queue = DurablePriorityQueue(self.path)
+        self.assertEqual([element for element in queue], [3, 2, 1])
+        queue.close()
+
+    def test_random_operations(self):
+        random.seed(32)
+        queue = DurablePriorityQueue(self.path, sync_every=7, checkpoint_every=50)
+        for _ in range(500):
+            operation = random.random()
+            if operation < 0.5 or queue.size == 0:
+                queue.enqueue(random.randint(0, 10000), random.randint(0, 200))
+            elif operation < 0.8:
+                queue.dequeue()
+            else:
+                queue.replace_priority(queue.peek(), random.randint(0, 200))
+
+            if random.random() < 0.05:
+                expected = str(queue)
+                queue.close()
+                queue = DurablePriorityQueue(self.path, sync_every=7, checkpoint_every=50)
+                self.assertEqual(str(queue), expected, "Wrong recovery of the queue")
+        queue.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT FairQueue
+import unittest
+import random
+
+from DataStructures.AbstractDataStructures import FairQueue
+from DataStructures.Errors import *
+
+
+class FairQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            FairQueue(elements_type="int")
+        with self.assertRaises(QueueTypeError):
+            FairQueue(default_weight="1")
+        with self.assertRaises(ValueError):
+            FairQueue(default_weight=0)
+
+        queue = FairQueue(int)
+        self.assertEqual(queue.type, int)
+        self.assertEqual(queue.size, 0)
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.lanes, [])
+        self.assertEqual(queue.peek(), None)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue("1", "tenant")
+        self.assertEqual(queue.lanes, [], "A lane must not be created for an invalid element")
+        with self.assertRaises(QueueElementError):
+            queue.depth("tenant")
+        with self.assertRaises(QueueElementError):
+            queue.weight("tenant")
+        with self.assertRaises(ValueError):
+            queue.add_lane("tenant", -1)
+
+    def test_round_robin(self):
+        queue = FairQueue(str)
+        for index in range(5):
+            queue.enqueue("noisy" + str(index), "noisy")
+        queue.enqueue("quiet0", "quiet")
+        queue.enqueue("quiet1", "quiet")
+
+        self.assertEqual(queue.lanes, ["noisy", "quiet"])
+        self.assertEqual(queue.depth("noisy"), 5)
+        self.assertEqual(str(queue), "{'noisy': ['noisy0', 'noisy1', 'noisy2', 'noisy3', 'noisy4'], "
+                                     "'quiet': ['quiet0', 'quiet1']}")
+        dequeued = []
+        while queue.size > 0:
+            peeked = queue.peek()
+            dequeued.append(queue.dequeue())
+            self.assertEqual(peeked, dequeued[-1], "Peek must return the element to be dequeued next")
+        self.assertEqual(dequeued, ["noisy0", "quiet0", "noisy1", "quiet1", "noisy2", "noisy3", "noisy4"])
+        self.assertEqual(queue.enqueued("noisy"), 5)
+        self.assertEqual(queue.dequeued("quiet"), 2)
+        self.assertEqual(queue.depth("quiet"), 0)
+
+    def test_weights(self):
+        queue = FairQueue(default_weight=2)
+        queue.add_lane("gold", 3)
+        queue.add_lane("bronze", 0.5)
+        self.assertEqual(queue.weight("gold"), 3)
+        self.assertEqual(queue.weight("bronze"), 0.5)
+        for index in range(12):
+            queue.enqueue(("gold", index), "gold")
+            queue.enqueue(("silver", index), "silver")
+            queue.enqueue(("bronze", index), "bronze")
+        self.assertEqual(queue.weight("silver"), 2)
+
+        dequeued = []
+        for _ in range(11):
+            peeked = queue.peek()
+            dequeued.append(queue.dequeue())
+            self.assertEqual(peeked, dequeued[-1], "Peek must return the element to be dequeued next")
+        lanes = [lane for lane, index in dequeued]
+        self.assertEqual(lanes.count("gold"), 6, "Lanes must be served in proportion to their weights")
+        self.assertEqual(lanes.count("silver"), 4, "Lanes must be served in proportion to their weights")
+        self.assertEqual(lanes.count("bronze"), 1, "Lanes must be served in proportion to their weights")
+
+        # every lane is served in FIFO order
+        for lane in ("gold", "silver", "bronze"):
+            indices = [index for name, index in dequeued if name == lane]
+            self.assertEqual(indices, sorted(indices))
+
+    def test_noisy_neighbour(self):
+        random.seed(37)
+        queue = FairQueue()
+        max_delay = 0
+        for step in range(2000):
+            for _ in range(5):
+                queue.enqueue(("noisy", step), "noisy")
+            if step % 10 == 0:
+                queue.enqueue(("quiet", step), "quiet")
+            lane, enqueued_step = queue.dequeue()
+            if lane == "quiet":
+                max_delay = max(max_delay, step - enqueued_step)
+        self.assertLessEqual(max_delay, 1, "A quiet lane must not wait behind a noisy lane")
+        self.assertEqual(queue.dequeued("quiet"), 200)
+        self.assertEqual(queue.dequeued("noisy"), 1800)
+
+    def test_random_operations(self):
+        random.seed(2017)
+        queue = FairQueue()
+        expected = {}
+        for _ in range(3000):
+            if random.random() < 0.55 or len(queue) == 0:
+                lane = random.randint(0, 5)
+                item = random.random()
+                queue.enqueue(item, lane)
+                expected.setdefault(lane, []).append(item)
+            else:
+                peeked = queue.peek()
+                item = queue.dequeue()
+                self.assertEqual(peeked, item)
+                lane = [lane for lane in expected if len(expected[lane]) > 0 and expected[lane][0] == item][0]
+                expected[lane].pop(0)
+            self.assertEqual(queue.size, sum(len(items) for items in expected.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -308,5 +308,20 @@ class MaxBinaryHeapTests(unittest.TestCase):
         self.assertEqual(str(heap), "[11.5, 10.9, 10.6, 3.9, 10.7, 10.5, 2.2, 1.1]", "Wrong remove implementation")
 
 
+    def test_extend(self):
+        heap = MaxBinaryHeap()
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.extend([1, 2, "3"])
+        self.assertEqual(heap.size, 0, "No elements must be added if an element is invalid")
+
+        random.seed(31)
+        elements = [random.randint(-1000, 1000) for _ in range(200)]
+        heap.extend(elements[:50])
+        heap.add(elements[50])
+        heap.extend(elements[51:])
+        self.assertEqual(heap.size, 200, "Wrong extend implementation")
+        self.assertEqual(heap.get_sorted_elements(), sorted(elements, reverse=True), "Wrong extend implementation")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -309,5 +309,20 @@ class MinBinaryHeapTests(unittest.TestCase):
         self.assertEqual(str(heap), "[1.1, 2.1, 10.9, 10.6, 15.0, 11.0, 11.7]", "Wrong heap implementation")
 
 
+    def test_extend(self):
+        heap = MinBinaryHeap()
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.extend([1, 2, "3"])
+        self.assertEqual(heap.size, 0, "No elements must be added if an element is invalid")
+
+        random.seed(31)
+        elements = [random.randint(-1000, 1000) for _ in range(200)]
+        heap.extend(elements[:50])
+        heap.add(elements[50])
+        heap.extend(elements[51:])
+        self.assertEqual(heap.size, 200, "Wrong extend implementation")
+        self.assertEqual(heap.get_sorted_elements(), sorted(elements, reverse=False), "Wrong extend implementation")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,151 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT MinMaxBinaryHeap
+import unittest
+import random
+
+from DataStructures.Errors import *
+from DataStructures.TreeDataStructures import MinMaxBinaryHeap
+
+
+class MinMaxBinaryHeapTests(unittest.TestCase):
+
+    def test_size(self):
+        heap = MinMaxBinaryHeap()
+        self.assertEqual(heap.size, 0, "Size method is not correct")
+        self.assertTrue(heap.size == len(heap), "len(heap) method not implemented correctly")
+
+        for i in range(10):
+            heap.add(i)
+        self.assertEqual(heap.size, 10, "Size method is not correct")
+
+        heap.remove_min()
+        heap.remove_max()
+        heap.replace_root(5)
+        self.assertEqual(len(heap), 8, "Size method is not correct")
+
+    def test_type(self):
+        with self.assertRaises(BinaryHeapTypeError):
+            MinMaxBinaryHeap(elements_type=5.4)
+
+        heap = MinMaxBinaryHeap(str)
+        self.assertEqual(heap.type, str, "type method is not correct")
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.add(1)
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.replace_root(1)
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.replace("a", 1)
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.remove(1)
+
+    def test_peek_remove(self):
+        heap = MinMaxBinaryHeap()
+        with self.assertRaises(EmptyBinaryHeapError):
+            heap.remove_min()
+        with self.assertRaises(EmptyBinaryHeapError):
+            heap.remove_max()
+        with self.assertRaises(EmptyBinaryHeapError):
+            heap.replace_root(1)
+        self.assertEqual(heap.peek_min(), None, "peek_min not working")
+        self.assertEqual(heap.peek_max(), None, "peek_max not working")
+
+        heap.add(7)
+        self.assertEqual(heap.peek_min(), 7)
+        self.assertEqual(heap.peek_max(), 7)
+        self.assertEqual(heap.remove_max(), 7)
+        self.assertEqual(heap.size, 0)
+
+        for num in [2, 43, 12, 234, 101, 59, 67, -5]:
+            heap.add(num)
+        self.assertEqual(heap.peek_min(), -5, "peek_min not working")
+        self.assertEqual(heap.peek_max(), 234, "peek_max not working")
+        self.assertEqual(heap.remove_max(), 234, "remove_max not working")
+        self.assertEqual(heap.remove_min(), -5, "remove_min not working")
+        self.assertEqual(heap.replace_root(100), 2, "replace_root not working")
+        self.assertEqual(heap.get_sorted_elements(), [12, 43, 59, 67, 100, 101])
+        self.assertEqual([element for element in heap], [12, 43, 59, 67, 100, 101], "Iterator not working")
+        self.assertEqual(heap.size, 0)
+
+    def test_replace_remove(self):
+        heap = MinMaxBinaryHeap()
+        with self.assertRaises(BinaryHeapElementError):
+            heap.replace(1, 2)
+        with self.assertRaises(BinaryHeapElementError):
+            heap.remove(1)
+
+        for num in range(20):
+            heap.add(num)
+        heap.replace(0, 50)
+        heap.replace(19, -1)
+        heap.remove(10)
+        self.assertEqual(heap.peek_min(), -1)
+        self.assertEqual(heap.peek_max(), 50)
+        self.assertFalse(10 in heap)
+        self.assertEqual(heap.get_sorted_elements(), [-1] + [i for i in range(1, 19) if i != 10] + [50])
+
+    def test_random_operations(self):
+        random.seed(2017)
+        heap = MinMaxBinaryHeap()
+        elements = []
+        for _ in range(2000):
+            operation = random.random()
+            if operation < 0.4 or len(elements) == 0:
+                element = random.randint(-100, 100)
+                heap.add(element)
+                elements.append(element)
+            elif operation < 0.55:
+                elements.remove(heap.remove_min())
+            elif operation < 0.7:
+                elements.remove(heap.remove_max())
+            elif operation < 0.85:
+                element = random.choice(elements)
+                heap.remove(element)
+                elements.remove(element)
+            else:
+                element = random.choice(elements)
+                new_element = random.randint(-100, 100)
+                heap.replace(element, new_element)
+                elements.remove(element)
+                elements.append(new_element)
+
+            if len(elements) > 0:
+                self.assertEqual(heap.peek_min(), min(elements), "Wrong min-max heap order")
+                self.assertEqual(heap.peek_max(), max(elements), "Wrong min-max heap order")
+            self.assertEqual(heap.get_sorted_elements(), sorted(elements))
+
+
+    def test_extend(self):
+        heap = MinMaxBinaryHeap()
+        with self.assertRaises(BinaryHeapTypeError):
+            heap.extend([1, 2.5])
+
+        random.seed(31)
+        elements = [random.randint(-1000, 1000) for _ in range(300)]
+        heap.extend(elements[:100])
+        heap.extend(elements[100:])
+        self.assertEqual(heap.size, 300, "Wrong extend implementation")
+        for _ in range(150):
+            self.assertEqual(heap.remove_max(), max(elements))
+            elements.remove(max(elements))
+            self.assertEqual(heap.remove_min(), min(elements))
+            elements.remove(min(elements))
+
+
+if __name__ == '__main__':
+    unittest.main()
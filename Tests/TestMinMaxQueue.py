@@ -0,0 +1,202 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADTs MinMaxStack and MinMaxQueue
+import unittest
+import operator
+from math import gcd
+
+from DataStructures.AbstractDataStructures import MinMaxStack, MinMaxQueue
+from DataStructures.Errors import *
+
+
+class MinMaxStackTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(StackTypeError):
+            MinMaxStack("int")
+        with self.assertRaises(StackTypeError):
+            MinMaxStack(aggregates=[operator.add])
+        with self.assertRaises(StackTypeError):
+            MinMaxStack(aggregates={1: operator.add})
+        with self.assertRaises(StackTypeError):
+            MinMaxStack(aggregates={"sum": 0})
+        with self.assertRaises(ValueError):
+            MinMaxStack(aggregates={"min": operator.add})
+
+        stack = MinMaxStack(int, aggregates={"sum": operator.add})
+        self.assertEqual(stack.type, int)
+        self.assertEqual(stack.aggregates, ("min", "max", "sum"))
+        self.assertEqual(stack.size, 0)
+        self.assertIsNone(stack.peek())
+        with self.assertRaises(EmptyStackError):
+            stack.min()
+        with self.assertRaises(EmptyStackError):
+            stack.pop()
+        with self.assertRaises(StackElementError):
+            stack.aggregate("product")
+
+    def test_aggregates(self):
+        stack = MinMaxStack(int, aggregates={"sum": operator.add, "gcd": gcd})
+        with self.assertRaises(StackTypeError):
+            stack.push("5")
+        with self.assertRaises(StackTypeError):
+            stack.push_many([1, 2.0])
+        self.assertEqual(stack.size, 0)
+
+        stack.push(12)
+        stack.push_many([18, 6, 30])
+        self.assertEqual((stack.min(), stack.max(), stack.aggregate("sum"), stack.aggregate("gcd")), (6, 30, 66, 6))
+        self.assertEqual(stack.pop(), 30)
+        self.assertEqual(stack.max(), 18)
+        self.assertEqual(stack.pop_many(2), [6, 18])
+        self.assertEqual((stack.min(), stack.max(), stack.aggregate("gcd")), (12, 12, 12))
+        self.assertTrue(12 in stack)
+        self.assertEqual(str(stack), "deque([12])")
+        self.assertEqual([element for element in stack], [12])
+        with self.assertRaises(EmptyStackError):
+            stack.max()
+
+    def test_order(self):
+        # the aggregate functions don't need to be commutative
+        stack = MinMaxStack(str, aggregates={"concat": operator.add})
+        stack.push_many(["a", "b", "c"])
+        stack.pop()
+        stack.push("d")
+        self.assertEqual(stack.aggregate("concat"), "abd")
+
+    def test_failed_aggregate(self):
+        stack = MinMaxStack()
+        stack.push(3)
+        with self.assertRaises(TypeError):
+            stack.push("a")
+        with self.assertRaises(TypeError):
+            stack.push_many([4, "a"])
+        self.assertEqual(stack.size, 1)
+        self.assertEqual((stack.min(), stack.max()), (3, 3))
+        self.assertEqual(stack.pop(), 3)
+        with self.assertRaises(EmptyStackError):
+            stack.pop()
+
+        def checked_add(first, second):
+            if first + second > 10:
+                raise ValueError("The sum is too big")
+            return first + second
+
+        stack = MinMaxStack(int, aggregates={"sum": checked_add})
+        stack.push_many([2, 3])
+        with self.assertRaises(ValueError):
+            stack.push_many([1, 6])
+        self.assertEqual(stack.size, 2, "The stack must not change if an aggregate function raises")
+        self.assertEqual((stack.max(), stack.aggregate("sum")), (3, 5))
+        self.assertEqual(stack.pop_many(2), [3, 2])
+
+
+class MinMaxQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            MinMaxQueue(5)
+        with self.assertRaises(QueueTypeError):
+            MinMaxQueue(aggregates={"sum": "add"})
+        with self.assertRaises(ValueError):
+            MinMaxQueue(aggregates={"max": max})
+
+        queue = MinMaxQueue(float)
+        self.assertEqual(queue.aggregates, ("min", "max"))
+        self.assertIsNone(queue.peek())
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+        with self.assertRaises(EmptyQueueError):
+            queue.max()
+        with self.assertRaises(QueueElementError):
+            queue.aggregate("sum")
+
+    def test_sliding_window(self):
+        values = [5, 1, 4, 8, 2, 9, 3, 3, 7, 6, 0, 2]
+        queue = MinMaxQueue(int, aggregates={"sum": operator.add})
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue(1.5)
+        with self.assertRaises(QueueTypeError):
+            queue.contains("1")
+
+        for index, value in enumerate(values):
+            queue.enqueue(value)
+            if queue.size > 4:
+                self.assertEqual(queue.dequeue(), values[index - 4])
+            window = values[max(0, index - 3): index + 1]
+            self.assertEqual(queue.min(), min(window), "Wrong minimum of the window")
+            self.assertEqual(queue.max(), max(window), "Wrong maximum of the window")
+            self.assertEqual(queue.aggregate("sum"), sum(window))
+            self.assertEqual(queue.peek(), window[0])
+
+        self.assertEqual(str(queue), "deque([7, 6, 0, 2])")
+        self.assertTrue(6 in queue)
+        self.assertFalse(9 in queue)
+        self.assertEqual(len(queue), 4)
+
+    def test_batches(self):
+        queue = MinMaxQueue(str, aggregates={"concat": operator.add})
+        queue.enqueue_many(["a", "b", "c"])
+        self.assertEqual(queue.dequeue(), "a")
+        queue.enqueue_many(["d", "e"])
+        self.assertEqual(queue.aggregate("concat"), "bcde", "The aggregates must follow the order of the queue")
+        self.assertEqual(queue.dequeue_many(3), ["b", "c", "d"])
+        self.assertEqual(queue.aggregate("concat"), "e")
+        queue.enqueue("f")
+        self.assertEqual((queue.min(), queue.max()), ("e", "f"))
+        self.assertEqual([element for element in queue], ["e", "f"])
+        self.assertEqual(queue.dequeue_many(2), [])
+        with self.assertRaises(QueueTypeError):
+            queue.dequeue_many("2")
+        with self.assertRaises(ValueError):
+            queue.dequeue_many(-2)
+
+    def test_failed_aggregate(self):
+        queue = MinMaxQueue()
+        queue.enqueue(1)
+        with self.assertRaises(TypeError):
+            queue.enqueue("a")
+        with self.assertRaises(TypeError):
+            queue.enqueue_many([2, "a"])
+        self.assertEqual(queue.size, 1)
+        self.assertEqual((queue.min(), queue.max()), (1, 1))
+        self.assertEqual(queue.dequeue(), 1)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+
+        failing = [False]
+
+        def checked_add(first, second):
+            if failing[0]:
+                raise ValueError("The aggregate function failed")
+            return first + second
+
+        queue = MinMaxQueue(int, aggregates={"sum": checked_add})
+        queue.enqueue_many([1, 2, 3])
+        failing[0] = True
+        with self.assertRaises(ValueError):
+            queue.dequeue()
+        failing[0] = False
+        self.assertEqual(queue.size, 3, "The queue must not change if an aggregate function raises")
+        self.assertEqual(queue.dequeue(), 1)
+        self.assertEqual((queue.min(), queue.max(), queue.aggregate("sum")), (2, 3, 5))
+        self.assertEqual(queue.dequeue_many(2), [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT PersistentQueue
+import unittest
+import os
+import tempfile
+
+from DataStructures.DurableDataStructures import PersistentQueue
+from DataStructures.Errors import *
+
+
+class PersistentQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ingest")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def segment_files(self):
+        return sorted(name for name in os.listdir(self.directory.name) if name.endswith(".segment"))
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            PersistentQueue(self.path, elements_type=5)
+        with self.assertRaises(QueueTypeError):
+            PersistentQueue(self.path, segment_size=1024.0)
+        with self.assertRaises(ValueError):
+            PersistentQueue(self.path, segment_size=0)
+        with self.assertRaises(QueueTypeError):
+            PersistentQueue(self.path, sync_every="1")
+        with self.assertRaises(ValueError):
+            PersistentQueue(self.path, sync_every=-5)
+
+        with PersistentQueue(self.path, str) as queue:
+            self.assertEqual(queue.size, 0)
+            self.assertEqual(len(queue), 0)
+            self.assertEqual(queue.type, str)
+            self.assertEqual(queue.path, self.path)
+            self.assertEqual(queue.segment_count, 1)
+            self.assertEqual(str(queue), "PersistentQueue({0!r}, size=0)".format(self.path))
+            self.assertFalse(queue.closed)
+            self.assertIsNone(queue.peek())
+        self.assertTrue(queue.closed)
+        with self.assertRaises(ValueError):
+            queue.enqueue("a")
+        queue.close()
+
+    def test_fifo(self):
+        with PersistentQueue(self.path, str) as queue:
+            with self.assertRaises(QueueTypeError):
+                queue.enqueue(5)
+            with self.assertRaises(QueueTypeError):
+                queue.enqueue_many(["a", 5])
+            self.assertEqual(queue.size, 0, "Enqueue many must not enqueue any element if one is not valid")
+            with self.assertRaises(EmptyQueueError):
+                queue.dequeue()
+
+            queue.enqueue("a")
+            queue.enqueue_many(["b", "c", "d"])
+            self.assertEqual(queue.peek(), "a")
+            self.assertTrue("c" in queue)
+            self.assertFalse("e" in queue)
+            with self.assertRaises(QueueTypeError):
+                queue.contains(1)
+
+            self.assertEqual(queue.dequeue(), "a")
+            self.assertEqual(queue.dequeue_many(2), ["b", "c"])
+            queue.enqueue("e")
+            self.assertEqual(queue.size, 2)
+            self.assertEqual([element for element in queue], ["d", "e"])
+            self.assertEqual(queue.dequeue_many(5), [])
+            with self.assertRaises(QueueTypeError):
+                queue.dequeue_many(1.0)
+            with self.assertRaises(ValueError):
+                queue.dequeue_many(-1)
+
+    def test_recovery(self):
+        queue = PersistentQueue(self.path, int)
+        queue.enqueue_many(range(100))
+        self.assertEqual(queue.dequeue_many(30), list(range(30)))
+
+        # the queue is not closed, which simulates a crash of the process
+        recovered = PersistentQueue(self.path, int)
+        self.assertEqual(recovered.size, 70, "Wrong recovery of the queue")
+        self.assertEqual(recovered.peek(), 30)
+        self.assertEqual(recovered.dequeue(), 30)
+        recovered.enqueue(100)
+        recovered.close()
+        # every operation of the crashed queue has already been synced, so closing it only releases its files
+        queue.close()
+
+        with PersistentQueue(self.path, int) as recovered:
+            self.assertEqual([element for element in recovered], list(range(31, 101)))
+        with PersistentQueue(self.path, int) as recovered:
+            self.assertEqual(recovered.size, 0, "Dequeued elements must not be recovered")
+
+    def test_group_commit(self):
+        queue = PersistentQueue(self.path, sync_every=10)
+        queue.enqueue_many(range(20))
+        for _ in range(5):
+            queue.dequeue()
+
+        # the dequeued elements since the last sync are dequeued again after a crash
+        recovered = PersistentQueue(self.path, sync_every=10)
+        self.assertEqual(recovered.size, 20)
+        self.assertEqual(recovered.peek(), 0)
+        recovered.close()
+
+        queue.flush()
+        with PersistentQueue(self.path, sync_every=10) as recovered:
+            self.assertEqual(recovered.size, 15)
+            self.assertEqual(recovered.peek(), 5)
+        queue.close()
+
+    def test_segments(self):
+        with PersistentQueue(self.path, bytes, segment_size=1000) as queue:
+            for index in range(50):
+                queue.enqueue(bytes([index]) * 100)
+            self.assertGreater(queue.segment_count, 5)
+            self.assertEqual(len(self.segment_files()), queue.segment_count)
+
+            # a record greater than the segment size is stored in a segment on its own
+            queue.enqueue(b"x" * 5000)
+            self.assertTrue(b"x" * 5000 in queue)
+            self.assertTrue(bytes([49]) * 100 in queue)
+
+            segments = queue.segment_count
+            self.assertEqual(queue.dequeue_many(25), [bytes([index]) * 100 for index in range(25)])
+            self.assertLess(queue.segment_count, segments, "Consumed segments must be deleted")
+            self.assertEqual(len(self.segment_files()), queue.segment_count)
+
+        with PersistentQueue(self.path, bytes, segment_size=1000) as queue:
+            self.assertEqual(queue.size, 26)
+            self.assertEqual(queue.dequeue_many(25), [bytes([index]) * 100 for index in range(25, 50)])
+            self.assertEqual(queue.dequeue(), b"x" * 5000)
+            self.assertEqual(queue.segment_count, 1)
+            self.assertEqual(len(self.segment_files()), 1)
+
+    def test_torn_record(self):
+        queue = PersistentQueue(self.path, str)
+        queue.enqueue_many(["a", "b", "c"])
+        queue.close()
+
+        segment_path = os.path.join(self.directory.name, self.segment_files()[-1])
+        with open(segment_path, "ab") as segment_file:
+            segment_file.write(b"\x00\x00\x00\x40\x12")
+
+        with PersistentQueue(self.path, str) as queue:
+            self.assertEqual(queue.size, 3, "A torn record must be discarded")
+            queue.enqueue("d")
+        with PersistentQueue(self.path, str) as queue:
+            self.assertEqual([element for element in queue], ["a", "b", "c", "d"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT PersistentStack
+import unittest
+
+from DataStructures.AbstractDataStructures import PersistentStack, Stack
+from DataStructures.Errors import *
+
+
+class PersistentStackTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(StackTypeError):
+            PersistentStack("int")
+
+        stack = PersistentStack(int)
+        self.assertEqual(stack.type, int)
+        self.assertEqual(stack.size, 0)
+        self.assertEqual(len(stack), 0)
+        self.assertIsNone(stack.peek())
+        self.assertEqual(str(stack), "PersistentStack([])")
+        with self.assertRaises(EmptyStackError):
+            stack.pop()
+        with self.assertRaises(AttributeError):
+            stack.elements = []
+
+    def test_versions(self):
+        empty = PersistentStack(str)
+        with self.assertRaises(StackTypeError):
+            empty.push(1)
+        with self.assertRaises(StackTypeError):
+            empty.push_many(["a", 1])
+
+        first = empty.push("a")
+        second = first.push_many(["b", "c"])
+        third = second.pop().push("d")
+
+        self.assertEqual(empty.size, 0, "Pushing must not change the old version")
+        self.assertEqual(list(first), ["a"])
+        self.assertEqual(list(second), ["c", "b", "a"])
+        self.assertEqual(list(third), ["d", "b", "a"])
+        self.assertEqual(str(third), "PersistentStack(['a', 'b', 'd'])")
+        self.assertEqual(second.peek(), "c")
+        self.assertEqual(third.size, 3)
+
+        self.assertTrue("c" in second)
+        self.assertFalse("c" in third)
+        with self.assertRaises(StackTypeError):
+            third.contains(5)
+
+        # the versions share the cells below their tops
+        self.assertIs(second.pop()._PersistentStack__top, third.pop()._PersistentStack__top)
+
+        stack = third.to_stack()
+        self.assertEqual(type(stack), Stack)
+        self.assertEqual(stack.type, str)
+        self.assertEqual(stack.pop_many(3), ["d", "b", "a"])
+        self.assertEqual(third.size, 3)
+
+    def test_backtracking(self):
+        # all subsets of a set, keeping a version of the current path at every branch
+        def subsets(elements, path):
+            if len(elements) == 0:
+                return [list(path)[::-1]]
+            return subsets(elements[1:], path) + subsets(elements[1:], path.push(elements[0]))
+
+        self.assertEqual(sorted(subsets([1, 2, 3], PersistentStack(int))),
+                         [[], [1], [1, 2], [1, 2, 3], [1, 3], [2], [2, 3], [3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,7 @@ limitations under the License.
 
 import unittest
 
-from DataStructures.AbstractDataStructures import PriorityQueue
+from DataStructures.AbstractDataStructures import PriorityQueue, DuplicatePriorityQueue
 from DataStructures.Errors import *
 
 
@@ -301,6 +301,164 @@ class PriorityQueueTest(unittest.TestCase):
         priority_queue.remove_element(0)
         self.assertEqual(priority_queue.dequeue(), 1, "Wrong remove implementation")
 
+    def test_priority_type(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            PriorityQueue(priority_type=5)
+
+        priority_queue = PriorityQueue()
+        self.assertEqual(priority_queue.priority_type, int, "Wrong default priority type")
+
+        priority_queue = PriorityQueue(str, priority_type=float)
+        self.assertEqual(priority_queue.priority_type, float, "Wrong priority type")
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.enqueue("word", 5)
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.get_element(5)
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.contains_priority(5)
+
+        priority_queue.enqueue("low", 0.25)
+        priority_queue.enqueue("high", 0.75)
+        priority_queue.enqueue("middle", 0.5)
+        self.assertTrue(priority_queue.contains_priority(0.5))
+        self.assertEqual(priority_queue.get_element(0.75), "high")
+        self.assertTrue(priority_queue.replace_priority("low", 1.5))
+        self.assertEqual(priority_queue.dequeue(), "low", "Wrong float priorities implementation")
+        self.assertEqual(priority_queue.dequeue(), "high", "Wrong float priorities implementation")
+
+        priority_queue = PriorityQueue(reverse=True, priority_type=tuple)
+        priority_queue.enqueue("second", (1, 5))
+        priority_queue.enqueue("first", (1, 2))
+        priority_queue.enqueue("third", (2, 0))
+        self.assertEqual([item for item in priority_queue], ["first", "second", "third"],
+                         "Wrong tuple priorities implementation")
+
+    def test_capacity(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            PriorityQueue(capacity=2.5)
+        with self.assertRaises(ValueError):
+            PriorityQueue(capacity=0)
+
+        priority_queue = PriorityQueue()
+        self.assertEqual(priority_queue.capacity, None)
+
+        priority_queue = PriorityQueue(str, capacity=3)
+        self.assertEqual(priority_queue.capacity, 3)
+        self.assertFalse(priority_queue.reversed)
+        for priority in [5, 1, 7]:
+            priority_queue.enqueue(str(priority), priority)
+
+        priority_queue.enqueue("0", 0)
+        self.assertEqual(len(priority_queue), 3, "Wrong capacity implementation")
+        self.assertFalse(priority_queue.contains_element("0"), "Elements below all other elements must be discarded")
+
+        priority_queue.enqueue("3", 3)
+        self.assertEqual(len(priority_queue), 3, "Wrong capacity implementation")
+        self.assertFalse(priority_queue.contains_priority(1), "The lowest ranked element must be evicted")
+
+        priority_queue.enqueue("overwritten", 5)
+        self.assertEqual(len(priority_queue), 3, "Overwriting an element must not evict elements")
+        self.assertEqual([item for item in priority_queue], ["7", "overwritten", "3"])
+
+        priority_queue = PriorityQueue(reverse=True, capacity=2)
+        for priority in range(10, 0, -1):
+            priority_queue.enqueue(priority, priority)
+        priority_queue.enqueue(100, 100)
+        self.assertTrue(priority_queue.reversed)
+        self.assertEqual(str(priority_queue), "{2: 2, 1: 1}", "Wrong capacity implementation with reverse")
+        priority_queue.remove_element(1)
+        priority_queue.enqueue(100, 100)
+        self.assertEqual(priority_queue.dequeue(), 2)
+        self.assertEqual(priority_queue.dequeue(), 100)
+
+    def test_ordered_index(self):
+        with self.assertRaises(PriorityQueueTypeError):
+            PriorityQueue(ordered_index=1)
+
+        for ordered_index in (True, False):
+            priority_queue = PriorityQueue(str, ordered_index=ordered_index)
+            self.assertEqual(priority_queue.ordered_index, ordered_index)
+            self.assertEqual(priority_queue.range(100, 200), [])
+            self.assertEqual(priority_queue.floor(5), None)
+
+            for priority in range(50, 300, 25):
+                priority_queue.enqueue("task" + str(priority), priority)
+
+            self.assertEqual(priority_queue.range(100, 200), ["task200", "task175", "task150", "task125", "task100"],
+                             "Wrong range implementation")
+            self.assertEqual(priority_queue.range(low=250), ["task275", "task250"])
+            self.assertEqual(priority_queue.count_above(200), 3, "Wrong count_above implementation")
+            self.assertEqual(priority_queue.count_above(1000), 0, "Wrong count_above implementation")
+            self.assertEqual(priority_queue.floor(110), 100, "Wrong floor implementation")
+            self.assertEqual(priority_queue.ceiling(110), 125, "Wrong ceiling implementation")
+            self.assertEqual(priority_queue.ceiling(300), None, "Wrong ceiling implementation")
+            with self.assertRaises(PriorityQueueTypeError):
+                priority_queue.range(1.5, 2)
+            with self.assertRaises(PriorityQueueTypeError):
+                priority_queue.count_above("1")
+            with self.assertRaises(PriorityQueueTypeError):
+                priority_queue.floor(1.5)
+            with self.assertRaises(PriorityQueueTypeError):
+                priority_queue.ceiling(1.5)
+
+            priority_queue.replace_priority("task50", 1000)
+            priority_queue.remove_element("task275")
+            self.assertEqual(priority_queue.dequeue(), "task50")
+            self.assertEqual(priority_queue.dequeue(), "task250")
+            self.assertEqual(len(priority_queue), 7)
+
+        priority_queue = PriorityQueue(reverse=True, capacity=3, ordered_index=True)
+        for priority in range(10):
+            priority_queue.enqueue(priority, priority)
+        self.assertEqual(priority_queue.range(), [0, 1, 2], "Wrong ordered index with capacity")
+        self.assertEqual(priority_queue.dequeue(), 0)
+
+
+    def test_merge(self):
+        priority_queue = PriorityQueue(str)
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.enqueue_many([("a", 1), ("b", 2.5)])
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.enqueue_many([("a", 1), (2, 2)])
+        self.assertEqual(len(priority_queue), 0, "No elements must be enqueued if a pair is invalid")
+
+        priority_queue.enqueue_many([("task" + str(priority), priority) for priority in range(0, 20, 2)])
+        priority_queue.enqueue_many([("overwritten", 4)])
+        self.assertEqual(len(priority_queue), 10, "Wrong enqueue_many implementation")
+        self.assertEqual(priority_queue.peek(), "task18")
+
+        other = PriorityQueue(str)
+        other.enqueue_many([("other" + str(priority), priority) for priority in range(1, 20, 2)])
+        other.enqueue("other4", 4)
+        priority_queue.merge(other)
+        self.assertEqual(len(other), 11, "The merged queue must not be modified")
+        self.assertEqual(len(priority_queue), 20, "Wrong merge implementation")
+        self.assertEqual(priority_queue.get_element(4), "other4", "Elements of the merged queue must be retained")
+        self.assertEqual([priority_queue.dequeue() for _ in range(3)], ["other19", "task18", "other17"])
+
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.merge([("a", 1)])
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.merge(PriorityQueue(str, priority_type=float))
+        with self.assertRaises(PriorityQueueTypeError):
+            priority_queue.merge(PriorityQueue(int))
+
+        duplicates = DuplicatePriorityQueue(str)
+        duplicates.enqueue("first", 100)
+        duplicates.enqueue("second", 100)
+        priority_queue.merge(duplicates)
+        self.assertEqual(priority_queue.dequeue(), "second", "The last element with the same priority must be retained")
+
+        for reverse, ordered_index in [(False, False), (True, False), (False, True), (True, True)]:
+            priority_queue = PriorityQueue(reverse=reverse, capacity=5, ordered_index=ordered_index)
+            other = PriorityQueue(reverse=not reverse)
+            priority_queue.enqueue_many([(priority, priority) for priority in range(0, 10, 2)])
+            other.enqueue_many([(priority, priority) for priority in range(1, 10, 2)])
+            priority_queue.merge(other)
+            self.assertEqual(len(priority_queue), 5, "Wrong merge implementation with capacity")
+            expected = [0, 1, 2, 3, 4] if reverse else [9, 8, 7, 6, 5]
+            self.assertEqual([element for element in priority_queue], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
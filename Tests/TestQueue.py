@@ -17,6 +17,8 @@ limitations under the License.
 
 # Simple unittests for the ADT Queue
 import unittest
+from threading import Thread
+from time import sleep
 
 from DataStructures.AbstractDataStructures import Queue
 from DataStructures.Errors import *
@@ -135,6 +137,24 @@ class QueueTest(unittest.TestCase):
         queue.enqueue((1, 2, 3))
         self.assertEqual(queue.dequeue()[0], 2, "Wrong dequeue implementation")
 
+    def test_dequeue_last(self):
+        queue = Queue(int, indexed=True)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue_last()
+
+        queue.enqueue_many([1, 2, 3, 3])
+        self.assertEqual(queue.dequeue_last(), 3)
+        self.assertTrue(queue.contains(3), "The counter of an indexed queue must be updated when the last element is removed")
+        self.assertEqual(queue.dequeue_last(), 3)
+        self.assertFalse(queue.contains(3), "The counter of an indexed queue must be updated when the last element is removed")
+        self.assertEqual(queue.size, 2)
+        self.assertEqual(queue.peek(), 1, "The front of the queue must not change when the last element is removed")
+
+        queue = Queue(float, compact=True)
+        queue.enqueue_many([1.5, 2.5])
+        self.assertEqual(queue.dequeue_last(), 2.5)
+        self.assertEqual(list(queue.view()), [1.5])
+
     def test_type(self):
         queue = Queue()
         self.assertEqual(queue.type, None)
@@ -213,5 +233,244 @@ class QueueTest(unittest.TestCase):
         self.assertEqual(queue.dequeue(), 2, "Wrong remove implementation")
 
 
+    def test_enqueue_dequeue_many(self):
+        queue = Queue(str)
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue_many(["a", "b", 3])
+        self.assertEqual(queue.size, 0, "No elements must be enqueued if an element has a wrong type")
+
+        queue.enqueue_many(["a", "b", "c"])
+        queue.enqueue_many(element for element in "de")
+        self.assertEqual(queue.size, 5, "Wrong enqueue_many implementation")
+        self.assertEqual(queue.peek(), "a")
+
+        with self.assertRaises(QueueTypeError):
+            queue.dequeue_many("2")
+        with self.assertRaises(ValueError):
+            queue.dequeue_many(-3)
+
+        self.assertEqual(queue.dequeue_many(0), [])
+        self.assertEqual(queue.dequeue_many(2), ["a", "b"], "Wrong dequeue_many implementation")
+        self.assertEqual(queue.dequeue_many(10), ["c", "d", "e"], "dequeue_many must return all remaining elements")
+        self.assertEqual(queue.dequeue_many(1), [])
+        self.assertEqual(queue.size, 0)
+
+
+    def test_maxlen(self):
+        with self.assertRaises(QueueTypeError):
+            Queue(maxlen="10")
+        with self.assertRaises(ValueError):
+            Queue(maxlen=-1)
+        with self.assertRaises(ValueError):
+            Queue(maxlen=3, overflow=None)
+
+        queue = Queue()
+        self.assertEqual((queue.maxlen, queue.overflow, queue.dropped), (None, "drop_oldest", 0))
+
+        queue = Queue(str, maxlen=3)
+        queue.enqueue_many(["a", "b", "c", "d"])
+        queue.enqueue("e")
+        self.assertEqual(queue.dropped, 2, "Wrong drop_oldest implementation")
+        self.assertEqual(queue.dequeue_many(3), ["c", "d", "e"], "The oldest elements must be dropped")
+
+        queue = Queue(str, maxlen=3, overflow="drop_newest")
+        queue.enqueue_many(["a", "b", "c", "d"])
+        queue.enqueue("e")
+        self.assertEqual(queue.dropped, 2, "Wrong drop_newest implementation")
+        self.assertEqual(queue.dequeue_many(3), ["a", "b", "c"], "The newest elements must be dropped")
+
+        queue = Queue(maxlen=2, overflow="raise")
+        queue.enqueue_many([1, 2])
+        with self.assertRaises(FullQueueError):
+            queue.enqueue(3)
+        queue.remove(1)
+        queue.enqueue(3)
+        with self.assertRaises(FullQueueError):
+            queue.enqueue_many([4])
+        self.assertEqual(queue.dequeue_many(2), [2, 3])
+        self.assertEqual(queue.dropped, 0)
+
+    def test_maxlen_block(self):
+        queue = Queue(int, maxlen=3, overflow="block")
+        dequeued = []
+
+        def consumer():
+            while len(dequeued) < 100:
+                if queue.size > 0:
+                    dequeued.append(queue.dequeue())
+
+        thread = Thread(target=consumer)
+        thread.start()
+        for element in range(100):
+            queue.enqueue(element)
+            self.assertLessEqual(queue.size, 3, "The queue must never exceed its maximum length")
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "Blocked enqueues must be woken up by dequeues")
+        self.assertEqual(dequeued, list(range(100)), "The order of the elements must be kept")
+        self.assertEqual(queue.dropped, 0)
+
+    def test_block_consumers(self):
+        # with the block policy all mutating methods hold the lock, the slow hash releases the GIL in the middle of the
+        # counter updates, so racing consumers corrupt the counter of an indexed queue, which isn't locked
+        class SlowHash(int):
+            def __hash__(self):
+                sleep(0.0001)
+                return int.__hash__(self)
+
+        elements = [SlowHash(element % 2) for element in range(200)]
+        queue = Queue(maxlen=len(elements), overflow="block", indexed=True)
+        queue.enqueue_many(elements)
+        taken, errors = [], []
+
+        def consumer(index):
+            while True:
+                try:
+                    items = [queue.dequeue()] if index % 2 == 0 else queue.dequeue_many(2)
+                except EmptyQueueError:
+                    return
+                except Exception as error:
+                    errors.append(error)
+                    return
+                if len(items) == 0:
+                    return
+                taken.extend(items)
+
+        threads = [Thread(target=consumer, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [], "Racing consumers must only see EmptyQueueError")
+        self.assertEqual(sorted(taken), sorted(elements), "Every element must be taken exactly once")
+        self.assertEqual(queue.size, 0)
+        self.assertFalse(queue.contains(0) or queue.contains(1), "The counter must match the elements")
+
+
+    def test_compact(self):
+        with self.assertRaises(QueueTypeError):
+            Queue(compact=True)
+        with self.assertRaises(QueueTypeError):
+            Queue(bool, compact=True)
+        with self.assertRaises(QueueTypeError):
+            Queue(float, compact="yes")
+        with self.assertRaises(QueueTypeError):
+            Queue(float).as_memoryview()
+
+        queue = Queue(float, compact=True)
+        self.assertTrue(queue.compact)
+        self.assertFalse(Queue(float).compact)
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue(1)
+
+        # the elements wrap around the end of the circular array
+        expected = []
+        for element in range(100):
+            queue.enqueue(float(element))
+            expected.append(float(element))
+            if element % 3 == 0:
+                self.assertEqual(queue.dequeue(), expected.pop(0))
+        queue.enqueue_many([100.0, 101.0])
+        expected.extend([100.0, 101.0])
+
+        self.assertEqual(queue.size, len(expected))
+        self.assertEqual(queue.peek(), expected[0])
+        self.assertTrue(expected[10] in queue)
+        queue.remove(expected[10])
+        expected.pop(10)
+        self.assertEqual(queue.as_memoryview().tolist(), expected, "Wrong memoryview export")
+        self.assertEqual(queue.dequeue_many(5), expected[:5])
+        self.assertEqual([element for element in queue], expected[5:])
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+
+        queue = Queue(int, maxlen=4, overflow="drop_newest", compact=True)
+        queue.enqueue_many(range(6))
+        self.assertEqual(queue.dropped, 2)
+        self.assertEqual(queue.as_memoryview().tolist(), [0, 1, 2, 3])
+
+
+    def test_indexed(self):
+        with self.assertRaises(QueueTypeError):
+            Queue(indexed=0)
+        self.assertFalse(Queue().indexed)
+
+        queue = Queue(str, indexed=True)
+        self.assertTrue(queue.indexed)
+        queue.enqueue_many(["a", "b", "b"])
+        queue.enqueue("c")
+        self.assertTrue("b" in queue)
+        self.assertFalse("d" in queue)
+        with self.assertRaises(QueueTypeError):
+            queue.contains(5)
+
+        self.assertEqual(queue.dequeue(), "a")
+        self.assertFalse("a" in queue)
+        queue.remove("b")
+        self.assertTrue("b" in queue)
+        self.assertEqual(queue.dequeue_many(2), ["b", "c"])
+        self.assertFalse("b" in queue)
+        with self.assertRaises(QueueElementError):
+            queue.remove("b")
+
+        queue = Queue(int, maxlen=2, overflow="drop_newest", indexed=True)
+        queue.enqueue_many([1, 2, 3])
+        queue.enqueue(4)
+        self.assertEqual([element for element in range(5) if element in queue], [1, 2])
+
+        queue = Queue(int, maxlen=2, compact=True, indexed=True)
+        queue.enqueue_many([1, 2, 3])
+        queue.enqueue(4)
+        self.assertEqual([element for element in range(5) if element in queue], [3, 4])
+
+    def test_indexed_compact(self):
+        # an element, which cannot be stored, must not be counted by an indexed queue
+        queue = Queue(int, compact=True, indexed=True)
+        with self.assertRaises(ValueError):
+            queue.enqueue(2**70)
+        self.assertFalse(queue.contains(2**70))
+        self.assertEqual(queue.size, 0)
+
+        with self.assertRaises(ValueError):
+            queue.enqueue_many([1, 2**70])
+        self.assertFalse(queue.contains(1), "A batch, which cannot be stored, must not be counted")
+        self.assertFalse(queue.contains(2**70))
+        self.assertEqual(queue.size, 0)
+
+        queue = Queue(int, maxlen=2, compact=True, indexed=True)
+        queue.enqueue_many([1, 2])
+        with self.assertRaises(ValueError):
+            queue.enqueue(2**70)
+        self.assertTrue(queue.contains(1), "An element must not be uncounted if the element pushing it out isn't stored")
+        self.assertTrue(queue.contains(2))
+
+        queue = Queue(int, maxlen=2, overflow="block", compact=True)
+        with self.assertRaises(ValueError):
+            queue.enqueue_many([2**63 - 1, 2**63])
+        self.assertEqual(queue.size, 0, "A batch with an integer, which doesn't fit in 64 bits, must be rejected as a whole")
+        queue.enqueue_many([2**63 - 1, -2**63])
+        self.assertEqual(queue.dequeue_many(2), [2**63 - 1, -2**63])
+
+    def test_view(self):
+        for queue in (Queue(float), Queue(float, compact=True)):
+            queue.enqueue_many([1.0, 2.0, 3.0])
+            queue.dequeue()
+            queue.enqueue(4.0)
+            self.assertEqual(list(queue.view()), [2.0, 3.0, 4.0])
+            self.assertEqual(queue.size, 3, "Viewing the queue must not remove its elements")
+
+            view = queue.view()
+            self.assertEqual(next(view), 2.0)
+            queue.dequeue()
+            with self.assertRaises(RuntimeError):
+                next(view)
+
+            view = queue.view()
+            queue.enqueue_many([5.0])
+            with self.assertRaises(RuntimeError):
+                list(view)
+        self.assertEqual(list(Queue().view()), [])
+
+
 if __name__ == '__main__':
     unittest.main()
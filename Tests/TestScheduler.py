@@ -0,0 +1,155 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the Scheduler
+import unittest
+import random
+
+from DataStructures.SchedulingDataStructures import Scheduler, TimerHandle
+from DataStructures.Errors import *
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(SchedulerTypeError):
+            Scheduler(time_type="float")
+        with self.assertRaises(SchedulerTypeError):
+            Scheduler(start=1)
+
+        scheduler = Scheduler(int, start=10)
+        self.assertEqual(scheduler.now, 10)
+        self.assertEqual(scheduler.time_type, int)
+        self.assertEqual(len(scheduler), 0)
+        self.assertEqual(scheduler.events_per_second, 0.0)
+        with self.assertRaises(SchedulerTypeError):
+            scheduler.schedule(11.0, print)
+        with self.assertRaises(SchedulerTypeError):
+            scheduler.schedule(11, "print")
+        with self.assertRaises(ValueError):
+            scheduler.schedule(9, print)
+        with self.assertRaises(SchedulerTypeError):
+            scheduler.run_until(11.0)
+        with self.assertRaises(ValueError):
+            scheduler.run_until(9)
+        with self.assertRaises(SchedulerTypeError):
+            scheduler.cancel(None)
+
+    def test_dispatch_order(self):
+        scheduler = Scheduler()
+        log = []
+        for at, name in [(3.0, "c"), (1.0, "a"), (3.0, "d"), (2.0, "b"), (3.0, "e"), (7.5, "f")]:
+            scheduler.schedule(at, lambda name=name: log.append((scheduler.now, name)))
+
+        self.assertEqual(scheduler.queue_depth, 6)
+        self.assertEqual(scheduler.run_until(3.0), 5)
+        self.assertEqual(log, [(1.0, "a"), (2.0, "b"), (3.0, "c"), (3.0, "d"), (3.0, "e")],
+                         "Events at the same time must be dispatched in the order they were scheduled")
+        self.assertEqual(scheduler.now, 3.0)
+        self.assertEqual(scheduler.run_until(5.0), 0)
+        self.assertEqual(scheduler.now, 5.0, "The time must be advanced even if no events are dispatched")
+        self.assertEqual(scheduler.run_until(10.0), 1)
+        self.assertEqual(scheduler.now, 10.0)
+        self.assertEqual(scheduler.dispatched, 6)
+        self.assertEqual(scheduler.max_queue_depth, 6)
+        self.assertEqual(scheduler.queue_depth, 0)
+        self.assertGreater(scheduler.events_per_second, 0)
+        self.assertGreaterEqual(scheduler.max_lag, 0)
+
+    def test_cancel(self):
+        scheduler = Scheduler(int)
+        log = []
+        first = scheduler.schedule(1, lambda: log.append("first"))
+        second = scheduler.schedule(1, lambda: log.append("second"))
+        third = scheduler.schedule(1, lambda: scheduler.cancel(second) or log.append("third"))
+        self.assertEqual(type(first), TimerHandle)
+        self.assertEqual(first.deadline, 1)
+
+        self.assertTrue(scheduler.cancel(first))
+        self.assertFalse(scheduler.cancel(first))
+        self.assertEqual(len(scheduler), 2)
+
+        # the third event is scheduled after the second one, hence cancelling it from the third callback is too late
+        scheduler.run_until(1)
+        self.assertEqual(log, ["second", "third"])
+        self.assertFalse(third.pending)
+        self.assertFalse(third.cancelled)
+        self.assertTrue(first.cancelled)
+        self.assertEqual(scheduler.dispatched, 2)
+
+        handles = [scheduler.schedule(5, lambda index=index: log.append(index)) for index in range(4)]
+        scheduler.schedule(5, lambda: scheduler.cancel(handles[3]))
+        scheduler.schedule(4, lambda: scheduler.cancel(handles[2]))
+        scheduler.run_until(5)
+        self.assertEqual(log, ["second", "third", 0, 1, 3], "Events of a batch can be cancelled by earlier batches")
+
+    def test_callbacks_schedule(self):
+        scheduler = Scheduler(int)
+        log = []
+
+        def tick():
+            log.append(scheduler.now)
+            if scheduler.now < 5:
+                scheduler.schedule(scheduler.now + 1, tick)
+            scheduler.schedule(scheduler.now, lambda: log.append("same time"))
+
+        scheduler.schedule(0, tick)
+        scheduler.run_until(3)
+        self.assertEqual(log, [0, "same time", 1, "same time", 2, "same time", 3, "same time"])
+        self.assertEqual(len(scheduler), 1)
+
+    def test_exception(self):
+        scheduler = Scheduler(int)
+        log = []
+
+        def fail():
+            raise RuntimeError("callback failure")
+
+        scheduler.schedule(1, lambda: log.append("before"))
+        scheduler.schedule(1, fail)
+        scheduler.schedule(1, lambda: log.append("after"))
+        scheduler.schedule(2, lambda: log.append("later"))
+        with self.assertRaises(RuntimeError):
+            scheduler.run_until(2)
+        self.assertEqual(log, ["before"])
+        self.assertEqual(scheduler.now, 1)
+
+        self.assertEqual(scheduler.run_until(2), 2)
+        self.assertEqual(log, ["before", "after", "later"], "The rest of the batch must be dispatched on the next run")
+
+    def test_random_operations(self):
+        random.seed(35)
+        scheduler = Scheduler(int)
+        dispatched = []
+        expected = []
+        for index in range(2000):
+            at = scheduler.now + random.randint(0, 20)
+            handle = scheduler.schedule(at, lambda index=index: dispatched.append(index))
+            expected.append((at, index, handle))
+            if random.random() < 0.2:
+                scheduler.cancel(random.choice(expected)[2])
+            if random.random() < 0.1:
+                scheduler.run_until(scheduler.now + random.randint(0, 10))
+        scheduler.run_until(scheduler.now + 100)
+
+        self.assertEqual(dispatched, [index for at, index, handle in sorted(expected, key=lambda event: event[:2])
+                                      if not handle.cancelled])
+        self.assertEqual(len(scheduler), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
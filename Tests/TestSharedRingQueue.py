@@ -0,0 +1,115 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import unittest
+import multiprocessing
+
+from DataStructures.ConcurrentDataStructures import SharedRingQueue
+from DataStructures.Errors import *
+
+
+def produce(queue, start, count):
+    for value in range(start, start + count):
+        while True:
+            try:
+                queue.enqueue((value, value / 2))
+                break
+            except FullQueueError:
+                pass
+    queue.close()
+
+
+class SharedRingQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            SharedRingQueue(5, 10)
+        with self.assertRaises(QueueTypeError):
+            SharedRingQueue("<z", 10)
+        with self.assertRaises(QueueTypeError):
+            SharedRingQueue("<q", 10.0)
+        with self.assertRaises(ValueError):
+            SharedRingQueue("<q", 0)
+        with self.assertRaises(QueueTypeError):
+            SharedRingQueue("<q", 10, multi_producer="no")
+
+        with SharedRingQueue("<qd", 8) as queue:
+            self.assertEqual(queue.record_format, "<qd")
+            self.assertEqual(queue.capacity, 8)
+            self.assertFalse(queue.multi_producer)
+            self.assertEqual(queue.size, 0)
+            self.assertEqual(len(queue), 0)
+
+    def test_enqueue_dequeue(self):
+        with SharedRingQueue("<i", 3) as queue:
+            self.assertEqual(queue.peek(), None)
+            with self.assertRaises(EmptyQueueError):
+                queue.dequeue()
+            with self.assertRaises(QueueTypeError):
+                queue.enqueue("1")
+            with self.assertRaises(QueueTypeError):
+                queue.enqueue((1, 2))
+
+            for round_index in range(5):
+                for value in range(3):
+                    queue.enqueue(round_index*10 + value)
+                with self.assertRaises(FullQueueError):
+                    queue.enqueue(100)
+                self.assertEqual(queue.size, 3)
+                self.assertEqual(queue.peek(), round_index*10)
+                self.assertEqual([queue.dequeue() for _ in range(3)], [round_index*10 + value for value in range(3)],
+                                 "Wrong order of records after wrapping around the ring")
+
+    def test_attach(self):
+        with SharedRingQueue("<qd", 4) as queue:
+            attached = SharedRingQueue.attach(queue.name)
+            self.assertEqual(attached.record_format, "<qd")
+            self.assertEqual(attached.capacity, 4)
+            queue.enqueue((7, 3.5))
+            self.assertEqual(attached.size, 1)
+            self.assertEqual(attached.dequeue(), (7, 3.5))
+            self.assertEqual(queue.size, 0)
+            attached.close()
+
+    def test_processes(self):
+        context = multiprocessing.get_context()
+        with SharedRingQueue("<qd", 16, multi_producer=True) as queue:
+            self.assertTrue(queue.multi_producer)
+            producers = [context.Process(target=produce, args=(queue, start, 500)) for start in (0, 1000, 2000)]
+            for process in producers:
+                process.start()
+
+            records = []
+            while len(records) < 1500:
+                try:
+                    records.append(queue.dequeue())
+                except EmptyQueueError:
+                    pass
+
+            for process in producers:
+                process.join(10)
+                self.assertEqual(process.exitcode, 0)
+
+            self.assertEqual(sorted(records), [(value, value / 2) for start in (0, 1000, 2000)
+                                               for value in range(start, start + 500)])
+            for start in (0, 1000, 2000):
+                values = [value for value, half in records if start <= value < start + 500]
+                self.assertEqual(values, sorted(values), "Records of a producer must be dequeued in FIFO order")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,8 @@ limitations under the License.
 
 # Simple unittests for the ADT Stack
 import unittest
+from threading import Thread
+from time import sleep
 
 from DataStructures.AbstractDataStructures import Stack
 from DataStructures.Errors import *
@@ -214,5 +216,260 @@ class StackTest(unittest.TestCase):
         self.assertEqual(stack.pop(), 8, "Wrong remove implementation")
 
 
+    def test_push_pop_many(self):
+        stack = Stack(int)
+        with self.assertRaises(StackTypeError):
+            stack.push_many([1, 2, "3"])
+        self.assertEqual(stack.size, 0, "No elements must be pushed if an element has a wrong type")
+
+        stack.push_many(range(10))
+        stack.push_many(element for element in [10, 11])
+        self.assertEqual(stack.size, 12, "Wrong push_many implementation")
+        self.assertEqual(stack.peek(), 11)
+
+        with self.assertRaises(StackTypeError):
+            stack.pop_many(2.0)
+        with self.assertRaises(ValueError):
+            stack.pop_many(-1)
+
+        self.assertEqual(stack.pop_many(0), [])
+        self.assertEqual(stack.pop_many(3), [11, 10, 9], "Wrong pop_many implementation")
+        self.assertEqual(stack.pop_many(100), list(range(8, -1, -1)), "pop_many must return all remaining elements")
+        self.assertEqual(stack.pop_many(5), [])
+        self.assertEqual(stack.size, 0)
+
+
+    def test_maxlen(self):
+        with self.assertRaises(StackTypeError):
+            Stack(maxlen=2.5)
+        with self.assertRaises(ValueError):
+            Stack(maxlen=0)
+        with self.assertRaises(ValueError):
+            Stack(maxlen=3, overflow="drop")
+
+        stack = Stack()
+        self.assertEqual((stack.maxlen, stack.overflow, stack.dropped), (None, "drop_oldest", 0))
+
+        stack = Stack(int, maxlen=3)
+        stack.push_many([1, 2, 3])
+        stack.push(4)
+        self.assertEqual(stack.dropped, 1, "Wrong drop_oldest implementation")
+        stack.push_many([5, 6])
+        self.assertEqual(stack.dropped, 3)
+        self.assertEqual(stack.pop_many(3), [6, 5, 4], "The oldest elements must be dropped")
+
+        stack = Stack(int, maxlen=3, overflow="drop_newest")
+        stack.push_many([1, 2])
+        stack.push_many([3, 4, 5])
+        stack.push(6)
+        self.assertEqual(stack.dropped, 3, "Wrong drop_newest implementation")
+        self.assertEqual(stack.pop_many(3), [3, 2, 1], "The newest elements must be dropped")
+
+        stack = Stack(maxlen=2, overflow="raise")
+        stack.push(1)
+        with self.assertRaises(FullStackError):
+            stack.push_many([2, 3])
+        self.assertEqual(stack.size, 1, "No elements must be pushed if they don't fit")
+        stack.push(2)
+        with self.assertRaises(FullStackError):
+            stack.push(3)
+        self.assertEqual(stack.dropped, 0)
+        self.assertEqual(stack.size, 2)
+
+    def test_maxlen_block(self):
+        stack = Stack(int, maxlen=2, overflow="block")
+        stack.push_many([1, 2])
+        popped = []
+
+        def consumer():
+            for _ in range(4):
+                while stack.size == 0:
+                    pass
+                popped.append(stack.pop())
+
+        thread = Thread(target=consumer)
+        thread.start()
+        stack.push_many([3, 4])
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "Blocked pushes must be woken up by pops")
+        self.assertEqual(sorted(popped), [1, 2, 3, 4])
+        self.assertEqual(stack.dropped, 0)
+
+    def test_block_consumers(self):
+        # with the block policy all mutating methods hold the lock, the slow hash releases the GIL in the middle of the
+        # counter updates, so racing consumers corrupt the counter of an indexed stack, which isn't locked
+        class SlowHash(int):
+            def __hash__(self):
+                sleep(0.0001)
+                return int.__hash__(self)
+
+        elements = [SlowHash(element % 2) for element in range(200)]
+        stack = Stack(maxlen=len(elements), overflow="block", indexed=True)
+        stack.push_many(elements)
+        taken, errors = [], []
+
+        def consumer(index):
+            while True:
+                try:
+                    items = [stack.pop()] if index % 2 == 0 else stack.pop_many(2)
+                except EmptyStackError:
+                    return
+                except Exception as error:
+                    errors.append(error)
+                    return
+                if len(items) == 0:
+                    return
+                taken.extend(items)
+
+        threads = [Thread(target=consumer, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [], "Racing consumers must only see EmptyStackError")
+        self.assertEqual(sorted(taken), sorted(elements), "Every element must be taken exactly once")
+        self.assertEqual(stack.size, 0)
+        self.assertFalse(stack.contains(0) or stack.contains(1), "The counter must match the elements")
+
+
+    def test_compact(self):
+        with self.assertRaises(StackTypeError):
+            Stack(compact=True)
+        with self.assertRaises(StackTypeError):
+            Stack(str, compact=True)
+        with self.assertRaises(StackTypeError):
+            Stack(int, compact=1)
+        with self.assertRaises(StackTypeError):
+            Stack(int).as_memoryview()
+
+        stack = Stack(int, compact=True)
+        self.assertTrue(stack.compact)
+        self.assertFalse(Stack(int).compact)
+        with self.assertRaises(StackTypeError):
+            stack.push(1.5)
+        with self.assertRaises(ValueError):
+            stack.push(2**64)
+        with self.assertRaises(ValueError):
+            stack.push_many([1, -2**63 - 1])
+        self.assertEqual(stack.size, 0, "A batch with an integer, which doesn't fit in 64 bits, must be rejected as a whole")
+        stack.push_many([-2**63, 2**63 - 1])
+        self.assertEqual(stack.pop_many(2), [2**63 - 1, -2**63])
+
+        stack.push_many(range(100))
+        stack.push(100)
+        self.assertEqual(stack.size, 101)
+        self.assertEqual(stack.peek(), 100)
+        self.assertTrue(50 in stack)
+        self.assertFalse(500 in stack)
+        stack.remove(50)
+        with self.assertRaises(StackElementError):
+            stack.remove(50)
+
+        view = stack.as_memoryview()
+        self.assertEqual(view.format, "q")
+        self.assertEqual(view.tolist(), [element for element in range(101) if element != 50])
+        view.release()
+
+        self.assertEqual(stack.pop(), 100)
+        self.assertEqual(stack.pop_many(3), [99, 98, 97])
+        self.assertEqual([element for element in stack][-3:], [2, 1, 0])
+        with self.assertRaises(EmptyStackError):
+            stack.pop()
+
+        stack = Stack(float, maxlen=3, compact=True)
+        stack.push_many([1.0, 2.0, 3.0, 4.0])
+        stack.push(5.0)
+        self.assertEqual(stack.dropped, 2)
+        self.assertEqual(str(stack), "ArrayDeque('d', [3.0, 4.0, 5.0])")
+        self.assertEqual(stack.as_memoryview().tolist(), [3.0, 4.0, 5.0])
+
+
+    def test_indexed(self):
+        with self.assertRaises(StackTypeError):
+            Stack(indexed="yes")
+        self.assertFalse(Stack().indexed)
+
+        stack = Stack(indexed=True)
+        self.assertTrue(stack.indexed)
+        with self.assertRaises(StackTypeError):
+            stack.push([1, 2])
+        with self.assertRaises(StackTypeError):
+            stack.push_many(["a", {}])
+        self.assertEqual(stack.size, 0)
+        self.assertFalse([1, 2] in stack)
+
+        stack.push_many(["a", "b", "a"])
+        stack.push("c")
+        self.assertTrue("a" in stack)
+        stack.remove("a")
+        self.assertTrue("a" in stack, "The counter must keep the second copy of the element")
+        with self.assertRaises(StackElementError):
+            stack.remove("d")
+        self.assertEqual(stack.pop(), "c")
+        self.assertFalse("c" in stack)
+        self.assertEqual(stack.pop_many(2), ["a", "b"])
+        self.assertFalse("a" in stack)
+        self.assertFalse("b" in stack)
+
+        # the elements dropped by the deque itself must be removed from the counter
+        stack = Stack(int, maxlen=3, indexed=True)
+        stack.push_many([1, 2, 3, 4])
+        self.assertFalse(1 in stack)
+        stack.push(5)
+        self.assertFalse(2 in stack)
+        stack.push_many([6, 7, 8, 9])
+        self.assertEqual([element for element in range(10) if element in stack], [7, 8, 9])
+        with self.assertRaises(StackElementError):
+            stack.remove(5)
+
+    def test_indexed_compact(self):
+        # an element, which cannot be stored, must not be counted by an indexed stack
+        stack = Stack(int, compact=True, indexed=True)
+        with self.assertRaises(ValueError):
+            stack.push(2**70)
+        self.assertFalse(stack.contains(2**70))
+        self.assertEqual(stack.size, 0)
+
+        with self.assertRaises(ValueError):
+            stack.push_many([1, 2**70])
+        self.assertFalse(stack.contains(1), "A batch, which cannot be stored, must not be counted")
+        self.assertFalse(stack.contains(2**70))
+        self.assertEqual(stack.size, 0)
+
+        stack = Stack(int, maxlen=2, compact=True, indexed=True)
+        stack.push_many([1, 2])
+        with self.assertRaises(ValueError):
+            stack.push(2**70)
+        self.assertTrue(stack.contains(1), "An element must not be uncounted if the element pushing it out isn't stored")
+        self.assertTrue(stack.contains(2))
+
+    def test_view(self):
+        for stack in (Stack(int), Stack(int, compact=True)):
+            stack.push_many([1, 2, 3])
+            self.assertEqual(list(stack.view()), [3, 2, 1])
+            self.assertEqual(stack.size, 3, "Viewing the stack must not remove its elements")
+
+            view = stack.view()
+            self.assertEqual(next(view), 3)
+            stack.push(4)
+            with self.assertRaises(RuntimeError):
+                next(view)
+
+            view = stack.view()
+            self.assertEqual(next(view), 4)
+            stack.pop()
+            with self.assertRaises(RuntimeError):
+                list(view)
+
+        stack = Stack(int, compact=True)
+        stack.push_many(range(5))
+        view = stack.view()
+        self.assertEqual(next(view), 4)
+        stack.as_memoryview().release()
+        self.assertEqual(list(view), [3, 2, 1, 0], "Exporting a memoryview must not break the iteration")
+        self.assertEqual(list(Stack().view()), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT TTLQueue
+import unittest
+from time import sleep
+
+from DataStructures.SchedulingDataStructures import TTLQueue
+from DataStructures.Errors import *
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(QueueTypeError):
+            TTLQueue("10")
+        with self.assertRaises(ValueError):
+            TTLQueue(0)
+        with self.assertRaises(QueueTypeError):
+            TTLQueue(10, elements_type=5)
+        with self.assertRaises(QueueTypeError):
+            TTLQueue(10, sweep_interval=[1])
+        with self.assertRaises(ValueError):
+            TTLQueue(10, sweep_interval=-1)
+        with self.assertRaises(QueueTypeError):
+            TTLQueue(10, clock=5)
+
+        queue = TTLQueue(2.5, str)
+        self.assertEqual(queue.ttl, 2.5)
+        self.assertEqual(queue.type, str)
+        self.assertEqual(queue.size, 0)
+        self.assertEqual(queue.expired, 0)
+        self.assertIsNone(queue.peek())
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+        queue.close()
+
+    def test_expiry(self):
+        clock = Clock()
+        queue = TTLQueue(10, int, clock=clock)
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue("a")
+        with self.assertRaises(QueueTypeError):
+            queue.enqueue_many([1, "a"])
+
+        queue.enqueue_many([1, 2, 3])
+        clock.now = 4
+        queue.enqueue(4)
+        queue.enqueue(5)
+        clock.now = 8
+        queue.enqueue_many(range(6, 10))
+        self.assertEqual(len(queue), 9)
+        self.assertEqual(str(queue), "deque([1, 2, 3, 4, 5, 6, 7, 8, 9])")
+
+        clock.now = 10
+        self.assertEqual(queue.peek(), 4, "The elements must expire exactly after their TTL")
+        self.assertEqual(queue.expired, 3)
+        self.assertFalse(1 in queue)
+        self.assertTrue(5 in queue)
+        self.assertEqual(queue.dequeue(), 4)
+
+        clock.now = 14
+        self.assertEqual(queue.expire(), 1)
+        self.assertEqual(queue.expire(), 0)
+        self.assertEqual(queue.dequeue_many(2), [6, 7])
+        clock.now = 100
+        self.assertEqual(queue.dequeue_many(2), [])
+        self.assertEqual(queue.expired, 6)
+        with self.assertRaises(EmptyQueueError):
+            queue.dequeue()
+
+        queue.enqueue_many([10, 11])
+        clock.now = 105
+        queue.enqueue(12)
+        self.assertEqual([element for element in queue], [10, 11, 12])
+        self.assertEqual(queue.size, 0)
+        self.assertEqual(queue.expired, 6)
+
+    def test_sweeper(self):
+        with TTLQueue(0.02, sweep_interval=0.01) as queue:
+            queue.enqueue_many(range(1000))
+            sleep(0.2)
+            self.assertEqual(len(queue._TTLQueue__expiries), 0, "The sweeper must remove the expired elements")
+            self.assertEqual(queue.expired, 1000)
+            queue.enqueue("new")
+            self.assertEqual(queue.dequeue(), "new")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT TimingWheel
+import unittest
+import asyncio
+import random
+
+from DataStructures.SchedulingDataStructures import TimingWheel, TimerHandle
+from DataStructures.Errors import *
+
+
+class TimingWheelTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(TimingWheelTypeError):
+            TimingWheel(elements_type="str")
+        with self.assertRaises(TimingWheelTypeError):
+            TimingWheel(slots=8.0)
+        with self.assertRaises(ValueError):
+            TimingWheel(slots=1)
+        with self.assertRaises(ValueError):
+            TimingWheel(levels=0)
+
+        wheel = TimingWheel(str)
+        self.assertEqual(wheel.type, str)
+        self.assertEqual(wheel.size, 0)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.now, 0)
+        with self.assertRaises(TimingWheelTypeError):
+            wheel.schedule(1, 5)
+        with self.assertRaises(TimingWheelTypeError):
+            wheel.schedule("timeout", 1.5)
+        with self.assertRaises(ValueError):
+            wheel.schedule("timeout", 0)
+        with self.assertRaises(TimingWheelTypeError):
+            wheel.cancel("timeout")
+        with self.assertRaises(TimingWheelTypeError):
+            wheel.advance(1.0)
+        with self.assertRaises(ValueError):
+            wheel.advance(-1)
+
+    def test_schedule_cancel(self):
+        wheel = TimingWheel(str, slots=4, levels=2)
+        first = wheel.schedule("first", 3)
+        second = wheel.schedule("second", 3)
+        late = wheel.schedule("late", 10)
+        beyond = wheel.schedule("beyond", 40)
+        self.assertEqual(wheel.size, 4)
+        self.assertEqual((first.item, first.deadline), ("first", 3))
+        self.assertTrue(first.pending)
+
+        self.assertTrue(wheel.cancel(first))
+        self.assertFalse(wheel.cancel(first), "A handle cannot be cancelled twice")
+        self.assertTrue(first.cancelled)
+        self.assertFalse(first.pending)
+        self.assertEqual(wheel.size, 3)
+
+        self.assertEqual(wheel.advance(2), [])
+        self.assertEqual(wheel.tick(), ["second"], "Cancelled elements must not expire")
+        self.assertFalse(second.pending)
+        self.assertFalse(second.cancelled)
+        self.assertFalse(wheel.cancel(second), "Expired elements cannot be cancelled")
+
+        self.assertEqual(wheel.advance(6), [])
+        self.assertEqual(wheel.tick(), ["late"])
+        self.assertEqual(wheel.advance(29), [])
+        self.assertEqual(wheel.now, 39)
+        self.assertEqual(wheel.tick(), ["beyond"], "Elements beyond the range of the wheel must expire on time")
+        self.assertEqual(wheel.size, 0)
+        self.assertFalse(beyond.pending)
+
+    def test_batch_expiry(self):
+        wheel = TimingWheel()
+        handles = [wheel.schedule(index, 100) for index in range(10)]
+        for handle in handles[::2]:
+            wheel.cancel(handle)
+        self.assertEqual(wheel.advance(99), [])
+        self.assertEqual(wheel.tick(), [1, 3, 5, 7, 9], "Elements must expire in the order they were scheduled")
+
+    def test_beyond_range(self):
+        # a single level is never cascaded, so elements beyond its range must not expire early
+        wheel = TimingWheel(slots=4, levels=1)
+        wheel.schedule("late", 10)
+        wheel.schedule("early", 2)
+        self.assertEqual(wheel.advance(2), ["early"])
+        self.assertEqual(wheel.advance(7), [], "An element beyond the range of the wheel must not expire early")
+        self.assertEqual(wheel.tick(), ["late"])
+        self.assertEqual(wheel.size, 0)
+
+        wheel = TimingWheel(slots=4, levels=2)
+        wheel.schedule("far", 40)
+        self.assertEqual(wheel.advance(39), [])
+        self.assertEqual(wheel.tick(), ["far"])
+
+        # elements cascaded from a higher level expire together with the elements scheduled in the lowest level
+        wheel = TimingWheel(slots=8, levels=2)
+        wheel.schedule(30, 40)
+        wheel.advance(33)
+        wheel.schedule(33, 7)
+        self.assertEqual(sorted(wheel.advance(7)), [30, 33])
+
+    def test_random_operations(self):
+        random.seed(34)
+        wheel = TimingWheel(slots=8, levels=3)
+        pending = {}
+        for _ in range(3000):
+            operation = random.random()
+            if operation < 0.4:
+                delay = random.randint(1, 1000)
+                handle = wheel.schedule(wheel.now + delay, delay)
+                pending[handle] = handle.deadline
+            elif operation < 0.6 and len(pending) > 0:
+                handle = random.choice(list(pending))
+                self.assertTrue(wheel.cancel(handle))
+                pending.pop(handle)
+            else:
+                expired = wheel.tick()
+                expected = [deadline for handle, deadline in pending.items() if deadline == wheel.now]
+                self.assertEqual(sorted(expired), sorted(expected), "Wrong expiry on tick {0}".format(wheel.now))
+                pending = {handle: deadline for handle, deadline in pending.items() if deadline != wheel.now}
+            self.assertEqual(wheel.size, len(pending))
+
+    def test_run(self):
+        wheel = TimingWheel(str)
+        expired = []
+
+        async def collect(items):
+            expired.extend(items)
+
+        async def scenario():
+            wheel.schedule("first", 2)
+            wheel.schedule("second", 4)
+            task = asyncio.create_task(wheel.run(0.01, collect))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+        self.assertEqual(expired, ["first", "second"])
+        self.assertGreaterEqual(wheel.now, 4)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(wheel.run(0, collect))
+
+
+if __name__ == "__main__":
+    unittest.main()
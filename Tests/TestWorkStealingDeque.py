@@ -0,0 +1,194 @@
+"""
+Copyright 2017 Nikolay Stanchev
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+# Simple unittests for the ADT WorkStealingDeque and the WorkStealingExecutor
+import unittest
+from threading import Event, Thread, current_thread
+from time import sleep
+from unittest.mock import patch
+
+import DataStructures.ConcurrentDataStructures as ConcurrentDataStructures
+from DataStructures.ConcurrentDataStructures import WorkStealingDeque, WorkStealingExecutor
+from DataStructures.Errors import *
+
+
+def fibonacci(executor, n):
+    if n < 2:
+        return n
+    first = executor.submit(fibonacci, executor, n - 1)
+    second = executor.submit(fibonacci, executor, n - 2)
+    return executor.wait(first) + executor.wait(second)
+
+
+class SlowWorkStealingDeque(WorkStealingDeque):
+    """
+    a deque, which widens the window between a worker checking that the deques are empty and going to sleep
+    """
+
+    @property
+    def size(self):
+        size = WorkStealingDeque.size.fget(self)
+        if current_thread().name.startswith("WorkStealingExecutor"):
+            sleep(0.05)
+        return size
+
+
+class WorkStealingDequeTest(unittest.TestCase):
+
+    def test_deque(self):
+        with self.assertRaises(StackTypeError):
+            WorkStealingDeque(5)
+
+        tasks = WorkStealingDeque(int)
+        with self.assertRaises(StackTypeError):
+            tasks.push("a")
+        with self.assertRaises(EmptyStackError):
+            tasks.pop()
+        with self.assertRaises(EmptyStackError):
+            tasks.steal()
+        self.assertIsNone(tasks.peek())
+
+        tasks.push_many(range(6))
+        self.assertEqual(tasks.peek(), 5)
+        self.assertEqual(tasks.pop(), 5, "The owner must pop in LIFO order")
+        self.assertEqual(tasks.steal(), 0, "Thieves must steal in FIFO order")
+        self.assertEqual(tasks.steal(), 1)
+        self.assertEqual(tasks.pop_many(5), [4, 3, 2])
+        with self.assertRaises(StackTypeError):
+            tasks.pop_many(1.5)
+        with self.assertRaises(ValueError):
+            tasks.pop_many(-1)
+        self.assertEqual(tasks.size, 0)
+
+    def test_concurrent_steal(self):
+        tasks = WorkStealingDeque(int)
+        stolen = [[] for _ in range(4)]
+
+        def steal(index):
+            while True:
+                try:
+                    element = tasks.steal()
+                except EmptyStackError:
+                    continue
+                if element < 0:
+                    return
+                stolen[index].append(element)
+
+        thieves = [Thread(target=steal, args=(index,)) for index in range(4)]
+        for thief in thieves:
+            thief.start()
+
+        popped = []
+        for element in range(20000):
+            tasks.push(element)
+            if element % 3 == 0:
+                try:
+                    popped.append(tasks.pop())
+                except EmptyStackError:
+                    pass
+        popped.extend(tasks.pop_many(20000))
+        tasks.push_many([-1]*4)
+        for thief in thieves:
+            thief.join()
+
+        elements = popped + [element for elements in stolen for element in elements]
+        self.assertEqual(sorted(elements), list(range(20000)), "Every element must be removed exactly once")
+
+
+class WorkStealingExecutorTest(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(ExecutorTypeError):
+            WorkStealingExecutor(2.0)
+        with self.assertRaises(ValueError):
+            WorkStealingExecutor(0)
+
+        with WorkStealingExecutor() as executor:
+            self.assertGreater(executor.workers, 0)
+        with WorkStealingExecutor(3) as executor:
+            self.assertEqual(executor.workers, 3)
+            self.assertEqual(executor.pending, 0)
+            self.assertEqual(executor.steals, 0)
+
+    def test_submit(self):
+        with WorkStealingExecutor(4) as executor:
+            futures = [executor.submit(pow, element, 2) for element in range(100)]
+            self.assertEqual([future.result() for future in futures], [element**2 for element in range(100)])
+            self.assertEqual(executor.wait(executor.submit(sorted, [3, 1, 2], reverse=True)), [3, 2, 1])
+
+            future = executor.submit(int, "not a number")
+            with self.assertRaises(ValueError):
+                executor.wait(future)
+
+    def test_recursive(self):
+        for workers in (1, 2, 8):
+            with WorkStealingExecutor(workers) as executor:
+                self.assertEqual(executor.wait(executor.submit(fibonacci, executor, 15)), 610,
+                                 "Recursive tasks must not block the workers")
+                self.assertEqual(executor.pending, 0)
+
+    def test_lost_wake_up(self):
+        with patch.object(ConcurrentDataStructures, "WorkStealingDeque", SlowWorkStealingDeque):
+            executor = WorkStealingExecutor(1)
+        try:
+            for attempt in range(3):
+                # the task is submitted while the worker is checking that its deque is empty
+                sleep(0.02)
+                self.assertEqual(executor.submit(lambda: 42).result(2), 42, "A worker must not miss a submitted task")
+        finally:
+            executor.shutdown()
+
+    def test_waiting_worker(self):
+        # the parent waits for a child, which another worker has stolen, so it goes to sleep until a new task is submitted
+        # (the one releasing the child) or the child is done
+        started, release = Event(), Event()
+
+        def child():
+            started.set()
+            return release.wait(5)
+
+        def parent(timeout):
+            future = executor.submit(child)
+            started.wait(5)
+            return executor.wait(future, timeout)
+
+        with WorkStealingExecutor(2) as executor:
+            future = executor.submit(parent, None)
+            self.assertTrue(started.wait(5))
+            sleep(0.05)
+            executor.submit(release.set)
+            self.assertTrue(future.result(5), "A waiting worker must be woken up by new tasks and by the result")
+
+            started.clear()
+            release.clear()
+            future = executor.submit(parent, 0.05)
+            with self.assertRaises(TimeoutError):
+                future.result(5)
+            release.set()
+
+    def test_shutdown(self):
+        executor = WorkStealingExecutor(2)
+        futures = [executor.submit(sum, range(element)) for element in range(50)]
+        executor.shutdown(wait=True)
+        self.assertTrue(all(future.done() for future in futures), "The submitted tasks must be run before shutdown")
+        with self.assertRaises(RuntimeError):
+            executor.submit(sum, [1, 2])
+        executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()